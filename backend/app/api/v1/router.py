@@ -5,6 +5,7 @@ from app.modules.audit.presentation.endpoints import router as audit_router
 from app.modules.auth.presentation.endpoints import router as auth_router
 from app.modules.compensation.presentation.endpoints import router as compensation_router
 from app.modules.contract.presentation.endpoints import router as contract_router
+from app.modules.dashboard.presentation.endpoints import router as dashboard_router
 from app.modules.employee.presentation.endpoints import router as employee_router
 from app.modules.payroll.presentation.endpoints import router as payroll_router
 from app.modules.reporting.presentation.routes import router as reporting_router
@@ -20,3 +21,4 @@ api_router.include_router(timesheet_router, prefix="/timesheets", tags=["timeshe
 api_router.include_router(payroll_router, prefix="/payrolls", tags=["payrolls"])
 api_router.include_router(reporting_router, prefix="/reporting", tags=["reporting"])
 api_router.include_router(audit_router, prefix="/audit", tags=["audit"])
+api_router.include_router(dashboard_router, prefix="/dashboard", tags=["dashboard"])
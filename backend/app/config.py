@@ -14,12 +14,78 @@ class Settings(BaseSettings):
     API_V1_PREFIX: str = "/api/v1"
 
     DATABASE_URL: str
+    # Optional read replica for queries and reporting
+    DATABASE_READ_URL: str | None = None
     RABBITMQ_URL: str
     REDIS_URL: str
 
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = False
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    DB_READ_YOUR_WRITES_SECONDS: int = 5
+
+    EVENT_BUS_TRANSPORT: str = "rabbitmq"
+    EVENT_BUS_QUEUE_SIZE: int = 10000
+    EVENT_BUS_WORKERS: int = 10
+    EVENT_CODEC: str = "msgpack"
+    EVENT_CONSUMER_PREFETCH_COUNT: int = 100
+    EVENT_RETRY_MAX_ATTEMPTS: int = 5
+    EVENT_RETRY_BASE_DELAY_MS: int = 1000
+    EVENT_RETRY_BACKOFF_MULTIPLIER: int = 4
+
+    READ_MODEL_CACHE_ENABLED: bool = True
+    READ_MODEL_CACHE_TTL_SECONDS: int = 300
+    READ_MODEL_CACHE_TIMEOUT_MS: int = 100
+
+    PAYROLL_MONTH_END_BATCH_SIZE: int = 200
+
+    REPORT_STREAM_BATCH_SIZE: int = 1000
+    REPORT_RENDER_MAX_WORKERS: int = 2
+    REPORT_RENDER_TIMEOUT_SECONDS: int = 300
+    REPORT_PDF_MAX_ROWS: int = 20_000
+    REPORT_COLUMNAR_ROW_GROUP_SIZE: int = 50_000
+    REPORT_CACHE_ENABLED: bool = True
+    REPORT_CACHE_MAX_BYTES: int = 1024 * 1024 * 1024
+    REPORT_STORAGE_BACKEND: str = "local"
+    REPORT_STORAGE_LOCAL_DIR: str = "/app/reports"
+    # Generators render here before the file is moved into storage; kept out of
+    # the files the retention sweep lists (a subdirectory of the local storage dir)
+    REPORT_WORK_DIR: str = "/app/reports/.work"
+    REPORT_STORAGE_S3_BUCKET: str = "reports"
+    REPORT_STORAGE_S3_PREFIX: str = ""
+    REPORT_STORAGE_S3_ENDPOINT_URL: str | None = None
+    REPORT_STORAGE_S3_REGION: str = "us-east-1"
+    REPORT_STORAGE_S3_ACCESS_KEY_ID: str | None = None
+    REPORT_STORAGE_S3_SECRET_ACCESS_KEY: str | None = None
+    REPORT_RETENTION_DAYS: int = 30
+    REPORT_STORAGE_QUOTA_BYTES: int = 10 * 1024 * 1024 * 1024
+    REPORT_RETENTION_SWEEP_INTERVAL_SECONDS: int = 3600
+    REPORT_TIME_BUDGET_SECONDS: int = 900
+    REPORT_ROW_BUDGET: int = 5_000_000
+    # Per report type overrides of the budgets above, e.g. {"payroll_close_pack": 1800}
+    REPORT_TIME_BUDGETS: dict[str, int] = {"payroll_close_pack": 1800}
+    REPORT_ROW_BUDGETS: dict[str, int] = {}
+    REPORT_HEARTBEAT_INTERVAL_SECONDS: int = 10
+    REPORT_LEASE_SECONDS: int = 120
+
+    RESPONSE_COMPRESSION_MIN_SIZE: int = 1024
+    RESPONSE_COMPRESSION_GZIP_LEVEL: int = 6
+    RESPONSE_COMPRESSION_BROTLI_QUALITY: int = 4
+
+    DASHBOARD_CACHE_TTL_SECONDS: int = 30
+    DASHBOARD_CONTRACT_EXPIRY_DAYS: int = 30
+
+    AUDIT_BATCH_MAX_SIZE: int = 100
+    AUDIT_BATCH_MAX_WAIT_MS: int = 200
+
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    AUTH_TOKEN_CACHE_SIZE: int = 10_000
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
     BACKEND_CORS_ORIGINS: list[str] = [
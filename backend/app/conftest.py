@@ -1,15 +1,18 @@
 import os
 
+import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.database import Base, get_db
+from app.database import Base, get_db, get_read_db
 from app.main import app
 from app.modules.auth.application.services import AuthenticationService
 from app.modules.auth.domain.value_objects import UserRole
 from app.modules.auth.infrastructure.dependencies import get_current_active_user
 from app.modules.auth.infrastructure.repository import SqlAlchemyUserRepository
+from app.shared.infrastructure.cache import get_read_model_cache
 
 
 def get_test_database_url() -> str:
@@ -55,12 +58,23 @@ def get_test_database_url() -> str:
     return f"postgresql+asyncpg://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
 
 
+@pytest.fixture(autouse=True)
+def disable_read_model_cache():
+    """Tests recreate the schema per test; never serve read models from Redis."""
+    cache = get_read_model_cache()
+    enabled = cache.enabled
+    cache.enabled = False
+    yield
+    cache.enabled = enabled
+
+
 @pytest_asyncio.fixture
 async def test_engine():
     test_database_url = get_test_database_url()
     engine = create_async_engine(test_database_url, echo=True)
 
     async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
 
     yield engine
@@ -124,6 +138,7 @@ async def client(test_session, test_user):
         return test_user
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_active_user] = override_get_current_user
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
@@ -141,6 +156,7 @@ async def unauthenticated_client(test_session):
         yield test_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
@@ -1,29 +1,131 @@
 from collections.abc import AsyncGenerator
+from typing import Any
+from uuid import UUID
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import event, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, declarative_base
 
 from app.config import get_settings
+from app.shared.infrastructure.context import get_current_user_id
+from app.shared.infrastructure.recent_writes import get_recent_writes
 
 settings = get_settings()
 
 DATABASE_URL = settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
-
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=True,
-    future=True,
-    pool_pre_ping=True,
+DATABASE_READ_URL = (
+    settings.DATABASE_READ_URL.replace("postgresql://", "postgresql+asyncpg://")
+    if settings.DATABASE_READ_URL
+    else None
 )
 
+
+def create_engine_from_settings(database_url: str) -> AsyncEngine:
+    """
+    Create an async engine with the pool configured from settings.
+
+    Stale connections are handled without a ping per checkout: connections are
+    recycled after DB_POOL_RECYCLE seconds (below typical server/proxy idle
+    timeouts), the pool hands out the most recently used connection first so
+    surplus connections sit idle and get recycled, and a connection that fails
+    with a disconnect error invalidates the pool so the next checkout reconnects.
+    """
+    url = make_url(database_url)
+    if url.drivername == "postgresql+asyncpg":
+        # SQLAlchemy's asyncpg adapter caches prepared statements per connection
+        url = url.update_query_dict(
+            {"prepared_statement_cache_size": str(settings.DB_PREPARED_STATEMENT_CACHE_SIZE)}
+        )
+
+    return create_async_engine(
+        url,
+        echo=settings.DB_ECHO,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_use_lifo=True,
+    )
+
+
+class PrimarySession(Session):
+    """Sync session class behind AsyncSessionLocal, used to track commits with writes"""
+
+
+class PrimaryAsyncSession(AsyncSession):
+    """
+    Records the current user's committed writes and drops the cached read
+    models they touched once commit() returns
+    """
+
+    async def commit(self) -> None:
+        await super().commit()
+        user_id = self.sync_session.info.pop("written_by", None)
+        if user_id is not None:
+            await get_recent_writes().record(user_id)
+
+        stale_views = self.sync_session.info.pop("stale_views", None)
+        if stale_views:
+            # Imported here: the cache module registers its listeners on PrimarySession
+            from app.shared.infrastructure.cache import get_read_model_cache
+
+            await get_read_model_cache().invalidate_many(stale_views)
+
+
+engine = create_engine_from_settings(DATABASE_URL)
+
+# Without a replica configured, reads use the primary engine
+read_engine = create_engine_from_settings(DATABASE_READ_URL) if DATABASE_READ_URL else engine
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
+    class_=PrimaryAsyncSession,
+    sync_session_class=PrimarySession,
+    expire_on_commit=False,
+)
+
+AsyncReadSessionLocal = async_sessionmaker(
+    read_engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
 
 Base = declarative_base()
 
+# Read-your-writes: users who committed a write within DB_READ_YOUR_WRITES_SECONDS
+# keep reading from the primary, so they never see a replica that lags behind
+# their own command. Tracked in Redis so it holds across API processes, see
+# app.shared.infrastructure.recent_writes.
+
+
+@event.listens_for(PrimarySession, "after_flush")
+def _mark_session_written(session: Session, flush_context: Any) -> None:
+    session.info["has_writes"] = True
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _record_user_write(session: Session) -> None:
+    # The Redis marker is async, so PrimaryAsyncSession.commit writes it
+    if session.info.pop("has_writes", False):
+        user_id = get_current_user_id()
+        if user_id is not None:
+            session.info["written_by"] = user_id
+
+
+@event.listens_for(PrimarySession, "after_soft_rollback")
+def _clear_session_written(session: Session, previous_transaction: Any) -> None:
+    session.info.pop("has_writes", None)
+
+
+async def has_recent_write(user_id: UUID | None) -> bool:
+    return await get_recent_writes().has_recent_write(user_id)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
@@ -31,3 +133,30 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             yield session
         finally:
             await session.close()
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Session for queries. Uses the read replica when one is configured, except
+    for users who just committed a write (read-your-writes).
+    """
+    use_primary = read_engine is not engine and await has_recent_write(get_current_user_id())
+
+    async with AsyncSessionLocal() if use_primary else AsyncReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+def get_pool_status(async_engine: AsyncEngine = engine) -> dict[str, Any]:
+    """Connection pool statistics for monitoring"""
+    pool: Any = async_engine.pool
+    return {
+        "pool_size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "status": pool.status(),
+    }
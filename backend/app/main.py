@@ -6,6 +6,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1.router import api_router
 from app.config import get_settings
 from app.modules.auth.infrastructure.middleware import AuthContextMiddleware
+from app.modules.reporting.infrastructure.render_pool import get_report_render_pool
+from app.shared.infrastructure.compression import CompressionMiddleware
 
 
 @asynccontextmanager
@@ -16,6 +18,45 @@ async def lifespan(app: FastAPI):
     logger = logging.getLogger(__name__)
     logger.info("Starting application lifespan...")
 
+    if settings.EVENT_BUS_TRANSPORT == "memory":
+        # Single-node mode: handle events in this process instead of the event consumer
+        from app.modules.audit.infrastructure.batch_writer import get_audit_log_batch_writer
+        from app.modules.employee.infrastructure.scheduler import (
+            start_employee_status_scheduler,
+            stop_employee_status_scheduler,
+        )
+        from app.modules.payroll.infrastructure.scheduler import start_scheduler, stop_scheduler
+        from app.modules.reporting.infrastructure.scheduler import (
+            start_report_lease_scheduler,
+            start_report_retention_scheduler,
+            stop_report_lease_scheduler,
+            stop_report_retention_scheduler,
+        )
+        from app.shared.infrastructure.event_bus import get_in_memory_event_bus
+        from app.shared.infrastructure.event_handlers import register_all_handlers
+
+        register_all_handlers()
+        event_bus = get_in_memory_event_bus()
+        await event_bus.start()
+        await start_scheduler()
+        await start_employee_status_scheduler()
+        await start_report_retention_scheduler()
+        await start_report_lease_scheduler()
+        logger.info("In-memory event bus initialized")
+
+        yield
+
+        await stop_report_lease_scheduler()
+        await stop_report_retention_scheduler()
+        await stop_employee_status_scheduler()
+        await stop_scheduler()
+        await event_bus.close()
+        # Write audit logs still waiting for their batch
+        await get_audit_log_batch_writer().close()
+        get_report_render_pool().shutdown()
+        logger.info("Shutting down application...")
+        return
+
     # Initialize RabbitMQ publisher on startup
     from app.shared.infrastructure.rabbitmq import get_rabbitmq_publisher
 
@@ -34,6 +75,7 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error closing RabbitMQ publisher: {e}")
 
+    get_report_render_pool().shutdown()
     logger.info("Shutting down application...")
 
 
@@ -45,6 +87,13 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.RESPONSE_COMPRESSION_MIN_SIZE,
+    gzip_level=settings.RESPONSE_COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.RESPONSE_COMPRESSION_BROTLI_QUALITY,
+)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.BACKEND_CORS_ORIGINS,
@@ -64,6 +113,13 @@ async def health_check():
     return {"status": "healthy", "service": "payroll-manager"}
 
 
+@app.get("/health/db")
+async def database_health_check():
+    from app.database import get_pool_status
+
+    return {"status": "healthy", "pool": get_pool_status()}
+
+
 @app.get("/")
 async def root():
     return {"message": "Payroll Manager API", "version": settings.VERSION}
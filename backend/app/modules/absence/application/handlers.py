@@ -23,6 +23,7 @@ from app.modules.absence.application.queries import (
 from app.modules.absence.domain.entities import Absence, AbsenceBalance
 from app.modules.absence.domain.events import (
     AbsenceApprovedEvent,
+    AbsenceBalanceUpdatedEvent,
     AbsenceCancelledEvent,
     AbsenceCreatedEvent,
     AbsenceRejectedEvent,
@@ -36,6 +37,7 @@ from app.modules.absence.infrastructure.read_model import (
     AbsenceReadModel,
 )
 from app.modules.absence.presentation.schemas import AbsenceBalanceResponse, AbsenceResponse
+from app.shared.domain.events import get_event_dispatcher
 from app.shared.domain.value_objects import DateRange
 
 
@@ -224,7 +226,9 @@ class CreateAbsenceBalanceHandler:
             total_days=command.total_days,
         )
 
-        return await self.balance_repository.save(balance)
+        saved = await self.balance_repository.save(balance)
+        await _dispatch_balance_updated(saved)
+        return saved
 
 
 class UpdateAbsenceBalanceHandler:
@@ -237,7 +241,22 @@ class UpdateAbsenceBalanceHandler:
             raise ValueError(f"Balance {command.balance_id} not found")
 
         balance.set_total_days(command.total_days)
-        return await self.balance_repository.save(balance)
+        saved = await self.balance_repository.save(balance)
+        await _dispatch_balance_updated(saved)
+        return saved
+
+
+async def _dispatch_balance_updated(balance: AbsenceBalance) -> None:
+    await get_event_dispatcher().dispatch(
+        AbsenceBalanceUpdatedEvent(
+            balance_id=balance.id,
+            employee_id=balance.employee_id,
+            absence_type=balance.absence_type.value,
+            year=balance.year,
+            total_days=balance.total_days,
+            used_days=balance.used_days,
+        )
+    )
 
 
 class GetAbsenceHandler:
@@ -1,6 +1,7 @@
 """Domain events for absence module"""
 
 from datetime import date
+from decimal import Decimal
 from uuid import UUID
 
 from app.shared.domain.events import DomainEvent
@@ -50,3 +51,14 @@ class AbsenceCancelledEvent(DomainEvent):
     end_date: date | None
     was_approved: bool
     cancelled_by: UUID | None
+
+
+class AbsenceBalanceUpdatedEvent(DomainEvent):
+    """Event raised when an absence balance is created or its total days change"""
+
+    balance_id: UUID
+    employee_id: UUID
+    absence_type: str
+    year: int
+    total_days: Decimal
+    used_days: Decimal
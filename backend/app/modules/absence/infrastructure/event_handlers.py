@@ -1,24 +1,33 @@
 """Event handlers for the absence module"""
 
 import logging
-from datetime import date, datetime
+from datetime import date
 from typing import Any
 from uuid import UUID
 
 from app.database import AsyncSessionLocal
 from app.modules.absence.application.commands import CreateAbsenceCommand
 from app.modules.absence.application.handlers import CreateAbsenceHandler
+from app.modules.absence.domain.events import (
+    AbsenceApprovedEvent,
+    AbsenceBalanceUpdatedEvent,
+    AbsenceCancelledEvent,
+    AbsenceCreatedEvent,
+    AbsenceRejectedEvent,
+)
 from app.modules.absence.domain.repository import (
     AbsenceBalanceRepository,
     AbsenceRepository,
 )
 from app.modules.absence.domain.value_objects import AbsenceType
+from app.modules.absence.infrastructure.read_model import ABSENCE_BALANCES_CACHE_NAMESPACE
 from app.modules.absence.infrastructure.repository import (
     SQLAlchemyAbsenceBalanceRepository,
     SQLAlchemyAbsenceRepository,
 )
 from app.modules.audit.domain.events import AuditLogCreatedEvent
 from app.shared.domain.events import get_event_dispatcher
+from app.shared.infrastructure.cache import get_read_model_cache
 from app.shared.infrastructure.event_registry import EventHandlerRegistry
 
 logger = logging.getLogger(__name__)
@@ -88,116 +97,130 @@ class AbsenceEventHandler:
 class AbsenceAuditEventHandler:
     """Handler that listens to absence events and emits audit events"""
 
-    async def handle_absence_created(self, event_data: dict[str, Any]) -> None:
+    async def handle_absence_created(self, event: AbsenceCreatedEvent) -> None:
         """Handle AbsenceCreatedEvent and emit AuditLogCreatedEvent"""
         try:
             audit_event = AuditLogCreatedEvent(
                 entity_type="ABSENCE",
-                entity_id=event_data["absence_id"],
+                entity_id=event.absence_id,
                 action="CREATED",
-                employee_id=event_data["employee_id"],
+                employee_id=event.employee_id,
                 old_values=None,
                 new_values={
-                    "absence_type": event_data["absence_type"],
-                    "start_date": event_data["start_date"],
-                    "end_date": event_data["end_date"],
-                    "reason": event_data.get("reason"),
-                    "status": event_data["status"],
+                    "absence_type": event.absence_type,
+                    "start_date": event.start_date,
+                    "end_date": event.end_date,
+                    "reason": event.reason,
+                    "status": event.status,
                 },
                 changed_by=None,
                 metadata={"source_event": "AbsenceCreatedEvent"},
-                occurred_at=datetime.fromisoformat(event_data["occurred_at"]),
+                occurred_at=event.occurred_at,
             )
 
             dispatcher = get_event_dispatcher()
-            await dispatcher.dispatch(audit_event)
+            await dispatcher.dispatch(audit_event, wait=True)
 
-            logger.info(f"Emitted audit event for absence created: {event_data['absence_id']}")
+            logger.info(f"Emitted audit event for absence created: {event.absence_id}")
         except Exception as e:
             logger.error(f"Failed to emit audit event for absence created: {e}")
+            raise
 
-    async def handle_absence_approved(self, event_data: dict[str, Any]) -> None:
+    async def handle_absence_approved(self, event: AbsenceApprovedEvent) -> None:
         """Handle AbsenceApprovedEvent and emit AuditLogCreatedEvent"""
         try:
             audit_event = AuditLogCreatedEvent(
                 entity_type="ABSENCE",
-                entity_id=event_data["absence_id"],
+                entity_id=event.absence_id,
                 action="APPROVED",
-                employee_id=event_data["employee_id"],
+                employee_id=event.employee_id,
                 old_values={"status": "pending"},
                 new_values={"status": "approved"},
-                changed_by=event_data.get("approved_by"),
+                changed_by=event.approved_by,
                 metadata={
                     "source_event": "AbsenceApprovedEvent",
-                    "absence_type": event_data["absence_type"],
-                    "start_date": event_data["start_date"],
-                    "end_date": event_data["end_date"],
+                    "absence_type": event.absence_type,
+                    "start_date": event.start_date,
+                    "end_date": event.end_date,
                 },
-                occurred_at=datetime.fromisoformat(event_data["occurred_at"]),
+                occurred_at=event.occurred_at,
             )
 
             dispatcher = get_event_dispatcher()
-            await dispatcher.dispatch(audit_event)
+            await dispatcher.dispatch(audit_event, wait=True)
 
-            logger.info(f"Emitted audit event for absence approved: {event_data['absence_id']}")
+            logger.info(f"Emitted audit event for absence approved: {event.absence_id}")
         except Exception as e:
             logger.error(f"Failed to emit audit event for absence approved: {e}")
+            raise
 
-    async def handle_absence_rejected(self, event_data: dict[str, Any]) -> None:
+    async def handle_absence_rejected(self, event: AbsenceRejectedEvent) -> None:
         """Handle AbsenceRejectedEvent and emit AuditLogCreatedEvent"""
         try:
             audit_event = AuditLogCreatedEvent(
                 entity_type="ABSENCE",
-                entity_id=event_data["absence_id"],
+                entity_id=event.absence_id,
                 action="REJECTED",
-                employee_id=event_data["employee_id"],
+                employee_id=event.employee_id,
                 old_values={"status": "pending"},
                 new_values={"status": "rejected"},
-                changed_by=event_data.get("rejected_by"),
+                changed_by=event.rejected_by,
                 metadata={
                     "source_event": "AbsenceRejectedEvent",
-                    "absence_type": event_data["absence_type"],
-                    "start_date": event_data["start_date"],
-                    "end_date": event_data["end_date"],
+                    "absence_type": event.absence_type,
+                    "start_date": event.start_date,
+                    "end_date": event.end_date,
                 },
-                occurred_at=datetime.fromisoformat(event_data["occurred_at"]),
+                occurred_at=event.occurred_at,
             )
 
             dispatcher = get_event_dispatcher()
-            await dispatcher.dispatch(audit_event)
+            await dispatcher.dispatch(audit_event, wait=True)
 
-            logger.info(f"Emitted audit event for absence rejected: {event_data['absence_id']}")
+            logger.info(f"Emitted audit event for absence rejected: {event.absence_id}")
         except Exception as e:
             logger.error(f"Failed to emit audit event for absence rejected: {e}")
+            raise
 
-    async def handle_absence_cancelled(self, event_data: dict[str, Any]) -> None:
+    async def handle_absence_cancelled(self, event: AbsenceCancelledEvent) -> None:
         """Handle AbsenceCancelledEvent and emit AuditLogCreatedEvent"""
         try:
-            old_status = "approved" if event_data["was_approved"] else "pending"
+            old_status = "approved" if event.was_approved else "pending"
             audit_event = AuditLogCreatedEvent(
                 entity_type="ABSENCE",
-                entity_id=event_data["absence_id"],
+                entity_id=event.absence_id,
                 action="CANCELED",  # Use American spelling to match AuditAction enum
-                employee_id=event_data["employee_id"],
+                employee_id=event.employee_id,
                 old_values={"status": old_status},
                 new_values={"status": "cancelled"},
-                changed_by=event_data.get("cancelled_by"),
+                changed_by=event.cancelled_by,
                 metadata={
                     "source_event": "AbsenceCancelledEvent",
-                    "absence_type": event_data["absence_type"],
-                    "start_date": event_data["start_date"],
-                    "end_date": event_data["end_date"],
-                    "was_approved": event_data["was_approved"],
+                    "absence_type": event.absence_type,
+                    "start_date": event.start_date,
+                    "end_date": event.end_date,
+                    "was_approved": event.was_approved,
                 },
-                occurred_at=datetime.fromisoformat(event_data["occurred_at"]),
+                occurred_at=event.occurred_at,
             )
 
             dispatcher = get_event_dispatcher()
-            await dispatcher.dispatch(audit_event)
+            await dispatcher.dispatch(audit_event, wait=True)
 
-            logger.info(f"Emitted audit event for absence cancelled: {event_data['absence_id']}")
+            logger.info(f"Emitted audit event for absence cancelled: {event.absence_id}")
         except Exception as e:
             logger.error(f"Failed to emit audit event for absence cancelled: {e}")
+            raise
+
+
+class AbsenceCacheInvalidationHandler:
+    """Drops an employee's cached absence balances when their used or total days change"""
+
+    async def handle_balance_changed(
+        self,
+        event: AbsenceApprovedEvent | AbsenceCancelledEvent | AbsenceBalanceUpdatedEvent,
+    ) -> None:
+        await get_read_model_cache().invalidate(ABSENCE_BALANCES_CACHE_NAMESPACE, event.employee_id)
 
 
 def register_absence_handlers(registry: EventHandlerRegistry) -> None:
@@ -216,9 +239,36 @@ def register_absence_audit_handlers(registry: EventHandlerRegistry) -> None:
     handler = AbsenceAuditEventHandler()
 
     # Listen to absence events and emit audit events
-    registry.register("absence.absence-created-event", handler.handle_absence_created)
-    registry.register("absence.absence-approved-event", handler.handle_absence_approved)
-    registry.register("absence.absence-rejected-event", handler.handle_absence_rejected)
-    registry.register("absence.absence-cancelled-event", handler.handle_absence_cancelled)
+    registry.register(
+        "absence.absence-created-event", handler.handle_absence_created, AbsenceCreatedEvent
+    )
+    registry.register(
+        "absence.absence-approved-event", handler.handle_absence_approved, AbsenceApprovedEvent
+    )
+    registry.register(
+        "absence.absence-rejected-event", handler.handle_absence_rejected, AbsenceRejectedEvent
+    )
+    registry.register(
+        "absence.absence-cancelled-event", handler.handle_absence_cancelled, AbsenceCancelledEvent
+    )
 
     logger.info("Registered absence audit event handlers")
+
+
+def register_absence_cache_handlers(registry: EventHandlerRegistry) -> None:
+    """Register handlers that invalidate cached absence balance read models"""
+    handler = AbsenceCacheInvalidationHandler()
+
+    registry.register(
+        "absence.absence-approved-event", handler.handle_balance_changed, AbsenceApprovedEvent
+    )
+    registry.register(
+        "absence.absence-cancelled-event", handler.handle_balance_changed, AbsenceCancelledEvent
+    )
+    registry.register(
+        "absence.absence-balance-updated-event",
+        handler.handle_balance_changed,
+        AbsenceBalanceUpdatedEvent,
+    )
+
+    logger.info("Registered absence cache invalidation handlers")
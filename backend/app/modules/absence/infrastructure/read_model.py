@@ -10,6 +10,12 @@ from app.modules.absence.presentation.schemas import (
     AbsenceBalanceResponse,
     AbsenceResponse,
 )
+from app.shared.infrastructure.cache import get_read_model_cache, invalidate_on_commit
+
+ABSENCE_BALANCES_CACHE_NAMESPACE = "absence-balances"
+invalidate_on_commit(
+    AbsenceBalanceModel, ABSENCE_BALANCES_CACHE_NAMESPACE, lambda row: row.employee_id
+)
 
 
 class AbsenceReadModel:
@@ -168,6 +174,16 @@ class AbsenceBalanceReadModel:
         return items, total_count
 
     async def get_by_employee(self, employee_id: UUID) -> list[AbsenceBalanceResponse]:
+        return await get_read_model_cache().get_or_load(
+            ABSENCE_BALANCES_CACHE_NAMESPACE,
+            employee_id,
+            "all",
+            list[AbsenceBalanceResponse],
+            lambda: self._load_by_employee(employee_id),
+            session=self.session,
+        )
+
+    async def _load_by_employee(self, employee_id: UUID) -> list[AbsenceBalanceResponse]:
         stmt = (
             select(AbsenceBalanceModel)
             .where(AbsenceBalanceModel.employee_id == employee_id)
@@ -191,6 +207,18 @@ class AbsenceBalanceReadModel:
 
     async def get_by_employee_and_year(
         self, employee_id: UUID, year: int
+    ) -> list[AbsenceBalanceResponse]:
+        return await get_read_model_cache().get_or_load(
+            ABSENCE_BALANCES_CACHE_NAMESPACE,
+            employee_id,
+            str(year),
+            list[AbsenceBalanceResponse],
+            lambda: self._load_by_employee_and_year(employee_id, year),
+            session=self.session,
+        )
+
+    async def _load_by_employee_and_year(
+        self, employee_id: UUID, year: int
     ) -> list[AbsenceBalanceResponse]:
         stmt = (
             select(AbsenceBalanceModel)
@@ -3,7 +3,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.modules.absence.application.commands import (
     ApproveAbsenceCommand,
     CancelAbsenceCommand,
@@ -118,7 +118,7 @@ async def create_absence(data: AbsenceCreate, session: AsyncSession = Depends(ge
 
 
 @router.get("/absences/{absence_id}", response_model=AbsenceResponse)
-async def get_absence(absence_id: UUID, session: AsyncSession = Depends(get_db)):
+async def get_absence(absence_id: UUID, session: AsyncSession = Depends(get_read_db)):
     handler = GetAbsenceHandler(session)
     query = GetAbsenceQuery(absence_id=absence_id)
 
@@ -134,7 +134,7 @@ async def list_absences(
     request: Request,
     page: int = 1,
     limit: int = 100,
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ):
     if page < 1:
         raise HTTPException(status_code=400, detail="Page must be >= 1")
@@ -158,7 +158,7 @@ async def list_absences(
 
 
 @router.get("/absences/employee/{employee_id}", response_model=AbsenceListResponse)
-async def get_absences_by_employee(employee_id: UUID, session: AsyncSession = Depends(get_db)):
+async def get_absences_by_employee(employee_id: UUID, session: AsyncSession = Depends(get_read_db)):
     handler = GetAbsencesByEmployeeHandler(session)
     query = GetAbsencesByEmployeeQuery(employee_id=employee_id)
     items = await handler.handle(query)
@@ -239,7 +239,7 @@ async def create_absence_balance(
 
 
 @router.get("/balances/{balance_id}", response_model=AbsenceBalanceResponse)
-async def get_absence_balance(balance_id: UUID, session: AsyncSession = Depends(get_db)):
+async def get_absence_balance(balance_id: UUID, session: AsyncSession = Depends(get_read_db)):
     handler = GetAbsenceBalanceHandler(session)
     query = GetAbsenceBalanceQuery(balance_id=balance_id)
 
@@ -255,7 +255,7 @@ async def list_absence_balances(
     request: Request,
     page: int = 1,
     limit: int = 100,
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ):
     if page < 1:
         raise HTTPException(status_code=400, detail="Page must be >= 1")
@@ -280,7 +280,7 @@ async def list_absence_balances(
 
 @router.get("/balances/employee/{employee_id}", response_model=AbsenceBalanceListResponse)
 async def get_absence_balances_by_employee(
-    employee_id: UUID, session: AsyncSession = Depends(get_db)
+    employee_id: UUID, session: AsyncSession = Depends(get_read_db)
 ):
     handler = GetAbsenceBalancesByEmployeeHandler(session)
     query = GetAbsenceBalancesByEmployeeQuery(employee_id=employee_id)
@@ -293,7 +293,7 @@ async def get_absence_balances_by_employee(
     response_model=AbsenceBalanceListResponse,
 )
 async def get_absence_balances_by_employee_and_year(
-    employee_id: UUID, year: int, session: AsyncSession = Depends(get_db)
+    employee_id: UUID, year: int, session: AsyncSession = Depends(get_read_db)
 ):
     handler = GetAbsenceBalancesByEmployeeAndYearHandler(session)
     query = GetAbsenceBalancesByEmployeeAndYearQuery(employee_id=employee_id, year=year)
@@ -11,6 +11,10 @@ class AuditLogRepository(ABC):
     async def save(self, audit_log: AuditLog) -> AuditLog:
         pass
 
+    @abstractmethod
+    async def save_many(self, audit_logs: list[AuditLog]) -> None:
+        pass
+
     @abstractmethod
     async def get_by_id(self, audit_id: UUID) -> AuditLog | None:
         pass
@@ -0,0 +1,142 @@
+"""Batched writer for audit logs"""
+
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.modules.audit.domain.models import AuditLog
+from app.modules.audit.infrastructure.repository import SQLAlchemyAuditLogRepository
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class AuditLogBatchWriter:
+    """
+    Accumulates audit logs and writes each batch in a single transaction.
+
+    A batch is written when it reaches max_batch_size rows or when max_wait_ms
+    has passed since its first row was submitted. submit() only returns once
+    the batch containing the row is committed, so a consumer that acks after
+    the handler returns acks the whole batch of messages together.
+
+    Batches are written in tasks of their own, so a cancelled submitter never
+    abandons the other rows of its batch. If a batch fails, its rows are
+    retried one by one and only the rows that still fail raise in their
+    submitter, so a single bad row does not fail every message in the batch.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        max_batch_size: int | None = None,
+        max_wait_ms: int | None = None,
+    ):
+        self.session_factory = session_factory
+        self.max_batch_size = max_batch_size or settings.AUDIT_BATCH_MAX_SIZE
+        wait_ms = settings.AUDIT_BATCH_MAX_WAIT_MS if max_wait_ms is None else max_wait_ms
+        self.max_wait = wait_ms / 1000
+        self._pending: list[tuple[AuditLog, asyncio.Future[None]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._write_tasks: set[asyncio.Task] = set()
+
+    async def submit(self, audit_log: AuditLog) -> None:
+        """Queue an audit log and wait until its batch has been committed"""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        self._pending.append((audit_log, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._start_write(self._take_batch())
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._on_timer)
+
+        await future
+
+    async def flush(self) -> None:
+        """Write whatever is currently pending"""
+        batch = self._take_batch()
+        if batch:
+            await asyncio.shield(self._start_write(batch))
+
+    async def close(self) -> None:
+        """Flush pending rows and wait for in-flight writes"""
+        await self.flush()
+        if self._write_tasks:
+            await asyncio.gather(*self._write_tasks, return_exceptions=True)
+
+    def _take_batch(self) -> list[tuple[AuditLog, asyncio.Future[None]]]:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        return batch
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        batch = self._take_batch()
+        if batch:
+            self._start_write(batch)
+
+    def _start_write(self, batch: list[tuple[AuditLog, asyncio.Future[None]]]) -> asyncio.Task:
+        task = asyncio.create_task(self._write(batch))
+        self._write_tasks.add(task)
+        task.add_done_callback(self._write_tasks.discard)
+        return task
+
+    async def _write(self, batch: list[tuple[AuditLog, asyncio.Future[None]]]) -> None:
+        try:
+            await self._save([audit_log for audit_log, _ in batch])
+        except Exception as e:
+            logger.error(f"Failed to write batch of {len(batch)} audit logs: {e}", exc_info=True)
+            if len(batch) == 1:
+                _resolve(batch[0][1], e)
+                return
+            # Retry row by row so only the rows that cannot be written fail
+            for audit_log, future in batch:
+                try:
+                    await self._save([audit_log])
+                except Exception as row_error:
+                    logger.error(f"Failed to write audit log {audit_log.id}: {row_error}")
+                    _resolve(future, row_error)
+                else:
+                    _resolve(future)
+            return
+
+        for _, future in batch:
+            _resolve(future)
+        logger.info(f"Wrote batch of {len(batch)} audit logs")
+
+    async def _save(self, audit_logs: list[AuditLog]) -> None:
+        async with self.session_factory() as session:
+            try:
+                repository = SQLAlchemyAuditLogRepository(session)
+                await repository.save_many(audit_logs)
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+
+def _resolve(future: asyncio.Future[None], error: Exception | None = None) -> None:
+    # The submitter may have been cancelled, which cancels its future
+    if future.done():
+        return
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
+
+
+_audit_log_batch_writer: AuditLogBatchWriter | None = None
+
+
+def get_audit_log_batch_writer() -> AuditLogBatchWriter:
+    """Shared writer of the audit handlers, closed on shutdown to flush pending rows"""
+    global _audit_log_batch_writer
+    if _audit_log_batch_writer is None:
+        _audit_log_batch_writer = AuditLogBatchWriter()
+    return _audit_log_batch_writer
@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.audit.domain.models import AuditLog
@@ -51,6 +51,29 @@ class SQLAlchemyAuditLogRepository(AuditLogRepository):
         await self.session.refresh(orm)
         return self._to_domain(orm)
 
+    async def save_many(self, audit_logs: list[AuditLog]) -> None:
+        """Persist audit logs with a single multi-row INSERT"""
+        if not audit_logs:
+            return
+
+        rows = [
+            {
+                "id": audit_log.id,
+                "entity_type": audit_log.entity_type,
+                "entity_id": audit_log.entity_id,
+                "employee_id": audit_log.employee_id,
+                "action": audit_log.action,
+                "old_values": audit_log.old_values,
+                "new_values": audit_log.new_values,
+                "changed_by": audit_log.changed_by,
+                "event_metadata": audit_log.metadata,
+                "occurred_at": audit_log.occurred_at,
+                "created_at": audit_log.created_at,
+            }
+            for audit_log in audit_logs
+        ]
+        await self.session.execute(insert(AuditLogORM), rows)
+
     async def get_by_id(self, audit_id: UUID) -> AuditLog | None:
         stmt = select(AuditLogORM).where(AuditLogORM.id == audit_id)
         result = await self.session.execute(stmt)
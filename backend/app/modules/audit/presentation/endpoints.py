@@ -5,7 +5,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_read_db
 from app.modules.audit.application.handlers import (
     GetAuditLogHandler,
     GetAuditLogsByEmployeeHandler,
@@ -33,7 +33,7 @@ async def list_audit_logs(
     limit: int = Query(100, ge=1, le=1000),
     entity_type: Optional[str] = None,
     action: Optional[str] = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> AuditLogListResponse:
     try:
         entity_type_enum = EntityType(entity_type) if entity_type else None
@@ -64,7 +64,7 @@ async def get_audit_logs_by_entity(
     entity_id: UUID,
     page: int = Query(1, ge=1),
     limit: int = Query(100, ge=1, le=1000),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> AuditLogListResponse:
     try:
         entity_type_enum = EntityType(entity_type)
@@ -87,7 +87,7 @@ async def get_audit_logs_by_employee(
     employee_id: UUID,
     page: int = Query(1, ge=1),
     limit: int = Query(100, ge=1, le=1000),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> AuditLogListResponse:
     handler = GetAuditLogsByEmployeeHandler(db)
     query = GetAuditLogsByEmployeeQuery(employee_id=employee_id, page=page, limit=limit)
@@ -104,7 +104,7 @@ async def get_audit_timeline(
     employee_id: Optional[UUID] = None,
     date_from: Optional[datetime] = None,
     date_to: Optional[datetime] = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> AuditLogListResponse:
     try:
         entity_type_enum = EntityType(entity_type) if entity_type else None
@@ -128,7 +128,9 @@ async def get_audit_timeline(
 
 
 @router.get("/{audit_id}", response_model=AuditLogResponse)
-async def get_audit_log(audit_id: UUID, db: AsyncSession = Depends(get_db)) -> AuditLogResponse:
+async def get_audit_log(
+    audit_id: UUID, db: AsyncSession = Depends(get_read_db)
+) -> AuditLogResponse:
     handler = GetAuditLogHandler(db)
     query = GetAuditLogQuery(audit_id=audit_id)
     audit_log = await handler.handle(query)
@@ -0,0 +1,157 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.modules.audit.domain.models import AuditLog
+from app.modules.audit.domain.value_objects import AuditAction, EntityType
+from app.modules.audit.infrastructure.batch_writer import AuditLogBatchWriter
+
+
+class FakeSession:
+    def __init__(self, factory: "FakeSessionFactory"):
+        self.factory = factory
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> bool:
+        return False
+
+    async def execute(self, statement, params=None):
+        if self.factory.fail:
+            raise RuntimeError("database unavailable")
+        if any(row["id"] in self.factory.poison for row in params):
+            raise ValueError("invalid audit log")
+        self.factory.batches.append(params)
+
+    async def commit(self) -> None:
+        await asyncio.sleep(self.factory.commit_delay)
+        self.factory.commits += 1
+
+    async def rollback(self) -> None:
+        self.factory.rollbacks += 1
+
+
+class FakeSessionFactory:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.poison: set = set()
+        self.commit_delay = 0.0
+        self.batches: list[list[dict]] = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def __call__(self) -> FakeSession:
+        return FakeSession(self)
+
+
+def make_audit_log() -> AuditLog:
+    return AuditLog.create(
+        entity_type=EntityType.EMPLOYEE,
+        entity_id=uuid4(),
+        action=AuditAction.CREATED,
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_is_written_when_full():
+    factory = FakeSessionFactory()
+    writer = AuditLogBatchWriter(factory, max_batch_size=3, max_wait_ms=10_000)
+
+    await asyncio.gather(*(writer.submit(make_audit_log()) for _ in range(3)))
+
+    assert len(factory.batches) == 1
+    assert len(factory.batches[0]) == 3
+    assert factory.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_is_written_after_max_wait():
+    factory = FakeSessionFactory()
+    writer = AuditLogBatchWriter(factory, max_batch_size=100, max_wait_ms=10)
+
+    await asyncio.gather(*(writer.submit(make_audit_log()) for _ in range(5)))
+
+    assert len(factory.batches) == 1
+    assert len(factory.batches[0]) == 5
+
+
+@pytest.mark.asyncio
+async def test_rows_are_mapped_to_orm_attributes():
+    factory = FakeSessionFactory()
+    writer = AuditLogBatchWriter(factory, max_batch_size=1)
+    audit_log = make_audit_log()
+
+    await writer.submit(audit_log)
+
+    row = factory.batches[0][0]
+    assert row["id"] == audit_log.id
+    assert row["entity_type"] == EntityType.EMPLOYEE
+    assert row["event_metadata"] == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_raises_for_every_submitter():
+    factory = FakeSessionFactory(fail=True)
+    writer = AuditLogBatchWriter(factory, max_batch_size=2, max_wait_ms=10_000)
+
+    results = await asyncio.gather(
+        writer.submit(make_audit_log()),
+        writer.submit(make_audit_log()),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    # The batch and then each of its rows
+    assert factory.rollbacks == 3
+    assert factory.commits == 0
+
+
+@pytest.mark.asyncio
+async def test_close_writes_pending_rows():
+    factory = FakeSessionFactory()
+    writer = AuditLogBatchWriter(factory, max_batch_size=100, max_wait_ms=60_000)
+
+    submits = [asyncio.create_task(writer.submit(make_audit_log())) for _ in range(2)]
+    await asyncio.sleep(0)
+    await writer.close()
+
+    await asyncio.gather(*submits)
+    assert len(factory.batches) == 1
+    assert len(factory.batches[0]) == 2
+
+
+@pytest.mark.asyncio
+async def test_bad_row_fails_only_its_own_submitter():
+    factory = FakeSessionFactory()
+    writer = AuditLogBatchWriter(factory, max_batch_size=3, max_wait_ms=10_000)
+    audit_logs = [make_audit_log() for _ in range(3)]
+    factory.poison = {audit_logs[1].id}
+
+    results = await asyncio.gather(
+        *(writer.submit(audit_log) for audit_log in audit_logs), return_exceptions=True
+    )
+
+    assert results[0] is None
+    assert isinstance(results[1], ValueError)
+    assert results[2] is None
+    assert [len(batch) for batch in factory.batches] == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_submitter_does_not_abandon_its_batch():
+    factory = FakeSessionFactory()
+    factory.commit_delay = 0.05
+    writer = AuditLogBatchWriter(factory, max_batch_size=2, max_wait_ms=10_000)
+
+    first = asyncio.create_task(writer.submit(make_audit_log()))
+    await asyncio.sleep(0)
+    # This submitter fills the batch and is cancelled while the batch is written
+    second = asyncio.create_task(writer.submit(make_audit_log()))
+    await asyncio.sleep(0)
+    second.cancel()
+
+    await asyncio.wait_for(first, timeout=1)
+    assert len(factory.batches) == 1
+    assert len(factory.batches[0]) == 2
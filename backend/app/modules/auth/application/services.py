@@ -72,7 +72,10 @@ class AuthenticationService:
         payload = self.decode_access_token(token)
         if payload is None:
             return None
+        return await self.get_user_from_claims(payload)
 
+    async def get_user_from_claims(self, payload: dict[str, Any]) -> User | None:
+        """Get the active user identified by verified access token claims."""
         user_id: str | None = payload.get("sub")
         if user_id is None:
             return None
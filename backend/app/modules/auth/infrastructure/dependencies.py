@@ -1,13 +1,15 @@
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.modules.auth.application.services import AuthenticationService
 from app.modules.auth.domain.models import User
+from app.modules.auth.infrastructure.middleware import TOKEN_CLAIMS_STATE
 from app.modules.auth.infrastructure.repository import SqlAlchemyUserRepository
+from app.modules.auth.infrastructure.token_cache import get_token_claims_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login", auto_error=False)
@@ -27,7 +29,17 @@ async def get_auth_service(
     return AuthenticationService(repository)
 
 
+def _get_token_claims(request: Request, token: str) -> dict[str, Any] | None:
+    """Claims verified by AuthContextMiddleware, or verify the token when it did not run."""
+    try:
+        claims: dict[str, Any] | None = getattr(request.state, TOKEN_CLAIMS_STATE)
+    except AttributeError:
+        claims = get_token_claims_cache().decode(token)
+    return claims
+
+
 async def get_current_user(
+    request: Request,
     token: Annotated[str, Depends(oauth2_scheme)],
     auth_service: Annotated[AuthenticationService, Depends(get_auth_service)],
 ) -> User:
@@ -38,7 +50,11 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    user = await auth_service.get_current_user(token)
+    claims = _get_token_claims(request, token)
+    if claims is None:
+        raise credentials_exception
+
+    user = await auth_service.get_user_from_claims(claims)
     if user is None:
         raise credentials_exception
 
@@ -54,10 +70,14 @@ async def get_current_active_user(current_user: Annotated[User, Depends(get_curr
 
 # Optional: get user ID or None (for endpoints that work with or without auth)
 async def get_optional_current_user(
+    request: Request,
     token: str | None = Depends(oauth2_scheme_optional),
     auth_service: AuthenticationService = Depends(get_auth_service),
 ) -> User | None:
     """Get current user if authenticated, None otherwise."""
     if token is None:
         return None
-    return await auth_service.get_current_user(token)
+    claims = _get_token_claims(request, token)
+    if claims is None:
+        return None
+    return await auth_service.get_user_from_claims(claims)
@@ -1,44 +1,54 @@
 """Authentication middleware for setting current user context."""
 
 import logging
-from typing import Callable
+from uuid import UUID
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.security.utils import get_authorization_scheme_param
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from app.modules.auth.application.services import AuthenticationService
-from app.shared.infrastructure.context import set_current_user_id
+from app.modules.auth.infrastructure.token_cache import get_token_claims_cache
+from app.shared.infrastructure.context import current_user_id
 
 logger = logging.getLogger(__name__)
 
+# request.state attribute holding the verified claims of the bearer token, or None
+TOKEN_CLAIMS_STATE = "token_claims"
 
-class AuthContextMiddleware(BaseHTTPMiddleware):
-    """Middleware to extract user from JWT and set in context."""
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Reset context for each request
-        set_current_user_id(None)
+class AuthContextMiddleware:
+    """
+    Pure ASGI middleware that verifies the bearer token once per request.
 
-        # Skip auth for OPTIONS requests (CORS preflight)
-        if request.method == "OPTIONS":
-            return await call_next(request)
+    The claims are stored in request.state for get_current_user and the user
+    ID is set in the request context for the rest of the request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        # Try to extract user from Authorization header
-        authorization: str | None = request.headers.get("Authorization")
-        if authorization and authorization.startswith("Bearer "):
-            token = authorization.replace("Bearer ", "")
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Skip auth for OPTIONS requests (CORS preflight)
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        claims = None
+        scheme, token = get_authorization_scheme_param(Headers(scope=scope).get("Authorization"))
+        if scheme.lower() == "bearer" and token:
+            claims = get_token_claims_cache().decode(token)
+        scope.setdefault("state", {})[TOKEN_CLAIMS_STATE] = claims
+
+        user_id = None
+        if claims is not None and "sub" in claims:
             try:
-                # Decode token to get user ID
-                payload = AuthenticationService.decode_access_token(token)
-                if payload and "sub" in payload:
-                    from uuid import UUID
-
-                    user_id = UUID(payload["sub"])
-                    set_current_user_id(user_id)
-                    logger.info(f"Set current user ID in context: {user_id}")
-            except Exception as e:
-                # If token is invalid, just continue without user context
-                logger.warning(f"Failed to decode token: {e}")
-
-        response = await call_next(request)
-        return response
+                user_id = UUID(str(claims["sub"]))
+            except ValueError:
+                # If the subject is malformed, just continue without user context
+                logger.warning(f"Invalid subject in access token: {claims['sub']}")
+
+        context_token = current_user_id.set(user_id)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_user_id.reset(context_token)
@@ -0,0 +1,70 @@
+"""
+In-process cache of verified access token claims.
+
+Verifying a JWT signature on every request is the most expensive part of
+authentication that does not touch the database. Claims of a verified token
+are kept in an LRU keyed by the token until the token's exp, so repeated
+requests with the same token skip verification. Invalid tokens are never
+cached.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+from app.config import get_settings
+from app.modules.auth.application.services import AuthenticationService
+
+settings = get_settings()
+
+
+class TokenClaimsCache:
+    def __init__(self, max_size: int | None = None):
+        self.max_size = max_size or settings.AUTH_TOKEN_CACHE_SIZE
+        self._entries: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        entry = self._entries.get(token)
+        if entry is None:
+            return None
+        claims, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[token]
+            return None
+        self._entries.move_to_end(token)
+        return claims
+
+    def put(self, token: str, claims: dict[str, Any]) -> None:
+        expires_at = claims.get("exp")
+        if not isinstance(expires_at, int | float):
+            # Tokens without an expiry would never leave the cache on their own
+            return
+        self._entries[token] = (claims, float(expires_at))
+        self._entries.move_to_end(token)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def decode(self, token: str) -> dict[str, Any] | None:
+        """Return the verified claims of token, or None if it is invalid or expired"""
+        claims = self.get(token)
+        if claims is None:
+            claims = AuthenticationService.decode_access_token(token)
+            if claims is not None:
+                self.put(token, claims)
+        return claims
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_token_claims_cache: TokenClaimsCache | None = None
+
+
+def get_token_claims_cache() -> TokenClaimsCache:
+    global _token_claims_cache
+    if _token_claims_cache is None:
+        _token_claims_cache = TokenClaimsCache()
+    return _token_claims_cache
@@ -0,0 +1,89 @@
+import time
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.modules.auth.application.services import AuthenticationService
+from app.modules.auth.infrastructure.middleware import AuthContextMiddleware
+from app.modules.auth.infrastructure.token_cache import TokenClaimsCache
+from app.shared.infrastructure.context import get_current_user_id
+
+
+def make_token(user_id, expires_delta: timedelta = timedelta(minutes=5)) -> str:
+    return AuthenticationService.create_access_token({"sub": str(user_id)}, expires_delta)
+
+
+async def whoami(request):
+    claims = request.state.token_claims
+    return JSONResponse(
+        {
+            "sub": claims["sub"] if claims else None,
+            "context_user_id": str(get_current_user_id()) if get_current_user_id() else None,
+        }
+    )
+
+
+def test_claims_are_cached_until_the_token_expires(monkeypatch):
+    cache = TokenClaimsCache(max_size=10)
+    token = make_token(uuid4())
+    calls = 0
+    decode = AuthenticationService.decode_access_token
+
+    def counting_decode(value):
+        nonlocal calls
+        calls += 1
+        return decode(value)
+
+    monkeypatch.setattr(AuthenticationService, "decode_access_token", counting_decode)
+
+    assert cache.decode(token) == cache.decode(token)
+    assert calls == 1
+
+    expires_at = cache.get(token)["exp"]
+    monkeypatch.setattr(time, "time", lambda: expires_at + 1)
+    assert cache.get(token) is None
+    assert len(cache) == 0
+
+
+def test_invalid_tokens_are_not_cached():
+    cache = TokenClaimsCache(max_size=10)
+
+    assert cache.decode("not-a-jwt") is None
+    assert cache.decode(make_token(uuid4(), timedelta(seconds=-1))) is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_tokens_are_evicted():
+    cache = TokenClaimsCache(max_size=2)
+    first, second, third = (make_token(uuid4()) for _ in range(3))
+
+    cache.decode(first)
+    cache.decode(second)
+    cache.decode(first)
+    cache.decode(third)
+
+    assert cache.get(first) is not None
+    assert cache.get(second) is None
+    assert cache.get(third) is not None
+
+
+@pytest.mark.asyncio
+async def test_middleware_shares_claims_and_user_context():
+    app = Starlette(routes=[Route("/whoami", whoami)])
+    app.add_middleware(AuthContextMiddleware)
+    user_id = uuid4()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        authenticated = await client.get(
+            "/whoami", headers={"Authorization": f"Bearer {make_token(user_id)}"}
+        )
+        anonymous = await client.get("/whoami", headers={"Authorization": "Bearer invalid"})
+
+    assert authenticated.json() == {"sub": str(user_id), "context_user_id": str(user_id)}
+    assert anonymous.json() == {"sub": None, "context_user_id": None}
+    assert get_current_user_id() is None
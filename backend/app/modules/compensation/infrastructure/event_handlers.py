@@ -1,120 +1,124 @@
 import logging
 from datetime import datetime
-from typing import Any
 
 from app.modules.audit.domain.events import AuditLogCreatedEvent
 from app.modules.compensation.application.commands import CreateRateCommand
 from app.modules.compensation.application.handlers import CreateRateHandler
+from app.modules.compensation.domain.events import (
+    BonusCreatedEvent,
+    DeductionCreatedEvent,
+    OvertimeCreatedEvent,
+    RateCreatedEvent,
+    SickLeaveCreatedEvent,
+)
 from app.modules.compensation.domain.value_objects import RateType
+from app.modules.compensation.infrastructure.read_model import RATES_CACHE_NAMESPACE
 from app.modules.compensation.infrastructure.repository import SQLAlchemyRateRepository
+from app.modules.contract.domain.events import ContractCreatedEvent
 from app.shared.domain.events import get_event_dispatcher
+from app.shared.infrastructure.cache import get_read_model_cache
 from app.shared.infrastructure.event_registry import EventHandlerRegistry
 
 logger = logging.getLogger(__name__)
 
 
 class CompensationEventHandler:
-    async def handle_rate_created(self, event_data: dict[str, Any]) -> None:
+    async def handle_rate_created(self, event: RateCreatedEvent) -> None:
         try:
             audit_event = AuditLogCreatedEvent(
                 entity_type="RATE",
-                entity_id=event_data["rate_id"],
+                entity_id=event.rate_id,
                 action="CREATED",
-                employee_id=event_data["employee_id"],
+                employee_id=event.employee_id,
                 old_values=None,
                 new_values={
-                    "rate_type": event_data["rate_type"],
-                    "amount": str(event_data["amount"]),
-                    "currency": event_data["currency"],
-                    "valid_from": event_data["valid_from"].isoformat(),
-                    "valid_to": event_data["valid_to"].isoformat()
-                    if event_data.get("valid_to")
-                    else None,
+                    "rate_type": event.rate_type,
+                    "amount": str(event.amount),
+                    "currency": event.currency,
+                    "valid_from": event.valid_from.isoformat(),
+                    "valid_to": event.valid_to.isoformat() if event.valid_to else None,
                 },
                 changed_by=None,
                 occurred_at=datetime.utcnow(),
                 metadata={
                     "event_type": "RateCreatedEvent",
-                    "rate_type": event_data["rate_type"],
+                    "rate_type": event.rate_type,
                 },
             )
-            await get_event_dispatcher().dispatch(audit_event)
-            logger.info(f"Published audit event for rate creation: {event_data['rate_id']}")
+            await get_event_dispatcher().dispatch(audit_event, wait=True)
+            logger.info(f"Published audit event for rate creation: {event.rate_id}")
         except Exception as e:
             logger.error(f"Error handling rate created event: {e}")
+            raise
 
-    async def handle_bonus_created(self, event_data: dict[str, Any]) -> None:
+    async def handle_bonus_created(self, event: BonusCreatedEvent) -> None:
         try:
             audit_event = AuditLogCreatedEvent(
                 entity_type="BONUS",
-                entity_id=event_data["bonus_id"],
+                entity_id=event.bonus_id,
                 action="CREATED",
-                employee_id=event_data["employee_id"],
+                employee_id=event.employee_id,
                 old_values=None,
                 new_values={
-                    "bonus_type": event_data["bonus_type"],
-                    "amount": str(event_data["amount"]),
-                    "currency": event_data["currency"],
-                    "payment_date": event_data["payment_date"].isoformat(),
+                    "bonus_type": event.bonus_type,
+                    "amount": str(event.amount),
+                    "currency": event.currency,
+                    "payment_date": event.payment_date.isoformat(),
                 },
                 changed_by=None,
                 occurred_at=datetime.utcnow(),
                 metadata={
                     "event_type": "BonusCreatedEvent",
-                    "bonus_type": event_data["bonus_type"],
+                    "bonus_type": event.bonus_type,
                 },
             )
-            await get_event_dispatcher().dispatch(audit_event)
-            logger.info(f"Published audit event for bonus creation: {event_data['bonus_id']}")
+            await get_event_dispatcher().dispatch(audit_event, wait=True)
+            logger.info(f"Published audit event for bonus creation: {event.bonus_id}")
         except Exception as e:
             logger.error(f"Error handling bonus created event: {e}")
+            raise
 
-    async def handle_deduction_created(self, event_data: dict[str, Any]) -> None:
+    async def handle_deduction_created(self, event: DeductionCreatedEvent) -> None:
         try:
             audit_event = AuditLogCreatedEvent(
                 entity_type="DEDUCTION",
-                entity_id=event_data["deduction_id"],
+                entity_id=event.deduction_id,
                 action="CREATED",
-                employee_id=event_data["employee_id"],
+                employee_id=event.employee_id,
                 old_values=None,
                 new_values={
-                    "deduction_type": event_data["deduction_type"],
-                    "amount": str(event_data["amount"]),
-                    "currency": event_data["currency"],
-                    "valid_from": event_data["valid_from"].isoformat(),
-                    "valid_to": event_data["valid_to"].isoformat()
-                    if event_data.get("valid_to")
-                    else None,
+                    "deduction_type": event.deduction_type,
+                    "amount": str(event.amount),
+                    "currency": event.currency,
+                    "valid_from": event.valid_from.isoformat(),
+                    "valid_to": event.valid_to.isoformat() if event.valid_to else None,
                 },
                 changed_by=None,
                 occurred_at=datetime.utcnow(),
                 metadata={
                     "event_type": "DeductionCreatedEvent",
-                    "deduction_type": event_data["deduction_type"],
+                    "deduction_type": event.deduction_type,
                 },
             )
-            await get_event_dispatcher().dispatch(audit_event)
-            logger.info(
-                f"Published audit event for deduction creation: {event_data['deduction_id']}"
-            )
+            await get_event_dispatcher().dispatch(audit_event, wait=True)
+            logger.info(f"Published audit event for deduction creation: {event.deduction_id}")
         except Exception as e:
             logger.error(f"Error handling deduction created event: {e}")
+            raise
 
-    async def handle_overtime_created(self, event_data: dict[str, Any]) -> None:
+    async def handle_overtime_created(self, event: OvertimeCreatedEvent) -> None:
         try:
             audit_event = AuditLogCreatedEvent(
                 entity_type="OVERTIME",
-                entity_id=event_data["overtime_id"],
+                entity_id=event.overtime_id,
                 action="CREATED",
-                employee_id=event_data["employee_id"],
+                employee_id=event.employee_id,
                 old_values=None,
                 new_values={
-                    "multiplier": str(event_data["multiplier"]),
-                    "threshold_hours": event_data["threshold_hours"],
-                    "valid_from": event_data["valid_from"].isoformat(),
-                    "valid_to": event_data["valid_to"].isoformat()
-                    if event_data.get("valid_to")
-                    else None,
+                    "multiplier": str(event.multiplier),
+                    "threshold_hours": event.threshold_hours,
+                    "valid_from": event.valid_from.isoformat(),
+                    "valid_to": event.valid_to.isoformat() if event.valid_to else None,
                 },
                 changed_by=None,
                 occurred_at=datetime.utcnow(),
@@ -122,26 +126,25 @@ class CompensationEventHandler:
                     "event_type": "OvertimeCreatedEvent",
                 },
             )
-            await get_event_dispatcher().dispatch(audit_event)
-            logger.info(f"Published audit event for overtime creation: {event_data['overtime_id']}")
+            await get_event_dispatcher().dispatch(audit_event, wait=True)
+            logger.info(f"Published audit event for overtime creation: {event.overtime_id}")
         except Exception as e:
             logger.error(f"Error handling overtime created event: {e}")
+            raise
 
-    async def handle_sick_leave_created(self, event_data: dict[str, Any]) -> None:
+    async def handle_sick_leave_created(self, event: SickLeaveCreatedEvent) -> None:
         try:
             audit_event = AuditLogCreatedEvent(
                 entity_type="SICK_LEAVE",
-                entity_id=event_data["sick_leave_id"],
+                entity_id=event.sick_leave_id,
                 action="CREATED",
-                employee_id=event_data["employee_id"],
+                employee_id=event.employee_id,
                 old_values=None,
                 new_values={
-                    "percentage": str(event_data["percentage"]),
-                    "max_days": event_data.get("max_days"),
-                    "valid_from": event_data["valid_from"].isoformat(),
-                    "valid_to": event_data["valid_to"].isoformat()
-                    if event_data.get("valid_to")
-                    else None,
+                    "percentage": str(event.percentage),
+                    "max_days": event.max_days,
+                    "valid_from": event.valid_from.isoformat(),
+                    "valid_to": event.valid_to.isoformat() if event.valid_to else None,
                 },
                 changed_by=None,
                 occurred_at=datetime.utcnow(),
@@ -149,65 +152,24 @@ class CompensationEventHandler:
                     "event_type": "SickLeaveCreatedEvent",
                 },
             )
-            await get_event_dispatcher().dispatch(audit_event)
-            logger.info(
-                f"Published audit event for sick leave creation: {event_data['sick_leave_id']}"
-            )
+            await get_event_dispatcher().dispatch(audit_event, wait=True)
+            logger.info(f"Published audit event for sick leave creation: {event.sick_leave_id}")
         except Exception as e:
             logger.error(f"Error handling sick leave created event: {e}")
+            raise
 
-    async def handle_contract_created(self, event_data: dict[str, Any]) -> None:
-        """Handle ContractCreatedEvent: emit audit event AND automatically create a Rate"""
-        from datetime import date, datetime
-
-        # First, emit audit event for the contract creation
-        try:
-            # Handle date fields - convert to date objects if they're strings
-            valid_from = event_data["valid_from"]
-            if isinstance(valid_from, str):
-                valid_from = date.fromisoformat(valid_from)
-
-            valid_to = event_data.get("valid_to")
-            if valid_to and isinstance(valid_to, str):
-                valid_to = date.fromisoformat(valid_to)
-
-            audit_event = AuditLogCreatedEvent(
-                entity_type="CONTRACT",
-                entity_id=event_data["contract_id"],
-                action="CREATED",
-                employee_id=event_data["employee_id"],
-                old_values=None,
-                new_values={
-                    "contract_type": event_data["contract_type"],
-                    "rate_amount": str(event_data["rate_amount"]),
-                    "rate_currency": event_data["rate_currency"],
-                    "valid_from": valid_from.isoformat()
-                    if hasattr(valid_from, "isoformat")
-                    else str(valid_from),
-                    "valid_to": valid_to.isoformat()
-                    if valid_to and hasattr(valid_to, "isoformat")
-                    else (str(valid_to) if valid_to else None),
-                },
-                changed_by=None,  # System-generated
-                occurred_at=datetime.now(),
-                metadata={
-                    "event_type": "ContractCreatedEvent",
-                    "contract_type": event_data["contract_type"],
-                },
-            )
-            await get_event_dispatcher().dispatch(audit_event)
-            logger.info(f"Published audit event for contract creation: {event_data['contract_id']}")
-        except Exception as e:
-            logger.error(f"Error emitting audit event for contract: {e}")
-
-        # Then, automatically create a Rate from the contract
+    async def handle_contract_created(self, event: ContractCreatedEvent) -> None:
+        """
+        Handle ContractCreatedEvent: automatically create a Rate.
+        The contract audit log is emitted by the contract module's own handler.
+        """
         try:
             from app.database import get_db
 
-            logger.info(f"Creating automatic rate from contract: {event_data['contract_id']}")
+            logger.info(f"Creating automatic rate from contract: {event.contract_id}")
 
             # Map contract type to rate type
-            contract_type = event_data["contract_type"]
+            contract_type = event.contract_type
             rate_type_mapping = {
                 "fixed_monthly": RateType.BASE_SALARY,
                 "hourly": RateType.HOURLY_RATE,
@@ -219,33 +181,15 @@ class CompensationEventHandler:
 
             rate_type = rate_type_mapping.get(contract_type, RateType.BASE_SALARY)
 
-            # Handle date fields for rate command
-            rate_valid_from = event_data["valid_from"]
-            if isinstance(rate_valid_from, str):
-                rate_valid_from = date.fromisoformat(rate_valid_from)
-
-            rate_valid_to = event_data.get("valid_to")
-            if rate_valid_to and isinstance(rate_valid_to, str):
-                rate_valid_to = date.fromisoformat(rate_valid_to)
-
-            # Handle amount - ensure it's a Decimal
-            from decimal import Decimal
-
-            rate_amount = event_data["rate_amount"]
-            if isinstance(rate_amount, str):
-                rate_amount = Decimal(rate_amount)
-            elif not isinstance(rate_amount, Decimal):
-                rate_amount = Decimal(str(rate_amount))
-
             # Create rate command
             command = CreateRateCommand(
-                employee_id=event_data["employee_id"],
+                employee_id=event.employee_id,
                 rate_type=rate_type,
-                amount=rate_amount,
-                currency=event_data["rate_currency"],
-                valid_from=rate_valid_from,
-                valid_to=rate_valid_to,
-                description=f"Auto-created from contract {event_data['contract_id']}",
+                amount=event.rate_amount,
+                currency=event.rate_currency,
+                valid_from=event.valid_from,
+                valid_to=event.valid_to,
+                description=f"Auto-created from contract {event.contract_id}",
             )
 
             # Get database session and create rate
@@ -256,7 +200,7 @@ class CompensationEventHandler:
                     rate = await handler.handle(command)
                     await session.commit()
                     logger.info(
-                        f"Successfully created rate {rate.id} from contract {event_data['contract_id']}"
+                        f"Successfully created rate {rate.id} from contract {event.contract_id}"
                     )
                     break
                 except Exception as e:
@@ -268,19 +212,55 @@ class CompensationEventHandler:
             logger.error(
                 f"Error handling contract created event for compensation: {e}", exc_info=True
             )
+            # Re-raise so the consumer retries the event instead of dropping it
+            raise
+
+
+class CompensationCacheInvalidationHandler:
+    """Drops an employee's cached active rates when a rate is added"""
+
+    async def handle_rate_created(self, event: RateCreatedEvent) -> None:
+        await get_read_model_cache().invalidate(RATES_CACHE_NAMESPACE, event.employee_id)
 
 
 def register_compensation_handlers(registry: EventHandlerRegistry) -> None:
     handler = CompensationEventHandler()
 
     # Register compensation event handlers (for audit logging)
-    registry.register("compensation.rate-created-event", handler.handle_rate_created)
-    registry.register("compensation.bonus-created-event", handler.handle_bonus_created)
-    registry.register("compensation.deduction-created-event", handler.handle_deduction_created)
-    registry.register("compensation.overtime-created-event", handler.handle_overtime_created)
-    registry.register("compensation.sick-leave-created-event", handler.handle_sick_leave_created)
+    registry.register(
+        "compensation.rate-created-event", handler.handle_rate_created, RateCreatedEvent
+    )
+    registry.register(
+        "compensation.bonus-created-event", handler.handle_bonus_created, BonusCreatedEvent
+    )
+    registry.register(
+        "compensation.deduction-created-event",
+        handler.handle_deduction_created,
+        DeductionCreatedEvent,
+    )
+    registry.register(
+        "compensation.overtime-created-event", handler.handle_overtime_created, OvertimeCreatedEvent
+    )
+    registry.register(
+        "compensation.sick-leave-created-event",
+        handler.handle_sick_leave_created,
+        SickLeaveCreatedEvent,
+    )
 
     # Register contract event handler (for automatic rate creation)
-    registry.register("contract.contract-created-event", handler.handle_contract_created)
+    registry.register(
+        "contract.contract-created-event", handler.handle_contract_created, ContractCreatedEvent
+    )
 
     logger.info("Registered compensation event handlers")
+
+
+def register_compensation_cache_handlers(registry: EventHandlerRegistry) -> None:
+    """Register handlers that invalidate cached compensation read models"""
+    handler = CompensationCacheInvalidationHandler()
+
+    registry.register(
+        "compensation.rate-created-event", handler.handle_rate_created, RateCreatedEvent
+    )
+
+    logger.info("Registered compensation cache invalidation handlers")
@@ -7,6 +7,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.compensation.infrastructure.models import BonusORM, RateORM
 from app.modules.compensation.presentation.views import BonusView, RateView
+from app.shared.infrastructure.cache import get_read_model_cache, invalidate_on_commit
+
+RATES_CACHE_NAMESPACE = "rates"
+invalidate_on_commit(RateORM, RATES_CACHE_NAMESPACE, lambda row: row.employee_id)
 
 
 class RateReadModel:
@@ -90,6 +94,16 @@ class RateReadModel:
         ]
 
     async def get_active_rate(self, employee_id: UUID, check_date: date) -> Optional[RateView]:
+        return await get_read_model_cache().get_or_load(
+            RATES_CACHE_NAMESPACE,
+            employee_id,
+            check_date.isoformat(),
+            RateView,
+            lambda: self._load_active_rate(employee_id, check_date),
+            session=self.session,
+        )
+
+    async def _load_active_rate(self, employee_id: UUID, check_date: date) -> Optional[RateView]:
         stmt = (
             select(RateORM)
             .where(RateORM.employee_id == employee_id)
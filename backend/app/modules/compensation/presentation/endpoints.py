@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.modules.auth.infrastructure.dependencies import get_current_active_user
 from app.modules.compensation.application.commands import CreateBonusCommand, CreateRateCommand
 from app.modules.compensation.application.handlers import (
@@ -93,7 +93,7 @@ async def create_rate(request: CreateRateRequest, db: AsyncSession = Depends(get
 
 
 @router.get("/rates/{rate_id}", response_model=RateView)
-async def get_rate(rate_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_rate(rate_id: UUID, db: AsyncSession = Depends(get_read_db)):
     read_model = RateReadModel(db)
     handler = GetRateHandler(read_model)
 
@@ -111,7 +111,7 @@ async def list_rates(
     request: Request,
     page: int = 1,
     limit: int = 100,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     if page < 1:
         raise HTTPException(status_code=400, detail="Page must be >= 1")
@@ -135,7 +135,7 @@ async def list_rates(
 
 
 @router.get("/rates/employee/{employee_id}", response_model=RateListResponse)
-async def get_rates_by_employee(employee_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_rates_by_employee(employee_id: UUID, db: AsyncSession = Depends(get_read_db)):
     read_model = RateReadModel(db)
     handler = GetRatesByEmployeeHandler(read_model)
 
@@ -147,7 +147,7 @@ async def get_rates_by_employee(employee_id: UUID, db: AsyncSession = Depends(ge
 
 @router.get("/rates/employee/{employee_id}/active", response_model=RateView)
 async def get_active_rate(
-    employee_id: UUID, check_date: date = date.today(), db: AsyncSession = Depends(get_db)
+    employee_id: UUID, check_date: date = date.today(), db: AsyncSession = Depends(get_read_db)
 ):
     read_model = RateReadModel(db)
     handler = GetActiveRateHandler(read_model)
@@ -188,7 +188,7 @@ async def create_bonus(request: CreateBonusRequest, db: AsyncSession = Depends(g
 
 
 @router.get("/bonuses/{bonus_id}", response_model=BonusView)
-async def get_bonus(bonus_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_bonus(bonus_id: UUID, db: AsyncSession = Depends(get_read_db)):
     read_model = BonusReadModel(db)
     handler = GetBonusHandler(read_model)
 
@@ -206,7 +206,7 @@ async def list_bonuses(
     request: Request,
     page: int = 1,
     limit: int = 100,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     if page < 1:
         raise HTTPException(status_code=400, detail="Page must be >= 1")
@@ -230,7 +230,7 @@ async def list_bonuses(
 
 
 @router.get("/bonuses/employee/{employee_id}", response_model=BonusListResponse)
-async def get_bonuses_by_employee(employee_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_bonuses_by_employee(employee_id: UUID, db: AsyncSession = Depends(get_read_db)):
     read_model = BonusReadModel(db)
     handler = GetBonusesByEmployeeHandler(read_model)
 
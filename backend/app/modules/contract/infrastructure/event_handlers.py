@@ -1,11 +1,17 @@
 """Event handlers for contract module to emit audit events"""
 
 import logging
-from datetime import datetime
-from typing import Any
 
 from app.modules.audit.domain.events import AuditLogCreatedEvent
+from app.modules.contract.domain.events import (
+    ContractActivatedEvent,
+    ContractCanceledEvent,
+    ContractCreatedEvent,
+    ContractExpiredEvent,
+)
+from app.modules.contract.infrastructure.read_model import ACTIVE_CONTRACTS_CACHE_NAMESPACE
 from app.shared.domain.events import get_event_dispatcher
+from app.shared.infrastructure.cache import get_read_model_cache
 from app.shared.infrastructure.event_registry import EventHandlerRegistry
 
 logger = logging.getLogger(__name__)
@@ -14,112 +20,129 @@ logger = logging.getLogger(__name__)
 class ContractAuditEventHandler:
     """Handler that listens to contract events and emits audit events"""
 
-    async def handle_contract_created(self, event_data: dict[str, Any]) -> None:
+    async def handle_contract_created(self, event: ContractCreatedEvent) -> None:
         """Handle ContractCreatedEvent and emit AuditLogCreatedEvent"""
         try:
             audit_event = AuditLogCreatedEvent(
                 entity_type="CONTRACT",
-                entity_id=event_data["contract_id"],
+                entity_id=event.contract_id,
                 action="CREATED",
-                employee_id=event_data["employee_id"],
+                employee_id=event.employee_id,
                 old_values=None,
                 new_values={
-                    "contract_type": event_data["contract_type"],
-                    "rate_amount": str(event_data["rate_amount"]),
-                    "rate_currency": event_data["rate_currency"],
-                    "valid_from": event_data["valid_from"],
-                    "valid_to": event_data.get("valid_to"),
+                    "contract_type": event.contract_type,
+                    "rate_amount": str(event.rate_amount),
+                    "rate_currency": event.rate_currency,
+                    "valid_from": event.valid_from,
+                    "valid_to": event.valid_to,
                 },
-                changed_by=event_data.get("changed_by"),
+                changed_by=event.changed_by,
                 metadata={"source_event": "ContractCreatedEvent"},
-                occurred_at=datetime.fromisoformat(event_data["occurred_at"]),
+                occurred_at=event.occurred_at,
             )
 
             dispatcher = get_event_dispatcher()
-            await dispatcher.dispatch(audit_event)
+            await dispatcher.dispatch(audit_event, wait=True)
 
-            logger.info(f"Emitted audit event for contract created: {event_data['contract_id']}")
+            logger.info(f"Emitted audit event for contract created: {event.contract_id}")
         except Exception as e:
             logger.error(f"Failed to emit audit event for contract created: {e}")
+            raise
 
-    async def handle_contract_activated(self, event_data: dict[str, Any]) -> None:
+    async def handle_contract_activated(self, event: ContractActivatedEvent) -> None:
         """Handle ContractActivatedEvent and emit AuditLogCreatedEvent"""
         try:
             audit_event = AuditLogCreatedEvent(
                 entity_type="CONTRACT",
-                entity_id=event_data["contract_id"],
+                entity_id=event.contract_id,
                 action="ACTIVATED",
-                employee_id=event_data["employee_id"],
+                employee_id=event.employee_id,
                 old_values=None,
                 new_values=None,
-                changed_by=event_data.get("changed_by"),
+                changed_by=event.changed_by,
                 metadata={
                     "source_event": "ContractActivatedEvent",
-                    "contract_type": event_data["contract_type"],
-                    "activated_at": event_data["activated_at"],
+                    "contract_type": event.contract_type,
+                    "activated_at": event.activated_at,
                 },
-                occurred_at=datetime.fromisoformat(event_data["occurred_at"]),
+                occurred_at=event.occurred_at,
             )
 
             dispatcher = get_event_dispatcher()
-            await dispatcher.dispatch(audit_event)
+            await dispatcher.dispatch(audit_event, wait=True)
 
-            logger.info(f"Emitted audit event for contract activated: {event_data['contract_id']}")
+            logger.info(f"Emitted audit event for contract activated: {event.contract_id}")
         except Exception as e:
             logger.error(f"Failed to emit audit event for contract activated: {e}")
+            raise
 
-    async def handle_contract_canceled(self, event_data: dict[str, Any]) -> None:
+    async def handle_contract_canceled(self, event: ContractCanceledEvent) -> None:
         """Handle ContractCanceledEvent and emit AuditLogCreatedEvent"""
         try:
             audit_event = AuditLogCreatedEvent(
                 entity_type="CONTRACT",
-                entity_id=event_data["contract_id"],
+                entity_id=event.contract_id,
                 action="CANCELED",
-                employee_id=event_data["employee_id"],
+                employee_id=event.employee_id,
                 old_values=None,
                 new_values=None,
-                changed_by=event_data.get("changed_by"),
+                changed_by=event.changed_by,
                 metadata={
                     "source_event": "ContractCanceledEvent",
-                    "contract_type": event_data["contract_type"],
-                    "cancellation_reason": event_data["cancellation_reason"],
-                    "canceled_at": event_data["canceled_at"],
+                    "contract_type": event.contract_type,
+                    "cancellation_reason": event.cancellation_reason,
+                    "canceled_at": event.canceled_at,
                 },
-                occurred_at=datetime.fromisoformat(event_data["occurred_at"]),
+                occurred_at=event.occurred_at,
             )
 
             dispatcher = get_event_dispatcher()
-            await dispatcher.dispatch(audit_event)
+            await dispatcher.dispatch(audit_event, wait=True)
 
-            logger.info(f"Emitted audit event for contract canceled: {event_data['contract_id']}")
+            logger.info(f"Emitted audit event for contract canceled: {event.contract_id}")
         except Exception as e:
             logger.error(f"Failed to emit audit event for contract canceled: {e}")
+            raise
 
-    async def handle_contract_expired(self, event_data: dict[str, Any]) -> None:
+    async def handle_contract_expired(self, event: ContractExpiredEvent) -> None:
         """Handle ContractExpiredEvent and emit AuditLogCreatedEvent"""
         try:
             audit_event = AuditLogCreatedEvent(
                 entity_type="CONTRACT",
-                entity_id=event_data["contract_id"],
+                entity_id=event.contract_id,
                 action="EXPIRED",
-                employee_id=event_data["employee_id"],
+                employee_id=event.employee_id,
                 old_values=None,
                 new_values=None,
-                changed_by=event_data.get("changed_by"),
+                changed_by=event.changed_by,
                 metadata={
                     "source_event": "ContractExpiredEvent",
-                    "contract_type": event_data["contract_type"],
-                    "expired_at": event_data["expired_at"],
+                    "contract_type": event.contract_type,
+                    "expired_at": event.expired_at,
                 },
-                occurred_at=datetime.fromisoformat(event_data["occurred_at"]),
+                occurred_at=event.occurred_at,
             )
 
             dispatcher = get_event_dispatcher()
-            await dispatcher.dispatch(audit_event)
+            await dispatcher.dispatch(audit_event, wait=True)
 
-            logger.info(f"Emitted audit event for contract expired: {event_data['contract_id']}")
+            logger.info(f"Emitted audit event for contract expired: {event.contract_id}")
         except Exception as e:
             logger.error(f"Failed to emit audit event for contract expired: {e}")
+            raise
+
+
+class ContractCacheInvalidationHandler:
+    """Drops an employee's cached active contracts when one of their contracts changes"""
+
+    async def handle_contract_changed(
+        self,
+        event: ContractCreatedEvent
+        | ContractActivatedEvent
+        | ContractCanceledEvent
+        | ContractExpiredEvent,
+    ) -> None:
+        await get_read_model_cache().invalidate(ACTIVE_CONTRACTS_CACHE_NAMESPACE, event.employee_id)
 
 
 def register_contract_audit_handlers(registry: EventHandlerRegistry) -> None:
@@ -127,9 +150,39 @@ def register_contract_audit_handlers(registry: EventHandlerRegistry) -> None:
     handler = ContractAuditEventHandler()
 
     # Listen to contract events and emit audit events
-    registry.register("contract.contract-created-event", handler.handle_contract_created)
-    registry.register("contract.contract-activated-event", handler.handle_contract_activated)
-    registry.register("contract.contract-canceled-event", handler.handle_contract_canceled)
-    registry.register("contract.contract-expired-event", handler.handle_contract_expired)
+    registry.register(
+        "contract.contract-created-event", handler.handle_contract_created, ContractCreatedEvent
+    )
+    registry.register(
+        "contract.contract-activated-event",
+        handler.handle_contract_activated,
+        ContractActivatedEvent,
+    )
+    registry.register(
+        "contract.contract-canceled-event", handler.handle_contract_canceled, ContractCanceledEvent
+    )
+    registry.register(
+        "contract.contract-expired-event", handler.handle_contract_expired, ContractExpiredEvent
+    )
 
     logger.info("Registered contract audit event handlers")
+
+
+def register_contract_cache_handlers(registry: EventHandlerRegistry) -> None:
+    """Register handlers that invalidate cached contract read models"""
+    handler = ContractCacheInvalidationHandler()
+
+    registry.register(
+        "contract.contract-created-event", handler.handle_contract_changed, ContractCreatedEvent
+    )
+    registry.register(
+        "contract.contract-activated-event", handler.handle_contract_changed, ContractActivatedEvent
+    )
+    registry.register(
+        "contract.contract-canceled-event", handler.handle_contract_changed, ContractCanceledEvent
+    )
+    registry.register(
+        "contract.contract-expired-event", handler.handle_contract_changed, ContractExpiredEvent
+    )
+
+    logger.info("Registered contract cache invalidation handlers")
@@ -1,3 +1,4 @@
+from datetime import date
 from typing import List, Optional, Tuple
 from uuid import UUID
 
@@ -10,6 +11,10 @@ from app.modules.contract.presentation.views import (
     ContractListView,
     ContractTermsView,
 )
+from app.shared.infrastructure.cache import get_read_model_cache, invalidate_on_commit
+
+ACTIVE_CONTRACTS_CACHE_NAMESPACE = "active-contracts"
+invalidate_on_commit(ContractORM, ACTIVE_CONTRACTS_CACHE_NAMESPACE, lambda row: row.employee_id)
 
 
 class ContractReadModel:
@@ -98,11 +103,22 @@ class ContractReadModel:
         ]
 
     async def get_active_by_employee(self, employee_id: UUID) -> List[ContractDetailView]:
-        from datetime import date
+        # Cached per day: "active" depends on today's date
+        today = date.today()
+        return await get_read_model_cache().get_or_load(
+            ACTIVE_CONTRACTS_CACHE_NAMESPACE,
+            employee_id,
+            today.isoformat(),
+            list[ContractDetailView],
+            lambda: self._load_active_by_employee(employee_id, today),
+            session=self.session,
+        )
 
+    async def _load_active_by_employee(
+        self, employee_id: UUID, today: date
+    ) -> List[ContractDetailView]:
         from app.modules.contract.domain.value_objects import ContractStatus
 
-        today = date.today()
         stmt = (
             select(ContractORM)
             .where(ContractORM.employee_id == employee_id)
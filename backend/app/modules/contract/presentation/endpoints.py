@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.modules.auth.infrastructure.dependencies import get_current_active_user
 from app.modules.contract.application.commands import (
     ActivateContractCommand,
@@ -93,7 +93,7 @@ async def create_contract(request: CreateContractRequest, db: AsyncSession = Dep
 
 
 @router.get("/{contract_id}", response_model=ContractDetailView)
-async def get_contract(contract_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_contract(contract_id: UUID, db: AsyncSession = Depends(get_read_db)):
     read_model = ContractReadModel(db)
     handler = GetContractHandler(read_model)
 
@@ -111,7 +111,7 @@ async def list_contracts(
     request: Request,
     page: int = 1,
     limit: int = 100,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     if page < 1:
         raise HTTPException(status_code=400, detail="Page must be >= 1")
@@ -137,7 +137,7 @@ async def list_contracts(
 
 
 @router.get("/employee/{employee_id}", response_model=ContractListResponse)
-async def get_contracts_by_employee(employee_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_contracts_by_employee(employee_id: UUID, db: AsyncSession = Depends(get_read_db)):
     read_model = ContractReadModel(db)
     handler = GetContractsByEmployeeHandler(read_model)
 
@@ -148,7 +148,7 @@ async def get_contracts_by_employee(employee_id: UUID, db: AsyncSession = Depend
 
 
 @router.get("/employee/{employee_id}/active", response_model=ContractListResponse)
-async def get_active_contracts(employee_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_active_contracts(employee_id: UUID, db: AsyncSession = Depends(get_read_db)):
     read_model = ContractReadModel(db)
     handler = GetActiveContractsHandler(read_model)
 
@@ -0,0 +1,11 @@
+from app.modules.dashboard.application.queries import GetDashboardSummaryQuery
+from app.modules.dashboard.infrastructure.read_model import DashboardReadModel
+from app.modules.dashboard.presentation.views import DashboardSummaryView
+
+
+class GetDashboardSummaryHandler:
+    def __init__(self, read_model: DashboardReadModel):
+        self.read_model = read_model
+
+    async def handle(self, query: GetDashboardSummaryQuery) -> DashboardSummaryView:
+        return await self.read_model.get_summary(query.as_of, query.expiring_within_days)
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass
+class GetDashboardSummaryQuery:
+    as_of: date
+    expiring_within_days: int
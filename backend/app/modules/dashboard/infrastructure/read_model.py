@@ -0,0 +1,193 @@
+"""
+Dashboard statistics aggregated across modules.
+
+The whole summary is one UNION ALL of grouped aggregates, so the dashboard
+costs a single database round trip however many tables it spans. Every
+branch yields rows of (metric, bucket, currency, total, gross, net); columns
+a metric does not use are NULL.
+
+Headcount for today reads the current_status projection; for any other
+as_of it is computed from the employment status history on that date.
+
+Summaries are cached for DASHBOARD_CACHE_TTL_SECONDS instead of being
+invalidated by events - they depend on nearly every write in the system.
+"""
+
+import calendar
+from datetime import date, timedelta
+from typing import Any
+
+from sqlalchemy import (
+    Numeric,
+    Select,
+    String,
+    cast,
+    func,
+    literal,
+    null,
+    or_,
+    select,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.modules.absence.domain.value_objects import AbsenceStatus
+from app.modules.absence.infrastructure.models import AbsenceModel
+from app.modules.contract.domain.value_objects import ContractStatus
+from app.modules.contract.infrastructure.models import ContractORM
+from app.modules.dashboard.presentation.views import (
+    ContractExpirationsView,
+    DashboardSummaryView,
+    HeadcountView,
+    PayrollPeriodSummaryView,
+    PayrollStatusTotalView,
+    PendingApprovalsView,
+)
+from app.modules.employee.domain.value_objects import EmploymentStatusType
+from app.modules.employee.infrastructure.models import EmployeeORM
+from app.modules.employee.infrastructure.projections import employee_status_on
+from app.modules.payroll.domain.value_objects import PayrollStatus
+from app.modules.payroll.infrastructure.models import PayrollORM
+from app.modules.timesheet.domain.value_objects import TimesheetStatus
+from app.modules.timesheet.infrastructure.models import TimesheetORM
+from app.shared.infrastructure.cache import get_read_model_cache
+
+settings = get_settings()
+
+DASHBOARD_CACHE_NAMESPACE = "dashboard"
+DASHBOARD_CACHE_KEY = "summary"
+
+
+def _month_bounds(as_of: date) -> tuple[date, date]:
+    last_day = calendar.monthrange(as_of.year, as_of.month)[1]
+    return as_of.replace(day=1), as_of.replace(day=last_day)
+
+
+def _aggregate(
+    metric: str,
+    bucket: Any = None,
+    currency: Any = None,
+    gross: Any = None,
+    net: Any = None,
+) -> Select:
+    return select(
+        literal(metric, String).label("metric"),
+        cast(null() if bucket is None else bucket, String).label("bucket"),
+        cast(null() if currency is None else currency, String).label("currency"),
+        func.count().label("total"),
+        cast(null() if gross is None else gross, Numeric).label("gross"),
+        cast(null() if net is None else net, Numeric).label("net"),
+    )
+
+
+class DashboardReadModel:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_summary(self, as_of: date, expiring_within_days: int) -> DashboardSummaryView:
+        return await get_read_model_cache().get_or_load(
+            DASHBOARD_CACHE_NAMESPACE,
+            DASHBOARD_CACHE_KEY,
+            f"{as_of.isoformat()}:{expiring_within_days}",
+            DashboardSummaryView,
+            lambda: self._load_summary(as_of, expiring_within_days),
+            session=self.session,
+            ttl_seconds=settings.DASHBOARD_CACHE_TTL_SECONDS,
+        )
+
+    @staticmethod
+    def _headcount(as_of: date) -> Select:
+        if as_of == date.today():
+            return (
+                _aggregate("headcount", bucket=EmployeeORM.current_status)
+                .select_from(EmployeeORM)
+                .group_by(EmployeeORM.current_status)
+            )
+
+        # current_status only holds today's status; other dates use the status
+        # history, counting employees hired by then
+        statuses = (
+            select(employee_status_on(as_of).label("status"))
+            .where(or_(EmployeeORM.hire_date.is_(None), EmployeeORM.hire_date <= as_of))
+            .subquery()
+        )
+        return (
+            _aggregate("headcount", bucket=statuses.c.status)
+            .select_from(statuses)
+            .group_by(statuses.c.status)
+        )
+
+    async def _load_summary(self, as_of: date, expiring_within_days: int) -> DashboardSummaryView:
+        period_start, period_end = _month_bounds(as_of)
+        expiring_until = as_of + timedelta(days=expiring_within_days)
+
+        stmt = union_all(
+            self._headcount(as_of),
+            _aggregate(
+                "payroll",
+                bucket=PayrollORM.status,
+                currency=PayrollORM.currency,
+                gross=func.sum(PayrollORM.gross_pay),
+                net=func.sum(PayrollORM.net_pay),
+            )
+            .where(PayrollORM.period_start_date <= period_end)
+            .where(PayrollORM.period_end_date >= period_start)
+            .group_by(PayrollORM.status, PayrollORM.currency),
+            _aggregate("pending_timesheets")
+            .select_from(TimesheetORM)
+            .where(TimesheetORM.status == TimesheetStatus.SUBMITTED.value),
+            _aggregate("pending_absences")
+            .select_from(AbsenceModel)
+            .where(AbsenceModel.status == AbsenceStatus.PENDING),
+            _aggregate("pending_payrolls")
+            .select_from(PayrollORM)
+            .where(PayrollORM.status == PayrollStatus.PENDING_APPROVAL),
+            _aggregate("expiring_contracts")
+            .select_from(ContractORM)
+            .where(ContractORM.status == ContractStatus.ACTIVE)
+            .where(ContractORM.valid_to.between(as_of, expiring_until)),
+        )
+        rows = (await self.session.execute(stmt)).all()
+
+        headcount = {status_type.value: 0 for status_type in EmploymentStatusType}
+        headcount_total = 0
+        payroll_totals: list[PayrollStatusTotalView] = []
+        counts: dict[str, int] = {}
+        for row in rows:
+            if row.metric == "headcount":
+                headcount_total += row.total
+                # Employees without any status in effect count only towards the total
+                if row.bucket is not None:
+                    headcount[EmploymentStatusType[row.bucket].value] = row.total
+            elif row.metric == "payroll":
+                payroll_totals.append(
+                    PayrollStatusTotalView(
+                        status=PayrollStatus[row.bucket].value,
+                        currency=row.currency,
+                        count=row.total,
+                        gross_pay=row.gross,
+                        net_pay=row.net,
+                    )
+                )
+            else:
+                counts[row.metric] = row.total
+
+        return DashboardSummaryView(
+            as_of=as_of,
+            headcount=HeadcountView(total=headcount_total, by_status=headcount),
+            payroll=PayrollPeriodSummaryView(
+                period_start=period_start,
+                period_end=period_end,
+                by_status=sorted(payroll_totals, key=lambda t: (t.status, t.currency)),
+            ),
+            pending_approvals=PendingApprovalsView(
+                timesheets=counts.get("pending_timesheets", 0),
+                absences=counts.get("pending_absences", 0),
+                payrolls=counts.get("pending_payrolls", 0),
+            ),
+            contract_expirations=ContractExpirationsView(
+                within_days=expiring_within_days,
+                count=counts.get("expiring_contracts", 0),
+            ),
+        )
@@ -0,0 +1,30 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database import get_read_db
+from app.modules.auth.infrastructure.dependencies import get_current_active_user
+from app.modules.dashboard.application.handlers import GetDashboardSummaryHandler
+from app.modules.dashboard.application.queries import GetDashboardSummaryQuery
+from app.modules.dashboard.infrastructure.read_model import DashboardReadModel
+from app.modules.dashboard.presentation.views import DashboardSummaryView
+
+settings = get_settings()
+
+router = APIRouter(dependencies=[Depends(get_current_active_user)])
+
+
+@router.get("/summary", response_model=DashboardSummaryView)
+async def get_dashboard_summary(
+    as_of: date | None = None,
+    expiring_within_days: int = Query(settings.DASHBOARD_CONTRACT_EXPIRY_DAYS, ge=1, le=365),
+    db: AsyncSession = Depends(get_read_db),
+):
+    read_model = DashboardReadModel(db)
+    handler = GetDashboardSummaryHandler(read_model)
+    query = GetDashboardSummaryQuery(
+        as_of=as_of or date.today(), expiring_within_days=expiring_within_days
+    )
+    return await handler.handle(query)
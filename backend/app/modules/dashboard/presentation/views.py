@@ -0,0 +1,42 @@
+from datetime import date
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+
+class HeadcountView(BaseModel):
+    total: int
+    by_status: dict[str, int]
+
+
+class PayrollStatusTotalView(BaseModel):
+    status: str
+    currency: str
+    count: int
+    gross_pay: Decimal
+    net_pay: Decimal
+
+
+class PayrollPeriodSummaryView(BaseModel):
+    period_start: date
+    period_end: date
+    by_status: list[PayrollStatusTotalView]
+
+
+class PendingApprovalsView(BaseModel):
+    timesheets: int
+    absences: int
+    payrolls: int
+
+
+class ContractExpirationsView(BaseModel):
+    within_days: int
+    count: int
+
+
+class DashboardSummaryView(BaseModel):
+    as_of: date
+    headcount: HeadcountView
+    payroll: PayrollPeriodSummaryView
+    pending_approvals: PendingApprovalsView
+    contract_expirations: ContractExpirationsView
@@ -0,0 +1,145 @@
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.absence.domain.value_objects import AbsenceStatus, AbsenceType
+from app.modules.absence.infrastructure.models import AbsenceModel
+from app.modules.contract.domain.value_objects import ContractStatus, ContractType
+from app.modules.contract.infrastructure.models import ContractORM
+from app.modules.dashboard.infrastructure.read_model import _month_bounds
+from app.modules.employee.domain.value_objects import EmploymentStatusType
+from app.modules.employee.infrastructure.models import EmployeeORM, EmploymentStatusORM
+from app.modules.payroll.domain.value_objects import PayrollPeriodType, PayrollStatus
+from app.modules.payroll.infrastructure.models import PayrollORM
+from app.modules.timesheet.infrastructure.models import TimesheetORM
+
+
+def make_payroll(status: PayrollStatus, period_start: date, period_end: date, gross: str):
+    return PayrollORM(
+        employee_id=uuid4(),
+        period_type=PayrollPeriodType.MONTHLY,
+        period_start_date=period_start,
+        period_end_date=period_end,
+        status=status,
+        gross_pay=Decimal(gross),
+        net_pay=Decimal(gross) * Decimal("0.7"),
+        currency="PLN",
+    )
+
+
+def make_contract(valid_to: date, status: ContractStatus = ContractStatus.ACTIVE):
+    return ContractORM(
+        employee_id=uuid4(),
+        contract_type=ContractType.FIXED_MONTHLY,
+        status=status,
+        rate_amount=Decimal("8000.00"),
+        valid_from=date(2024, 1, 1),
+        valid_to=valid_to,
+    )
+
+
+def test_month_bounds():
+    assert _month_bounds(date(2024, 2, 14)) == (date(2024, 2, 1), date(2024, 2, 29))
+    assert _month_bounds(date(2024, 12, 31)) == (date(2024, 12, 1), date(2024, 12, 31))
+
+
+@pytest.mark.asyncio
+async def test_dashboard_summary(client: AsyncClient, test_session: AsyncSession):
+    await client.post(
+        "/api/v1/employees/",
+        json={
+            "first_name": "Jane",
+            "last_name": "Smith",
+            "email": "jane.smith@example.com",
+            "hire_date": "2024-01-01",
+        },
+    )
+    test_session.add_all(
+        [
+            make_payroll(PayrollStatus.DRAFT, date(2024, 3, 1), date(2024, 3, 31), "1000.00"),
+            make_payroll(PayrollStatus.DRAFT, date(2024, 3, 1), date(2024, 3, 31), "500.00"),
+            make_payroll(
+                PayrollStatus.PENDING_APPROVAL, date(2024, 3, 1), date(2024, 3, 31), "2000.00"
+            ),
+            make_payroll(
+                PayrollStatus.PENDING_APPROVAL, date(2024, 2, 1), date(2024, 2, 29), "2000.00"
+            ),
+            TimesheetORM(
+                employee_id=uuid4(),
+                start_date=date(2024, 3, 4),
+                end_date=date(2024, 3, 8),
+                hours=40,
+                status="submitted",
+            ),
+            AbsenceModel(
+                id=uuid4(),
+                employee_id=uuid4(),
+                absence_type=AbsenceType.VACATION,
+                start_date=date(2024, 3, 18),
+                end_date=date(2024, 3, 22),
+                status=AbsenceStatus.PENDING,
+            ),
+            make_contract(date(2024, 3, 31)),
+            make_contract(date(2024, 6, 30)),
+            make_contract(date(2024, 3, 31), status=ContractStatus.CANCELED),
+        ]
+    )
+    await test_session.commit()
+
+    response = await client.get("/api/v1/dashboard/summary", params={"as_of": "2024-03-15"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["headcount"]["total"] == 1
+    assert data["headcount"]["by_status"]["active"] == 1
+    assert data["headcount"]["by_status"]["terminated"] == 0
+    assert data["payroll"]["period_start"] == "2024-03-01"
+    assert [
+        (total["status"], total["count"], Decimal(total["gross_pay"]))
+        for total in data["payroll"]["by_status"]
+    ] == [("DRAFT", 2, Decimal("1500.00")), ("PENDING_APPROVAL", 1, Decimal("2000.00"))]
+    assert data["pending_approvals"] == {"timesheets": 1, "absences": 1, "payrolls": 2}
+    assert data["contract_expirations"] == {"within_days": 30, "count": 1}
+
+
+@pytest.mark.asyncio
+async def test_dashboard_headcount_for_past_date(client: AsyncClient, test_session: AsyncSession):
+    employee = EmployeeORM(
+        first_name="Anna",
+        last_name="Nowak",
+        email="anna.nowak@example.com",
+        hire_date=date(2024, 1, 1),
+        current_status=EmploymentStatusType.TERMINATED,
+    )
+    test_session.add(employee)
+    await test_session.flush()
+    test_session.add_all(
+        [
+            EmploymentStatusORM(
+                employee_id=employee.id,
+                status_type=EmploymentStatusType.ACTIVE,
+                valid_from=date(2024, 1, 1),
+                valid_to=date(2024, 5, 31),
+            ),
+            EmploymentStatusORM(
+                employee_id=employee.id,
+                status_type=EmploymentStatusType.TERMINATED,
+                valid_from=date(2024, 6, 1),
+            ),
+        ]
+    )
+    await test_session.commit()
+
+    before = await client.get("/api/v1/dashboard/summary", params={"as_of": "2024-03-15"})
+    after = await client.get("/api/v1/dashboard/summary", params={"as_of": "2024-07-01"})
+    before_hire = await client.get("/api/v1/dashboard/summary", params={"as_of": "2023-12-31"})
+
+    assert before.json()["headcount"]["by_status"]["active"] == 1
+    assert before.json()["headcount"]["by_status"]["terminated"] == 0
+    assert after.json()["headcount"]["by_status"]["active"] == 0
+    assert after.json()["headcount"]["by_status"]["terminated"] == 1
+    assert before_hire.json()["headcount"]["total"] == 0
@@ -5,13 +5,13 @@ This is the public interface for inter-module communication
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import date
 from typing import Any, Optional
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.modules.employee.domain.value_objects import EmploymentStatusType
 from app.modules.employee.infrastructure.read_model import EmployeeReadModel
 
 
@@ -39,6 +39,18 @@ class IEmployeeModuleFacade(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_active_employee_ids(self, on_date: date) -> list[UUID]:
+        """Get IDs of all employees active on a specific date in a single query"""
+        pass
+
+    @abstractmethod
+    def iter_active_employee_ids(
+        self, on_date: date, batch_size: int = 500
+    ) -> AsyncIterator[list[UUID]]:
+        """Stream IDs of employees active on a specific date in batches"""
+        pass
+
     @abstractmethod
     async def get_employee_hire_date(self, employee_id: UUID) -> Optional[date]:
         """Get employee hire date"""
@@ -73,17 +85,17 @@ class EmployeeModuleFacade(IEmployeeModuleFacade):
         Check if employee is active on a specific date
         Returns True if employee has an ACTIVE status on that date
         """
-        employee = await self.get_employee_by_id(employee_id)
-        if not employee:
-            return False
+        return await self.read_model.is_active_on_date(employee_id, check_date)
 
-        # Check if employee has an active status on the date
-        for status in employee.statuses:
-            if status.valid_from <= check_date:
-                if status.valid_to is None or status.valid_to >= check_date:
-                    return status.status_type == EmploymentStatusType.ACTIVE
+    async def get_active_employee_ids(self, on_date: date) -> list[UUID]:
+        """Get IDs of all employees active on a specific date in a single query"""
+        return await self.read_model.get_active_employee_ids(on_date)
 
-        return False
+    def iter_active_employee_ids(
+        self, on_date: date, batch_size: int = 500
+    ) -> AsyncIterator[list[UUID]]:
+        """Stream IDs of employees active on a specific date in batches"""
+        return self.read_model.iter_active_employee_ids(on_date, batch_size)
 
     async def get_employee_hire_date(self, employee_id: UUID) -> Optional[date]:
         """Get employee hire date"""
@@ -197,7 +197,11 @@ class ListEmployeesHandler:
 
     async def handle(self, query: ListEmployeesQuery):
         items, total_count = await self.read_model.list(
-            page=query.page, limit=query.limit, search=query.search
+            page=query.page,
+            limit=query.limit,
+            search=query.search,
+            approximate_count=query.approximate_count,
+            status=query.status,
         )
         return items, total_count
 
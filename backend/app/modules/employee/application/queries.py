@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from app.modules.employee.domain.value_objects import EmploymentStatusType
+
 
 @dataclass
 class GetEmployeeQuery:
@@ -12,6 +14,8 @@ class ListEmployeesQuery:
     page: int = 1
     limit: int = 100
     search: str | None = None
+    approximate_count: bool = False
+    status: EmploymentStatusType | None = None
 
 
 @dataclass
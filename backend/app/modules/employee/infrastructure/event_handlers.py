@@ -1,11 +1,20 @@
 """Event handlers for employee module to emit audit events"""
 
 import logging
-from datetime import datetime
-from typing import Any
 
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.database import AsyncSessionLocal
 from app.modules.audit.domain.events import AuditLogCreatedEvent
+from app.modules.employee.domain.events import (
+    EmployeeCreatedEvent,
+    EmployeeStatusChangedEvent,
+    EmployeeUpdatedEvent,
+)
+from app.modules.employee.infrastructure.projections import EmployeeStatusProjection
+from app.modules.employee.infrastructure.read_model import EMPLOYEE_CACHE_NAMESPACE
 from app.shared.domain.events import get_event_dispatcher
+from app.shared.infrastructure.cache import get_read_model_cache
 from app.shared.infrastructure.event_registry import EventHandlerRegistry
 
 logger = logging.getLogger(__name__)
@@ -14,83 +23,105 @@ logger = logging.getLogger(__name__)
 class EmployeeAuditEventHandler:
     """Handler that listens to employee events and emits audit events"""
 
-    async def handle_employee_created(self, event_data: dict[str, Any]) -> None:
+    async def handle_employee_created(self, event: EmployeeCreatedEvent) -> None:
         """Handle EmployeeCreatedEvent and emit AuditLogCreatedEvent"""
         try:
             audit_event = AuditLogCreatedEvent(
                 entity_type="EMPLOYEE",
-                entity_id=event_data["employee_id"],
+                entity_id=event.employee_id,
                 action="CREATED",
-                employee_id=event_data["employee_id"],
+                employee_id=event.employee_id,
                 old_values=None,
                 new_values={
-                    "first_name": event_data["first_name"],
-                    "last_name": event_data["last_name"],
-                    "email": event_data["email"],
-                    "hire_date": event_data.get("hire_date"),
+                    "first_name": event.first_name,
+                    "last_name": event.last_name,
+                    "email": event.email,
+                    "hire_date": event.hire_date,
                 },
-                changed_by=event_data.get("changed_by"),
+                changed_by=event.changed_by,
                 metadata={"source_event": "EmployeeCreatedEvent"},
-                occurred_at=datetime.fromisoformat(event_data["occurred_at"]),
+                occurred_at=event.occurred_at,
             )
 
             dispatcher = get_event_dispatcher()
-            await dispatcher.dispatch(audit_event)
+            await dispatcher.dispatch(audit_event, wait=True)
 
-            logger.info(f"Emitted audit event for employee created: {event_data['employee_id']}")
+            logger.info(f"Emitted audit event for employee created: {event.employee_id}")
         except Exception as e:
             logger.error(f"Failed to emit audit event for employee created: {e}")
+            raise
 
-    async def handle_employee_updated(self, event_data: dict[str, Any]) -> None:
+    async def handle_employee_updated(self, event: EmployeeUpdatedEvent) -> None:
         """Handle EmployeeUpdatedEvent and emit AuditLogCreatedEvent"""
         try:
             audit_event = AuditLogCreatedEvent(
                 entity_type="EMPLOYEE",
-                entity_id=event_data["employee_id"],
+                entity_id=event.employee_id,
                 action="UPDATED",
-                employee_id=event_data["employee_id"],
-                old_values=event_data["old_values"],
-                new_values=event_data["new_values"],
-                changed_by=event_data.get("changed_by"),
+                employee_id=event.employee_id,
+                old_values=event.old_values,
+                new_values=event.new_values,
+                changed_by=event.changed_by,
                 metadata={"source_event": "EmployeeUpdatedEvent"},
-                occurred_at=datetime.fromisoformat(event_data["occurred_at"]),
+                occurred_at=event.occurred_at,
             )
 
             dispatcher = get_event_dispatcher()
-            await dispatcher.dispatch(audit_event)
+            await dispatcher.dispatch(audit_event, wait=True)
 
-            logger.info(f"Emitted audit event for employee updated: {event_data['employee_id']}")
+            logger.info(f"Emitted audit event for employee updated: {event.employee_id}")
         except Exception as e:
             logger.error(f"Failed to emit audit event for employee updated: {e}")
+            raise
 
-    async def handle_employee_status_changed(self, event_data: dict[str, Any]) -> None:
+    async def handle_employee_status_changed(self, event: EmployeeStatusChangedEvent) -> None:
         """Handle EmployeeStatusChangedEvent and emit AuditLogCreatedEvent"""
         try:
             audit_event = AuditLogCreatedEvent(
                 entity_type="EMPLOYEE",
-                entity_id=event_data["employee_id"],
+                entity_id=event.employee_id,
                 action="STATUS_CHANGED",
-                employee_id=event_data["employee_id"],
-                old_values={"status": event_data["old_status"]},
-                new_values={"status": event_data["new_status"]},
-                changed_by=event_data.get("changed_by"),
+                employee_id=event.employee_id,
+                old_values={"status": event.old_status},
+                new_values={"status": event.new_status},
+                changed_by=event.changed_by,
                 metadata={
                     "source_event": "EmployeeStatusChangedEvent",
-                    "valid_from": event_data["status_valid_from"],
-                    "valid_to": event_data.get("status_valid_to"),
-                    "reason": event_data.get("reason"),
+                    "valid_from": event.status_valid_from,
+                    "valid_to": event.status_valid_to,
+                    "reason": event.reason,
                 },
-                occurred_at=datetime.fromisoformat(event_data["occurred_at"]),
+                occurred_at=event.occurred_at,
             )
 
             dispatcher = get_event_dispatcher()
-            await dispatcher.dispatch(audit_event)
+            await dispatcher.dispatch(audit_event, wait=True)
 
-            logger.info(
-                f"Emitted audit event for employee status changed: {event_data['employee_id']}"
-            )
+            logger.info(f"Emitted audit event for employee status changed: {event.employee_id}")
         except Exception as e:
             logger.error(f"Failed to emit audit event for employee status changed: {e}")
+            raise
+
+
+class EmployeeStatusProjectionHandler:
+    """Keeps employees.current_status in sync with status changes"""
+
+    def __init__(self, session_factory: async_sessionmaker = AsyncSessionLocal):
+        self.session_factory = session_factory
+
+    async def handle_employee_status_changed(self, event: EmployeeStatusChangedEvent) -> None:
+        async with self.session_factory() as session:
+            await EmployeeStatusProjection(session).refresh([event.employee_id])
+            await session.commit()
+
+
+class EmployeeCacheInvalidationHandler:
+    """Drops cached employee read models when an employee changes"""
+
+    async def handle_employee_changed(
+        self, event: EmployeeUpdatedEvent | EmployeeStatusChangedEvent
+    ) -> None:
+        await get_read_model_cache().invalidate(EMPLOYEE_CACHE_NAMESPACE, event.employee_id)
 
 
 def register_employee_audit_handlers(registry: EventHandlerRegistry) -> None:
@@ -98,10 +129,45 @@ def register_employee_audit_handlers(registry: EventHandlerRegistry) -> None:
     handler = EmployeeAuditEventHandler()
 
     # Listen to employee events and emit audit events
-    registry.register("employee.employee-created-event", handler.handle_employee_created)
-    registry.register("employee.employee-updated-event", handler.handle_employee_updated)
     registry.register(
-        "employee.employee-status-changed-event", handler.handle_employee_status_changed
+        "employee.employee-created-event", handler.handle_employee_created, EmployeeCreatedEvent
+    )
+    registry.register(
+        "employee.employee-updated-event", handler.handle_employee_updated, EmployeeUpdatedEvent
+    )
+    registry.register(
+        "employee.employee-status-changed-event",
+        handler.handle_employee_status_changed,
+        EmployeeStatusChangedEvent,
     )
 
     logger.info("Registered employee audit event handlers")
+
+
+def register_employee_cache_handlers(registry: EventHandlerRegistry) -> None:
+    """Register handlers that invalidate cached employee read models"""
+    handler = EmployeeCacheInvalidationHandler()
+
+    registry.register(
+        "employee.employee-updated-event", handler.handle_employee_changed, EmployeeUpdatedEvent
+    )
+    registry.register(
+        "employee.employee-status-changed-event",
+        handler.handle_employee_changed,
+        EmployeeStatusChangedEvent,
+    )
+
+    logger.info("Registered employee cache invalidation handlers")
+
+
+def register_employee_projection_handlers(registry: EventHandlerRegistry) -> None:
+    """Register handlers that maintain employee projections"""
+    handler = EmployeeStatusProjectionHandler()
+
+    registry.register(
+        "employee.employee-status-changed-event",
+        handler.handle_employee_status_changed,
+        EmployeeStatusChangedEvent,
+    )
+
+    logger.info("Registered employee projection handlers")
@@ -1,9 +1,10 @@
 import uuid
+from datetime import date, datetime
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, String
+from sqlalchemy import Date, DateTime, ForeignKey, Index, String, text
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -12,31 +13,63 @@ from app.modules.employee.domain.value_objects import EmploymentStatusType
 
 class EmployeeORM(Base):
     __tablename__ = "employees"
+    __table_args__ = (
+        # Trigram index for name/email search (requires the pg_trgm extension)
+        Index(
+            "ix_employees_search_trgm",
+            text("(first_name || ' ' || last_name || ' ' || email) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    first_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    last_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    phone: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    date_of_birth: Mapped[date | None] = mapped_column(Date, nullable=True)
+    hire_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    # Status in effect today, maintained by EmployeeStatusProjection
+    current_status: Mapped[EmploymentStatusType | None] = mapped_column(
+        SQLEnum(EmploymentStatusType), nullable=True, index=True
+    )
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), onupdate=func.now()
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    first_name = Column(String(100), nullable=False)
-    last_name = Column(String(100), nullable=False)
-    email = Column(String(255), unique=True, nullable=False, index=True)
-    phone = Column(String(20), nullable=True)
-    date_of_birth = Column(Date, nullable=True)
-    hire_date = Column(Date, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-
-    statuses = relationship(
+    statuses: Mapped[list["EmploymentStatusORM"]] = relationship(
         "EmploymentStatusORM", back_populates="employee", cascade="all, delete-orphan"
     )
 
 
 class EmploymentStatusORM(Base):
     __tablename__ = "employment_statuses"
+    __table_args__ = (
+        # Covers the "active on date" predicate, per employee and for the whole active set
+        Index(
+            "ix_employment_statuses_employee_status_period",
+            "employee_id",
+            "status_type",
+            "valid_from",
+            "valid_to",
+        ),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    employee_id = Column(UUID(as_uuid=True), ForeignKey("employees.id"), nullable=False)
-    status_type = Column(SQLEnum(EmploymentStatusType), nullable=False)
-    valid_from = Column(Date, nullable=False)
-    valid_to = Column(Date, nullable=True)
-    reason = Column(String(500), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    employee_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("employees.id"), nullable=False
+    )
+    status_type: Mapped[EmploymentStatusType] = mapped_column(
+        SQLEnum(EmploymentStatusType), nullable=False
+    )
+    valid_from: Mapped[date] = mapped_column(Date, nullable=False)
+    valid_to: Mapped[date | None] = mapped_column(Date, nullable=True)
+    reason: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
 
-    employee = relationship("EmployeeORM", back_populates="statuses")
+    employee: Mapped[EmployeeORM] = relationship("EmployeeORM", back_populates="statuses")
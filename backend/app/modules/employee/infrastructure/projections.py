@@ -0,0 +1,68 @@
+"""
+Projections maintained on the employees table.
+
+employees.current_status holds the employment status in effect today, so
+employee lists and status filters are single-table queries instead of
+loading every historical status. It is set when an employee is saved,
+refreshed when EmployeeStatusChangedEvent is handled, and rolled over
+nightly for statuses whose validity starts or ends on the new day.
+"""
+
+from datetime import date
+from typing import Any, cast
+from uuid import UUID
+
+from sqlalchemy import CursorResult, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.selectable import ScalarSelect
+
+from app.modules.employee.infrastructure.models import EmployeeORM, EmploymentStatusORM
+
+
+def employee_status_on(on_date: date) -> ScalarSelect:
+    """
+    Status in effect on a date of the EmployeeORM row of the enclosing query,
+    NULL if none - current_status as it was (or will be) on that date
+    """
+    return (
+        select(EmploymentStatusORM.status_type)
+        .where(EmploymentStatusORM.employee_id == EmployeeORM.id)
+        .where(EmploymentStatusORM.valid_from <= on_date)
+        .where(
+            or_(
+                EmploymentStatusORM.valid_to.is_(None),
+                EmploymentStatusORM.valid_to >= on_date,
+            )
+        )
+        .order_by(EmploymentStatusORM.valid_from.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
+class EmployeeStatusProjection:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def refresh(
+        self, employee_ids: list[UUID] | None = None, on_date: date | None = None
+    ) -> int:
+        """
+        Recompute current_status as of on_date (default today) for the given
+        employees, or all employees. Only rows whose status changed are written.
+        Returns the number of updated rows.
+        """
+        status_on_date = employee_status_on(on_date or date.today())
+
+        stmt = (
+            update(EmployeeORM)
+            # A rollover is not an edit of the employee; keep updated_at as is
+            .values(current_status=status_on_date, updated_at=EmployeeORM.updated_at)
+            .where(EmployeeORM.current_status.is_distinct_from(status_on_date))
+            .execution_options(synchronize_session=False)
+        )
+        if employee_ids is not None:
+            stmt = stmt.where(EmployeeORM.id.in_(employee_ids))
+
+        result = cast(CursorResult[Any], await self.session.execute(stmt))
+        return result.rowcount
@@ -1,16 +1,49 @@
+import re
+from collections.abc import AsyncIterator
+from datetime import date
 from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import Text, cast, func, or_, select
+from sqlalchemy import Select, String, exists, func, literal_column, or_, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.modules.employee.infrastructure.models import EmployeeORM
+from app.modules.employee.domain.value_objects import EmploymentStatusType
+from app.modules.employee.infrastructure.models import EmployeeORM, EmploymentStatusORM
 from app.modules.employee.presentation.views import (
     EmployeeDetailView,
     EmployeeListView,
     EmploymentStatusView,
 )
+from app.shared.infrastructure.cache import get_read_model_cache, invalidate_on_commit
+
+EMPLOYEE_CACHE_NAMESPACE = "employee"
+invalidate_on_commit(EmployeeORM, EMPLOYEE_CACHE_NAMESPACE, lambda row: row.id)
+invalidate_on_commit(EmploymentStatusORM, EMPLOYEE_CACHE_NAMESPACE, lambda row: row.employee_id)
+
+# Must match the expression of the ix_employees_search_trgm index
+EMPLOYEE_SEARCH_TEXT = (
+    EmployeeORM.first_name.concat(literal_column("' '", String))
+    .concat(EmployeeORM.last_name)
+    .concat(literal_column("' '", String))
+    .concat(EmployeeORM.email)
+)
+
+SEARCH_COUNT_LIMIT = 1000
+
+_UUID_HEX_PREFIX = re.compile(r"^[0-9a-f]{4,32}$")
+
+
+def _uuid_prefix_range(term: str) -> tuple[UUID, UUID] | None:
+    """Lowest and highest UUID starting with the given hex prefix, if it is one"""
+    prefix = term.replace("-", "")
+    if not _UUID_HEX_PREFIX.match(prefix):
+        return None
+    return UUID(prefix.ljust(32, "0")), UUID(prefix.ljust(32, "f"))
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
 class EmployeeReadModel:
@@ -18,6 +51,16 @@ class EmployeeReadModel:
         self.session = session
 
     async def get_by_id(self, employee_id: UUID) -> Optional[EmployeeDetailView]:
+        return await get_read_model_cache().get_or_load(
+            EMPLOYEE_CACHE_NAMESPACE,
+            employee_id,
+            "detail",
+            EmployeeDetailView,
+            lambda: self._load_by_id(employee_id),
+            session=self.session,
+        )
+
+    async def _load_by_id(self, employee_id: UUID) -> Optional[EmployeeDetailView]:
         stmt = (
             select(EmployeeORM)
             .options(selectinload(EmployeeORM.statuses))
@@ -50,6 +93,71 @@ class EmployeeReadModel:
             updated_at=orm.updated_at.date() if orm.updated_at else None,
         )
 
+    @staticmethod
+    def _active_statuses_on(check_date: date) -> Select:
+        # Statuses of an employee never overlap (a status change closes the previous one),
+        # so an employee is active iff an ACTIVE status covers the date.
+        # Served by ix_employment_statuses_employee_status_period.
+        return (
+            select(EmploymentStatusORM.employee_id)
+            .where(EmploymentStatusORM.status_type == EmploymentStatusType.ACTIVE)
+            .where(EmploymentStatusORM.valid_from <= check_date)
+            .where(
+                or_(
+                    EmploymentStatusORM.valid_to.is_(None),
+                    EmploymentStatusORM.valid_to >= check_date,
+                )
+            )
+        )
+
+    async def is_active_on_date(self, employee_id: UUID, check_date: date) -> bool:
+        stmt = select(
+            exists(
+                self._active_statuses_on(check_date).where(
+                    EmploymentStatusORM.employee_id == employee_id
+                )
+            )
+        )
+        return bool(await self.session.scalar(stmt))
+
+    async def get_active_employee_ids(self, on_date: date) -> list[UUID]:
+        """IDs of all employees active on a date, in a single query, ordered by ID"""
+        stmt = (
+            self._active_statuses_on(on_date).distinct().order_by(EmploymentStatusORM.employee_id)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def iter_active_employee_ids(
+        self, on_date: date, batch_size: int = 500
+    ) -> AsyncIterator[list[UUID]]:
+        """
+        Yield IDs of employees active on a date in batches of at most batch_size.
+        Uses keyset pagination on employee_id (no OFFSET or count), so each batch
+        is an independent short query and callers may commit between batches.
+        """
+        last_id: UUID | None = None
+        while True:
+            stmt = (
+                self._active_statuses_on(on_date)
+                .distinct()
+                .order_by(EmploymentStatusORM.employee_id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                stmt = stmt.where(EmploymentStatusORM.employee_id > last_id)
+
+            result = await self.session.execute(stmt)
+            batch = list(result.scalars().all())
+            if not batch:
+                return
+
+            yield batch
+
+            if len(batch) < batch_size:
+                return
+            last_id = batch[-1]
+
     async def get_by_ids(self, employee_ids: list[UUID]) -> dict[UUID, EmployeeDetailView]:
         """
         Get multiple employees by their IDs in a single query
@@ -91,36 +199,44 @@ class EmployeeReadModel:
         }
 
     async def list(
-        self, page: int = 1, limit: int = 100, search: str | None = None
+        self,
+        page: int = 1,
+        limit: int = 100,
+        search: str | None = None,
+        approximate_count: bool = False,
+        status: EmploymentStatusType | None = None,
     ) -> Tuple[List[EmployeeListView], int]:
+        """
+        List employees, newest first, or by relevance when searching.
+
+        Search matches a UUID prefix of the employee ID (primary key range scan) or a
+        substring of name/email (ix_employees_search_trgm trigram index). With
+        approximate_count the total is estimated from table statistics, or capped at
+        SEARCH_COUNT_LIMIT when searching, instead of counting every match.
+        Status filtering and the listed status use the current_status projection.
+        """
         skip = (page - 1) * limit
 
         # Build base query with optional search filter
         base_query = select(EmployeeORM)
-        if search:
-            # Search by ID (using TEXT cast for better UUID string matching),
-            # first name, last name, or email
+        order_by: list = [EmployeeORM.created_at.desc()]
+        if status:
+            base_query = base_query.where(EmployeeORM.current_status == status)
+        if search and search.strip():
             search_term = search.strip().lower()
-            search_filter = or_(
-                cast(EmployeeORM.id, Text).ilike(f"%{search_term}%"),
-                EmployeeORM.first_name.ilike(f"%{search_term}%"),
-                EmployeeORM.last_name.ilike(f"%{search_term}%"),
-                EmployeeORM.email.ilike(f"%{search_term}%"),
+            search_filter = EMPLOYEE_SEARCH_TEXT.ilike(
+                f"%{_escape_like(search_term)}%", escape="\\"
             )
+            id_range = _uuid_prefix_range(search_term)
+            if id_range:
+                search_filter = or_(EmployeeORM.id.between(*id_range), search_filter)
             base_query = base_query.where(search_filter)
+            order_by.insert(0, func.similarity(EMPLOYEE_SEARCH_TEXT, search_term).desc())
 
-        # Get total count
-        count_stmt = select(func.count()).select_from(base_query.subquery())
-        count_result = await self.session.execute(count_stmt)
-        total_count = count_result.scalar_one()
+        total_count = await self._count(base_query, approximate=approximate_count)
 
         # Get paginated items
-        stmt = (
-            base_query.options(selectinload(EmployeeORM.statuses))
-            .offset(skip)
-            .limit(limit)
-            .order_by(EmployeeORM.created_at.desc())
-        )
+        stmt = base_query.order_by(*order_by, EmployeeORM.id).offset(skip).limit(limit)
         result = await self.session.execute(stmt)
         orms = result.scalars().all()
 
@@ -131,20 +247,27 @@ class EmployeeReadModel:
                 last_name=orm.last_name,
                 email=orm.email,
                 hire_date=orm.hire_date,
-                current_status=self._get_current_status(orm),
+                current_status=orm.current_status,
             )
             for orm in orms
         ]
 
         return items, total_count
 
-    def _get_current_status(self, orm: EmployeeORM):
-        from datetime import date
+    async def _count(self, base_query: Select, approximate: bool) -> int:
+        if not approximate:
+            count_stmt = select(func.count()).select_from(base_query.subquery())
+            return (await self.session.execute(count_stmt)).scalar_one()
 
-        today = date.today()
-        active_statuses = [
-            s
-            for s in orm.statuses
-            if s.valid_from <= today and (s.valid_to is None or s.valid_to >= today)
-        ]
-        return active_statuses[0].status_type if active_statuses else None
+        if base_query.whereclause is None:
+            # Planner statistics; -1 until the table has been analyzed
+            estimate = await self.session.scalar(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'employees'::regclass")
+            )
+            if estimate is not None and estimate >= 0:
+                return int(estimate)
+            return await self._count(base_query, approximate=False)
+
+        capped = base_query.with_only_columns(EmployeeORM.id).limit(SEARCH_COUNT_LIMIT)
+        count_stmt = select(func.count()).select_from(capped.subquery())
+        return (await self.session.execute(count_stmt)).scalar_one()
@@ -1,4 +1,5 @@
 import logging
+from datetime import date
 from typing import List, Optional
 from uuid import UUID
 
@@ -72,6 +73,7 @@ class SQLAlchemyEmployeeRepository(EmployeeRepository):
         )
 
     def _to_orm(self, employee: Employee) -> EmployeeORM:
+        current_status = employee.get_status_at(date.today())
         orm = EmployeeORM(
             id=employee.id,
             first_name=employee.first_name,
@@ -80,6 +82,7 @@ class SQLAlchemyEmployeeRepository(EmployeeRepository):
             phone=employee.phone,
             date_of_birth=employee.date_of_birth,
             hire_date=employee.hire_date,
+            current_status=current_status.status_type if current_status else None,
         )
 
         orm.statuses = [
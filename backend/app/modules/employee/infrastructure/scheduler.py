@@ -0,0 +1,99 @@
+"""
+Employee Status Rollover Scheduler
+Refreshes employees.current_status daily after midnight, so statuses that
+start or end on the new day (future-dated changes, fixed-term leave) take effect
+"""
+
+import asyncio
+import logging
+from datetime import datetime, time, timedelta
+
+from app.database import AsyncSessionLocal
+from app.modules.employee.infrastructure.projections import EmployeeStatusProjection
+
+logger = logging.getLogger(__name__)
+
+
+class EmployeeStatusScheduler:
+    """
+    Scheduler for the nightly current_status rollover
+    """
+
+    def __init__(self):
+        self.is_running = False
+        self._task = None
+
+    async def start(self) -> None:
+        """Start the scheduler"""
+        if self.is_running:
+            logger.warning("Employee status scheduler is already running")
+            return
+
+        self.is_running = True
+        self._task = asyncio.create_task(self._run_scheduler())
+        logger.info("Employee status scheduler started")
+
+    async def stop(self) -> None:
+        """Stop the scheduler"""
+        if not self.is_running:
+            return
+
+        self.is_running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        logger.info("Employee status scheduler stopped")
+
+    async def _run_scheduler(self) -> None:
+        """Main scheduler loop - rolls statuses over on start and daily at midnight"""
+        while self.is_running:
+            try:
+                await self.rollover()
+
+                # Sleep until next midnight
+                now = datetime.now()
+                tomorrow = now + timedelta(days=1)
+                next_midnight = datetime.combine(tomorrow.date(), time.min)
+                await asyncio.sleep((next_midnight - now).total_seconds())
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in employee status scheduler loop: {e}", exc_info=True)
+                # Sleep for an hour before retrying
+                await asyncio.sleep(3600)
+
+    async def rollover(self) -> int:
+        """Recompute current_status for all employees as of today"""
+        async with AsyncSessionLocal() as session:
+            updated = await EmployeeStatusProjection(session).refresh()
+            await session.commit()
+
+        logger.info(f"Employee status rollover updated {updated} employees")
+        return updated
+
+
+# Global scheduler instance
+_scheduler_instance = None
+
+
+def get_employee_status_scheduler() -> EmployeeStatusScheduler:
+    """Get the global scheduler instance"""
+    global _scheduler_instance
+    if _scheduler_instance is None:
+        _scheduler_instance = EmployeeStatusScheduler()
+    return _scheduler_instance
+
+
+async def start_employee_status_scheduler() -> None:
+    """Start the employee status scheduler"""
+    await get_employee_status_scheduler().start()
+
+
+async def stop_employee_status_scheduler() -> None:
+    """Stop the employee status scheduler"""
+    await get_employee_status_scheduler().stop()
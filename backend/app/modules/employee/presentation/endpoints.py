@@ -2,11 +2,11 @@ import logging
 from datetime import date
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from pydantic import BaseModel, EmailStr
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.modules.auth.infrastructure.dependencies import get_current_active_user
 from app.modules.employee.application.commands import (
     ChangeEmployeeStatusCommand,
@@ -98,7 +98,7 @@ async def create_employee(request: CreateEmployeeRequest, db: AsyncSession = Dep
 
 
 @router.get("/{employee_id}", response_model=EmployeeDetailView)
-async def get_employee(employee_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_employee(employee_id: UUID, db: AsyncSession = Depends(get_read_db)):
     read_model = EmployeeReadModel(db)
     handler = GetEmployeeHandler(read_model)
 
@@ -117,7 +117,9 @@ async def list_employees(
     page: int = 1,
     limit: int = 100,
     search: str | None = None,
-    db: AsyncSession = Depends(get_db),
+    approximate_count: bool = False,
+    status_filter: EmploymentStatusType | None = Query(None, alias="status"),
+    db: AsyncSession = Depends(get_read_db),
 ):
     if page < 1:
         raise HTTPException(status_code=400, detail="Page must be >= 1")
@@ -127,7 +129,13 @@ async def list_employees(
     read_model = EmployeeReadModel(db)
     handler = ListEmployeesHandler(read_model)
 
-    query = ListEmployeesQuery(page=page, limit=limit, search=search)
+    query = ListEmployeesQuery(
+        page=page,
+        limit=limit,
+        search=search,
+        approximate_count=approximate_count,
+        status=status_filter,
+    )
     items, total_count = await handler.handle(query)
 
     base_url = str(request.url).split("?")[0]
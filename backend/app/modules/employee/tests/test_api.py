@@ -67,6 +67,58 @@ async def test_list_employees(client: AsyncClient):
     assert data["metadata"]["total_items"] >= 3
 
 
+@pytest.mark.asyncio
+async def test_search_employees_by_name_email_and_id_prefix(client: AsyncClient):
+    ids = {}
+    for first_name, last_name in [("Agnieszka", "Wiśniewska"), ("Tomasz", "Zieliński")]:
+        response = await client.post(
+            "/api/v1/employees/",
+            json={
+                "first_name": first_name,
+                "last_name": last_name,
+                "email": f"{first_name.lower()}@example.com",
+                "hire_date": "2024-01-01",
+            },
+        )
+        ids[first_name] = response.json()["id"]
+
+    by_name = (await client.get("/api/v1/employees/", params={"search": "agniesz"})).json()
+    assert [item["id"] for item in by_name["items"]] == [ids["Agnieszka"]]
+
+    by_email = (await client.get("/api/v1/employees/", params={"search": "tomasz@"})).json()
+    assert [item["id"] for item in by_email["items"]] == [ids["Tomasz"]]
+
+    by_id = (
+        await client.get(
+            "/api/v1/employees/",
+            params={"search": ids["Tomasz"][:8], "approximate_count": True},
+        )
+    ).json()
+    assert ids["Tomasz"] in [item["id"] for item in by_id["items"]]
+    assert by_id["metadata"]["total_items"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_list_employees_filtered_by_current_status(client: AsyncClient):
+    response = await client.post(
+        "/api/v1/employees/",
+        json={
+            "first_name": "Filter",
+            "last_name": "Test",
+            "email": "filter.test@example.com",
+            "hire_date": "2024-01-01",
+        },
+    )
+    employee_id = response.json()["id"]
+
+    active = (await client.get("/api/v1/employees/", params={"status": "active"})).json()
+    terminated = (await client.get("/api/v1/employees/", params={"status": "terminated"})).json()
+
+    assert employee_id in [item["id"] for item in active["items"]]
+    assert all(item["current_status"] == "active" for item in active["items"])
+    assert employee_id not in [item["id"] for item in terminated["items"]]
+
+
 @pytest.mark.asyncio
 async def test_update_employee(client: AsyncClient):
     create_response = await client.post(
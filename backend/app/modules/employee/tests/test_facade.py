@@ -0,0 +1,127 @@
+from datetime import date
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.employee.api.facade import EmployeeModuleFacade
+from app.modules.employee.domain.value_objects import EmploymentStatusType
+from app.modules.employee.infrastructure.models import EmployeeORM, EmploymentStatusORM
+from app.modules.employee.infrastructure.projections import EmployeeStatusProjection
+from app.modules.employee.infrastructure.read_model import _uuid_prefix_range
+
+
+async def create_employee(
+    session: AsyncSession, statuses: list[tuple[EmploymentStatusType, date, date | None]]
+) -> EmployeeORM:
+    employee_id = uuid4()
+    employee = EmployeeORM(
+        id=employee_id,
+        first_name="Anna",
+        last_name="Nowak",
+        email=f"{employee_id}@example.com",
+        hire_date=statuses[0][1],
+    )
+    session.add(employee)
+    for status_type, valid_from, valid_to in statuses:
+        session.add(
+            EmploymentStatusORM(
+                employee_id=employee_id,
+                status_type=status_type,
+                valid_from=valid_from,
+                valid_to=valid_to,
+            )
+        )
+    await session.commit()
+    return employee
+
+
+@pytest.mark.asyncio
+async def test_is_employee_active_on_date(test_session: AsyncSession):
+    employee = await create_employee(
+        test_session,
+        [
+            (EmploymentStatusType.ACTIVE, date(2024, 1, 1), date(2024, 5, 31)),
+            (EmploymentStatusType.ON_LEAVE, date(2024, 6, 1), None),
+        ],
+    )
+    facade = EmployeeModuleFacade(test_session)
+
+    assert await facade.is_employee_active_on_date(employee.id, date(2024, 5, 31))
+    assert not await facade.is_employee_active_on_date(employee.id, date(2024, 6, 1))
+    assert not await facade.is_employee_active_on_date(employee.id, date(2023, 12, 31))
+    assert not await facade.is_employee_active_on_date(uuid4(), date(2024, 5, 31))
+
+
+@pytest.mark.asyncio
+async def test_get_active_employee_ids(test_session: AsyncSession):
+    active = await create_employee(
+        test_session, [(EmploymentStatusType.ACTIVE, date(2024, 1, 1), None)]
+    )
+    on_leave = await create_employee(
+        test_session,
+        [
+            (EmploymentStatusType.ACTIVE, date(2024, 1, 1), date(2024, 2, 29)),
+            (EmploymentStatusType.ON_LEAVE, date(2024, 3, 1), None),
+        ],
+    )
+    not_yet_hired = await create_employee(
+        test_session, [(EmploymentStatusType.ACTIVE, date(2024, 4, 1), None)]
+    )
+    facade = EmployeeModuleFacade(test_session)
+
+    active_ids = await facade.get_active_employee_ids(date(2024, 3, 31))
+
+    assert active_ids == [active.id]
+    assert on_leave.id not in active_ids
+    assert not_yet_hired.id not in active_ids
+
+
+@pytest.mark.asyncio
+async def test_iter_active_employee_ids_streams_in_keyset_batches(test_session: AsyncSession):
+    employees = [
+        await create_employee(test_session, [(EmploymentStatusType.ACTIVE, date(2024, 1, 1), None)])
+        for _ in range(5)
+    ]
+    facade = EmployeeModuleFacade(test_session)
+
+    batches = [
+        batch async for batch in facade.iter_active_employee_ids(date(2024, 3, 31), batch_size=2)
+    ]
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [employee_id for batch in batches for employee_id in batch] == sorted(
+        employee.id for employee in employees
+    )
+
+
+def test_uuid_prefix_search_range():
+    employee_id = UUID("3f2a9c4e-1b7d-4c2a-9e8f-0a1b2c3d4e5f")
+    low, high = _uuid_prefix_range("3f2a9c4e-1b")
+
+    assert low <= employee_id <= high
+    assert _uuid_prefix_range("anna") is None
+    assert _uuid_prefix_range("3f2") is None
+
+
+@pytest.mark.asyncio
+async def test_status_projection_rolls_over_future_dated_statuses(test_session: AsyncSession):
+    employee = await create_employee(
+        test_session,
+        [
+            (EmploymentStatusType.ACTIVE, date(2024, 1, 1), date(2024, 5, 31)),
+            (EmploymentStatusType.ON_LEAVE, date(2024, 6, 1), None),
+        ],
+    )
+    projection = EmployeeStatusProjection(test_session)
+
+    assert await projection.refresh(on_date=date(2024, 5, 31)) == 1
+    await test_session.refresh(employee)
+    assert employee.current_status == EmploymentStatusType.ACTIVE
+
+    # Nothing changed on the same day
+    assert await projection.refresh(on_date=date(2024, 5, 31)) == 0
+
+    assert await projection.refresh([employee.id], on_date=date(2024, 6, 1)) == 1
+    await test_session.refresh(employee)
+    assert employee.current_status == EmploymentStatusType.ON_LEAVE
@@ -1,11 +1,14 @@
 import logging
-from typing import Any
+from uuid import UUID
 
-from app.database import get_db
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
 from app.modules.employee.api.facade import EmployeeModuleFacade
-from app.modules.employee.infrastructure.read_model import EmployeeReadModel
 from app.modules.payroll.application.commands import CreatePayrollCommand
 from app.modules.payroll.application.handlers import CreatePayrollHandler
+from app.modules.payroll.domain.events import MonthEndEvent
 from app.modules.payroll.domain.services import PayrollCalculationService, PayrollPeriodService
 from app.modules.payroll.domain.value_objects import PayrollPeriod, PayrollPeriodType
 from app.modules.payroll.infrastructure.adapters import (
@@ -16,32 +19,32 @@ from app.modules.payroll.infrastructure.repository import SQLAlchemyPayrollRepos
 from app.shared.infrastructure.event_registry import EventHandlerRegistry
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 
 class PayrollEventHandler:
-    async def handle_month_end(self, event_data: dict[str, Any]) -> None:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        batch_size: int | None = None,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size or settings.PAYROLL_MONTH_END_BATCH_SIZE
+
+    async def handle_month_end(self, event: MonthEndEvent) -> None:
         """
-        Handle MonthEndEvent: automatically create and calculate payroll for all active employees
+        Handle MonthEndEvent: automatically create and calculate payroll for all active employees.
+
+        Active employees are streamed in keyset batches and each batch is processed and
+        committed in its own session, so memory stays bounded regardless of headcount.
+        Employees that already have a payroll for the period are skipped, so a retried
+        event resumes where the failed attempt stopped.
         """
         try:
-            from datetime import date as date_type
-
-            year = event_data["year"]
-            month = event_data["month"]
-
-            # Parse dates from strings (they're serialized to JSON)
-            period_start_str = event_data["period_start"]
-            period_end_str = event_data["period_end"]
-
-            if isinstance(period_start_str, str):
-                period_start = date_type.fromisoformat(period_start_str)
-            else:
-                period_start = period_start_str
-
-            if isinstance(period_end_str, str):
-                period_end = date_type.fromisoformat(period_end_str)
-            else:
-                period_end = period_end_str
+            year = event.year
+            month = event.month
+            period_start = event.period_start
+            period_end = event.period_end
 
             logger.info(f"Processing month-end payroll for {year}-{month:02d}")
 
@@ -54,97 +57,112 @@ class PayrollEventHandler:
 
             # Calculate working days
             working_days = PayrollPeriodService.get_working_days(period_start, period_end)
+            notes = f"Auto-generated for {year}-{month:02d}"
+
+            # Stream employees active at the end of the period
+            active_count = 0
+            created_count = 0
+            async with self.session_factory() as id_session:
+                employee_facade = EmployeeModuleFacade(id_session)
+                async for employee_ids in employee_facade.iter_active_employee_ids(
+                    period_end, batch_size=self.batch_size
+                ):
+                    active_count += len(employee_ids)
+                    created_count += await self._process_batch(
+                        employee_ids, period, working_days, notes
+                    )
+                    logger.info(f"Month-end {year}-{month:02d}: {active_count} employees processed")
+
+            logger.info(
+                f"Completed month-end payroll processing for {year}-{month:02d}: "
+                f"{created_count} payrolls for {active_count} active employees"
+            )
 
-            # Get all active employees at the end of the period
-            async for session in get_db():
-                try:
-                    # Get active employees
-                    employee_facade = EmployeeModuleFacade(session)
-                    read_model = EmployeeReadModel(session)
-
-                    # Get all employees (we'll filter active ones)
-                    all_employees, total_count = await read_model.list(page=1, limit=1000)
-                    logger.info(f"Found {total_count} total employees")
-
-                    # Filter to only active employees
-                    active_employees = []
-                    for emp in all_employees:
-                        is_active = await employee_facade.is_employee_active_on_date(
-                            emp.id, period_end
+        except Exception as e:
+            logger.error(f"Error handling month-end event: {e}", exc_info=True)
+            # Re-raise so the consumer retries the event instead of dropping it
+            raise
+
+    async def _process_batch(
+        self,
+        employee_ids: list[UUID],
+        period: PayrollPeriod,
+        working_days: int,
+        notes: str,
+    ) -> int:
+        """Create and calculate payrolls for one batch of employees in a single transaction"""
+        created = 0
+        async with self.session_factory() as session:
+            try:
+                repository = SQLAlchemyPayrollRepository(session)
+                already_processed = await repository.get_employee_ids_with_payroll_for_period(
+                    employee_ids, period.start_date, period.end_date
+                )
+
+                adapter = PayrollDataGatheringAdapter(session)
+                validation_adapter = PayrollValidationAdapter(session)
+                create_handler = CreatePayrollHandler(repository, validation_adapter)
+                calculation_service = PayrollCalculationService(adapter)
+
+                for employee_id in employee_ids:
+                    if employee_id in already_processed:
+                        continue
+
+                    try:
+                        # Check eligibility
+                        can_process = await adapter.validate_payroll_eligibility(
+                            employee_id, period.start_date
                         )
-                        if is_active:
-                            active_employees.append(emp)
-
-                    logger.info(f"Found {len(active_employees)} active employees")
-
-                    # Create and calculate payroll for each active employee
-                    for employee in active_employees:
-                        try:
-                            employee_id = employee.id
-
-                            # Check eligibility
-                            adapter = PayrollDataGatheringAdapter(session)
-                            can_process = await adapter.validate_payroll_eligibility(
-                                employee_id, period_start
-                            )
 
-                            if not can_process:
-                                logger.info(
-                                    f"Skipping payroll for employee {employee_id} - not eligible"
-                                )
-                                continue
-
-                            # Create payroll
-                            repository = SQLAlchemyPayrollRepository(session)
-                            validation_adapter = PayrollValidationAdapter(session)
-                            create_handler = CreatePayrollHandler(repository, validation_adapter)
-
-                            command = CreatePayrollCommand(
-                                employee_id=employee_id,
-                                period_type=period.period_type,
-                                period_start_date=period.start_date,
-                                period_end_date=period.end_date,
-                                notes=f"Auto-generated for {year}-{month:02d}",
+                        if not can_process:
+                            logger.info(
+                                f"Skipping payroll for employee {employee_id} - not eligible"
                             )
+                            continue
 
-                            payroll = await create_handler.handle(command)
+                        # Create payroll
+                        command = CreatePayrollCommand(
+                            employee_id=employee_id,
+                            period_type=period.period_type,
+                            period_start_date=period.start_date,
+                            period_end_date=period.end_date,
+                            notes=notes,
+                        )
 
-                            # Calculate payroll
-                            calculation_service = PayrollCalculationService(adapter)
-                            calculated_payroll = await calculation_service.calculate_payroll(
-                                payroll, working_days
-                            )
+                        payroll = await create_handler.handle(command)
 
-                            logger.info(
-                                f"Created and calculated payroll {calculated_payroll.id} "
-                                f"for employee {employee_id}"
-                            )
+                        # Calculate payroll
+                        calculated_payroll = await calculation_service.calculate_payroll(
+                            payroll, working_days
+                        )
+                        created += 1
 
-                        except Exception as e:
-                            logger.error(
-                                f"Error processing payroll for employee {employee.id}: {e}",
-                                exc_info=True,
-                            )
-                            # Continue processing other employees
-                            continue
+                        logger.info(
+                            f"Created and calculated payroll {calculated_payroll.id} "
+                            f"for employee {employee_id}"
+                        )
 
-                    await session.commit()
-                    logger.info(f"Completed month-end payroll processing for {year}-{month:02d}")
-                    break
+                    except Exception as e:
+                        logger.error(
+                            f"Error processing payroll for employee {employee_id}: {e}",
+                            exc_info=True,
+                        )
+                        # Continue processing other employees
+                        continue
 
-                except Exception as e:
-                    await session.rollback()
-                    logger.error(f"Error in month-end payroll processing: {e}", exc_info=True)
-                    raise
+                await session.commit()
+                return created
 
-        except Exception as e:
-            logger.error(f"Error handling month-end event: {e}", exc_info=True)
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"Error in month-end payroll batch: {e}", exc_info=True)
+                raise
 
 
 def register_payroll_handlers(registry: EventHandlerRegistry) -> None:
     handler = PayrollEventHandler()
 
     # Register month-end event handler
-    registry.register("payroll.month-end-event", handler.handle_month_end)
+    registry.register("payroll.month-end-event", handler.handle_month_end, MonthEndEvent)
 
     logger.info("Registered payroll event handlers")
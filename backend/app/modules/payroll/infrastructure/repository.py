@@ -3,6 +3,7 @@ SQLAlchemy implementation of PayrollRepository
 """
 
 import logging
+from datetime import date
 from typing import List, Optional
 from uuid import UUID
 
@@ -205,6 +206,20 @@ class SQLAlchemyPayrollRepository(PayrollRepository):
         result = await self.session.execute(stmt)
         return [self._to_domain(orm) for orm in result.scalars().all()]
 
+    async def get_employee_ids_with_payroll_for_period(
+        self, employee_ids: list[UUID], period_start: date, period_end: date
+    ) -> set[UUID]:
+        """Which of the given employees already have a payroll for the period"""
+        if not employee_ids:
+            return set()
+        stmt = select(PayrollORM.employee_id).where(
+            PayrollORM.employee_id.in_(employee_ids),
+            PayrollORM.period_start_date == period_start,
+            PayrollORM.period_end_date == period_end,
+        )
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+
     async def get_by_employee(self, employee_id: UUID) -> List[Payroll]:
         """Get all payrolls for an employee - wrapper around find_by_employee"""
         return await self.find_by_employee(employee_id)
@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.modules.auth.infrastructure.dependencies import get_current_active_user
 from app.modules.payroll.application.commands import (
     ApprovePayrollCommand,
@@ -95,7 +95,7 @@ async def create_payroll(request: CreatePayrollRequest, db: AsyncSession = Depen
 
 
 @router.get("/{payroll_id}", response_model=PayrollDetailView)
-async def get_payroll(payroll_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_payroll(payroll_id: UUID, db: AsyncSession = Depends(get_read_db)):
     read_model = PayrollReadModel(db)
     handler = GetPayrollHandler(read_model)
 
@@ -113,7 +113,7 @@ async def list_payrolls(
     request: Request,
     page: int = 1,
     limit: int = 100,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     if page < 1:
         raise HTTPException(status_code=400, detail="Page must be >= 1")
@@ -142,7 +142,7 @@ async def list_payrolls_by_employee(
     request: Request,
     page: int = 1,
     limit: int = 100,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     if page < 1:
         raise HTTPException(status_code=400, detail="Page must be >= 1")
@@ -22,3 +22,8 @@ class GenerateReportCommand:
 @dataclass
 class DeleteReportCommand:
     report_id: UUID
+
+
+@dataclass
+class CancelReportCommand:
+    report_id: UUID
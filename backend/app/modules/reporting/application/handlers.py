@@ -1,8 +1,7 @@
 from datetime import date
-from pathlib import Path
-from typing import Any
 
 from app.modules.reporting.application.commands import (
+    CancelReportCommand,
     CreateReportCommand,
     DeleteReportCommand,
     GenerateReportCommand,
@@ -18,6 +17,7 @@ from app.modules.reporting.domain.repository import ReportRepository
 from app.modules.reporting.domain.services import (
     CreateReportService,
 )
+from app.modules.reporting.domain.storage import IReportStorage
 from app.modules.reporting.domain.value_objects import (
     ReportFormat,
     ReportParameters,
@@ -25,7 +25,15 @@ from app.modules.reporting.domain.value_objects import (
     ReportType,
 )
 from app.modules.reporting.infrastructure.adapters import ReportingDataAdapter
+from app.modules.reporting.infrastructure.close_pack import PayrollClosePackBuilder
 from app.modules.reporting.infrastructure.generators import ReportGeneratorFactory
+from app.modules.reporting.infrastructure.progress import (
+    ReportLease,
+    ReportProgress,
+    time_budget_seconds,
+)
+from app.modules.reporting.infrastructure.report_cache import ReportFileCache
+from app.modules.reporting.infrastructure.storage import get_report_storage
 
 
 class CreateReportHandler:
@@ -81,6 +89,24 @@ class DeleteReportHandler:
         await self.repository.delete(command.report_id)
 
 
+class CancelReportHandler:
+    """
+    Cancels a pending or processing report. A worker generating the report
+    notices at its next heartbeat and stops.
+    """
+
+    def __init__(self, repository: ReportRepository):
+        self.repository = repository
+
+    async def handle(self, command: CancelReportCommand) -> Report:
+        report = await self.repository.get_by_id(command.report_id)
+        if not report:
+            raise ValueError(f"Report {command.report_id} not found")
+
+        report.cancel()
+        return await self.repository.save(report)
+
+
 class GetReportHandler:
     def __init__(self, repository: ReportRepository):
         self.repository = repository
@@ -126,10 +152,18 @@ class GenerateReportHandler:
         repository: ReportRepository,
         generator_factory: ReportGeneratorFactory,
         data_adapter: ReportingDataAdapter,
+        report_cache: ReportFileCache | None = None,
+        storage: IReportStorage | None = None,
+        close_pack_builder: PayrollClosePackBuilder | None = None,
     ):
         self.repository = repository
         self.generator_factory = generator_factory
         self.data_adapter = data_adapter
+        self.report_cache = report_cache or ReportFileCache()
+        self.storage = storage or get_report_storage()
+        self.close_pack_builder = close_pack_builder or PayrollClosePackBuilder(
+            generator_factory=generator_factory, report_cache=self.report_cache
+        )
 
     async def handle(self, command: GenerateReportCommand) -> Report:
         """
@@ -153,53 +187,37 @@ class GenerateReportHandler:
 
         return report
 
-    async def _generate_report_file(self, report: Report) -> Path:
+    async def _generate_report_file(self, report: Report) -> str:
+        """Generate, store and complete the report; returns its storage key"""
         report.start_processing()
         await self.repository.save(report)
 
-        try:
-            data = await self._fetch_report_data(report)
-            generator = self.generator_factory.get_generator(report.format.value)
-            file_path = await generator.generate(report, data)
+        # Progress is counted for the row budget; without a session factory the
+        # lease only enforces the time budget
+        progress = ReportProgress.for_report_type(report.report_type)
+        self.data_adapter.progress = progress
+        lease = ReportLease(report.id, progress, time_budget_seconds(report.report_type))
 
-            report.complete(str(file_path))
+        try:
+            if report.report_type == ReportType.PAYROLL_CLOSE_PACK:
+                file_path = await lease.run(
+                    self.close_pack_builder.build(report, self.repository.save_sections, progress)
+                )
+            else:
+                file_path = await lease.run(
+                    self.report_cache.get_or_generate(
+                        report, self.data_adapter, self.generator_factory
+                    )
+                )
+            stored = await self.storage.save(file_path)
+
+            report.rows_processed = progress.rows
+            report.complete(stored.key)
             await self.repository.save(report)
 
-            return file_path
+            return stored.key
 
         except Exception as e:
             report.fail(str(e))
             await self.repository.save(report)
             raise
-
-    async def _fetch_report_data(self, report: Report) -> dict[str, Any]:
-        if report.report_type == ReportType.PAYROLL_SUMMARY:
-            return await self._fetch_payroll_summary_data(report)
-        elif report.report_type == ReportType.EMPLOYEE_COMPENSATION:
-            return await self._fetch_employee_compensation_data(report)
-        elif report.report_type == ReportType.ABSENCE_SUMMARY:
-            return await self._fetch_absence_summary_data(report)
-        elif report.report_type == ReportType.TIMESHEET_SUMMARY:
-            return await self._fetch_timesheet_summary_data(report)
-        elif report.report_type == ReportType.TAX_REPORT:
-            return await self._fetch_tax_report_data(report)
-        else:
-            return await self._fetch_custom_report_data(report)
-
-    async def _fetch_payroll_summary_data(self, report: Report) -> dict[str, Any]:
-        return await self.data_adapter.fetch_payroll_summary_data(report.parameters)
-
-    async def _fetch_employee_compensation_data(self, report: Report) -> dict[str, Any]:
-        return await self.data_adapter.fetch_employee_compensation_data(report.parameters)
-
-    async def _fetch_absence_summary_data(self, report: Report) -> dict[str, Any]:
-        return await self.data_adapter.fetch_absence_summary_data(report.parameters)
-
-    async def _fetch_timesheet_summary_data(self, report: Report) -> dict[str, Any]:
-        return await self.data_adapter.fetch_timesheet_summary_data(report.parameters)
-
-    async def _fetch_tax_report_data(self, report: Report) -> dict[str, Any]:
-        return await self.data_adapter.fetch_tax_report_data(report.parameters)
-
-    async def _fetch_custom_report_data(self, report: Report) -> dict[str, Any]:
-        return await self.data_adapter.fetch_custom_report_data(report.parameters)
@@ -3,8 +3,10 @@ from datetime import datetime
 from uuid import UUID, uuid4
 
 from app.modules.reporting.domain.value_objects import (
+    PAYROLL_CLOSE_PACK_SECTIONS,
     ReportFormat,
     ReportParameters,
+    ReportSection,
     ReportStatus,
     ReportType,
 )
@@ -22,12 +24,21 @@ class Report:
     error_message: str | None = None
     created_at: datetime = field(default_factory=datetime.now)
     completed_at: datetime | None = None
+    sections: list[ReportSection] = field(default_factory=list)
+    # Rows fetched so far and the last sign of life of the generating worker
+    rows_processed: int = 0
+    heartbeat_at: datetime | None = None
     _domain_events: list = field(default_factory=list, init=False, repr=False)
 
+    def __post_init__(self) -> None:
+        if self.report_type == ReportType.PAYROLL_CLOSE_PACK and not self.sections:
+            self.sections = [ReportSection(section) for section in PAYROLL_CLOSE_PACK_SECTIONS]
+
     def start_processing(self) -> None:
         if self.status != ReportStatus.PENDING:
             raise ValueError(f"Cannot start processing report in {self.status.value} status")
         self.status = ReportStatus.PROCESSING
+        self.heartbeat_at = datetime.now()
 
     def complete(self, file_path: str) -> None:
         if self.status != ReportStatus.PROCESSING:
@@ -42,6 +53,37 @@ class Report:
         self.status = ReportStatus.FAILED
         self.error_message = error_message
         self.completed_at = datetime.now()
+        self._close_open_sections(ReportStatus.FAILED)
+
+    def cancel(self) -> None:
+        if self.status not in [ReportStatus.PENDING, ReportStatus.PROCESSING]:
+            raise ValueError(f"Cannot cancel report in {self.status.value} status")
+        self.status = ReportStatus.CANCELLED
+        self.completed_at = datetime.now()
+        self._close_open_sections(ReportStatus.CANCELLED)
+
+    def update_section(
+        self, report_type: ReportType, status: ReportStatus, error_message: str | None = None
+    ) -> None:
+        if self.status != ReportStatus.PROCESSING:
+            raise ValueError(f"Cannot update sections of report in {self.status.value} status")
+        if all(section.report_type != report_type for section in self.sections):
+            raise ValueError(f"Report has no {report_type.value} section")
+        self.sections = [
+            ReportSection(report_type, status, error_message)
+            if section.report_type == report_type
+            else section
+            for section in self.sections
+        ]
+
+    def _close_open_sections(self, status: ReportStatus) -> None:
+        """Give sections that never finished the terminal status of the report"""
+        self.sections = [
+            ReportSection(section.report_type, status, section.error_message)
+            if section.status in (ReportStatus.PENDING, ReportStatus.PROCESSING)
+            else section
+            for section in self.sections
+        ]
 
     def is_completed(self) -> bool:
         return self.status == ReportStatus.COMPLETED
@@ -49,6 +91,9 @@ class Report:
     def is_failed(self) -> bool:
         return self.status == ReportStatus.FAILED
 
+    def is_cancelled(self) -> bool:
+        return self.status == ReportStatus.CANCELLED
+
     def is_processing(self) -> bool:
         return self.status == ReportStatus.PROCESSING
 
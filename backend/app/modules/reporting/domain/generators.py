@@ -1,12 +1,75 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
+from typing import Any
 
 from app.modules.reporting.domain.entities import Report
 
 
+class ColumnType(Enum):
+    STRING = "string"
+    INTEGER = "integer"
+    DECIMAL = "decimal"
+    MONEY = "money"
+    DATE = "date"
+
+
+@dataclass(frozen=True)
+class ReportColumn:
+    name: str
+    type: ColumnType = ColumnType.STRING
+
+    def format(self, value: Any) -> str:
+        """Display text of a value, as written to PDF, CSV, XLSX and JSON reports"""
+        if value is None:
+            return ""
+        if self.type == ColumnType.MONEY:
+            return f"${value:,.2f}"
+        return str(value)
+
+
+@dataclass
+class ReportData:
+    """
+    Column headers and an async iterator over report rows, consumed once.
+
+    Typed reports also carry their columns; their rows then hold values of the
+    column types (str, int, Decimal, date) instead of display text, so
+    columnar formats can keep them and text formats use text_rows().
+    """
+
+    headers: list[str]
+    rows: AsyncIterator[list[Any]]
+    columns: list[ReportColumn] | None = None
+
+    @classmethod
+    def from_rows(cls, headers: list[str], rows: Iterable[list[str]]) -> "ReportData":
+        async def iterate_rows() -> AsyncIterator[list[str]]:
+            for row in rows:
+                yield row
+
+        return cls(headers=headers, rows=iterate_rows())
+
+    @classmethod
+    def typed(cls, columns: list[ReportColumn], rows: AsyncIterator[list[Any]]) -> "ReportData":
+        return cls(headers=[column.name for column in columns], rows=rows, columns=columns)
+
+    async def text_rows(self) -> AsyncIterator[list[str]]:
+        """The rows as display text"""
+        if self.columns is None:
+            async for row in self.rows:
+                yield row
+            return
+
+        async for row in self.rows:
+            yield [column.format(value) for column, value in zip(self.columns, row, strict=True)]
+
+
 class IReportGenerator(ABC):
     @abstractmethod
-    async def generate(self, report: Report, data: dict) -> Path:
+    async def generate(self, report: Report, data: ReportData) -> Path:
         pass
 
     @abstractmethod
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
 from app.modules.reporting.domain.entities import Report
@@ -29,3 +30,18 @@ class ReportRepository(ABC):
     @abstractmethod
     async def delete(self, report_id: UUID) -> None:
         pass
+
+    @abstractmethod
+    async def save_sections(self, report: Report) -> None:
+        """Save the section statuses of a report that is still processing"""
+        pass
+
+    @abstractmethod
+    async def clear_file_paths(self, keys: list[str]) -> int:
+        """Detach stored files about to be deleted from the reports pointing at them"""
+        pass
+
+    @abstractmethod
+    async def fail_stale_processing(self, heartbeat_before: datetime, error_message: str) -> int:
+        """Fail processing reports without a heartbeat since heartbeat_before"""
+        pass
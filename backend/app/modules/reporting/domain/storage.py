@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class StoredReportFile:
+    key: str
+    size: int
+    etag: str
+    modified_at: datetime
+
+
+class IReportStorage(ABC):
+    @abstractmethod
+    async def save(self, source: Path) -> StoredReportFile:
+        """Move a rendered report file into storage, keyed by its file name"""
+        pass
+
+    @abstractmethod
+    async def stat(self, key: str) -> StoredReportFile | None:
+        pass
+
+    @abstractmethod
+    def read(self, key: str, start: int = 0, end: int | None = None) -> AsyncIterator[bytes]:
+        """Stream the bytes from start to end (inclusive) of a stored file"""
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def list_files(self) -> AsyncIterator[StoredReportFile]:
+        pass
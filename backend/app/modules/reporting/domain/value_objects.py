@@ -9,14 +9,26 @@ class ReportType(Enum):
     ABSENCE_SUMMARY = "absence_summary"
     TIMESHEET_SUMMARY = "timesheet_summary"
     TAX_REPORT = "tax_report"
+    PAYROLL_CLOSE_PACK = "payroll_close_pack"
     CUSTOM = "custom"
 
 
+# Sections of a payroll close pack, in the order they are bundled
+PAYROLL_CLOSE_PACK_SECTIONS = (
+    ReportType.PAYROLL_SUMMARY,
+    ReportType.TAX_REPORT,
+    ReportType.ABSENCE_SUMMARY,
+    ReportType.EMPLOYEE_COMPENSATION,
+)
+
+
 class ReportFormat(Enum):
     PDF = "pdf"
     CSV = "csv"
     XLSX = "xlsx"
     JSON = "json"
+    PARQUET = "parquet"
+    ARROW = "arrow"
 
 
 class ReportStatus(Enum):
@@ -24,6 +36,7 @@ class ReportStatus(Enum):
     PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLED = "cancelled"
 
 
 @dataclass(frozen=True)
@@ -48,3 +61,28 @@ class ReportParameters:
             "end_date": self.end_date.isoformat() if self.end_date else None,
             "additional_filters": self.additional_filters,
         }
+
+
+@dataclass(frozen=True)
+class ReportSection:
+    """Generation status of one section of a composite report"""
+
+    report_type: ReportType
+    status: ReportStatus = ReportStatus.PENDING
+    error_message: str | None = None
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization"""
+        return {
+            "report_type": self.report_type.value,
+            "status": self.status.value,
+            "error_message": self.error_message,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ReportSection":
+        return cls(
+            report_type=ReportType(data["report_type"]),
+            status=ReportStatus(data["status"]),
+            error_message=data.get("error_message"),
+        )
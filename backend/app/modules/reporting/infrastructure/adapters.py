@@ -1,21 +1,122 @@
 """
 Reporting Module Adapters
 Anti-Corruption Layer for accessing other modules' data
+
+Report rows are streamed from the database with server-side cursors in
+batches of REPORT_STREAM_BATCH_SIZE, so generators can write reports of any
+size without holding all rows in memory.
 """
 
+from collections.abc import AsyncIterator, Sequence
 from datetime import date
 from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
+from sqlalchemy import (
+    Numeric,
+    Select,
+    cast,
+    event,
+    func,
+    literal_column,
+    or_,
+    select,
+    true,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import outerjoin, selectinload
+from sqlalchemy.schema import DDL
 
+from app.config import get_settings
+from app.database import Base
 from app.modules.absence.api.facade import AbsenceModuleFacade
-from app.modules.compensation.api.facade import CompensationModuleFacade
-from app.modules.contract.api.facade import ContractModuleFacade
+from app.modules.absence.infrastructure.models import AbsenceModel
+from app.modules.compensation.infrastructure.models import BonusORM
+from app.modules.contract.domain.value_objects import ContractStatus
+from app.modules.contract.infrastructure.models import ContractORM
 from app.modules.employee.api.facade import EmployeeModuleFacade
+from app.modules.employee.infrastructure.models import EmployeeORM
+from app.modules.payroll.domain.value_objects import PayrollLineType
+from app.modules.payroll.infrastructure.models import PayrollLineORM, PayrollORM
 from app.modules.payroll.infrastructure.read_model import PayrollReadModel
-from app.modules.reporting.domain.value_objects import ReportParameters
+from app.modules.reporting.domain.entities import Report
+from app.modules.reporting.domain.generators import ColumnType, ReportColumn, ReportData
+from app.modules.reporting.domain.value_objects import ReportParameters, ReportType
+from app.modules.reporting.infrastructure.models import (
+    BUMP_REPORT_SOURCE_VERSION,
+    ReportSourceVersionORM,
+    report_source_version_trigger,
+)
+from app.modules.reporting.infrastructure.progress import ReportProgress
+from app.modules.timesheet.domain.value_objects import TimesheetStatus
+from app.modules.timesheet.infrastructure.models import TimesheetORM
+
+settings = get_settings()
+
+# Tables each report type reads; a change to any of them invalidates cached reports
+REPORT_SOURCE_TABLES: dict[ReportType, tuple[type, ...]] = {
+    ReportType.PAYROLL_SUMMARY: (PayrollORM, EmployeeORM),
+    ReportType.EMPLOYEE_COMPENSATION: (EmployeeORM, ContractORM, BonusORM),
+    ReportType.ABSENCE_SUMMARY: (AbsenceModel, EmployeeORM),
+    ReportType.TIMESHEET_SUMMARY: (TimesheetORM, EmployeeORM),
+    ReportType.TAX_REPORT: (PayrollORM, PayrollLineORM, EmployeeORM),
+}
+REPORT_SOURCE_TABLE_NAMES = sorted(
+    {model.__tablename__ for models in REPORT_SOURCE_TABLES.values() for model in models}
+)
+
+# Schemas created from the models (tests) get the change counter triggers the
+# migrations install
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(BUMP_REPORT_SOURCE_VERSION).execute_if(dialect="postgresql"),
+)
+for _table_name in REPORT_SOURCE_TABLE_NAMES:
+    event.listen(
+        Base.metadata,
+        "after_create",
+        DDL(report_source_version_trigger(_table_name)).execute_if(dialect="postgresql"),
+    )
+
+# Typed row schemas; text formats render money as "$1,234.56"
+PAYROLL_SUMMARY_COLUMNS = [
+    ReportColumn("Employee"),
+    ReportColumn("Gross Pay", ColumnType.MONEY),
+    ReportColumn("Deductions", ColumnType.MONEY),
+    ReportColumn("Net Pay", ColumnType.MONEY),
+    ReportColumn("Period Start", ColumnType.DATE),
+    ReportColumn("Period End", ColumnType.DATE),
+]
+EMPLOYEE_COMPENSATION_COLUMNS = [
+    ReportColumn("Employee"),
+    ReportColumn("Base Salary", ColumnType.MONEY),
+    ReportColumn("Bonuses", ColumnType.MONEY),
+    ReportColumn("Total", ColumnType.MONEY),
+    ReportColumn("Year", ColumnType.INTEGER),
+]
+ABSENCE_SUMMARY_COLUMNS = [
+    ReportColumn("Employee"),
+    ReportColumn("Absence Type"),
+    ReportColumn("Days", ColumnType.INTEGER),
+    ReportColumn("Start Date", ColumnType.DATE),
+    ReportColumn("End Date", ColumnType.DATE),
+]
+TIMESHEET_SUMMARY_COLUMNS = [
+    ReportColumn("Employee"),
+    ReportColumn("Regular Hours", ColumnType.DECIMAL),
+    ReportColumn("Overtime Hours", ColumnType.DECIMAL),
+    ReportColumn("Total Hours", ColumnType.DECIMAL),
+    ReportColumn("Week"),
+]
+TAX_REPORT_COLUMNS = [
+    ReportColumn("Employee"),
+    ReportColumn("Gross Income", ColumnType.MONEY),
+    ReportColumn("Federal Tax", ColumnType.MONEY),
+    ReportColumn("State Tax", ColumnType.MONEY),
+    ReportColumn("Total Tax", ColumnType.MONEY),
+]
 
 
 class ReportingDataAdapter:
@@ -24,25 +125,91 @@ class ReportingDataAdapter:
     Implements the Anti-Corruption Layer pattern
     """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        batch_size: int | None = None,
+        progress: ReportProgress | None = None,
+    ):
         self.session = session
+        self.batch_size = batch_size or settings.REPORT_STREAM_BATCH_SIZE
+        # Counts the fetched rows and enforces the row budget
+        self.progress = progress
         self.employee_facade = EmployeeModuleFacade(session)
         self.absence_facade = AbsenceModuleFacade(session)
-        self.compensation_facade = CompensationModuleFacade(session)
-        self.contract_facade = ContractModuleFacade(session)
         self.payroll_read_model = PayrollReadModel(session)
 
-    async def fetch_payroll_summary_data(self, parameters: ReportParameters) -> dict[str, Any]:
+    async def fetch_report_data(self, report: Report) -> ReportData:
+        """Fetch data for the report based on its type"""
+        if report.report_type == ReportType.PAYROLL_SUMMARY:
+            data = await self.fetch_payroll_summary_data(report.parameters)
+        elif report.report_type == ReportType.EMPLOYEE_COMPENSATION:
+            data = await self.fetch_employee_compensation_data(report.parameters)
+        elif report.report_type == ReportType.ABSENCE_SUMMARY:
+            data = await self.fetch_absence_summary_data(report.parameters)
+        elif report.report_type == ReportType.TIMESHEET_SUMMARY:
+            data = await self.fetch_timesheet_summary_data(report.parameters)
+        elif report.report_type == ReportType.TAX_REPORT:
+            data = await self.fetch_tax_report_data(report.parameters)
+        else:
+            data = await self.fetch_custom_report_data(report.parameters)
+
+        if self.progress is not None:
+            data.rows = self.progress.track(data.rows)
+        return data
+
+    async def data_watermark(self, report_type: ReportType) -> str:
+        """
+        Fingerprint of the tables a report type reads, for the report cache.
+
+        Every insert, update, delete or truncate of a source table bumps its
+        change counter in report_source_versions (see ReportSourceVersionORM),
+        including writes whose updated_at is not maintained. Reading the
+        counters is a primary key lookup, however large the tables grow.
+        """
+        table_names = sorted(
+            model.__tablename__ for model in REPORT_SOURCE_TABLES.get(report_type, ())
+        )
+        if not table_names:
+            return ""
+
+        query = (
+            select(ReportSourceVersionORM.table_name, func.sum(ReportSourceVersionORM.version))
+            .where(ReportSourceVersionORM.table_name.in_(table_names))
+            .group_by(ReportSourceVersionORM.table_name)
+        )
+        versions = dict((await self.session.execute(query)).tuples().all())
+        return ";".join(f"{name}:{versions.get(name, 0)}" for name in table_names)
+
+    async def _stream_batches(
+        self, query: Select, scalars: bool = True
+    ) -> AsyncIterator[Sequence[Any]]:
+        """Stream ORM objects (or rows, if not scalars) for query in batches of batch_size"""
+        query = query.execution_options(yield_per=self.batch_size)
+        if scalars:
+            result = await self.session.stream_scalars(query)
+        else:
+            result = await self.session.stream(query)
+        try:
+            async for batch in result.partitions():
+                yield batch
+        finally:
+            await result.close()
+
+    async def _employee_names(self, employee_ids: set[UUID]) -> dict[UUID, str]:
+        """Bulk fetch employee names for one batch to avoid N+1 queries"""
+        employees_map = await self.employee_facade.get_employees_by_ids(list(employee_ids))
+        return {
+            employee_id: f"{employee.first_name} {employee.last_name}"
+            for employee_id, employee in employees_map.items()
+        }
+
+    async def fetch_payroll_summary_data(self, parameters: ReportParameters) -> ReportData:
         """
         Fetch payroll summary data from Payroll module
         Returns data in format ready for report generation
         """
-        # Fetch payrolls from read model
-        from sqlalchemy import select
-
-        from app.modules.payroll.infrastructure.models import PayrollORM
-
-        query = select(PayrollORM)
+        query = select(PayrollORM).order_by(PayrollORM.period_start_date, PayrollORM.id)
 
         if parameters.employee_id:
             query = query.where(PayrollORM.employee_id == UUID(parameters.employee_id))
@@ -53,97 +220,94 @@ class ReportingDataAdapter:
                 PayrollORM.period_end_date <= parameters.end_date,
             )
 
-        result = await self.session.execute(query)
-        payrolls = result.scalars().all()
-
-        # Bulk fetch all employees to avoid N+1 query
-        employee_ids = list(set(payroll.employee_id for payroll in payrolls))
-        employees_map = await self.employee_facade.get_employees_by_ids(employee_ids)
-
-        # Format data for report
-        rows = []
-        for payroll in payrolls:
-            # Get employee name from map
-            employee = employees_map.get(payroll.employee_id)
-            employee_name = f"{employee.first_name} {employee.last_name}" if employee else "Unknown"
-
-            # Extract payroll summary data
-            gross_pay = f"${payroll.gross_pay:,.2f}" if payroll.gross_pay else "$0.00"
-            deductions = (
-                f"${payroll.total_deductions:,.2f}" if payroll.total_deductions else "$0.00"
-            )
-            net_pay = f"${payroll.net_pay:,.2f}" if payroll.net_pay else "$0.00"
-            period = f"{payroll.period_start_date} to {payroll.period_end_date}"
-
-            rows.append([employee_name, gross_pay, deductions, net_pay, period])
+        async def rows() -> AsyncIterator[list[Any]]:
+            async for payrolls in self._stream_batches(query):
+                names = await self._employee_names({payroll.employee_id for payroll in payrolls})
+
+                for payroll in payrolls:
+                    yield [
+                        names.get(payroll.employee_id, "Unknown"),
+                        payroll.gross_pay or Decimal("0"),
+                        payroll.total_deductions or Decimal("0"),
+                        payroll.net_pay or Decimal("0"),
+                        payroll.period_start_date,
+                        payroll.period_end_date,
+                    ]
 
-        return {
-            "headers": ["Employee", "Gross Pay", "Deductions", "Net Pay", "Period"],
-            "rows": rows,
-        }
+        return ReportData.typed(PAYROLL_SUMMARY_COLUMNS, rows())
 
-    async def fetch_employee_compensation_data(
-        self, parameters: ReportParameters
-    ) -> dict[str, Any]:
+    async def fetch_employee_compensation_data(self, parameters: ReportParameters) -> ReportData:
         """
-        Fetch employee compensation data from Contract and Compensation modules
+        Fetch employee compensation data in a single query: each employee with
+        the rate of the contract in effect on the check date (lateral join) and
+        the sum of bonuses paid in the period (grouped subquery)
         """
-        # Get all employees or specific employee
-        from sqlalchemy import select
-
-        from app.modules.employee.infrastructure.models import EmployeeORM
+        # Get current contract for base salary
+        check_date = parameters.start_date if parameters.start_date else date.today()
+
+        # Get bonuses for the period (or year)
+        start = parameters.start_date if parameters.start_date else date(check_date.year, 1, 1)
+        end = parameters.end_date if parameters.end_date else date(check_date.year, 12, 31)
+
+        # The latest active contract valid on the check date, as in
+        # ContractModuleFacade.get_active_contract_for_employee
+        contract = (
+            select(ContractORM.rate_amount)
+            .where(
+                ContractORM.employee_id == EmployeeORM.id,
+                ContractORM.status == ContractStatus.ACTIVE,
+                ContractORM.valid_from <= check_date,
+                or_(ContractORM.valid_to.is_(None), ContractORM.valid_to >= check_date),
+            )
+            .order_by(ContractORM.valid_from.desc())
+            .limit(1)
+            .lateral("contract")
+        )
 
-        query = select(EmployeeORM)
+        bonuses = (
+            select(BonusORM.employee_id, func.sum(BonusORM.amount).label("total"))
+            .where(BonusORM.payment_date >= start, BonusORM.payment_date <= end)
+            .group_by(BonusORM.employee_id)
+        )
 
         if parameters.employee_id:
-            query = query.where(EmployeeORM.id == UUID(parameters.employee_id))
-
-        if parameters.department:
-            query = query.where(EmployeeORM.department == parameters.department)
-
-        result = await self.session.execute(query)
-        employees = result.scalars().all()
-
-        # Build rows
-        rows = []
-        for employee in employees:
-            employee_name = f"{employee.first_name} {employee.last_name}"
-
-            # Get current contract for base salary
-            check_date = parameters.start_date if parameters.start_date else date.today()
-
-            contract = await self.contract_facade.get_active_contract_for_employee(
-                employee.id, check_date
+            bonuses = bonuses.where(BonusORM.employee_id == UUID(parameters.employee_id))
+        bonuses = bonuses.subquery("period_bonuses")
+
+        query = (
+            select(
+                EmployeeORM.first_name,
+                EmployeeORM.last_name,
+                func.coalesce(contract.c.rate_amount, 0).label("base_salary"),
+                func.coalesce(bonuses.c.total, 0).label("total_bonuses"),
             )
+            .select_from(
+                outerjoin(EmployeeORM, contract, true()).outerjoin(
+                    bonuses, bonuses.c.employee_id == EmployeeORM.id
+                )
+            )
+            .order_by(EmployeeORM.last_name, EmployeeORM.id)
+        )
 
-            base_salary = Decimal("0")
-            if contract:
-                base_salary = contract.terms.rate_amount
-
-            # Get bonuses for the period (or year)
-            start = parameters.start_date if parameters.start_date else date(check_date.year, 1, 1)
-            end = parameters.end_date if parameters.end_date else date(check_date.year, 12, 31)
-
-            bonuses = await self.compensation_facade.get_bonuses_for_period(employee.id, start, end)
-
-            total_bonuses = sum(bonus.amount_value for bonus in bonuses)
-            total_comp = base_salary + total_bonuses
-
-            year = start.year
+        if parameters.employee_id:
+            query = query.where(EmployeeORM.id == UUID(parameters.employee_id))
 
-            rows.append(
-                [
-                    employee_name,
-                    f"${base_salary:,.2f}",
-                    f"${total_bonuses:,.2f}",
-                    f"${total_comp:,.2f}",
-                    str(year),
-                ]
-            )
+        async def rows() -> AsyncIterator[list[Any]]:
+            async for batch in self._stream_batches(query, scalars=False):
+                for employee in batch:
+                    total_comp = employee.base_salary + employee.total_bonuses
+
+                    yield [
+                        f"{employee.first_name} {employee.last_name}",
+                        employee.base_salary,
+                        employee.total_bonuses,
+                        total_comp,
+                        start.year,
+                    ]
 
-        return {"headers": ["Employee", "Base Salary", "Bonuses", "Total", "Year"], "rows": rows}
+        return ReportData.typed(EMPLOYEE_COMPENSATION_COLUMNS, rows())
 
-    async def fetch_absence_summary_data(self, parameters: ReportParameters) -> dict[str, Any]:
+    async def fetch_absence_summary_data(self, parameters: ReportParameters) -> ReportData:
         """
         Fetch absence summary data from Absence module
         """
@@ -151,108 +315,120 @@ class ReportingDataAdapter:
         start = parameters.start_date
         end = parameters.end_date
 
-        # Get absences from facade
-        if parameters.employee_id and start and end:
-            absences = await self.absence_facade.get_approved_absences_in_period(
-                UUID(parameters.employee_id), start, end
-            )
-        elif parameters.employee_id:
-            absences = await self.absence_facade.get_absences_for_employee(
-                UUID(parameters.employee_id)
-            )
-        else:
-            # Get all absences for the period
-            from sqlalchemy import select
-
-            from app.modules.absence.infrastructure.models import AbsenceORM
-
-            query = select(AbsenceORM)
+        async def batches() -> AsyncIterator[Sequence[Any]]:
+            # Absences of a single employee come from the facade in one go
+            if parameters.employee_id and start and end:
+                yield await self.absence_facade.get_approved_absences_in_period(
+                    UUID(parameters.employee_id), start, end
+                )
+            elif parameters.employee_id:
+                yield await self.absence_facade.get_absences_for_employee(
+                    UUID(parameters.employee_id)
+                )
+            else:
+                # Stream all absences for the period
+                query = select(AbsenceModel).order_by(AbsenceModel.start_date, AbsenceModel.id)
+
+                if start and end:
+                    query = query.where(
+                        AbsenceModel.start_date >= start, AbsenceModel.end_date <= end
+                    )
+
+                async for batch in self._stream_batches(query):
+                    yield batch
+
+        async def rows() -> AsyncIterator[list[Any]]:
+            async for absences in batches():
+                names = await self._employee_names({absence.employee_id for absence in absences})
+
+                for absence in absences:
+                    # Calculate days
+                    days = (absence.end_date - absence.start_date).days + 1
+
+                    yield [
+                        names.get(absence.employee_id, "Unknown"),
+                        absence.absence_type.value
+                        if hasattr(absence.absence_type, "value")
+                        else str(absence.absence_type),
+                        days,
+                        absence.start_date,
+                        absence.end_date,
+                    ]
 
-            if start and end:
-                query = query.where(AbsenceORM.start_date >= start, AbsenceORM.end_date <= end)
+        return ReportData.typed(ABSENCE_SUMMARY_COLUMNS, rows())
 
-            result = await self.session.execute(query)
-            absence_orms = result.scalars().all()
+    async def fetch_timesheet_summary_data(self, parameters: ReportParameters) -> ReportData:
+        """
+        Fetch approved hours per employee and ISO week in a single query: the
+        timesheets are summed per employee and week (grouped subquery) and
+        joined with employee names
+        """
+        # The format is rendered inline so the grouped and selected expressions match
+        week = func.to_char(TimesheetORM.start_date, literal_column("""'IYYY-"W"IW'""")).label(
+            "week"
+        )
+
+        weekly_hours = (
+            select(
+                TimesheetORM.employee_id,
+                week,
+                cast(func.sum(TimesheetORM.hours), Numeric(12, 2)).label("regular_hours"),
+                cast(func.sum(TimesheetORM.overtime_hours), Numeric(12, 2)).label("overtime_hours"),
+            )
+            .where(TimesheetORM.status == TimesheetStatus.APPROVED.value)
+            .group_by(TimesheetORM.employee_id, week)
+        )
 
-            # Convert to response format
-            from app.modules.absence.presentation.schemas import AbsenceResponse
+        if parameters.employee_id:
+            weekly_hours = weekly_hours.where(
+                TimesheetORM.employee_id == UUID(parameters.employee_id)
+            )
 
-            absences = [
-                AbsenceResponse(
-                    id=a.id,
-                    employee_id=a.employee_id,
-                    absence_type=a.absence_type,
-                    start_date=a.start_date,
-                    end_date=a.end_date,
-                    status=a.status,
-                    reason=a.reason,
-                    created_at=a.created_at,
-                    updated_at=a.updated_at,
-                )
-                for a in absence_orms
-            ]
-
-        # Bulk fetch all employees to avoid N+1 query
-        employee_ids = list(set(absence.employee_id for absence in absences))
-        employees_map = await self.employee_facade.get_employees_by_ids(employee_ids)
-
-        # Build rows
-        rows = []
-        for absence in absences:
-            # Get employee name from map
-            employee = employees_map.get(absence.employee_id)
-            employee_name = f"{employee.first_name} {employee.last_name}" if employee else "Unknown"
-
-            # Calculate days
-            days = (absence.end_date - absence.start_date).days + 1
-
-            rows.append(
-                [
-                    employee_name,
-                    absence.absence_type.value
-                    if hasattr(absence.absence_type, "value")
-                    else str(absence.absence_type),
-                    str(days),
-                    str(absence.start_date),
-                    str(absence.end_date),
-                ]
+        if parameters.start_date and parameters.end_date:
+            weekly_hours = weekly_hours.where(
+                TimesheetORM.start_date >= parameters.start_date,
+                TimesheetORM.end_date <= parameters.end_date,
+            )
+        weekly_hours = weekly_hours.subquery("weekly_hours")
+
+        query = (
+            select(
+                EmployeeORM.first_name,
+                EmployeeORM.last_name,
+                weekly_hours.c.week,
+                weekly_hours.c.regular_hours,
+                weekly_hours.c.overtime_hours,
+            )
+            .select_from(
+                outerjoin(weekly_hours, EmployeeORM, EmployeeORM.id == weekly_hours.c.employee_id)
             )
+            .order_by(EmployeeORM.last_name, weekly_hours.c.employee_id, weekly_hours.c.week)
+        )
+
+        async def rows() -> AsyncIterator[list[Any]]:
+            async for batch in self._stream_batches(query, scalars=False):
+                for timesheet in batch:
+                    if timesheet.first_name is None:
+                        employee_name = "Unknown"
+                    else:
+                        employee_name = f"{timesheet.first_name} {timesheet.last_name}"
+
+                    yield [
+                        employee_name,
+                        timesheet.regular_hours,
+                        timesheet.overtime_hours,
+                        timesheet.regular_hours + timesheet.overtime_hours,
+                        timesheet.week,
+                    ]
 
-        return {
-            "headers": ["Employee", "Absence Type", "Days", "Start Date", "End Date"],
-            "rows": rows,
-        }
+        return ReportData.typed(TIMESHEET_SUMMARY_COLUMNS, rows())
 
-    async def fetch_timesheet_summary_data(self, parameters: ReportParameters) -> dict[str, Any]:
-        """
-        Fetch timesheet summary data
-        Note: Timesheet module not yet implemented, returning placeholder
-        """
-        return {
-            "headers": [
-                "Employee",
-                "Regular Hours",
-                "Overtime Hours",
-                "Total Hours",
-                "Week",
-            ],
-            "rows": [
-                ["No timesheet data", "0", "0", "0", "N/A"],
-            ],
-        }
-
-    async def fetch_tax_report_data(self, parameters: ReportParameters) -> dict[str, Any]:
+    async def fetch_tax_report_data(self, parameters: ReportParameters) -> ReportData:
         """
         Fetch tax report data from payroll records
         Attempts to extract federal/state tax breakdown from payroll lines
         """
         # Build query for payrolls with lines eager-loaded
-        from sqlalchemy import select
-        from sqlalchemy.orm import selectinload
-
-        from app.modules.payroll.domain.value_objects import PayrollLineType
-        from app.modules.payroll.infrastructure.models import PayrollORM
-
         query = select(PayrollORM).options(selectinload(PayrollORM.lines))
 
         if parameters.employee_id:
@@ -264,103 +440,71 @@ class ReportingDataAdapter:
                 PayrollORM.period_end_date <= parameters.end_date,
             )
 
-        result = await self.session.execute(query)
-        payrolls = result.scalars().all()
-
-        # Aggregate tax data by employee
+        # Aggregate tax data by employee; only the per-employee totals are kept
         employee_taxes: dict[UUID, dict[str, Decimal]] = {}
         has_explicit_breakdown = False
 
-        for payroll in payrolls:
-            if payroll.employee_id not in employee_taxes:
-                employee_taxes[payroll.employee_id] = {
-                    "gross": Decimal("0"),
-                    "federal_tax": Decimal("0"),
-                    "state_tax": Decimal("0"),
-                    "total_tax": Decimal("0"),
-                }
-
-            employee_taxes[payroll.employee_id]["gross"] += payroll.gross_pay or Decimal("0")
-            employee_taxes[payroll.employee_id]["total_tax"] += payroll.total_taxes or Decimal("0")
-
-            # Try to extract federal/state tax breakdown from payroll lines
-            for line in payroll.lines:
-                if line.line_type == PayrollLineType.TAX:
-                    description_lower = line.description.lower()
-                    amount = abs(line.amount) if line.amount else Decimal("0")
-
-                    if "federal" in description_lower:
-                        employee_taxes[payroll.employee_id]["federal_tax"] += amount
-                        has_explicit_breakdown = True
-                    elif "state" in description_lower:
-                        employee_taxes[payroll.employee_id]["state_tax"] += amount
-                        has_explicit_breakdown = True
-
-        # Bulk fetch all employees to avoid N+1 query
-        employee_ids = list(employee_taxes.keys())
-        employees_map = await self.employee_facade.get_employees_by_ids(employee_ids)
-
-        # Determine headers based on whether we have explicit breakdown
+        async for payrolls in self._stream_batches(query):
+            for payroll in payrolls:
+                if payroll.employee_id not in employee_taxes:
+                    employee_taxes[payroll.employee_id] = {
+                        "gross": Decimal("0"),
+                        "federal_tax": Decimal("0"),
+                        "state_tax": Decimal("0"),
+                        "total_tax": Decimal("0"),
+                    }
+
+                taxes = employee_taxes[payroll.employee_id]
+                taxes["gross"] += payroll.gross_pay or Decimal("0")
+                taxes["total_tax"] += payroll.total_taxes or Decimal("0")
+
+                # Try to extract federal/state tax breakdown from payroll lines
+                for line in payroll.lines:
+                    if line.line_type == PayrollLineType.TAX:
+                        description_lower = line.description.lower()
+                        amount = abs(line.amount) if line.amount else Decimal("0")
+
+                        if "federal" in description_lower:
+                            taxes["federal_tax"] += amount
+                            has_explicit_breakdown = True
+                        elif "state" in description_lower:
+                            taxes["state_tax"] += amount
+                            has_explicit_breakdown = True
+
+        # No explicit breakdown available, show only gross and total tax
         if has_explicit_breakdown:
-            headers = [
-                "Employee",
-                "Gross Income",
-                "Federal Tax",
-                "State Tax",
-                "Total Tax",
-            ]
+            columns = TAX_REPORT_COLUMNS
         else:
-            # No explicit breakdown available, show only total
-            headers = [
-                "Employee",
-                "Gross Income",
-                "Total Tax",
-            ]
-
-        # Build rows
-        rows = []
-        for employee_id, tax_data in employee_taxes.items():
-            employee = employees_map.get(employee_id)
-            employee_name = f"{employee.first_name} {employee.last_name}" if employee else "Unknown"
-
-            gross = tax_data["gross"]
-            total_tax = tax_data["total_tax"]
-
-            if has_explicit_breakdown:
-                federal_tax = tax_data["federal_tax"]
-                state_tax = tax_data["state_tax"]
-
-                rows.append(
-                    [
-                        employee_name,
-                        f"${gross:,.2f}",
-                        f"${federal_tax:,.2f}",
-                        f"${state_tax:,.2f}",
-                        f"${total_tax:,.2f}",
-                    ]
-                )
-            else:
-                # Only show gross and total tax when no breakdown available
-                rows.append(
-                    [
-                        employee_name,
-                        f"${gross:,.2f}",
-                        f"${total_tax:,.2f}",
-                    ]
-                )
-
-        return {
-            "headers": headers,
-            "rows": rows,
-        }
-
-    async def fetch_custom_report_data(self, parameters: ReportParameters) -> dict[str, Any]:
+            columns = [TAX_REPORT_COLUMNS[0], TAX_REPORT_COLUMNS[1], TAX_REPORT_COLUMNS[4]]
+
+        async def rows() -> AsyncIterator[list[Any]]:
+            employee_ids = list(employee_taxes)
+            for offset in range(0, len(employee_ids), self.batch_size):
+                batch = employee_ids[offset : offset + self.batch_size]
+                names = await self._employee_names(set(batch))
+
+                for employee_id in batch:
+                    tax_data = employee_taxes[employee_id]
+                    employee_name = names.get(employee_id, "Unknown")
+
+                    if has_explicit_breakdown:
+                        yield [
+                            employee_name,
+                            tax_data["gross"],
+                            tax_data["federal_tax"],
+                            tax_data["state_tax"],
+                            tax_data["total_tax"],
+                        ]
+                    else:
+                        yield [employee_name, tax_data["gross"], tax_data["total_tax"]]
+
+        return ReportData.typed(columns, rows())
+
+    async def fetch_custom_report_data(self, parameters: ReportParameters) -> ReportData:
         """
         Fetch custom report data based on additional_filters
         """
-        return {
-            "headers": ["Field 1", "Field 2", "Field 3"],
-            "rows": [
-                ["Custom report", "not yet", "implemented"],
-            ],
-        }
+        return ReportData.from_rows(
+            ["Field 1", "Field 2", "Field 3"],
+            [["Custom report", "not yet", "implemented"]],
+        )
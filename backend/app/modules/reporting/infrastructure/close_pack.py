@@ -0,0 +1,220 @@
+"""
+Payroll close pack: the month-end payroll summary, tax report, absence summary
+and compensation report generated together as one report.
+
+Every section is queried concurrently on its own read session, since a
+session runs one query at a time. The sections are then bundled:
+
+  xlsx  - one workbook with a sheet per section, written in a render worker
+  other - a ZIP archive with a file per section; each section goes through
+          the report cache and its generator, so PDF sections are rendered in
+          parallel render workers
+
+Each section's status is recorded on the report as it progresses. If any
+section fails the pack fails, after the other sections have finished.
+"""
+
+import asyncio
+import logging
+import zipfile
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any, TypeVar
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import get_settings
+from app.database import AsyncReadSessionLocal
+from app.modules.reporting.domain.entities import Report
+from app.modules.reporting.domain.value_objects import ReportFormat, ReportStatus, ReportType
+from app.modules.reporting.infrastructure.adapters import ReportingDataAdapter
+from app.modules.reporting.infrastructure.generators import ReportGeneratorFactory, spool_rows
+from app.modules.reporting.infrastructure.progress import ReportProgress
+from app.modules.reporting.infrastructure.render_pool import (
+    ReportRenderPool,
+    get_report_render_pool,
+)
+from app.modules.reporting.infrastructure.rendering import RenderJob, render_xlsx_workbook
+from app.modules.reporting.infrastructure.report_cache import ReportFileCache
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+T = TypeVar("T")
+
+
+class PayrollClosePackBuilder:
+    def __init__(
+        self,
+        read_session_factory: async_sessionmaker = AsyncReadSessionLocal,
+        generator_factory: ReportGeneratorFactory | None = None,
+        report_cache: ReportFileCache | None = None,
+        render_pool: ReportRenderPool | None = None,
+        output_dir: str = settings.REPORT_WORK_DIR,
+    ):
+        self.read_session_factory = read_session_factory
+        self.output_dir = Path(output_dir)
+        self.render_pool = render_pool or get_report_render_pool()
+        self.generator_factory = generator_factory or ReportGeneratorFactory(
+            output_dir, self.render_pool
+        )
+        self.report_cache = report_cache or ReportFileCache(output_dir)
+
+    async def build(
+        self,
+        report: Report,
+        on_section_update: Callable[[Report], Awaitable[Any]] | None = None,
+        progress: ReportProgress | None = None,
+    ) -> Path:
+        """Generate every section of the report and return the bundled file"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        bundle_suffix = ".xlsx" if report.format == ReportFormat.XLSX else ".zip"
+        bundle_path = self.output_dir / f"report_{report.id}_{timestamp}{bundle_suffix}"
+
+        # Section updates are saved one at a time on the caller's session
+        lock = asyncio.Lock()
+        section_files: list[Path] = []
+
+        async def update(
+            section_type: ReportType, status: ReportStatus, error_message: str | None = None
+        ) -> None:
+            async with lock:
+                report.update_section(section_type, status, error_message)
+                if on_section_update is not None:
+                    await on_section_update(report)
+
+        async def build_section(section_type: ReportType, build: Awaitable[T]) -> T:
+            await update(section_type, ReportStatus.PROCESSING)
+            try:
+                section = await build
+            except Exception as e:
+                logger.error(f"Section {section_type.value} of report {report.id} failed: {e}")
+                await update(section_type, ReportStatus.FAILED, str(e))
+                raise
+            except BaseException:
+                # The pack was cancelled or ran out of time; leave no section processing
+                await update(section_type, ReportStatus.CANCELLED)
+                raise
+            await update(section_type, ReportStatus.COMPLETED)
+            return section
+
+        async def spool_section(index: int, section_type: ReportType) -> RenderJob:
+            job = await self._spool_section(report, section_type, bundle_path, index, progress)
+            section_files.append(Path(job.rows_path))
+            return job
+
+        async def generate_section(section_type: ReportType) -> Path:
+            section_file = await self._generate_section(report, section_type, progress)
+            section_files.append(section_file)
+            return section_file
+
+        section_types = [section.report_type for section in report.sections]
+        try:
+            if report.format == ReportFormat.XLSX:
+                jobs = _completed_sections(
+                    report,
+                    await asyncio.gather(
+                        *(
+                            build_section(section_type, spool_section(index, section_type))
+                            for index, section_type in enumerate(section_types)
+                        ),
+                        return_exceptions=True,
+                    ),
+                )
+                await self.render_pool.render(render_xlsx_workbook, str(bundle_path), jobs)
+            else:
+                files = _completed_sections(
+                    report,
+                    await asyncio.gather(
+                        *(
+                            build_section(section_type, generate_section(section_type))
+                            for section_type in section_types
+                        ),
+                        return_exceptions=True,
+                    ),
+                )
+                await asyncio.to_thread(_write_zip_bundle, bundle_path, report, files)
+            return bundle_path
+        except BaseException:
+            bundle_path.unlink(missing_ok=True)
+            raise
+        finally:
+            for section_file in section_files:
+                section_file.unlink(missing_ok=True)
+
+    def _section_report(self, report: Report, section_type: ReportType) -> Report:
+        return Report(
+            name=_section_title(section_type),
+            report_type=section_type,
+            format=report.format,
+            status=ReportStatus.PROCESSING,
+            parameters=report.parameters,
+        )
+
+    async def _generate_section(
+        self, report: Report, section_type: ReportType, progress: ReportProgress | None
+    ) -> Path:
+        async with self.read_session_factory() as read_session:
+            return await self.report_cache.get_or_generate(
+                self._section_report(report, section_type),
+                ReportingDataAdapter(read_session, progress=progress),
+                self.generator_factory,
+            )
+
+    async def _spool_section(
+        self,
+        report: Report,
+        section_type: ReportType,
+        bundle_path: Path,
+        index: int,
+        progress: ReportProgress | None,
+    ) -> RenderJob:
+        rows_path = bundle_path.with_name(f"{bundle_path.name}.{index}.rows.csv")
+        async with self.read_session_factory() as read_session:
+            data = await ReportingDataAdapter(read_session, progress=progress).fetch_report_data(
+                self._section_report(report, section_type)
+            )
+            try:
+                row_count = await spool_rows(data, rows_path)
+            except BaseException:
+                rows_path.unlink(missing_ok=True)
+                raise
+
+        return RenderJob(
+            title=_section_title(section_type),
+            report_type=section_type.value,
+            generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            headers=data.headers,
+            rows_path=str(rows_path),
+            output_path=str(bundle_path),
+            row_count=row_count,
+        )
+
+
+def _completed_sections(report: Report, results: list[T | BaseException]) -> list[T]:
+    """The sections in report order, or RuntimeError naming every failed section"""
+    failed = [
+        f"{section.report_type.value}: {result}"
+        for section, result in zip(report.sections, results, strict=True)
+        if isinstance(result, BaseException)
+    ]
+    if failed:
+        raise RuntimeError(f"Report sections failed: {'; '.join(failed)}")
+    return [result for result in results if not isinstance(result, BaseException)]
+
+
+def _section_title(section_type: ReportType) -> str:
+    return section_type.value.replace("_", " ").title()
+
+
+def _write_zip_bundle(bundle_path: Path, report: Report, section_files: list[Path]) -> None:
+    with zipfile.ZipFile(bundle_path, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+        for index, (section, section_file) in enumerate(
+            zip(report.sections, section_files, strict=True), start=1
+        ):
+            bundle.write(
+                section_file,
+                arcname=f"{index:02d}_{section.report_type.value}{section_file.suffix}",
+            )
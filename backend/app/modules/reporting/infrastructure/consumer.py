@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 
 import aio_pika
@@ -7,22 +6,44 @@ from aio_pika.abc import AbstractChannel, AbstractIncomingMessage, AbstractRobus
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from app.config import get_settings
-from app.database import AsyncSessionLocal
+from app.database import AsyncReadSessionLocal, AsyncSessionLocal
+from app.modules.reporting.domain.entities import Report
 from app.modules.reporting.domain.value_objects import ReportType
 from app.modules.reporting.infrastructure.adapters import ReportingDataAdapter
+from app.modules.reporting.infrastructure.close_pack import PayrollClosePackBuilder
 from app.modules.reporting.infrastructure.generators import ReportGeneratorFactory
+from app.modules.reporting.infrastructure.progress import (
+    ReportCancelledError,
+    ReportLease,
+    ReportProgress,
+    time_budget_seconds,
+)
+from app.modules.reporting.infrastructure.render_pool import get_report_render_pool
+from app.modules.reporting.infrastructure.report_cache import ReportFileCache
 from app.modules.reporting.infrastructure.repository import SQLAlchemyReportRepository
+from app.modules.reporting.infrastructure.storage import get_report_storage
+from app.shared.infrastructure.codecs import get_codec_for_content_type
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
 class ReportGenerationConsumer:
-    def __init__(self, session_factory: async_sessionmaker = AsyncSessionLocal):
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        read_session_factory: async_sessionmaker = AsyncReadSessionLocal,
+    ):
         self.session_factory = session_factory
+        self.read_session_factory = read_session_factory
         self.connection: AbstractRobustConnection | None = None
         self.channel: AbstractChannel | None = None
         self.generator_factory = ReportGeneratorFactory()
+        self.report_cache = ReportFileCache()
+        self.storage = get_report_storage()
+        self.close_pack_builder = PayrollClosePackBuilder(
+            read_session_factory, self.generator_factory, self.report_cache
+        )
 
     async def connect(self) -> None:
         try:
@@ -49,7 +70,7 @@ class ReportGenerationConsumer:
     async def process_message(self, message: AbstractIncomingMessage) -> None:
         async with message.process():
             try:
-                event_data = json.loads(message.body.decode())
+                event_data = get_codec_for_content_type(message.content_type).decode(message.body)
                 routing_key = message.routing_key
 
                 # Parse routing key: event.payroll-manager.reporting.event-name
@@ -85,10 +106,9 @@ class ReportGenerationConsumer:
         """Generate the report asynchronously"""
         report_id = event_data["report_id"]
 
-        async with self.session_factory() as session:
+        async with self.session_factory() as session, self.read_session_factory() as read_session:
             try:
                 repository = SQLAlchemyReportRepository(session)
-                data_adapter = ReportingDataAdapter(session)
 
                 # Get the report
                 report = await repository.get_by_id(report_id)
@@ -105,6 +125,10 @@ class ReportGenerationConsumer:
                     logger.info(f"Report {report_id} is currently being processed")
                     return
 
+                if report.is_cancelled():
+                    logger.info(f"Report {report_id} was cancelled")
+                    return
+
                 # Start processing
                 report.start_processing()
                 await repository.save(report)
@@ -112,20 +136,46 @@ class ReportGenerationConsumer:
 
                 logger.info(f"Starting generation of report {report_id}")
 
-                # Fetch data for report
-                data = await self._fetch_report_data(report, data_adapter)
+                progress = ReportProgress.for_report_type(report.report_type)
+                data_adapter = ReportingDataAdapter(read_session, progress=progress)
+                lease = ReportLease(
+                    report.id,
+                    progress,
+                    time_budget_seconds(report.report_type),
+                    self.session_factory,
+                )
+
+                if report.report_type == ReportType.PAYROLL_CLOSE_PACK:
+
+                    async def save_sections(updated: Report) -> None:
+                        await repository.save_sections(updated)
+                        await session.commit()
+
+                    file_path = await lease.run(
+                        self.close_pack_builder.build(report, save_sections, progress)
+                    )
+                else:
+                    # Reuse an identical cached report or fetch data and generate it
+                    file_path = await lease.run(
+                        self.report_cache.get_or_generate(
+                            report, data_adapter, self.generator_factory
+                        )
+                    )
 
-                # Generate the report file
-                generator = self.generator_factory.get_generator(report.format.value)
-                file_path = await generator.generate(report, data)
+                stored = await self.storage.save(file_path)
 
                 # Mark as completed
-                report.complete(str(file_path))
+                report.rows_processed = progress.rows
+                report.complete(stored.key)
                 await repository.save(report)
                 await session.commit()
 
                 logger.info(f"Report {report_id} generated successfully: {file_path}")
 
+            except ReportCancelledError as e:
+                # Cancelled through the API or reclaimed after its lease expired
+                logger.info(f"Stopped generating report {report_id}: {e}")
+
             except Exception as e:
                 logger.error(f"Failed to generate report {report_id}: {e}")
 
@@ -140,21 +190,6 @@ class ReportGenerationConsumer:
                     logger.error(f"Failed to update report status: {update_error}")
                     await session.rollback()
 
-    async def _fetch_report_data(self, report, data_adapter) -> dict:
-        """Fetch data for the report based on its type"""
-        if report.report_type == ReportType.PAYROLL_SUMMARY:
-            return await data_adapter.fetch_payroll_summary_data(report.parameters)
-        elif report.report_type == ReportType.EMPLOYEE_COMPENSATION:
-            return await data_adapter.fetch_employee_compensation_data(report.parameters)
-        elif report.report_type == ReportType.ABSENCE_SUMMARY:
-            return await data_adapter.fetch_absence_summary_data(report.parameters)
-        elif report.report_type == ReportType.TIMESHEET_SUMMARY:
-            return await data_adapter.fetch_timesheet_summary_data(report.parameters)
-        elif report.report_type == ReportType.TAX_REPORT:
-            return await data_adapter.fetch_tax_report_data(report.parameters)
-        else:
-            return await data_adapter.fetch_custom_report_data(report.parameters)
-
     async def close(self) -> None:
         if self.connection and not self.connection.is_closed:
             await self.connection.close()
@@ -169,6 +204,7 @@ async def start_report_generation_consumer():
         await asyncio.Future()
     except KeyboardInterrupt:
         await consumer.close()
+        get_report_render_pool().shutdown()
 
 
 if __name__ == "__main__":
@@ -1,15 +1,25 @@
 """Event handlers for reporting module"""
 
 import logging
-from typing import Any
 
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
-from app.database import AsyncSessionLocal
+from app.database import AsyncReadSessionLocal, AsyncSessionLocal
+from app.modules.reporting.domain.entities import Report
+from app.modules.reporting.domain.events import ReportGenerationRequestedEvent
 from app.modules.reporting.domain.value_objects import ReportType
 from app.modules.reporting.infrastructure.adapters import ReportingDataAdapter
+from app.modules.reporting.infrastructure.close_pack import PayrollClosePackBuilder
 from app.modules.reporting.infrastructure.generators import ReportGeneratorFactory
+from app.modules.reporting.infrastructure.progress import (
+    ReportCancelledError,
+    ReportLease,
+    ReportProgress,
+    time_budget_seconds,
+)
+from app.modules.reporting.infrastructure.report_cache import ReportFileCache
 from app.modules.reporting.infrastructure.repository import SQLAlchemyReportRepository
+from app.modules.reporting.infrastructure.storage import get_report_storage
 from app.shared.infrastructure.event_registry import EventHandlerRegistry
 
 logger = logging.getLogger(__name__)
@@ -18,18 +28,30 @@ logger = logging.getLogger(__name__)
 class ReportingEventHandler:
     """Handler for reporting-related events"""
 
-    def __init__(self, session_factory: async_sessionmaker = AsyncSessionLocal):
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        read_session_factory: async_sessionmaker = AsyncReadSessionLocal,
+    ):
         self.session_factory = session_factory
+        # Report data is read from the replica (when configured), report status on the primary
+        self.read_session_factory = read_session_factory
         self.generator_factory = ReportGeneratorFactory()
-
-    async def handle_report_generation_requested(self, event_data: dict[str, Any]) -> None:
+        self.report_cache = ReportFileCache()
+        self.storage = get_report_storage()
+        self.close_pack_builder = PayrollClosePackBuilder(
+            read_session_factory, self.generator_factory, self.report_cache
+        )
+
+    async def handle_report_generation_requested(
+        self, event: ReportGenerationRequestedEvent
+    ) -> None:
         """Handle ReportGenerationRequestedEvent"""
-        report_id = event_data["report_id"]
+        report_id = event.report_id
 
-        async with self.session_factory() as session:
+        async with self.session_factory() as session, self.read_session_factory() as read_session:
             try:
                 repository = SQLAlchemyReportRepository(session)
-                data_adapter = ReportingDataAdapter(session)
 
                 # Get the report
                 report = await repository.get_by_id(report_id)
@@ -46,6 +68,10 @@ class ReportingEventHandler:
                     logger.info(f"Report {report_id} is currently being processed")
                     return
 
+                if report.is_cancelled():
+                    logger.info(f"Report {report_id} was cancelled")
+                    return
+
                 # Start processing
                 report.start_processing()
                 await repository.save(report)
@@ -53,20 +79,47 @@ class ReportingEventHandler:
 
                 logger.info(f"Starting generation of report {report_id}")
 
-                # Fetch data for report
-                data = await self._fetch_report_data(report, data_adapter)
+                progress = ReportProgress.for_report_type(report.report_type)
+                data_adapter = ReportingDataAdapter(read_session, progress=progress)
+                lease = ReportLease(
+                    report.id,
+                    progress,
+                    time_budget_seconds(report.report_type),
+                    self.session_factory,
+                )
+
+                if report.report_type == ReportType.PAYROLL_CLOSE_PACK:
+
+                    async def save_sections(updated: Report) -> None:
+                        await repository.save_sections(updated)
+                        await session.commit()
+
+                    file_path = await lease.run(
+                        self.close_pack_builder.build(report, save_sections, progress)
+                    )
+                else:
+                    # Reuse an identical cached report or fetch data and generate it
+                    file_path = await lease.run(
+                        self.report_cache.get_or_generate(
+                            report, data_adapter, self.generator_factory
+                        )
+                    )
 
-                # Generate the report file
-                generator = self.generator_factory.get_generator(report.format.value)
-                file_path = await generator.generate(report, data)
+                stored = await self.storage.save(file_path)
 
                 # Mark as completed
-                report.complete(str(file_path))
+                report.rows_processed = progress.rows
+                report.complete(stored.key)
                 await repository.save(report)
                 await session.commit()
 
                 logger.info(f"Report {report_id} generated successfully: {file_path}")
 
+            except ReportCancelledError as e:
+                # Cancelled through the API or reclaimed after its lease expired
+                logger.info(f"Stopped generating report {report_id}: {e}")
+                await session.rollback()
+
             except Exception as e:
                 logger.error(f"Failed to generate report {report_id}: {e}")
                 await session.rollback()
@@ -81,21 +134,6 @@ class ReportingEventHandler:
                     logger.error(f"Failed to update report status: {update_error}")
                     await session.rollback()
 
-    async def _fetch_report_data(self, report, data_adapter) -> dict[str, Any]:
-        """Fetch data for the report based on its type"""
-        if report.report_type == ReportType.PAYROLL_SUMMARY:
-            return await data_adapter.fetch_payroll_summary_data(report.parameters)
-        elif report.report_type == ReportType.EMPLOYEE_COMPENSATION:
-            return await data_adapter.fetch_employee_compensation_data(report.parameters)
-        elif report.report_type == ReportType.ABSENCE_SUMMARY:
-            return await data_adapter.fetch_absence_summary_data(report.parameters)
-        elif report.report_type == ReportType.TIMESHEET_SUMMARY:
-            return await data_adapter.fetch_timesheet_summary_data(report.parameters)
-        elif report.report_type == ReportType.TAX_REPORT:
-            return await data_adapter.fetch_tax_report_data(report.parameters)
-        else:
-            return await data_adapter.fetch_custom_report_data(report.parameters)
-
 
 def register_reporting_handlers(registry: EventHandlerRegistry) -> None:
     """Register all reporting event handlers"""
@@ -103,7 +141,9 @@ def register_reporting_handlers(registry: EventHandlerRegistry) -> None:
 
     # Register reporting events with new format: module.event-name
     registry.register(
-        "reporting.report-generation-requested-event", handler.handle_report_generation_requested
+        "reporting.report-generation-requested-event",
+        handler.handle_report_generation_requested,
+        ReportGenerationRequestedEvent,
     )
 
     logger.info("Registered reporting event handlers")
@@ -1,219 +1,339 @@
+import asyncio
 import csv
 import json
+from abc import abstractmethod
+from collections.abc import AsyncIterator, Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
-
+from app.config import get_settings
 from app.modules.reporting.domain.entities import Report
-from app.modules.reporting.domain.generators import IReportGenerator
+from app.modules.reporting.domain.generators import (
+    ColumnType,
+    IReportGenerator,
+    ReportColumn,
+    ReportData,
+)
+from app.modules.reporting.infrastructure.render_pool import (
+    ReportRenderPool,
+    get_report_render_pool,
+)
+from app.modules.reporting.infrastructure.rendering import RenderJob, render_pdf, render_xlsx
+
+settings = get_settings()
+
+
+async def spool_rows(data: ReportData, rows_path: Path) -> int:
+    """Write the rows as text to a CSV spool file; returns the number of rows"""
+    row_count = 0
+    with open(rows_path, "w", newline="", encoding="utf-8") as rows_file:
+        writer = csv.writer(rows_file)
+        async for row in data.text_rows():
+            writer.writerow(row)
+            row_count += 1
+    return row_count
+
+
+async def _render_in_worker(
+    render_pool: ReportRenderPool,
+    render_function: Callable[[RenderJob], str],
+    report: Report,
+    data: ReportData,
+    file_path: Path,
+    parameter_lines: list[str] | None = None,
+    max_rows: int | None = None,
+) -> Path:
+    """
+    Spool the streamed rows to a CSV file next to the report and render it in
+    a worker process, which reads the rows back from the spool file.
+
+    Returns the path of the rendered file, which differs from file_path when
+    the renderer falls back to another format.
+    """
+    rows_path = file_path.with_name(f"{file_path.name}.rows.csv")
+    try:
+        row_count = await spool_rows(data, rows_path)
+
+        job = RenderJob(
+            title=report.name,
+            report_type=report.report_type.value,
+            generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            headers=data.headers,
+            rows_path=str(rows_path),
+            output_path=str(file_path),
+            parameter_lines=parameter_lines or [],
+            row_count=row_count,
+            max_rows=max_rows,
+        )
+        return Path(await render_pool.render(render_function, job))
+    except BaseException:
+        # Do not leave a partial report behind on failure, timeout or cancellation
+        file_path.unlink(missing_ok=True)
+        file_path.with_suffix(".zip").unlink(missing_ok=True)
+        raise
+    finally:
+        rows_path.unlink(missing_ok=True)
 
 
 class PDFReportGenerator(IReportGenerator):
-    def __init__(self, output_dir: str = "/app/reports"):
+    def __init__(
+        self,
+        output_dir: str = settings.REPORT_WORK_DIR,
+        render_pool: ReportRenderPool | None = None,
+    ):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.render_pool = render_pool or get_report_render_pool()
 
     def supports_format(self, format_type: str) -> bool:
         return format_type.lower() == "pdf"
 
-    async def generate(self, report: Report, data: dict[str, Any]) -> Path:
+    async def generate(self, report: Report, data: ReportData) -> Path:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"report_{report.id}_{timestamp}.pdf"
         file_path = self.output_dir / filename
 
-        doc = SimpleDocTemplate(str(file_path), pagesize=letter)
-        story = []
-        styles = getSampleStyleSheet()
-
-        title = Paragraph(f"<b>{report.name}</b>", styles["Title"])
-        story.append(title)
-        story.append(Spacer(1, 12))
-
-        info_text = f"""
-        <b>Report Type:</b> {report.report_type.value}<br/>
-        <b>Generated:</b> {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}<br/>
-        <b>Parameters:</b><br/>
-        """
-
+        parameter_lines = []
         if report.parameters.employee_id:
-            info_text += f"- Employee ID: {report.parameters.employee_id}<br/>"
+            parameter_lines.append(f"Employee ID: {report.parameters.employee_id}")
         if report.parameters.department:
-            info_text += f"- Department: {report.parameters.department}<br/>"
+            parameter_lines.append(f"Department: {report.parameters.department}")
         if report.parameters.start_date and report.parameters.end_date:
-            info_text += (
-                f"- Period: {report.parameters.start_date} to {report.parameters.end_date}<br/>"
+            parameter_lines.append(
+                f"Period: {report.parameters.start_date} to {report.parameters.end_date}"
             )
 
-        info = Paragraph(info_text, styles["Normal"])
-        story.append(info)
-        story.append(Spacer(1, 20))
-
-        if "rows" in data and data["rows"]:
-            headers = data.get("headers", [])
-
-            # Only prepend headers if they are non-empty
-            if headers:
-                table_data = [headers] + data["rows"]
-                # Apply header-specific styling
-                table_style = TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ("FONTSIZE", (0, 0), (-1, 0), 14),
-                        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                        ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
-                        ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                    ]
-                )
-            else:
-                # No headers, just use rows
-                table_data = data["rows"]
-                # Apply only body styling (no row 0 header styling)
-                table_style = TableStyle(
-                    [
-                        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                        ("BACKGROUND", (0, 0), (-1, -1), colors.beige),
-                        ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                    ]
-                )
-
-            table = Table(table_data)
-            table.setStyle(table_style)
-            story.append(table)
-
-        doc.build(story)
-        return file_path
+        return await _render_in_worker(
+            self.render_pool,
+            render_pdf,
+            report,
+            data,
+            file_path,
+            parameter_lines,
+            max_rows=settings.REPORT_PDF_MAX_ROWS,
+        )
 
 
 class CSVReportGenerator(IReportGenerator):
-    def __init__(self, output_dir: str = "/app/reports"):
+    def __init__(self, output_dir: str = settings.REPORT_WORK_DIR):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def supports_format(self, format_type: str) -> bool:
         return format_type.lower() == "csv"
 
-    async def generate(self, report: Report, data: dict[str, Any]) -> Path:
+    async def generate(self, report: Report, data: ReportData) -> Path:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"report_{report.id}_{timestamp}.csv"
         file_path = self.output_dir / filename
 
         with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
-            if "rows" in data and data["rows"]:
-                headers = data.get("headers", [])
-                writer = csv.writer(csvfile)
+            writer = csv.writer(csvfile)
 
-                writer.writerow([f"# {report.name}"])
-                writer.writerow([f"# Report Type: {report.report_type.value}"])
-                writer.writerow([f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"])
-                writer.writerow([])
+            writer.writerow([f"# {report.name}"])
+            writer.writerow([f"# Report Type: {report.report_type.value}"])
+            writer.writerow([f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"])
+            writer.writerow([])
 
-                if headers:
-                    writer.writerow(headers)
-                writer.writerows(data["rows"])
+            if data.headers:
+                writer.writerow(data.headers)
+            # Rows are written as they are streamed from the database
+            async for row in data.text_rows():
+                writer.writerow(row)
 
         return file_path
 
 
 class XLSXReportGenerator(IReportGenerator):
-    def __init__(self, output_dir: str = "/app/reports"):
+    def __init__(
+        self,
+        output_dir: str = settings.REPORT_WORK_DIR,
+        render_pool: ReportRenderPool | None = None,
+    ):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.render_pool = render_pool or get_report_render_pool()
 
     def supports_format(self, format_type: str) -> bool:
         return format_type.lower() == "xlsx"
 
-    async def generate(self, report: Report, data: dict[str, Any]) -> Path:
-        try:
-            from openpyxl import Workbook
-            from openpyxl.styles import Font, PatternFill
-        except ImportError:
-            raise ImportError(
-                "openpyxl is required for XLSX generation. Install with: pip install openpyxl"
-            )
-
+    async def generate(self, report: Report, data: ReportData) -> Path:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"report_{report.id}_{timestamp}.xlsx"
         file_path = self.output_dir / filename
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Report"
-
-        ws.append([report.name])
-        ws["A1"].font = Font(bold=True, size=14)
-
-        ws.append([f"Report Type: {report.report_type.value}"])
-        ws.append([f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"])
-        ws.append([])
-
-        if "rows" in data and data["rows"]:
-            headers = data.get("headers", [])
-            if headers:
-                ws.append(headers)
-                header_row = ws.max_row
-                for cell in ws[header_row]:
-                    cell.font = Font(bold=True)
-                    cell.fill = PatternFill(
-                        start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
-                    )
-
-            for row in data["rows"]:
-                ws.append(row)
-
-        wb.save(str(file_path))
-        return file_path
+        return await _render_in_worker(self.render_pool, render_xlsx, report, data, file_path)
 
 
 class JSONReportGenerator(IReportGenerator):
-    def __init__(self, output_dir: str = "/app/reports"):
+    def __init__(self, output_dir: str = settings.REPORT_WORK_DIR):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def supports_format(self, format_type: str) -> bool:
         return format_type.lower() == "json"
 
-    async def generate(self, report: Report, data: dict[str, Any]) -> Path:
+    async def generate(self, report: Report, data: ReportData) -> Path:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"report_{report.id}_{timestamp}.json"
         file_path = self.output_dir / filename
 
-        report_data = {
-            "metadata": {
-                "name": report.name,
-                "type": report.report_type.value,
-                "generated_at": datetime.now().isoformat(),
-                "parameters": {
-                    "employee_id": report.parameters.employee_id,
-                    "department": report.parameters.department,
-                    "start_date": report.parameters.start_date,
-                    "end_date": report.parameters.end_date,
-                    "additional_filters": report.parameters.additional_filters,
-                },
-            },
-            "data": data,
+        metadata = {
+            "name": report.name,
+            "type": report.report_type.value,
+            "generated_at": datetime.now().isoformat(),
+            "parameters": report.parameters.to_dict(),
         }
 
+        # The document is written incrementally, one row per line
         with open(file_path, "w", encoding="utf-8") as jsonfile:
-            json.dump(report_data, jsonfile, indent=2, ensure_ascii=False)
+            jsonfile.write('{"metadata": ')
+            json.dump(metadata, jsonfile, ensure_ascii=False)
+            jsonfile.write(',\n"data": {"headers": ')
+            json.dump(data.headers, jsonfile, ensure_ascii=False)
+            jsonfile.write(', "rows": [')
+
+            separator = "\n"
+            async for row in data.text_rows():
+                jsonfile.write(separator)
+                json.dump(row, jsonfile, ensure_ascii=False)
+                separator = ",\n"
+
+            jsonfile.write("\n]}}\n")
+
+        return file_path
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required for Parquet and Arrow reports. Install with: pip install pyarrow"
+        )
+    return pyarrow
+
+
+def _arrow_schema(pa: Any, report: Report, data: ReportData) -> Any:
+    """Arrow schema of the report columns, with the report metadata attached"""
+    arrow_types = {
+        ColumnType.STRING: pa.string(),
+        ColumnType.INTEGER: pa.int64(),
+        ColumnType.DECIMAL: pa.decimal128(18, 4),
+        ColumnType.MONEY: pa.decimal128(18, 2),
+        ColumnType.DATE: pa.date32(),
+    }
+    # Reports without a typed schema are exported as text columns
+    columns = data.columns or [ReportColumn(header) for header in data.headers]
+    metadata = {
+        "name": report.name,
+        "type": report.report_type.value,
+        "generated_at": datetime.now().isoformat(),
+        "parameters": json.dumps(report.parameters.to_dict()),
+    }
+    return pa.schema(
+        [pa.field(column.name, arrow_types[column.type]) for column in columns], metadata=metadata
+    )
+
+
+def _record_batch(pa: Any, schema: Any, rows: list[list[Any]]) -> Any:
+    columns = zip(*rows, strict=True)
+    return pa.RecordBatch.from_arrays(
+        [pa.array(values, type=field.type) for values, field in zip(columns, schema, strict=True)],
+        schema=schema,
+    )
+
+
+class _ColumnarReportGenerator(IReportGenerator):
+    """
+    Writes typed rows as Arrow record batches of REPORT_COLUMNAR_ROW_GROUP_SIZE
+    rows, so at most one batch is held in memory. Decimal and date values keep
+    their types instead of being formatted as text.
+    """
+
+    format_type: str
+    extension: str
+
+    def __init__(self, output_dir: str = settings.REPORT_WORK_DIR, batch_rows: int | None = None):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.batch_rows = batch_rows or settings.REPORT_COLUMNAR_ROW_GROUP_SIZE
+
+    def supports_format(self, format_type: str) -> bool:
+        return format_type.lower() == self.format_type
+
+    @abstractmethod
+    def _open_writer(self, pa: Any, file_path: Path, schema: Any) -> Any:
+        pass
+
+    async def generate(self, report: Report, data: ReportData) -> Path:
+        pa = _import_pyarrow()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"report_{report.id}_{timestamp}.{self.extension}"
+        file_path = self.output_dir / filename
+
+        schema = _arrow_schema(pa, report, data)
+        try:
+            with self._open_writer(pa, file_path, schema) as writer:
+                async for rows in self._batches(data.rows):
+                    # Converting and encoding a batch releases the GIL
+                    batch = await asyncio.to_thread(_record_batch, pa, schema, rows)
+                    await asyncio.to_thread(writer.write_batch, batch)
+        except BaseException:
+            file_path.unlink(missing_ok=True)
+            raise
 
         return file_path
 
+    async def _batches(self, rows: AsyncIterator[list[Any]]) -> AsyncIterator[list[list[Any]]]:
+        batch = []
+        async for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_rows:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+class ParquetReportGenerator(_ColumnarReportGenerator):
+    """Parquet file with one row group per batch, compressed with zstd"""
+
+    format_type = "parquet"
+    extension = "parquet"
+
+    def _open_writer(self, pa: Any, file_path: Path, schema: Any) -> Any:
+        import pyarrow.parquet as pq
+
+        return pq.ParquetWriter(file_path, schema, compression="zstd")
+
+
+class ArrowReportGenerator(_ColumnarReportGenerator):
+    """Arrow IPC stream, readable with pyarrow.ipc.open_stream or pandas"""
+
+    format_type = "arrow"
+    extension = "arrows"
+
+    def _open_writer(self, pa: Any, file_path: Path, schema: Any) -> Any:
+        return pa.ipc.new_stream(
+            str(file_path), schema, options=pa.ipc.IpcWriteOptions(compression="zstd")
+        )
+
 
 class ReportGeneratorFactory:
-    def __init__(self, output_dir: str = "/app/reports"):
+    def __init__(
+        self,
+        output_dir: str = settings.REPORT_WORK_DIR,
+        render_pool: ReportRenderPool | None = None,
+    ):
         self.generators: list[IReportGenerator] = [
-            PDFReportGenerator(output_dir),
+            PDFReportGenerator(output_dir, render_pool),
             CSVReportGenerator(output_dir),
-            XLSXReportGenerator(output_dir),
+            XLSXReportGenerator(output_dir, render_pool),
             JSONReportGenerator(output_dir),
+            ParquetReportGenerator(output_dir),
+            ArrowReportGenerator(output_dir),
         ]
 
     def get_generator(self, format_type: str) -> IReportGenerator:
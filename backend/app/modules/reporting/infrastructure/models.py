@@ -1,8 +1,9 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, Column, DateTime, Enum, String, Text
+from sqlalchemy import JSON, BigInteger, DateTime, Enum, Integer, String, Text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
 from app.modules.reporting.domain.value_objects import (
@@ -15,27 +16,34 @@ from app.modules.reporting.domain.value_objects import (
 class ReportORM(Base):
     __tablename__ = "reports"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
-    name = Column(String(255), nullable=False)
-    report_type: ReportType = Column(
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    report_type: Mapped[ReportType] = mapped_column(
         Enum(ReportType, native_enum=False, length=50),
         nullable=False,
         index=True,
     )
-    format: ReportFormat = Column(
+    format: Mapped[ReportFormat] = mapped_column(
         Enum(ReportFormat, native_enum=False, length=20),
         nullable=False,
     )
-    status: ReportStatus = Column(
+    status: Mapped[ReportStatus] = mapped_column(
         Enum(ReportStatus, native_enum=False, length=20),
         nullable=False,
         index=True,
     )
-    parameters = Column(JSON, nullable=True)
-    file_path = Column(String(500), nullable=True)
-    error_message = Column(Text, nullable=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.now)
-    completed_at = Column(DateTime, nullable=True)
+    parameters: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    file_path: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # Section statuses of composite reports
+    sections: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    rows_processed: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    # Lease of the generating worker, renewed by its heartbeat
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     def to_dict(self) -> dict[str, str | UUID | datetime | dict | None]:
         return {
@@ -49,4 +57,45 @@ class ReportORM(Base):
             "error_message": self.error_message,
             "created_at": self.created_at,
             "completed_at": self.completed_at,
+            "sections": self.sections,
+            "rows_processed": self.rows_processed,
+            "heartbeat_at": self.heartbeat_at,
         }
+
+
+# Writers spread their counter bumps over this many rows per table so that
+# concurrent transactions rarely wait on each other's counter row
+REPORT_SOURCE_VERSION_SLOTS = 16
+
+BUMP_REPORT_SOURCE_VERSION = f"""
+CREATE OR REPLACE FUNCTION bump_report_source_version() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO report_source_versions (table_name, slot, version)
+    VALUES (TG_TABLE_NAME, mod(pg_backend_pid(), {REPORT_SOURCE_VERSION_SLOTS}), 1)
+    ON CONFLICT (table_name, slot)
+    DO UPDATE SET version = report_source_versions.version + 1;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def report_source_version_trigger(table_name: str) -> str:
+    return (
+        f"CREATE TRIGGER report_source_version "
+        f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table_name} "
+        f"FOR EACH STATEMENT EXECUTE FUNCTION bump_report_source_version()"
+    )
+
+
+class ReportSourceVersionORM(Base):
+    """
+    Change counter of a table reports read, bumped by a statement trigger on
+    every write. The sum over a table's slots only grows as writes commit.
+    """
+
+    __tablename__ = "report_source_versions"
+
+    table_name: Mapped[str] = mapped_column(String(63), primary_key=True)
+    slot: Mapped[int] = mapped_column(Integer, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
@@ -0,0 +1,153 @@
+"""
+Progress, cancellation and budgets of a running report generation.
+
+ReportProgress counts the rows fetched for a report and fails it once it
+exceeds its row budget. ReportLease runs the generation: every
+REPORT_HEARTBEAT_INTERVAL_SECONDS it saves the row count and renews the
+report's heartbeat_at on its own session. The heartbeat only succeeds while
+the report is still processing, so a report cancelled through the API (or
+reclaimed after its lease expired) stops the generation at the next
+heartbeat. A generation exceeding its time budget fails.
+
+Budgets are REPORT_TIME_BUDGET_SECONDS and REPORT_ROW_BUDGET, overridden per
+report type by REPORT_TIME_BUDGETS and REPORT_ROW_BUDGETS.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable
+from datetime import datetime
+from typing import Any, TypeVar
+from uuid import UUID
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import get_settings
+from app.modules.reporting.domain.value_objects import ReportStatus, ReportType
+from app.modules.reporting.infrastructure.models import ReportORM
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+T = TypeVar("T")
+
+
+class ReportCancelledError(Exception):
+    """Raised when a report stops processing while it is being generated"""
+
+
+class ReportBudgetExceededError(Exception):
+    """Raised when generating a report takes more time or rows than its budget"""
+
+
+def time_budget_seconds(report_type: ReportType) -> int:
+    return settings.REPORT_TIME_BUDGETS.get(report_type.value, settings.REPORT_TIME_BUDGET_SECONDS)
+
+
+def row_budget(report_type: ReportType) -> int:
+    return settings.REPORT_ROW_BUDGETS.get(report_type.value, settings.REPORT_ROW_BUDGET)
+
+
+class ReportProgress:
+    def __init__(self, max_rows: int | None = None):
+        self.rows = 0
+        self.max_rows = max_rows
+
+    @classmethod
+    def for_report_type(cls, report_type: ReportType) -> "ReportProgress":
+        return cls(row_budget(report_type))
+
+    async def track(self, rows: AsyncIterator[list[Any]]) -> AsyncIterator[list[Any]]:
+        """Count rows as they are streamed, failing once the row budget is exceeded"""
+        async for row in rows:
+            self.rows += 1
+            if self.max_rows is not None and self.rows > self.max_rows:
+                raise ReportBudgetExceededError(
+                    f"Report exceeded its budget of {self.max_rows:,} rows"
+                )
+            yield row
+
+
+class ReportLease:
+    def __init__(
+        self,
+        report_id: UUID,
+        progress: ReportProgress,
+        time_budget: float,
+        session_factory: async_sessionmaker | None = None,
+        heartbeat_interval: float | None = None,
+    ):
+        self.report_id = report_id
+        self.progress = progress
+        self.time_budget = time_budget
+        # Without a session factory only the time budget is enforced
+        self.session_factory = session_factory
+        self.heartbeat_interval = heartbeat_interval or settings.REPORT_HEARTBEAT_INTERVAL_SECONDS
+        self.cancelled = False
+
+    async def run(self, work: Awaitable[T]) -> T:
+        """Await work while heartbeating; raises if it is cancelled or over budget"""
+        task = asyncio.ensure_future(work)
+        heartbeat = None
+        if self.session_factory is not None:
+            heartbeat = asyncio.create_task(self._heartbeat(task))
+
+        try:
+            async with asyncio.timeout(self.time_budget):
+                result = await task
+            # The report may have been cancelled after the last heartbeat
+            if self.session_factory is not None and not await self.beat():
+                raise ReportCancelledError(f"Report {self.report_id} is no longer processing")
+            return result
+        except TimeoutError:
+            raise ReportBudgetExceededError(
+                f"Report exceeded its time budget of {self.time_budget} seconds"
+            )
+        except asyncio.CancelledError:
+            if self.cancelled:
+                raise ReportCancelledError(f"Report {self.report_id} is no longer processing")
+            raise
+        finally:
+            task.cancel()
+            if heartbeat is not None:
+                heartbeat.cancel()
+                try:
+                    await heartbeat
+                except asyncio.CancelledError:
+                    pass
+
+    async def beat(self) -> bool:
+        """Save progress and renew the lease; returns False if the report is no longer processing"""
+        if self.session_factory is None:
+            raise RuntimeError("Heartbeats need a session factory")
+
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(ReportORM)
+                .where(
+                    ReportORM.id == self.report_id,
+                    ReportORM.status == ReportStatus.PROCESSING,
+                )
+                .values(rows_processed=self.progress.rows, heartbeat_at=datetime.now())
+                .returning(ReportORM.id)
+            )
+            alive = result.scalar_one_or_none() is not None
+            await session.commit()
+        return alive
+
+    async def _heartbeat(self, task: asyncio.Future) -> None:
+        while not task.done():
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                alive = await self.beat()
+            except Exception as e:
+                # A missed heartbeat is retried; the lease is long enough to survive a few
+                logger.warning(f"Heartbeat of report {self.report_id} failed: {e}")
+                continue
+
+            if not alive:
+                logger.info(f"Report {self.report_id} is no longer processing, stopping")
+                self.cancelled = True
+                task.cancel()
+                return
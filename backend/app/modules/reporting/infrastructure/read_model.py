@@ -32,6 +32,9 @@ class ReportReadModel:
             error_message=orm.error_message,
             created_at=orm.created_at,
             completed_at=orm.completed_at,
+            sections=orm.sections or [],
+            rows_processed=orm.rows_processed or 0,
+            heartbeat_at=orm.heartbeat_at,
         )
 
     async def list(self, skip: int = 0, limit: int = 100) -> tuple[list[ReportResponse], int]:
@@ -55,6 +58,9 @@ class ReportReadModel:
                 error_message=orm.error_message,
                 created_at=orm.created_at,
                 completed_at=orm.completed_at,
+                sections=orm.sections or [],
+                rows_processed=orm.rows_processed or 0,
+                heartbeat_at=orm.heartbeat_at,
             )
             for orm in orms
         ]
@@ -92,6 +98,9 @@ class ReportReadModel:
                 error_message=orm.error_message,
                 created_at=orm.created_at,
                 completed_at=orm.completed_at,
+                sections=orm.sections or [],
+                rows_processed=orm.rows_processed or 0,
+                heartbeat_at=orm.heartbeat_at,
             )
             for orm in orms
         ]
@@ -127,6 +136,9 @@ class ReportReadModel:
                 error_message=orm.error_message,
                 created_at=orm.created_at,
                 completed_at=orm.completed_at,
+                sections=orm.sections or [],
+                rows_processed=orm.rows_processed or 0,
+                heartbeat_at=orm.heartbeat_at,
             )
             for orm in orms
         ]
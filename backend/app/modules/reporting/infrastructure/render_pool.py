@@ -0,0 +1,100 @@
+"""
+Bounded pool of report render worker processes.
+
+CPU-bound rendering (see rendering.py) runs in worker processes so a large
+report cannot stall the event loop that also serves requests and consumes
+events. At most REPORT_RENDER_MAX_WORKERS renders run at once; further
+renders wait for a free worker.
+
+Each worker is a single-process executor that is reused between renders. A
+render that exceeds REPORT_RENDER_TIMEOUT_SECONDS, or whose caller is
+cancelled, has its worker process killed, so the stuck render stops using CPU
+and no other in-flight render is affected.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class ReportRenderTimeoutError(Exception):
+    """Raised when rendering a report takes longer than the render timeout"""
+
+
+def _kill_worker(executor: ProcessPoolExecutor) -> None:
+    kill_workers = getattr(executor, "kill_workers", None)
+    if kill_workers is not None:
+        kill_workers()
+    else:
+        # ProcessPoolExecutor.kill_workers is new in Python 3.14
+        for process in list((executor._processes or {}).values()):
+            process.kill()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ReportRenderPool:
+    def __init__(self, max_workers: int | None = None, timeout_seconds: float | None = None):
+        self.max_workers = max_workers or settings.REPORT_RENDER_MAX_WORKERS
+        self.timeout_seconds = timeout_seconds or settings.REPORT_RENDER_TIMEOUT_SECONDS
+        self._slots = asyncio.Semaphore(self.max_workers)
+        self._idle: list[ProcessPoolExecutor] = []
+        # Workers are forked from a clean server process rather than from this
+        # one, which has the event loop and connection threads running
+        self._context = multiprocessing.get_context("forkserver")
+
+    async def render(self, render_function: Callable[..., Any], *args: Any) -> Any:
+        """Run a picklable, module-level render function in a worker process"""
+        async with self._slots:
+            executor = (
+                self._idle.pop()
+                if self._idle
+                else ProcessPoolExecutor(max_workers=1, mp_context=self._context)
+            )
+            future = asyncio.get_running_loop().run_in_executor(executor, render_function, *args)
+            try:
+                result = await asyncio.wait_for(future, self.timeout_seconds)
+            except TimeoutError:
+                _kill_worker(executor)
+                raise ReportRenderTimeoutError(
+                    f"Report rendering exceeded {self.timeout_seconds} seconds"
+                )
+            except asyncio.CancelledError:
+                _kill_worker(executor)
+                raise
+            except BrokenProcessPool:
+                executor.shutdown(wait=False)
+                raise
+            except Exception:
+                # The render function raised; the worker itself is still usable
+                self._idle.append(executor)
+                raise
+
+            self._idle.append(executor)
+            return result
+
+    def shutdown(self) -> None:
+        """Stop idle workers; renders in flight keep their worker until they finish"""
+        idle, self._idle = self._idle, []
+        for executor in idle:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if idle:
+            logger.info(f"Stopped {len(idle)} report render worker(s)")
+
+
+_report_render_pool: ReportRenderPool | None = None
+
+
+def get_report_render_pool() -> ReportRenderPool:
+    global _report_render_pool
+    if _report_render_pool is None:
+        _report_render_pool = ReportRenderPool()
+    return _report_render_pool
@@ -0,0 +1,232 @@
+"""
+PDF and XLSX rendering functions run in report render worker processes.
+
+Laying out a PDF with reportlab and writing an XLSX with openpyxl is CPU
+bound, so it runs in a worker process instead of on the event loop. Every
+function here is module-level and takes only a RenderJob, which holds plain
+strings and the path of a spooled CSV file with the report rows, so it can be
+pickled and sent to a worker. A render function returns the path of the file
+it wrote.
+"""
+
+import csv
+import io
+import itertools
+import zipfile
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus import Flowable, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+# Rows per PDF table: a 27pt header and 18pt rows fill one letter page
+PDF_ROWS_PER_TABLE = 34
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    title: str
+    report_type: str
+    generated_at: str
+    headers: list[str]
+    rows_path: str
+    output_path: str
+    parameter_lines: list[str] = field(default_factory=list)
+    row_count: int = 0
+    # PDF only: above this many rows a summary PDF and a CSV are bundled instead
+    max_rows: int | None = None
+
+
+def read_spooled_rows(rows_path: str) -> Iterator[list[str]]:
+    with open(rows_path, newline="", encoding="utf-8") as rows_file:
+        yield from csv.reader(rows_file)
+
+
+def render_pdf(job: RenderJob) -> str:
+    """
+    Render the rows as a sequence of page-sized tables.
+
+    reportlab lays a table out as a whole, which gets quadratically slower
+    with the number of rows, so the rows are split into tables of
+    PDF_ROWS_PER_TABLE rows with fixed column widths and the header repeated
+    on each. Above job.max_rows rows the PDF would still be too large to be
+    useful, so a summary PDF and a CSV with every row are bundled into a ZIP
+    archive instead.
+    """
+    if job.max_rows is not None and job.row_count > job.max_rows:
+        return _render_pdf_summary_bundle(job)
+
+    doc = SimpleDocTemplate(job.output_path, pagesize=letter)
+    story = _pdf_heading(job)
+    story.extend(_pdf_tables(job.headers, read_spooled_rows(job.rows_path), doc.width))
+    doc.build(story)
+    return job.output_path
+
+
+def _pdf_heading(job: RenderJob) -> list[Flowable]:
+    styles = getSampleStyleSheet()
+    story: list[Flowable] = []
+
+    title = Paragraph(f"<b>{job.title}</b>", styles["Title"])
+    story.append(title)
+    story.append(Spacer(1, 12))
+
+    info_text = f"""
+    <b>Report Type:</b> {job.report_type}<br/>
+    <b>Generated:</b> {job.generated_at}<br/>
+    <b>Parameters:</b><br/>
+    """
+    for line in job.parameter_lines:
+        info_text += f"- {line}<br/>"
+
+    info = Paragraph(info_text, styles["Normal"])
+    story.append(info)
+    story.append(Spacer(1, 20))
+    return story
+
+
+def _pdf_tables(
+    headers: list[str], rows: Iterable[list[str]], available_width: float
+) -> Iterator[Table]:
+    if headers:
+        # Apply header-specific styling
+        table_style = TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                ("FONTSIZE", (0, 0), (-1, 0), 14),
+                ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+                ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
+                ("GRID", (0, 0), (-1, -1), 1, colors.black),
+            ]
+        )
+    else:
+        # No headers, just use rows
+        # Apply only body styling (no row 0 header styling)
+        table_style = TableStyle(
+            [
+                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                ("BACKGROUND", (0, 0), (-1, -1), colors.beige),
+                ("GRID", (0, 0), (-1, -1), 1, colors.black),
+            ]
+        )
+
+    column_widths = None
+    rows = iter(rows)
+    while chunk := list(itertools.islice(rows, PDF_ROWS_PER_TABLE)):
+        # Every table uses the column widths measured on the first one, so the
+        # columns line up across pages and are not measured again per table
+        if column_widths is None:
+            column_widths = _pdf_column_widths(headers, chunk, available_width)
+        table_data = [headers, *chunk] if headers else chunk
+        table = Table(table_data, colWidths=column_widths, repeatRows=1 if headers else 0)
+        table.setStyle(table_style)
+        yield table
+
+
+def _pdf_column_widths(
+    headers: list[str], rows: Sequence[list[str]], available_width: float
+) -> list[float]:
+    column_count = max([len(headers), *(len(row) for row in rows)])
+    widths = [0.0] * column_count
+    for index, header in enumerate(headers):
+        widths[index] = stringWidth(header, "Helvetica-Bold", 14)
+    for row in rows:
+        for index, value in enumerate(row):
+            widths[index] = max(widths[index], stringWidth(value, "Helvetica", 10))
+    # Cell padding on both sides
+    widths = [width + 12 for width in widths]
+
+    total_width = sum(widths)
+    if total_width > available_width:
+        widths = [width * available_width / total_width for width in widths]
+    return widths
+
+
+def _render_pdf_summary_bundle(job: RenderJob) -> str:
+    output_path = Path(job.output_path)
+    bundle_path = output_path.with_suffix(".zip")
+    csv_name = f"{output_path.stem}.csv"
+
+    styles = getSampleStyleSheet()
+    summary_path = output_path.with_name(f"{output_path.stem}.summary.pdf")
+    doc = SimpleDocTemplate(str(summary_path), pagesize=letter)
+    story = _pdf_heading(job)
+    story.append(
+        Paragraph(
+            f"This report has {job.row_count:,} rows, more than the {job.max_rows:,} rows "
+            f"rendered to PDF. Every row is in <b>{csv_name}</b> in this archive; "
+            f"the first {PDF_ROWS_PER_TABLE} rows are shown below.",
+            styles["Normal"],
+        )
+    )
+    story.append(Spacer(1, 20))
+    preview = itertools.islice(read_spooled_rows(job.rows_path), PDF_ROWS_PER_TABLE)
+    story.extend(_pdf_tables(job.headers, preview, doc.width))
+
+    try:
+        doc.build(story)
+        with zipfile.ZipFile(bundle_path, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+            bundle.write(summary_path, arcname=f"{output_path.stem}.pdf")
+            with bundle.open(csv_name, "w") as csv_entry:
+                with io.TextIOWrapper(csv_entry, encoding="utf-8", newline="") as csv_file:
+                    writer = csv.writer(csv_file)
+                    if job.headers:
+                        writer.writerow(job.headers)
+                    writer.writerows(read_spooled_rows(job.rows_path))
+    finally:
+        summary_path.unlink(missing_ok=True)
+    return str(bundle_path)
+
+
+def render_xlsx(job: RenderJob) -> str:
+    return render_xlsx_workbook(job.output_path, [job])
+
+
+def render_xlsx_workbook(output_path: str, jobs: list[RenderJob]) -> str:
+    """Write one sheet per job; a single job is written to a sheet named Report"""
+    try:
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font, PatternFill
+    except ImportError:
+        raise ImportError(
+            "openpyxl is required for XLSX generation. Install with: pip install openpyxl"
+        )
+
+    # Write-only mode streams rows to disk instead of keeping every cell in memory
+    wb = Workbook(write_only=True)
+    for job in jobs:
+        # Sheet titles are limited to 31 characters
+        ws = wb.create_sheet("Report" if len(jobs) == 1 else job.title[:31])
+
+        title = WriteOnlyCell(ws, value=job.title)
+        title.font = Font(bold=True, size=14)
+        ws.append([title])
+
+        ws.append([f"Report Type: {job.report_type}"])
+        ws.append([f"Generated: {job.generated_at}"])
+        ws.append([])
+
+        if job.headers:
+            header_font = Font(bold=True)
+            header_fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+            header_cells = []
+            for header in job.headers:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.font = header_font
+                cell.fill = header_fill
+                header_cells.append(cell)
+            ws.append(header_cells)
+
+        for row in read_spooled_rows(job.rows_path):
+            ws.append(row)
+
+    wb.save(output_path)
+    return output_path
@@ -0,0 +1,138 @@
+"""
+Content-addressed cache of generated report files.
+
+A report is keyed by its type, format, normalized parameters, the date it is
+generated on and a watermark of the tables it reads (see
+ReportingDataAdapter.data_watermark). When an identical report was already
+generated and none of its source tables changed since, the cached file is
+hard-linked to the new report instead of querying and rendering it again.
+
+Cached files live in a .cache directory of REPORT_WORK_DIR. The directory
+is kept under REPORT_CACHE_MAX_BYTES by evicting the least recently used
+files; report files themselves are separate hard links and are not affected.
+The key version is REPORT_CACHE_VERSION - bump it when generated files change
+so old entries are never reused.
+
+The cache fails open: if the cache directory cannot be read or written, the
+report is generated as if there was no cache.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from datetime import date, datetime
+from pathlib import Path
+
+from app.config import get_settings
+from app.modules.reporting.domain.entities import Report
+from app.modules.reporting.infrastructure.adapters import ReportingDataAdapter
+from app.modules.reporting.infrastructure.generators import ReportGeneratorFactory
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+REPORT_CACHE_VERSION = 2
+
+
+class ReportFileCache:
+    def __init__(
+        self,
+        output_dir: str = settings.REPORT_WORK_DIR,
+        max_bytes: int | None = None,
+        enabled: bool | None = None,
+    ):
+        self.output_dir = Path(output_dir)
+        self.cache_dir = self.output_dir / ".cache"
+        self.max_bytes = max_bytes or settings.REPORT_CACHE_MAX_BYTES
+        self.enabled = settings.REPORT_CACHE_ENABLED if enabled is None else enabled
+
+    @staticmethod
+    def key(report: Report, watermark: str, as_of: date) -> str:
+        fingerprint = json.dumps(
+            {
+                "version": REPORT_CACHE_VERSION,
+                "type": report.report_type.value,
+                "format": report.format.value,
+                "parameters": report.parameters.to_dict(),
+                "as_of": as_of.isoformat(),
+                "watermark": watermark,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+    async def get_or_generate(
+        self,
+        report: Report,
+        data_adapter: ReportingDataAdapter,
+        generator_factory: ReportGeneratorFactory,
+    ) -> Path:
+        """Return the file of an identical cached report, or generate and cache it"""
+        generator = generator_factory.get_generator(report.format.value)
+        if not self.enabled:
+            return await generator.generate(report, await data_adapter.fetch_report_data(report))
+
+        watermark = await data_adapter.data_watermark(report.report_type)
+        key = self.key(report, watermark, date.today())
+
+        file_path = self._reuse(key, report)
+        if file_path is not None:
+            logger.info(f"Report {report.id} reused cached file {key}")
+            return file_path
+
+        file_path = await generator.generate(report, await data_adapter.fetch_report_data(report))
+        self._store(key, file_path)
+        return file_path
+
+    def _reuse(self, key: str, report: Report) -> Path | None:
+        try:
+            cached = next(self.cache_dir.glob(f"{key}.*"), None)
+            if cached is None:
+                return None
+
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            file_path = self.output_dir / f"report_{report.id}_{timestamp}{cached.suffix}"
+            _link_or_copy(cached, file_path)
+            # The modification time of a cached file is its last use
+            os.utime(cached)
+            return file_path
+        except OSError as e:
+            logger.warning(f"Report cache unavailable, generating report: {e}")
+            return None
+
+    def _store(self, key: str, file_path: Path) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _link_or_copy(file_path, self.cache_dir / f"{key}{file_path.suffix}")
+            self._evict()
+        except FileExistsError:
+            # An identical report was generated and cached concurrently
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to cache report file {file_path}: {e}")
+
+    def _evict(self) -> None:
+        """Remove least recently used files until the cache fits in max_bytes"""
+        entries = []
+        for cached in self.cache_dir.iterdir():
+            stat = cached.stat()
+            entries.append((stat.st_mtime, stat.st_size, cached))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, cached in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self.max_bytes:
+                break
+            cached.unlink(missing_ok=True)
+            total_size -= size
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    try:
+        os.link(source, target)
+    except FileExistsError:
+        raise
+    except OSError:
+        # Hard links are not supported across filesystems or on every filesystem
+        shutil.copyfile(source, target)
@@ -1,14 +1,16 @@
 import logging
-from datetime import date
+from datetime import date, datetime
+from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import CursorResult, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.reporting.domain.entities import Report
 from app.modules.reporting.domain.repository import ReportRepository
 from app.modules.reporting.domain.value_objects import (
     ReportParameters,
+    ReportSection,
     ReportStatus,
     ReportType,
 )
@@ -54,6 +56,9 @@ class SQLAlchemyReportRepository(ReportRepository):
             error_message=orm.error_message,
             created_at=orm.created_at,
             completed_at=orm.completed_at,
+            sections=[ReportSection.from_dict(section) for section in orm.sections or []],
+            rows_processed=orm.rows_processed or 0,
+            heartbeat_at=orm.heartbeat_at,
         )
 
     def _to_orm(self, report: Report) -> ReportORM:
@@ -81,6 +86,9 @@ class SQLAlchemyReportRepository(ReportRepository):
             error_message=report.error_message,
             created_at=report.created_at,
             completed_at=report.completed_at,
+            sections=[section.to_dict() for section in report.sections] or None,
+            rows_processed=report.rows_processed,
+            heartbeat_at=report.heartbeat_at,
         )
 
     async def _dispatch_events(self, report: Report) -> None:
@@ -147,3 +155,44 @@ class SQLAlchemyReportRepository(ReportRepository):
     async def delete(self, report_id: UUID) -> None:
         await self.session.execute(delete(ReportORM).where(ReportORM.id == report_id))
         await self.session.flush()
+
+    async def save_sections(self, report: Report) -> None:
+        # A targeted update, so a concurrent cancellation is not overwritten
+        await self.session.execute(
+            update(ReportORM)
+            .where(ReportORM.id == report.id, ReportORM.status == ReportStatus.PROCESSING)
+            .values(sections=[section.to_dict() for section in report.sections])
+        )
+        await self.session.flush()
+
+    async def clear_file_paths(self, keys: list[str]) -> int:
+        result = cast(
+            CursorResult[Any],
+            await self.session.execute(
+                update(ReportORM).where(ReportORM.file_path.in_(keys)).values(file_path=None)
+            ),
+        )
+        await self.session.flush()
+        return result.rowcount
+
+    async def fail_stale_processing(self, heartbeat_before: datetime, error_message: str) -> int:
+        # Rows are failed through the entity so unfinished sections are failed with them;
+        # reports locked by a worker that is saving them right now are left for the next run
+        result = await self.session.execute(
+            select(ReportORM)
+            .where(
+                ReportORM.status == ReportStatus.PROCESSING,
+                func.coalesce(ReportORM.heartbeat_at, ReportORM.created_at) < heartbeat_before,
+            )
+            .with_for_update(skip_locked=True)
+        )
+        stale = result.scalars().all()
+        for orm in stale:
+            report = self._to_domain(orm)
+            report.fail(error_message)
+            orm.status = report.status
+            orm.error_message = report.error_message
+            orm.completed_at = report.completed_at
+            orm.sections = [section.to_dict() for section in report.sections] or None
+        await self.session.flush()
+        return len(stale)
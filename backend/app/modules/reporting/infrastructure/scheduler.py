@@ -0,0 +1,268 @@
+"""
+Report Retention Scheduler
+Periodically deletes stored report files older than REPORT_RETENTION_DAYS and,
+while storage holds more than REPORT_STORAGE_QUOTA_BYTES, the oldest files.
+Reports pointing at a deleted file have their file_path cleared first. Files
+left in REPORT_WORK_DIR by renders that never finished are deleted once they
+are older than the longest report time budget.
+
+Report Lease Scheduler
+Periodically fails processing reports whose heartbeat is older than
+REPORT_LEASE_SECONDS, left behind by a worker that died mid-generation
+"""
+
+import asyncio
+import logging
+import os
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.modules.reporting.domain.storage import IReportStorage
+from app.modules.reporting.infrastructure.repository import SQLAlchemyReportRepository
+from app.modules.reporting.infrastructure.storage import get_report_storage
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Stored files detached from their reports and deleted per transaction
+SWEEP_BATCH_SIZE = 500
+
+
+class ReportRetentionSweeper:
+    def __init__(
+        self,
+        storage: IReportStorage,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        retention_days: int | None = None,
+        quota_bytes: int | None = None,
+        work_dir: str | None = None,
+    ):
+        self.storage = storage
+        self.session_factory = session_factory
+        self.retention_days = retention_days or settings.REPORT_RETENTION_DAYS
+        self.quota_bytes = quota_bytes or settings.REPORT_STORAGE_QUOTA_BYTES
+        self.work_dir = Path(work_dir or settings.REPORT_WORK_DIR)
+
+    async def sweep(self, now: datetime | None = None) -> int:
+        """Delete expired files, then the oldest files over quota; returns the number deleted"""
+        now = now or datetime.now(UTC)
+        cutoff = now - timedelta(days=self.retention_days)
+        files = sorted(
+            [stored async for stored in self.storage.list_files()],
+            key=lambda stored: stored.modified_at,
+        )
+
+        total_size = sum(stored.size for stored in files)
+        expired = []
+        for stored in files:
+            if stored.modified_at >= cutoff and total_size <= self.quota_bytes:
+                break
+            expired.append(stored.key)
+            total_size -= stored.size
+
+        for start in range(0, len(expired), SWEEP_BATCH_SIZE):
+            keys = expired[start : start + SWEEP_BATCH_SIZE]
+            # Reports stop offering a file before it goes, so downloads never find it missing
+            async with self.session_factory() as session:
+                await SQLAlchemyReportRepository(session).clear_file_paths(keys)
+                await session.commit()
+            for key in keys:
+                await self.storage.delete(key)
+
+        abandoned = await self.sweep_work_dir(now)
+        if abandoned:
+            logger.warning(f"Deleted {abandoned} files left behind by unfinished report renders")
+
+        return len(expired)
+
+    async def sweep_work_dir(self, now: datetime) -> int:
+        """Delete working files older than any render may run; returns the number deleted"""
+        longest_budget = max(
+            settings.REPORT_TIME_BUDGET_SECONDS, *settings.REPORT_TIME_BUDGETS.values()
+        )
+        cutoff = (
+            now - timedelta(seconds=longest_budget + settings.REPORT_LEASE_SECONDS)
+        ).timestamp()
+
+        def delete_abandoned() -> int:
+            if not self.work_dir.exists():
+                return 0
+            deleted = 0
+            for entry in os.scandir(self.work_dir):
+                # Skips the report cache directory
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    Path(entry.path).unlink(missing_ok=True)
+                    deleted += 1
+            return deleted
+
+        return await asyncio.to_thread(delete_abandoned)
+
+
+class ReportRetentionScheduler:
+    """
+    Scheduler for the report retention sweep
+    """
+
+    def __init__(self):
+        self.is_running = False
+        self._task = None
+
+    async def start(self) -> None:
+        """Start the scheduler"""
+        if self.is_running:
+            logger.warning("Report retention scheduler is already running")
+            return
+
+        self.is_running = True
+        self._task = asyncio.create_task(self._run_scheduler())
+        logger.info("Report retention scheduler started")
+
+    async def stop(self) -> None:
+        """Stop the scheduler"""
+        if not self.is_running:
+            return
+
+        self.is_running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        logger.info("Report retention scheduler stopped")
+
+    async def _run_scheduler(self) -> None:
+        """Main scheduler loop - sweeps on start and every sweep interval"""
+        while self.is_running:
+            try:
+                deleted = await ReportRetentionSweeper(get_report_storage()).sweep()
+                logger.info(f"Report retention sweep deleted {deleted} files")
+
+                await asyncio.sleep(settings.REPORT_RETENTION_SWEEP_INTERVAL_SECONDS)
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in report retention scheduler loop: {e}", exc_info=True)
+                # Sleep for an hour before retrying
+                await asyncio.sleep(3600)
+
+
+# Global scheduler instance
+_scheduler_instance = None
+
+
+def get_report_retention_scheduler() -> ReportRetentionScheduler:
+    """Get the global scheduler instance"""
+    global _scheduler_instance
+    if _scheduler_instance is None:
+        _scheduler_instance = ReportRetentionScheduler()
+    return _scheduler_instance
+
+
+async def start_report_retention_scheduler() -> None:
+    """Start the report retention scheduler"""
+    await get_report_retention_scheduler().start()
+
+
+async def stop_report_retention_scheduler() -> None:
+    """Stop the report retention scheduler"""
+    await get_report_retention_scheduler().stop()
+
+
+class StaleReportReclaimer:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        lease_seconds: int | None = None,
+    ):
+        self.session_factory = session_factory
+        self.lease_seconds = lease_seconds or settings.REPORT_LEASE_SECONDS
+
+    async def reclaim(self, now: datetime | None = None) -> int:
+        """Fail processing reports whose lease expired; returns the number failed"""
+        cutoff = (now or datetime.now()) - timedelta(seconds=self.lease_seconds)
+        async with self.session_factory() as session:
+            repository = SQLAlchemyReportRepository(session)
+            failed = await repository.fail_stale_processing(
+                cutoff, "Report generation stopped sending heartbeats"
+            )
+            await session.commit()
+        return failed
+
+
+class ReportLeaseScheduler:
+    """
+    Scheduler for reclaiming reports with an expired lease
+    """
+
+    def __init__(self):
+        self.is_running = False
+        self._task = None
+
+    async def start(self) -> None:
+        """Start the scheduler"""
+        if self.is_running:
+            logger.warning("Report lease scheduler is already running")
+            return
+
+        self.is_running = True
+        self._task = asyncio.create_task(self._run_scheduler())
+        logger.info("Report lease scheduler started")
+
+    async def stop(self) -> None:
+        """Stop the scheduler"""
+        if not self.is_running:
+            return
+
+        self.is_running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        logger.info("Report lease scheduler stopped")
+
+    async def _run_scheduler(self) -> None:
+        """Main scheduler loop - reclaims on start and every lease"""
+        while self.is_running:
+            try:
+                failed = await StaleReportReclaimer().reclaim()
+                if failed:
+                    logger.warning(f"Failed {failed} reports with an expired lease")
+
+                await asyncio.sleep(settings.REPORT_LEASE_SECONDS)
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in report lease scheduler loop: {e}", exc_info=True)
+                await asyncio.sleep(settings.REPORT_LEASE_SECONDS)
+
+
+_lease_scheduler_instance = None
+
+
+def get_report_lease_scheduler() -> ReportLeaseScheduler:
+    """Get the global lease scheduler instance"""
+    global _lease_scheduler_instance
+    if _lease_scheduler_instance is None:
+        _lease_scheduler_instance = ReportLeaseScheduler()
+    return _lease_scheduler_instance
+
+
+async def start_report_lease_scheduler() -> None:
+    """Start the report lease scheduler"""
+    await get_report_lease_scheduler().start()
+
+
+async def stop_report_lease_scheduler() -> None:
+    """Stop the report lease scheduler"""
+    await get_report_lease_scheduler().stop()
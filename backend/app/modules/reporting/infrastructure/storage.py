@@ -0,0 +1,196 @@
+"""
+Report file storage backends.
+
+Generators render into a local working directory (REPORT_WORK_DIR); the
+rendered file is then moved into storage and the report records its storage
+key (the file name).
+REPORT_STORAGE_BACKEND selects the backend:
+
+  local - files stay on disk in REPORT_STORAGE_LOCAL_DIR, which API replicas
+          must share as a volume
+  s3    - files are uploaded to an S3-compatible bucket (AWS S3, MinIO), so
+          any replica can serve any report; requires boto3
+
+Both backends stream reads in chunks and support byte ranges, so downloads
+never load a whole report into memory.
+"""
+
+import asyncio
+import logging
+import os
+import shutil
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from app.config import get_settings
+from app.modules.reporting.domain.storage import IReportStorage, StoredReportFile
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class LocalReportStorage(IReportStorage):
+    def __init__(self, root: str | None = None):
+        self.root = Path(root or settings.REPORT_STORAGE_LOCAL_DIR)
+
+    def _path(self, key: str) -> Path:
+        path = Path(key)
+        # Reports completed before storage keys were introduced store an absolute path
+        if path.is_absolute():
+            return path
+        return self.root / path.name
+
+    @staticmethod
+    def _stored_file(key: str, path: Path) -> StoredReportFile:
+        stat = path.stat()
+        return StoredReportFile(
+            key=key,
+            size=stat.st_size,
+            etag=f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+            modified_at=datetime.fromtimestamp(stat.st_mtime, UTC),
+        )
+
+    async def save(self, source: Path) -> StoredReportFile:
+        target = self.root / source.name
+        if source.resolve() != target.resolve():
+            self.root.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(shutil.move, source, target)
+        return self._stored_file(source.name, target)
+
+    async def stat(self, key: str) -> StoredReportFile | None:
+        try:
+            return self._stored_file(key, self._path(key))
+        except FileNotFoundError:
+            return None
+
+    async def read(self, key: str, start: int = 0, end: int | None = None) -> AsyncIterator[bytes]:
+        with open(self._path(key), "rb") as file:
+            file.seek(start)
+            remaining = None if end is None else end - start + 1
+            while remaining is None or remaining > 0:
+                size = READ_CHUNK_SIZE if remaining is None else min(READ_CHUNK_SIZE, remaining)
+                chunk = await asyncio.to_thread(file.read, size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    async def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    async def list_files(self) -> AsyncIterator[StoredReportFile]:
+        if not self.root.exists():
+            return
+        for entry in await asyncio.to_thread(lambda: list(os.scandir(self.root))):
+            # Skips the working directory of renders in progress
+            if entry.is_file():
+                yield self._stored_file(entry.name, Path(entry.path))
+
+
+class S3ReportStorage(IReportStorage):
+    def __init__(
+        self,
+        bucket: str | None = None,
+        prefix: str | None = None,
+        client: Any = None,
+    ):
+        self.bucket = bucket or settings.REPORT_STORAGE_S3_BUCKET
+        self.prefix = settings.REPORT_STORAGE_S3_PREFIX if prefix is None else prefix
+        self.client = client or self._create_client()
+
+    @staticmethod
+    def _create_client() -> Any:
+        try:
+            import boto3
+        except ImportError:
+            raise ImportError(
+                "boto3 is required for the s3 report storage backend. "
+                "Install with: pip install boto3"
+            )
+
+        return boto3.client(
+            "s3",
+            endpoint_url=settings.REPORT_STORAGE_S3_ENDPOINT_URL,
+            region_name=settings.REPORT_STORAGE_S3_REGION,
+            aws_access_key_id=settings.REPORT_STORAGE_S3_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.REPORT_STORAGE_S3_SECRET_ACCESS_KEY,
+        )
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}{Path(key).name}"
+
+    async def save(self, source: Path) -> StoredReportFile:
+        # upload_file streams the file in parts; it is never read into memory whole
+        await asyncio.to_thread(
+            self.client.upload_file, str(source), self.bucket, self._object_key(source.name)
+        )
+        source.unlink(missing_ok=True)
+        stored = await self.stat(source.name)
+        if stored is None:
+            raise RuntimeError(f"Uploaded report {source.name} is missing from the bucket")
+        return stored
+
+    async def stat(self, key: str) -> StoredReportFile | None:
+        from botocore.exceptions import ClientError
+
+        try:
+            head = await asyncio.to_thread(
+                self.client.head_object, Bucket=self.bucket, Key=self._object_key(key)
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return None
+            raise
+        return StoredReportFile(
+            key=key,
+            size=head["ContentLength"],
+            etag=head["ETag"],
+            modified_at=head["LastModified"],
+        )
+
+    async def read(self, key: str, start: int = 0, end: int | None = None) -> AsyncIterator[bytes]:
+        byte_range = f"bytes={start}-{'' if end is None else end}"
+        response = await asyncio.to_thread(
+            self.client.get_object, Bucket=self.bucket, Key=self._object_key(key), Range=byte_range
+        )
+        body = response["Body"]
+        try:
+            while chunk := await asyncio.to_thread(body.read, READ_CHUNK_SIZE):
+                yield chunk
+        finally:
+            body.close()
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(
+            self.client.delete_object, Bucket=self.bucket, Key=self._object_key(key)
+        )
+
+    async def list_files(self) -> AsyncIterator[StoredReportFile]:
+        paginator = self.client.get_paginator("list_objects_v2")
+        pages = iter(paginator.paginate(Bucket=self.bucket, Prefix=self.prefix))
+        while page := await asyncio.to_thread(next, pages, None):
+            for item in page.get("Contents", []):
+                yield StoredReportFile(
+                    key=item["Key"].removeprefix(self.prefix),
+                    size=item["Size"],
+                    etag=item["ETag"],
+                    modified_at=item["LastModified"],
+                )
+
+
+_report_storage: IReportStorage | None = None
+
+
+def get_report_storage() -> IReportStorage:
+    global _report_storage
+    if _report_storage is None:
+        if settings.REPORT_STORAGE_BACKEND == "s3":
+            _report_storage = S3ReportStorage()
+        else:
+            _report_storage = LocalReportStorage()
+    return _report_storage
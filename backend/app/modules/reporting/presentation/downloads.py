@@ -0,0 +1,99 @@
+"""
+Streaming report downloads with ETags and single byte ranges.
+
+Clients can revalidate a downloaded report with If-None-Match and resume an
+interrupted download with Range (guarded by If-Range). Multiple ranges in one
+request are not supported; such requests get the whole file, as RFC 9110
+allows.
+"""
+
+from email.utils import format_datetime
+
+from fastapi import Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.modules.reporting.domain.storage import IReportStorage, StoredReportFile
+
+
+def parse_byte_range(range_header: str, size: int) -> tuple[int, int] | None:
+    """
+    Return the inclusive (start, end) of a single "bytes=" range, or None to
+    serve the whole file. Raises ValueError if the range cannot be satisfied.
+    """
+    unit, _, ranges = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+
+    first, separator, last = ranges.strip().partition("-")
+    # Malformed ranges are ignored
+    if not separator or not (first or last):
+        return None
+    if (first and not first.isdigit()) or (last and not last.isdigit()):
+        return None
+
+    if first:
+        start = int(first)
+        end = int(last) if last else size - 1
+        if last and start > end:
+            return None
+    else:
+        # Suffix range: the last N bytes
+        suffix_length = int(last)
+        if suffix_length == 0:
+            raise ValueError("Empty suffix range")
+        start = max(size - suffix_length, 0)
+        end = size - 1
+
+    if start >= size:
+        raise ValueError(f"Range {range_header} is not satisfiable for {size} bytes")
+    return start, min(end, size - 1)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    candidates = [candidate.strip().removeprefix("W/") for candidate in header.split(",")]
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def report_file_response(
+    request: Request, storage: IReportStorage, stored: StoredReportFile
+) -> Response:
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": stored.etag,
+        "Last-Modified": format_datetime(stored.modified_at, usegmt=True),
+        "Content-Disposition": f'attachment; filename="{stored.key}"',
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, stored.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range == stored.etag):
+        try:
+            byte_range = parse_byte_range(range_header, stored.size)
+        except ValueError:
+            return Response(
+                status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{stored.size}"},
+            )
+
+        if byte_range is not None:
+            start, end = byte_range
+            return StreamingResponse(
+                storage.read(stored.key, start, end),
+                status_code=status.HTTP_206_PARTIAL_CONTENT,
+                media_type="application/octet-stream",
+                headers={
+                    **headers,
+                    "Content-Range": f"bytes {start}-{end}/{stored.size}",
+                    "Content-Length": str(end - start + 1),
+                },
+            )
+
+    return StreamingResponse(
+        storage.read(stored.key),
+        media_type="application/octet-stream",
+        headers={**headers, "Content-Length": str(stored.size)},
+    )
@@ -1,28 +1,31 @@
 import logging
-from pathlib import Path
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.modules.auth.infrastructure.dependencies import get_current_active_user
 from app.modules.reporting.application.commands import (
+    CancelReportCommand,
     CreateReportCommand,
     DeleteReportCommand,
 )
 from app.modules.reporting.application.handlers import (
+    CancelReportHandler,
     CreateReportHandler,
     DeleteReportHandler,
     GetReportHandler,
 )
 from app.modules.reporting.application.queries import GetReportQuery
+from app.modules.reporting.domain.storage import IReportStorage
 from app.modules.reporting.domain.value_objects import ReportStatus, ReportType
 from app.modules.reporting.infrastructure.read_model import ReportReadModel
 from app.modules.reporting.infrastructure.repository import (
     SQLAlchemyReportRepository,
 )
+from app.modules.reporting.infrastructure.storage import get_report_storage
+from app.modules.reporting.presentation.downloads import report_file_response
 from app.modules.reporting.presentation.schemas import (
     CreateReportRequest,
     ReportListResponse,
@@ -78,7 +81,7 @@ async def create_report(
 
 
 @router.get("/", response_model=ReportListResponse)
-async def list_reports(db: AsyncSession = Depends(get_db)) -> ReportListResponse:
+async def list_reports(db: AsyncSession = Depends(get_read_db)) -> ReportListResponse:
     read_model = ReportReadModel(db)
     reports, _ = await read_model.list()
 
@@ -86,7 +89,7 @@ async def list_reports(db: AsyncSession = Depends(get_db)) -> ReportListResponse
 
 
 @router.get("/{report_id}", response_model=ReportResponse)
-async def get_report(report_id: UUID, db: AsyncSession = Depends(get_db)) -> ReportResponse:
+async def get_report(report_id: UUID, db: AsyncSession = Depends(get_read_db)) -> ReportResponse:
     read_model = ReportReadModel(db)
     report = await read_model.get_by_id(report_id)
 
@@ -98,7 +101,7 @@ async def get_report(report_id: UUID, db: AsyncSession = Depends(get_db)) -> Rep
 
 @router.get("/type/{report_type}", response_model=ReportListResponse)
 async def list_reports_by_type(
-    report_type: str, db: AsyncSession = Depends(get_db)
+    report_type: str, db: AsyncSession = Depends(get_read_db)
 ) -> ReportListResponse:
     try:
         report_type_enum = ReportType(report_type)
@@ -115,7 +118,7 @@ async def list_reports_by_type(
 
 @router.get("/status/{report_status}", response_model=ReportListResponse)
 async def list_reports_by_status(
-    report_status: str, db: AsyncSession = Depends(get_db)
+    report_status: str, db: AsyncSession = Depends(get_read_db)
 ) -> ReportListResponse:
     try:
         status_enum = ReportStatus(report_status)
@@ -132,7 +135,12 @@ async def list_reports_by_status(
 
 
 @router.get("/{report_id}/download")
-async def download_report(report_id: UUID, db: AsyncSession = Depends(get_db)):
+async def download_report(
+    report_id: UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+    storage: IReportStorage = Depends(get_report_storage),
+):
     repository = SQLAlchemyReportRepository(db)
     handler = GetReportHandler(repository)
 
@@ -149,20 +157,38 @@ async def download_report(report_id: UUID, db: AsyncSession = Depends(get_db)):
         )
 
     if not report.file_path:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report file not found")
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Report file was deleted by the retention policy",
+        )
 
-    file_path = Path(report.file_path)
-    if not file_path.exists():
+    stored = await storage.stat(report.file_path)
+    if stored is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Report file does not exist on disk",
         )
 
-    return FileResponse(
-        path=str(file_path),
-        filename=file_path.name,
-        media_type="application/octet-stream",
-    )
+    return report_file_response(request, storage, stored)
+
+
+@router.post("/{report_id}/cancel", response_model=ReportResponse)
+async def cancel_report(report_id: UUID, db: AsyncSession = Depends(get_db)) -> ReportResponse:
+    repository = SQLAlchemyReportRepository(db)
+    if not await repository.get_by_id(report_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found")
+
+    handler = CancelReportHandler(repository)
+    command = CancelReportCommand(report_id=report_id)
+
+    try:
+        report = await handler.handle(command)
+        await db.commit()
+    except ValueError as e:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return ReportResponse.from_entity(report)
 
 
 @router.delete("/{report_id}", status_code=status.HTTP_204_NO_CONTENT)
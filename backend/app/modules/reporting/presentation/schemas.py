@@ -8,9 +8,9 @@ class CreateReportRequest(BaseModel):
     name: str = Field(..., min_length=1, max_length=255)
     report_type: str = Field(
         ...,
-        pattern="^(payroll_summary|employee_compensation|absence_summary|timesheet_summary|tax_report|custom)$",
+        pattern="^(payroll_summary|employee_compensation|absence_summary|timesheet_summary|tax_report|payroll_close_pack|custom)$",
     )
-    format: str = Field(..., pattern="^(pdf|csv|xlsx|json)$")
+    format: str = Field(..., pattern="^(pdf|csv|xlsx|json|parquet|arrow)$")
     employee_id: str | None = None
     department: str | None = None
     start_date: str | None = None
@@ -18,6 +18,12 @@ class CreateReportRequest(BaseModel):
     additional_filters: dict[str, str] | None = None
 
 
+class ReportSectionResponse(BaseModel):
+    report_type: str
+    status: str
+    error_message: str | None = None
+
+
 class ReportResponse(BaseModel):
     id: UUID
     name: str
@@ -29,6 +35,9 @@ class ReportResponse(BaseModel):
     error_message: str | None
     created_at: datetime
     completed_at: datetime | None
+    sections: list[ReportSectionResponse] = []
+    rows_processed: int = 0
+    heartbeat_at: datetime | None = None
 
     @classmethod
     def from_entity(cls, report):
@@ -53,6 +62,9 @@ class ReportResponse(BaseModel):
             error_message=report.error_message,
             created_at=report.created_at,
             completed_at=report.completed_at,
+            sections=[ReportSectionResponse(**section.to_dict()) for section in report.sections],
+            rows_processed=report.rows_processed,
+            heartbeat_at=report.heartbeat_at,
         )
 
 
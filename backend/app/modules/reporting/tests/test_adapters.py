@@ -0,0 +1,210 @@
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.compensation.domain.value_objects import BonusType
+from app.modules.compensation.infrastructure.models import BonusORM
+from app.modules.contract.domain.value_objects import ContractStatus, ContractType
+from app.modules.contract.infrastructure.models import ContractORM
+from app.modules.employee.infrastructure.models import EmployeeORM
+from app.modules.reporting.domain.value_objects import ReportParameters, ReportType
+from app.modules.reporting.infrastructure.adapters import ReportingDataAdapter
+from app.modules.timesheet.infrastructure.models import TimesheetORM
+
+
+def make_employee(first_name: str, last_name: str) -> EmployeeORM:
+    return EmployeeORM(
+        id=uuid4(),
+        first_name=first_name,
+        last_name=last_name,
+        email=f"{first_name}.{last_name}@example.com".lower(),
+    )
+
+
+def make_contract(employee_id, rate: str, valid_from: date, valid_to: date | None, status):
+    return ContractORM(
+        employee_id=employee_id,
+        contract_type=ContractType.FIXED_MONTHLY,
+        status=status,
+        rate_amount=Decimal(rate),
+        valid_from=valid_from,
+        valid_to=valid_to,
+    )
+
+
+def make_bonus(employee_id, amount: str, payment_date: date) -> BonusORM:
+    return BonusORM(
+        employee_id=employee_id,
+        bonus_type=BonusType.PERFORMANCE,
+        amount=Decimal(amount),
+        payment_date=payment_date,
+    )
+
+
+def make_timesheet(
+    employee_id, day: date, hours: float, overtime_hours: float = 0.0, status: str = "approved"
+) -> TimesheetORM:
+    return TimesheetORM(
+        employee_id=employee_id,
+        start_date=day,
+        end_date=day,
+        hours=hours,
+        overtime_hours=overtime_hours,
+        overtime_type="regular" if overtime_hours else None,
+        status=status,
+    )
+
+
+@pytest.mark.asyncio
+async def test_employee_compensation_data_in_one_query(test_session: AsyncSession):
+    alice = make_employee("Alice", "Anderson")
+    bob = make_employee("Bob", "Brown")
+    test_session.add_all([alice, bob])
+    await test_session.flush()
+    test_session.add_all(
+        [
+            # Expired before the check date
+            make_contract(
+                alice.id, "5000.00", date(2023, 1, 1), date(2024, 12, 31), ContractStatus.ACTIVE
+            ),
+            make_contract(alice.id, "6000.00", date(2025, 1, 1), None, ContractStatus.ACTIVE),
+            make_contract(alice.id, "9000.00", date(2025, 1, 1), None, ContractStatus.CANCELED),
+            make_bonus(alice.id, "1000.00", date(2025, 3, 15)),
+            make_bonus(alice.id, "500.00", date(2025, 6, 30)),
+            # Outside the period
+            make_bonus(alice.id, "700.00", date(2024, 12, 31)),
+            # Bob has no contract and no bonuses
+        ]
+    )
+    await test_session.flush()
+
+    adapter = ReportingDataAdapter(test_session)
+    data = await adapter.fetch_employee_compensation_data(
+        ReportParameters(start_date=date(2025, 1, 1), end_date=date(2025, 12, 31))
+    )
+    rows = [row async for row in data.rows]
+
+    assert data.headers == ["Employee", "Base Salary", "Bonuses", "Total", "Year"]
+    assert rows == [
+        ["Alice Anderson", Decimal("6000.00"), Decimal("1500.00"), Decimal("7500.00"), 2025],
+        ["Bob Brown", Decimal("0"), Decimal("0"), Decimal("0"), 2025],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_employee_compensation_data_for_one_employee(test_session: AsyncSession):
+    alice = make_employee("Alice", "Anderson")
+    bob = make_employee("Bob", "Brown")
+    test_session.add_all([alice, bob])
+    await test_session.flush()
+    test_session.add_all(
+        [
+            make_contract(bob.id, "4000.00", date(2025, 1, 1), None, ContractStatus.ACTIVE),
+            make_bonus(bob.id, "250.00", date(2025, 2, 1)),
+            make_bonus(alice.id, "1000.00", date(2025, 2, 1)),
+        ]
+    )
+    await test_session.flush()
+
+    adapter = ReportingDataAdapter(test_session)
+    data = await adapter.fetch_employee_compensation_data(
+        ReportParameters(
+            employee_id=str(bob.id), start_date=date(2025, 1, 1), end_date=date(2025, 12, 31)
+        )
+    )
+
+    assert [row async for row in data.text_rows()] == [
+        ["Bob Brown", "$4,000.00", "$250.00", "$4,250.00", "2025"]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_timesheet_summary_groups_approved_hours_by_iso_week(test_session: AsyncSession):
+    alice = make_employee("Alice", "Anderson")
+    bob = make_employee("Bob", "Brown")
+    test_session.add_all([alice, bob])
+    await test_session.flush()
+    test_session.add_all(
+        [
+            # 2025-W02
+            make_timesheet(alice.id, date(2025, 1, 6), 8.0),
+            make_timesheet(alice.id, date(2025, 1, 7), 8.0, overtime_hours=2.5),
+            make_timesheet(alice.id, date(2025, 1, 8), 8.0, status="draft"),
+            make_timesheet(bob.id, date(2025, 1, 10), 6.0),
+            # 2025-W03
+            make_timesheet(alice.id, date(2025, 1, 13), 7.5),
+            # Outside the period
+            make_timesheet(alice.id, date(2024, 12, 31), 8.0),
+        ]
+    )
+    await test_session.flush()
+
+    adapter = ReportingDataAdapter(test_session)
+    data = await adapter.fetch_timesheet_summary_data(
+        ReportParameters(start_date=date(2025, 1, 1), end_date=date(2025, 3, 31))
+    )
+
+    assert data.headers == ["Employee", "Regular Hours", "Overtime Hours", "Total Hours", "Week"]
+    assert [row async for row in data.text_rows()] == [
+        ["Alice Anderson", "16.00", "2.50", "18.50", "2025-W02"],
+        ["Alice Anderson", "7.50", "0.00", "7.50", "2025-W03"],
+        ["Bob Brown", "6.00", "0.00", "6.00", "2025-W02"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_timesheet_summary_for_one_employee(test_session: AsyncSession):
+    alice = make_employee("Alice", "Anderson")
+    bob = make_employee("Bob", "Brown")
+    test_session.add_all([alice, bob])
+    await test_session.flush()
+    test_session.add_all(
+        [
+            make_timesheet(alice.id, date(2025, 1, 6), 8.0),
+            make_timesheet(bob.id, date(2025, 1, 6), 4.0),
+        ]
+    )
+    await test_session.flush()
+
+    adapter = ReportingDataAdapter(test_session)
+    data = await adapter.fetch_timesheet_summary_data(ReportParameters(employee_id=str(bob.id)))
+
+    assert [row async for row in data.rows] == [
+        ["Bob Brown", Decimal("4.00"), Decimal("0.00"), Decimal("4.00"), "2025-W02"]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_data_watermark_changes_on_every_write_to_a_source_table(
+    test_session: AsyncSession,
+):
+    adapter = ReportingDataAdapter(test_session)
+    watermarks = [await adapter.data_watermark(ReportType.TIMESHEET_SUMMARY)]
+
+    alice = make_employee("Alice", "Anderson")
+    test_session.add(alice)
+    await test_session.flush()
+    watermarks.append(await adapter.data_watermark(ReportType.TIMESHEET_SUMMARY))
+
+    timesheet = make_timesheet(alice.id, date(2025, 3, 3), 8.0)
+    test_session.add(timesheet)
+    await test_session.flush()
+    watermarks.append(await adapter.data_watermark(ReportType.TIMESHEET_SUMMARY))
+
+    timesheet.hours = 6.0
+    await test_session.flush()
+    watermarks.append(await adapter.data_watermark(ReportType.TIMESHEET_SUMMARY))
+
+    await test_session.delete(timesheet)
+    await test_session.flush()
+    watermarks.append(await adapter.data_watermark(ReportType.TIMESHEET_SUMMARY))
+
+    assert watermarks[0] == "employees:0;timesheets:0"
+    assert len(set(watermarks)) == len(watermarks)
+    # Writes to tables the report does not read leave it unchanged
+    test_session.add(make_bonus(alice.id, "100.00", date(2025, 3, 15)))
+    await test_session.flush()
+    assert await adapter.data_watermark(ReportType.TIMESHEET_SUMMARY) == watermarks[-1]
@@ -0,0 +1,150 @@
+import asyncio
+import zipfile
+from contextlib import asynccontextmanager
+from datetime import date
+
+import pytest
+from openpyxl import load_workbook
+
+from app.modules.reporting.domain.entities import Report
+from app.modules.reporting.domain.generators import ReportData
+from app.modules.reporting.domain.value_objects import (
+    ReportFormat,
+    ReportParameters,
+    ReportStatus,
+    ReportType,
+)
+from app.modules.reporting.infrastructure import close_pack
+from app.modules.reporting.infrastructure.close_pack import PayrollClosePackBuilder
+from app.modules.reporting.infrastructure.report_cache import ReportFileCache
+
+
+class FakeDataAdapter:
+    started = 0
+    failing: set[ReportType] = set()
+    hanging: set[ReportType] = set()
+
+    def __init__(self, session, progress=None):
+        self.session = session
+
+    async def data_watermark(self, report_type: ReportType) -> str:
+        return ""
+
+    async def fetch_report_data(self, report: Report) -> ReportData:
+        FakeDataAdapter.started += 1
+        # Every section query has to be running before any of them returns
+        while FakeDataAdapter.started < 4:
+            await asyncio.sleep(0)
+        if report.report_type in FakeDataAdapter.failing:
+            raise RuntimeError("connection lost")
+        if report.report_type in FakeDataAdapter.hanging:
+            await asyncio.Event().wait()
+        return ReportData.from_rows(["Section"], [[report.report_type.value]])
+
+
+@asynccontextmanager
+async def fake_read_session():
+    yield None
+
+
+@pytest.fixture
+def builder(tmp_path, monkeypatch):
+    FakeDataAdapter.started = 0
+    FakeDataAdapter.failing = set()
+    FakeDataAdapter.hanging = set()
+    monkeypatch.setattr(close_pack, "ReportingDataAdapter", FakeDataAdapter)
+    return PayrollClosePackBuilder(
+        fake_read_session,
+        report_cache=ReportFileCache(str(tmp_path), enabled=False),
+        output_dir=str(tmp_path),
+    )
+
+
+def make_report(report_format: ReportFormat) -> Report:
+    report = Report(
+        name="January Close",
+        report_type=ReportType.PAYROLL_CLOSE_PACK,
+        format=report_format,
+        parameters=ReportParameters(start_date=date(2025, 1, 1), end_date=date(2025, 1, 31)),
+    )
+    report.start_processing()
+    return report
+
+
+@pytest.mark.asyncio
+async def test_sections_are_generated_concurrently_and_zipped(builder, tmp_path):
+    report = make_report(ReportFormat.CSV)
+    updates = []
+
+    async def on_section_update(updated: Report) -> None:
+        updates.append([section.status for section in updated.sections])
+
+    file_path = await asyncio.wait_for(builder.build(report, on_section_update), timeout=10)
+
+    assert list(tmp_path.iterdir()) == [file_path]
+    with zipfile.ZipFile(file_path) as bundle:
+        assert bundle.namelist() == [
+            "01_payroll_summary.csv",
+            "02_tax_report.csv",
+            "03_absence_summary.csv",
+            "04_employee_compensation.csv",
+        ]
+        assert "tax_report" in bundle.read("02_tax_report.csv").decode()
+    assert all(section.status == ReportStatus.COMPLETED for section in report.sections)
+    # Every section is saved as processing and then as completed
+    assert len(updates) == 8
+
+
+@pytest.mark.asyncio
+async def test_xlsx_pack_is_one_workbook_with_a_sheet_per_section(builder, tmp_path):
+    file_path = await builder.build(make_report(ReportFormat.XLSX))
+
+    assert file_path.suffix == ".xlsx"
+    assert list(tmp_path.iterdir()) == [file_path]
+    workbook = load_workbook(file_path, read_only=True)
+    assert workbook.sheetnames == [
+        "Payroll Summary",
+        "Tax Report",
+        "Absence Summary",
+        "Employee Compensation",
+    ]
+    rows = list(workbook["Tax Report"].iter_rows(values_only=True))
+    assert list(rows[5]) == ["tax_report"]
+
+
+@pytest.mark.asyncio
+async def test_failed_section_fails_the_pack_after_the_others_finish(builder, tmp_path):
+    FakeDataAdapter.failing = {ReportType.TAX_REPORT}
+    report = make_report(ReportFormat.CSV)
+
+    with pytest.raises(RuntimeError, match="tax_report: connection lost"):
+        await builder.build(report)
+
+    statuses = {section.report_type: section.status for section in report.sections}
+    assert statuses == {
+        ReportType.PAYROLL_SUMMARY: ReportStatus.COMPLETED,
+        ReportType.TAX_REPORT: ReportStatus.FAILED,
+        ReportType.ABSENCE_SUMMARY: ReportStatus.COMPLETED,
+        ReportType.EMPLOYEE_COMPENSATION: ReportStatus.COMPLETED,
+    }
+    assert report.sections[1].error_message == "connection lost"
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_cancelled_pack_leaves_no_section_processing(builder, tmp_path):
+    FakeDataAdapter.hanging = {ReportType.TAX_REPORT, ReportType.ABSENCE_SUMMARY}
+    report = make_report(ReportFormat.CSV)
+
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.5):
+            await builder.build(report)
+
+    statuses = {section.report_type: section.status for section in report.sections}
+    assert statuses == {
+        ReportType.PAYROLL_SUMMARY: ReportStatus.COMPLETED,
+        ReportType.TAX_REPORT: ReportStatus.CANCELLED,
+        ReportType.ABSENCE_SUMMARY: ReportStatus.CANCELLED,
+        ReportType.EMPLOYEE_COMPENSATION: ReportStatus.COMPLETED,
+    }
+    assert list(tmp_path.iterdir()) == []
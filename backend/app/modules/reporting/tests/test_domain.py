@@ -2,6 +2,7 @@ import pytest
 
 from app.modules.reporting.domain.entities import Report
 from app.modules.reporting.domain.value_objects import (
+    PAYROLL_CLOSE_PACK_SECTIONS,
     ReportFormat,
     ReportParameters,
     ReportStatus,
@@ -117,6 +118,33 @@ def test_fail_report_invalid_status():
         report.fail("Some error")
 
 
+def test_cancel_processing_report():
+    report = Report(
+        name="Test Report",
+        report_type=ReportType.PAYROLL_SUMMARY,
+        format=ReportFormat.CSV,
+        status=ReportStatus.PROCESSING,
+    )
+
+    report.cancel()
+
+    assert report.status == ReportStatus.CANCELLED
+    assert report.is_cancelled()
+    assert report.completed_at is not None
+
+
+def test_cancel_report_invalid_status():
+    report = Report(
+        name="Test Report",
+        report_type=ReportType.PAYROLL_SUMMARY,
+        format=ReportFormat.CSV,
+        status=ReportStatus.COMPLETED,
+    )
+
+    with pytest.raises(ValueError, match="Cannot cancel report"):
+        report.cancel()
+
+
 def test_report_status_checks():
     report = Report(
         name="Test Report",
@@ -158,3 +186,49 @@ def test_report_parameters_invalid_date_range():
             start_date="2024-01-31",
             end_date="2024-01-01",
         )
+
+
+def test_payroll_close_pack_tracks_section_status():
+    report = Report(
+        name="January Close",
+        report_type=ReportType.PAYROLL_CLOSE_PACK,
+        format=ReportFormat.XLSX,
+    )
+
+    assert [section.report_type for section in report.sections] == list(PAYROLL_CLOSE_PACK_SECTIONS)
+    assert all(section.status == ReportStatus.PENDING for section in report.sections)
+
+    with pytest.raises(ValueError, match="Cannot update sections"):
+        report.update_section(ReportType.TAX_REPORT, ReportStatus.PROCESSING)
+
+    report.start_processing()
+    report.update_section(ReportType.TAX_REPORT, ReportStatus.FAILED, "timeout")
+
+    assert report.sections[1].status == ReportStatus.FAILED
+    assert report.sections[1].error_message == "timeout"
+    with pytest.raises(ValueError, match="no custom section"):
+        report.update_section(ReportType.CUSTOM, ReportStatus.COMPLETED)
+
+
+def test_failing_or_cancelling_a_pack_closes_unfinished_sections():
+    failed = Report(report_type=ReportType.PAYROLL_CLOSE_PACK, format=ReportFormat.CSV)
+    failed.start_processing()
+    failed.update_section(ReportType.PAYROLL_SUMMARY, ReportStatus.COMPLETED)
+    failed.update_section(ReportType.TAX_REPORT, ReportStatus.PROCESSING)
+
+    failed.fail("Report exceeded its time budget of 1800 seconds")
+
+    assert [section.status for section in failed.sections] == [
+        ReportStatus.COMPLETED,
+        ReportStatus.FAILED,
+        ReportStatus.FAILED,
+        ReportStatus.FAILED,
+    ]
+
+    cancelled = Report(report_type=ReportType.PAYROLL_CLOSE_PACK, format=ReportFormat.CSV)
+    cancelled.start_processing()
+    cancelled.update_section(ReportType.TAX_REPORT, ReportStatus.PROCESSING)
+
+    cancelled.cancel()
+
+    assert all(section.status == ReportStatus.CANCELLED for section in cancelled.sections)
@@ -0,0 +1,88 @@
+import pytest
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from app.modules.reporting.infrastructure.storage import LocalReportStorage
+from app.modules.reporting.presentation.downloads import parse_byte_range, report_file_response
+
+CONTENT = bytes(range(256)) * 4
+
+
+def test_parse_byte_range():
+    assert parse_byte_range("bytes=0-99", 1024) == (0, 99)
+    assert parse_byte_range("bytes=1000-", 1024) == (1000, 1023)
+    assert parse_byte_range("bytes=1000-5000", 1024) == (1000, 1023)
+    assert parse_byte_range("bytes=-24", 1024) == (1000, 1023)
+    assert parse_byte_range("bytes=-5000", 1024) == (0, 1023)
+    # Unsupported or malformed ranges serve the whole file
+    assert parse_byte_range("bytes=0-1,5-6", 1024) is None
+    assert parse_byte_range("items=0-1", 1024) is None
+    assert parse_byte_range("bytes=a-b", 1024) is None
+    assert parse_byte_range("bytes=5-1", 1024) is None
+    with pytest.raises(ValueError):
+        parse_byte_range("bytes=1024-", 1024)
+    with pytest.raises(ValueError):
+        parse_byte_range("bytes=-0", 1024)
+
+
+@pytest.fixture
+async def client(tmp_path):
+    storage = LocalReportStorage(str(tmp_path))
+    (tmp_path / "report_1.pdf").write_bytes(CONTENT)
+    app = FastAPI()
+
+    @app.get("/download")
+    async def download(request: Request):
+        stored = await storage.stat("report_1.pdf")
+        return report_file_response(request, storage, stored)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_download_streams_whole_file_with_etag(client):
+    response = await client.get("/download")
+
+    assert response.status_code == 200
+    assert response.content == CONTENT
+    assert response.headers["content-type"] == "application/octet-stream"
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["content-length"] == str(len(CONTENT))
+    assert 'filename="report_1.pdf"' in response.headers["content-disposition"]
+    assert response.headers["etag"]
+
+
+@pytest.mark.asyncio
+async def test_download_range(client):
+    response = await client.get("/download", headers={"Range": "bytes=100-199"})
+
+    assert response.status_code == 206
+    assert response.content == CONTENT[100:200]
+    assert response.headers["content-range"] == f"bytes 100-199/{len(CONTENT)}"
+
+
+@pytest.mark.asyncio
+async def test_download_unsatisfiable_range(client):
+    response = await client.get("/download", headers={"Range": "bytes=5000-"})
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(CONTENT)}"
+
+
+@pytest.mark.asyncio
+async def test_download_if_none_match(client):
+    etag = (await client.get("/download")).headers["etag"]
+
+    response = await client.get("/download", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_download_if_range_with_stale_etag_serves_whole_file(client):
+    response = await client.get("/download", headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.content == CONTENT
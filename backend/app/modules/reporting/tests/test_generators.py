@@ -0,0 +1,177 @@
+import csv
+import io
+import json
+import zipfile
+from collections.abc import AsyncIterator
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from openpyxl import load_workbook
+
+from app.modules.reporting.domain.entities import Report
+from app.modules.reporting.domain.generators import ColumnType, ReportColumn, ReportData
+from app.modules.reporting.domain.value_objects import ReportFormat, ReportParameters, ReportType
+from app.modules.reporting.infrastructure.generators import ReportGeneratorFactory, settings
+
+HEADERS = ["Employee", "Gross Pay", "Deductions", "Net Pay", "Period"]
+ROWS = [
+    [f"Employee {index}", "$8,000.00", "$800.00", "$7,200.00", "2025-01-01 to 2025-01-31"]
+    for index in range(250)
+]
+
+
+def make_report(report_format: ReportFormat) -> Report:
+    return Report(
+        name="Payroll Summary",
+        report_type=ReportType.PAYROLL_SUMMARY,
+        format=report_format,
+        parameters=ReportParameters(start_date=date(2025, 1, 1), end_date=date(2025, 1, 31)),
+    )
+
+
+def make_data() -> ReportData:
+    return ReportData.from_rows(HEADERS, ROWS)
+
+
+TYPED_COLUMNS = [
+    ReportColumn("Employee"),
+    ReportColumn("Net Pay", ColumnType.MONEY),
+    ReportColumn("Days", ColumnType.INTEGER),
+    ReportColumn("Period Start", ColumnType.DATE),
+]
+TYPED_ROWS = [
+    [f"Employee {index}", Decimal("7200.50") + index, index, date(2025, 1, 1)]
+    for index in range(250)
+]
+
+
+def make_typed_data() -> ReportData:
+    async def rows() -> AsyncIterator[list]:
+        for row in TYPED_ROWS:
+            yield row
+
+    return ReportData.typed(TYPED_COLUMNS, rows())
+
+
+@pytest.mark.asyncio
+async def test_csv_report_is_written_from_row_stream(tmp_path):
+    generator = ReportGeneratorFactory(str(tmp_path)).get_generator("csv")
+
+    file_path = await generator.generate(make_report(ReportFormat.CSV), make_data())
+
+    with open(file_path, newline="", encoding="utf-8") as csvfile:
+        lines = list(csv.reader(csvfile))
+    assert lines[0] == ["# Payroll Summary"]
+    assert lines[4] == HEADERS
+    assert lines[5:] == ROWS
+
+
+@pytest.mark.asyncio
+async def test_json_report_is_a_valid_document(tmp_path):
+    generator = ReportGeneratorFactory(str(tmp_path)).get_generator("json")
+
+    file_path = await generator.generate(make_report(ReportFormat.JSON), make_data())
+
+    document = json.loads(file_path.read_text(encoding="utf-8"))
+    assert document["metadata"]["parameters"]["start_date"] == "2025-01-01"
+    assert document["data"] == {"headers": HEADERS, "rows": ROWS}
+
+
+@pytest.mark.asyncio
+async def test_json_report_without_rows(tmp_path):
+    generator = ReportGeneratorFactory(str(tmp_path)).get_generator("json")
+
+    file_path = await generator.generate(
+        make_report(ReportFormat.JSON), ReportData.from_rows(HEADERS, [])
+    )
+
+    assert json.loads(file_path.read_text(encoding="utf-8"))["data"]["rows"] == []
+
+
+@pytest.mark.asyncio
+async def test_xlsx_report_is_written_in_write_only_mode(tmp_path):
+    generator = ReportGeneratorFactory(str(tmp_path)).get_generator("xlsx")
+
+    file_path = await generator.generate(make_report(ReportFormat.XLSX), make_data())
+
+    sheet = load_workbook(file_path, read_only=True)["Report"]
+    rows = [list(row) for row in sheet.iter_rows(values_only=True)]
+    assert rows[0][0] == "Payroll Summary"
+    assert rows[4] == HEADERS
+    assert rows[5:] == ROWS
+
+
+@pytest.mark.asyncio
+async def test_pdf_report_is_rendered_in_a_worker(tmp_path):
+    generator = ReportGeneratorFactory(str(tmp_path)).get_generator("pdf")
+
+    file_path = await generator.generate(make_report(ReportFormat.PDF), make_data())
+
+    assert file_path.read_bytes().startswith(b"%PDF")
+    # The spooled rows are removed once the worker is done
+    assert list(tmp_path.iterdir()) == [file_path]
+
+
+@pytest.mark.asyncio
+async def test_pdf_report_above_row_cap_is_a_summary_and_csv_bundle(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "REPORT_PDF_MAX_ROWS", 100)
+    generator = ReportGeneratorFactory(str(tmp_path)).get_generator("pdf")
+
+    file_path = await generator.generate(make_report(ReportFormat.PDF), make_data())
+
+    assert file_path.suffix == ".zip"
+    assert list(tmp_path.iterdir()) == [file_path]
+    with zipfile.ZipFile(file_path) as bundle:
+        names = sorted(bundle.namelist())
+        assert names == [f"{file_path.stem}.csv", f"{file_path.stem}.pdf"]
+        assert bundle.read(f"{file_path.stem}.pdf").startswith(b"%PDF")
+        lines = list(csv.reader(io.StringIO(bundle.read(f"{file_path.stem}.csv").decode())))
+    assert lines == [HEADERS, *ROWS]
+
+
+@pytest.mark.asyncio
+async def test_typed_rows_are_formatted_for_text_formats(tmp_path):
+    generator = ReportGeneratorFactory(str(tmp_path)).get_generator("csv")
+
+    file_path = await generator.generate(make_report(ReportFormat.CSV), make_typed_data())
+
+    with open(file_path, newline="", encoding="utf-8") as csvfile:
+        lines = list(csv.reader(csvfile))
+    assert lines[4] == ["Employee", "Net Pay", "Days", "Period Start"]
+    assert lines[6] == ["Employee 1", "$7,201.50", "1", "2025-01-01"]
+
+
+@pytest.mark.asyncio
+async def test_parquet_report_keeps_column_types_in_row_groups(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    factory = ReportGeneratorFactory(str(tmp_path))
+    factory.get_generator("parquet").batch_rows = 100
+
+    file_path = await factory.get_generator("parquet").generate(
+        make_report(ReportFormat.PARQUET), make_typed_data()
+    )
+
+    parquet_file = pq.ParquetFile(file_path)
+    assert parquet_file.metadata.num_row_groups == 3
+    assert str(parquet_file.schema_arrow.field("Net Pay").type) == "decimal128(18, 2)"
+    assert parquet_file.schema_arrow.metadata[b"type"] == b"payroll_summary"
+    assert parquet_file.read().to_pylist()[1] == {
+        "Employee": "Employee 1",
+        "Net Pay": Decimal("7201.50"),
+        "Days": 1,
+        "Period Start": date(2025, 1, 1),
+    }
+
+
+@pytest.mark.asyncio
+async def test_arrow_report_without_typed_schema_has_text_columns(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    generator = ReportGeneratorFactory(str(tmp_path)).get_generator("arrow")
+
+    file_path = await generator.generate(make_report(ReportFormat.ARROW), make_data())
+
+    with pa.ipc.open_stream(file_path) as reader:
+        table = reader.read_all()
+    assert table.column_names == HEADERS
+    assert table.to_pylist()[0] == dict(zip(HEADERS, ROWS[0], strict=True))
@@ -0,0 +1,82 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.modules.reporting.infrastructure.progress import (
+    ReportBudgetExceededError,
+    ReportCancelledError,
+    ReportLease,
+    ReportProgress,
+)
+
+
+async def rows(count: int):
+    for index in range(count):
+        yield [index]
+
+
+class FakeLease(ReportLease):
+    """Lease whose heartbeat reports the report alive for a number of beats"""
+
+    def __init__(self, progress: ReportProgress, time_budget: int, alive_beats: int):
+        # An unbound session factory: beat() is replaced and never opens a session
+        super().__init__(
+            uuid4(),
+            progress,
+            time_budget,
+            session_factory=async_sessionmaker(),
+            heartbeat_interval=0.01,
+        )
+        self.alive_beats = alive_beats
+        self.beats = 0
+
+    async def beat(self) -> bool:
+        self.beats += 1
+        return self.beats <= self.alive_beats
+
+
+async def test_progress_counts_rows():
+    progress = ReportProgress(max_rows=10)
+
+    tracked = [row async for row in progress.track(rows(10))]
+
+    assert len(tracked) == 10
+    assert progress.rows == 10
+
+
+async def test_progress_fails_over_row_budget():
+    progress = ReportProgress(max_rows=5)
+
+    with pytest.raises(ReportBudgetExceededError, match="5 rows"):
+        [row async for row in progress.track(rows(10))]
+
+
+async def test_lease_returns_result():
+    lease = ReportLease(uuid4(), ReportProgress(), time_budget=5)
+
+    assert await lease.run(asyncio.sleep(0, result="report.csv")) == "report.csv"
+
+
+async def test_lease_fails_over_time_budget():
+    lease = ReportLease(uuid4(), ReportProgress(), time_budget=0.05)
+
+    with pytest.raises(ReportBudgetExceededError, match="time budget"):
+        await lease.run(asyncio.sleep(5))
+
+
+async def test_lease_stops_cancelled_report():
+    lease = FakeLease(ReportProgress(), time_budget=5, alive_beats=2)
+
+    with pytest.raises(ReportCancelledError):
+        await lease.run(asyncio.sleep(5))
+
+    assert lease.beats == 3
+
+
+async def test_lease_detects_cancellation_after_last_heartbeat():
+    lease = FakeLease(ReportProgress(), time_budget=5, alive_beats=0)
+
+    with pytest.raises(ReportCancelledError):
+        await lease.run(asyncio.sleep(0))
@@ -0,0 +1,111 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from app.modules.reporting.infrastructure.render_pool import (
+    ReportRenderPool,
+    ReportRenderTimeoutError,
+)
+
+
+def worker_pid() -> int:
+    return os.getpid()
+
+
+def sleep_then_return_pid(seconds: float) -> int:
+    time.sleep(seconds)
+    return os.getpid()
+
+
+def fail() -> None:
+    raise ValueError("render failed")
+
+
+def is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+async def wait_until_dead(pid: int) -> bool:
+    for _ in range(50):
+        if not is_alive(pid):
+            return True
+        await asyncio.sleep(0.1)
+    return False
+
+
+@pytest.mark.asyncio
+async def test_render_runs_in_a_reused_worker_process():
+    pool = ReportRenderPool(max_workers=1, timeout_seconds=30)
+    try:
+        first = await pool.render(worker_pid)
+        second = await pool.render(worker_pid)
+    finally:
+        pool.shutdown()
+
+    assert first != os.getpid()
+    assert first == second
+
+
+@pytest.mark.asyncio
+async def test_render_error_is_raised_and_worker_is_kept():
+    pool = ReportRenderPool(max_workers=1, timeout_seconds=30)
+    try:
+        pid = await pool.render(worker_pid)
+        with pytest.raises(ValueError, match="render failed"):
+            await pool.render(fail)
+        assert await pool.render(worker_pid) == pid
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_render_timeout_kills_the_worker():
+    pool = ReportRenderPool(max_workers=1, timeout_seconds=30)
+    try:
+        pid = await pool.render(worker_pid)
+        pool.timeout_seconds = 0.5
+        with pytest.raises(ReportRenderTimeoutError):
+            await pool.render(sleep_then_return_pid, 30)
+
+        assert await wait_until_dead(pid)
+        # The next render gets a fresh worker
+        pool.timeout_seconds = 30
+        assert await pool.render(worker_pid) != pid
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_render_kills_the_worker():
+    pool = ReportRenderPool(max_workers=1, timeout_seconds=30)
+    try:
+        pid = await pool.render(worker_pid)
+        task = asyncio.create_task(pool.render(sleep_then_return_pid, 30))
+        await asyncio.sleep(0.5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert await wait_until_dead(pid)
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_renders_are_limited_to_max_workers():
+    pool = ReportRenderPool(max_workers=2, timeout_seconds=30)
+    try:
+        start = time.perf_counter()
+        pids = await asyncio.gather(*(pool.render(sleep_then_return_pid, 0.5) for _ in range(4)))
+        elapsed = time.perf_counter() - start
+    finally:
+        pool.shutdown()
+
+    assert len(set(pids)) == 2
+    assert elapsed >= 1.0
@@ -0,0 +1,103 @@
+import os
+from datetime import date
+
+import pytest
+
+from app.modules.reporting.domain.entities import Report
+from app.modules.reporting.domain.generators import ReportData
+from app.modules.reporting.domain.value_objects import ReportFormat, ReportParameters, ReportType
+from app.modules.reporting.infrastructure.generators import ReportGeneratorFactory
+from app.modules.reporting.infrastructure.report_cache import ReportFileCache
+
+
+class FakeDataAdapter:
+    def __init__(self, watermark: str = "payrolls:1:100"):
+        self.watermark = watermark
+        self.fetches = 0
+
+    async def data_watermark(self, report_type: ReportType) -> str:
+        return self.watermark
+
+    async def fetch_report_data(self, report: Report) -> ReportData:
+        self.fetches += 1
+        return ReportData.from_rows(["Employee", "Net Pay"], [["Jane Smith", "$7,200.00"]])
+
+
+def make_report(employee_id: str | None = None) -> Report:
+    return Report(
+        name="Payroll Summary",
+        report_type=ReportType.PAYROLL_SUMMARY,
+        format=ReportFormat.CSV,
+        parameters=ReportParameters(
+            employee_id=employee_id, start_date=date(2025, 1, 1), end_date=date(2025, 1, 31)
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_identical_report_reuses_cached_file(tmp_path):
+    cache = ReportFileCache(str(tmp_path), max_bytes=1024 * 1024, enabled=True)
+    factory = ReportGeneratorFactory(str(tmp_path))
+    adapter = FakeDataAdapter()
+
+    first = await cache.get_or_generate(make_report(), adapter, factory)
+    second = await cache.get_or_generate(make_report(), adapter, factory)
+
+    assert adapter.fetches == 1
+    assert first != second
+    assert second.read_bytes() == first.read_bytes()
+    assert os.path.samefile(first, second)
+
+
+@pytest.mark.asyncio
+async def test_changed_data_or_parameters_are_generated_again(tmp_path):
+    cache = ReportFileCache(str(tmp_path), max_bytes=1024 * 1024, enabled=True)
+    factory = ReportGeneratorFactory(str(tmp_path))
+    adapter = FakeDataAdapter()
+
+    await cache.get_or_generate(make_report(), adapter, factory)
+    adapter.watermark = "payrolls:2:101"
+    await cache.get_or_generate(make_report(), adapter, factory)
+    await cache.get_or_generate(
+        make_report("5d3b8f1e-6c1e-4c8e-9a2b-1e2f3a4b5c6d"), adapter, factory
+    )
+
+    assert adapter.fetches == 3
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_always_generates(tmp_path):
+    cache = ReportFileCache(str(tmp_path), enabled=False)
+    factory = ReportGeneratorFactory(str(tmp_path))
+    adapter = FakeDataAdapter()
+
+    await cache.get_or_generate(make_report(), adapter, factory)
+    await cache.get_or_generate(make_report(), adapter, factory)
+
+    assert adapter.fetches == 2
+    assert not cache.cache_dir.exists()
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_files_are_evicted(tmp_path):
+    factory = ReportGeneratorFactory(str(tmp_path))
+    adapter = FakeDataAdapter()
+    first = await ReportFileCache(str(tmp_path), enabled=True).get_or_generate(
+        make_report(), adapter, factory
+    )
+    file_size = first.stat().st_size
+    # Room for two cached files
+    cache = ReportFileCache(str(tmp_path), max_bytes=file_size * 2, enabled=True)
+    oldest = next(cache.cache_dir.iterdir())
+    os.utime(oldest, (0, 0))
+
+    adapter.watermark = "payrolls:2:101"
+    await cache.get_or_generate(make_report(), adapter, factory)
+    adapter.watermark = "payrolls:3:102"
+    await cache.get_or_generate(make_report(), adapter, factory)
+
+    cached = list(cache.cache_dir.iterdir())
+    assert len(cached) == 2
+    assert oldest not in cached
+    # Evicting a cache entry does not remove the report that used it
+    assert first.exists()
@@ -1,5 +1,7 @@
 """Tests for reporting repository"""
 
+from datetime import datetime
+
 import pytest
 
 from app.modules.reporting.domain.entities import Report
@@ -273,3 +275,78 @@ async def test_repository_update_with_parameters(test_session):
     assert updated.parameters.start_date == date(2024, 1, 1)
     assert updated.parameters.end_date == date(2024, 1, 31)
     assert updated.parameters.additional_filters == {"key": "value"}
+
+
+@pytest.mark.asyncio
+async def test_repository_preserves_section_status(test_session):
+    """Test section statuses of a payroll close pack survive a round trip"""
+    repository = SQLAlchemyReportRepository(test_session)
+
+    report = Report(
+        name="January Close",
+        report_type=ReportType.PAYROLL_CLOSE_PACK,
+        format=ReportFormat.CSV,
+    )
+    report.start_processing()
+    report.update_section(ReportType.TAX_REPORT, ReportStatus.FAILED, "timeout")
+    await repository.save(report)
+    await test_session.commit()
+
+    retrieved = await repository.get_by_id(report.id)
+
+    assert retrieved.sections == report.sections
+    assert retrieved.sections[1].error_message == "timeout"
+
+
+@pytest.mark.asyncio
+async def test_repository_fails_stale_reports_and_their_sections(test_session):
+    repository = SQLAlchemyReportRepository(test_session)
+    stale = Report(
+        name="Stale Close Pack",
+        report_type=ReportType.PAYROLL_CLOSE_PACK,
+        format=ReportFormat.CSV,
+    )
+    stale.start_processing()
+    stale.heartbeat_at = datetime(2025, 1, 1, 12, 0)
+    stale.update_section(ReportType.PAYROLL_SUMMARY, ReportStatus.COMPLETED)
+    await repository.save(stale)
+    live = Report(name="Live", report_type=ReportType.CUSTOM, format=ReportFormat.CSV)
+    live.start_processing()
+    await repository.save(live)
+    await test_session.commit()
+
+    failed = await repository.fail_stale_processing(
+        datetime(2025, 1, 1, 12, 5), "Report generation stopped sending heartbeats"
+    )
+    await test_session.commit()
+
+    assert failed == 1
+    reclaimed = await repository.get_by_id(stale.id)
+    assert reclaimed.status == ReportStatus.FAILED
+    assert [section.status for section in reclaimed.sections] == [
+        ReportStatus.COMPLETED,
+        ReportStatus.FAILED,
+        ReportStatus.FAILED,
+        ReportStatus.FAILED,
+    ]
+    assert (await repository.get_by_id(live.id)).status == ReportStatus.PROCESSING
+
+
+@pytest.mark.asyncio
+async def test_repository_clears_file_paths_of_swept_files(test_session):
+    repository = SQLAlchemyReportRepository(test_session)
+    reports = []
+    for key in ["swept.csv", "kept.csv"]:
+        report = Report(name=key, report_type=ReportType.CUSTOM, format=ReportFormat.CSV)
+        report.start_processing()
+        report.complete(key)
+        await repository.save(report)
+        reports.append(report)
+    await test_session.commit()
+
+    cleared = await repository.clear_file_paths(["swept.csv", "missing.csv"])
+    await test_session.commit()
+
+    assert cleared == 1
+    assert (await repository.get_by_id(reports[0].id)).file_path is None
+    assert (await repository.get_by_id(reports[1].id)).file_path == "kept.csv"
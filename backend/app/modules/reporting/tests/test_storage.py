@@ -0,0 +1,151 @@
+import os
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.modules.reporting.infrastructure import scheduler
+from app.modules.reporting.infrastructure.scheduler import ReportRetentionSweeper
+from app.modules.reporting.infrastructure.storage import LocalReportStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalReportStorage(str(tmp_path / "storage"))
+
+
+class FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def commit(self):
+        pass
+
+
+class FakeReportRepository:
+    def __init__(self, storage: LocalReportStorage, cleared: list[str]):
+        self.storage = storage
+        self.cleared = cleared
+
+    async def clear_file_paths(self, keys: list[str]) -> int:
+        # Files are detached from their reports while they still exist
+        assert all((self.storage.root / key).exists() for key in keys)
+        self.cleared.extend(keys)
+        return len(keys)
+
+
+@pytest.fixture
+def cleared(monkeypatch, storage):
+    keys: list[str] = []
+    monkeypatch.setattr(
+        scheduler, "SQLAlchemyReportRepository", lambda session: FakeReportRepository(storage, keys)
+    )
+    return keys
+
+
+def make_sweeper(storage, tmp_path, **kwargs) -> ReportRetentionSweeper:
+    return ReportRetentionSweeper(
+        storage,
+        session_factory=FakeSession,  # type: ignore[arg-type]
+        work_dir=str(tmp_path / "work"),
+        **kwargs,
+    )
+
+
+def write_report(directory, name: str, content: bytes = b"0123456789"):
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_bytes(content)
+    return path
+
+
+@pytest.mark.asyncio
+async def test_save_moves_rendered_file_into_storage(tmp_path, storage):
+    rendered = write_report(tmp_path / "work", "report_1.csv")
+
+    stored = await storage.save(rendered)
+
+    assert stored.key == "report_1.csv"
+    assert stored.size == 10
+    assert not rendered.exists()
+    assert await storage.stat("report_1.csv") == stored
+
+
+@pytest.mark.asyncio
+async def test_read_streams_byte_ranges(tmp_path, storage):
+    await storage.save(write_report(tmp_path / "work", "report_1.csv"))
+
+    assert b"".join([chunk async for chunk in storage.read("report_1.csv")]) == b"0123456789"
+    assert b"".join([chunk async for chunk in storage.read("report_1.csv", 2, 5)]) == b"2345"
+    assert b"".join([chunk async for chunk in storage.read("report_1.csv", 8)]) == b"89"
+
+
+@pytest.mark.asyncio
+async def test_stat_reads_legacy_absolute_paths(tmp_path, storage):
+    legacy = write_report(tmp_path / "legacy", "report_1.pdf")
+
+    stored = await storage.stat(str(legacy))
+
+    assert stored is not None
+    assert stored.size == 10
+    assert await storage.stat("missing.pdf") is None
+
+
+@pytest.mark.asyncio
+async def test_list_files_skips_directories(storage):
+    write_report(storage.root, "report_1.csv")
+    write_report(storage.root / ".cache", "cached.csv")
+
+    assert [stored.key async for stored in storage.list_files()] == ["report_1.csv"]
+
+
+@pytest.mark.asyncio
+async def test_retention_deletes_expired_files(tmp_path, storage, cleared):
+    now = datetime.now(UTC)
+    expired = write_report(storage.root, "expired.csv")
+    recent = write_report(storage.root, "recent.csv")
+    old_timestamp = (now - timedelta(days=31)).timestamp()
+    os.utime(expired, (old_timestamp, old_timestamp))
+
+    deleted = await make_sweeper(storage, tmp_path, retention_days=30, quota_bytes=1000).sweep(now)
+
+    assert deleted == 1
+    assert cleared == ["expired.csv"]
+    assert not expired.exists()
+    assert recent.exists()
+
+
+@pytest.mark.asyncio
+async def test_retention_deletes_oldest_files_over_quota(tmp_path, storage, cleared):
+    now = datetime.now(UTC)
+    paths = [write_report(storage.root, f"report_{index}.csv") for index in range(3)]
+    for age_hours, path in zip([3, 2, 1], paths, strict=True):
+        timestamp = (now - timedelta(hours=age_hours)).timestamp()
+        os.utime(path, (timestamp, timestamp))
+
+    deleted = await make_sweeper(storage, tmp_path, retention_days=30, quota_bytes=20).sweep(now)
+
+    assert deleted == 1
+    assert cleared == ["report_0.csv"]
+    assert [path.exists() for path in paths] == [False, True, True]
+
+
+@pytest.mark.asyncio
+async def test_retention_deletes_only_abandoned_working_files(tmp_path, storage, cleared):
+    now = datetime.now(UTC)
+    sweeper = make_sweeper(storage, tmp_path)
+    in_progress = write_report(sweeper.work_dir, "report_1.csv")
+    abandoned = write_report(sweeper.work_dir, "report_2.csv")
+    cached = write_report(sweeper.work_dir / ".cache", "cached.csv")
+    for path in [abandoned, cached]:
+        timestamp = (now - timedelta(days=1)).timestamp()
+        os.utime(path, (timestamp, timestamp))
+
+    assert await sweeper.sweep(now) == 0
+
+    assert in_progress.exists()
+    assert not abandoned.exists()
+    assert cached.exists()
+    assert cleared == []
@@ -4,7 +4,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.modules.auth.infrastructure.dependencies import get_current_active_user
 from app.modules.timesheet.application.commands import (
     ApproveTimesheetCommand,
@@ -82,7 +82,7 @@ async def create_timesheet(
 
 @router.get("/{timesheet_id}", response_model=TimesheetResponse)
 async def get_timesheet(
-    timesheet_id: UUID, db: AsyncSession = Depends(get_db)
+    timesheet_id: UUID, db: AsyncSession = Depends(get_read_db)
 ) -> TimesheetResponse:
     repository = SQLAlchemyTimesheetRepository(db)
     handler = GetTimesheetHandler(repository)
@@ -97,7 +97,7 @@ async def get_timesheet(
 
 
 @router.get("/", response_model=list[TimesheetResponse])
-async def list_timesheets(db: AsyncSession = Depends(get_db)) -> list[TimesheetResponse]:
+async def list_timesheets(db: AsyncSession = Depends(get_read_db)) -> list[TimesheetResponse]:
     repository = SQLAlchemyTimesheetRepository(db)
     handler = ListTimesheetsHandler(repository)
 
@@ -109,7 +109,7 @@ async def list_timesheets(db: AsyncSession = Depends(get_db)) -> list[TimesheetR
 
 @router.get("/employee/{employee_id}", response_model=list[TimesheetResponse])
 async def get_timesheets_by_employee(
-    employee_id: UUID, db: AsyncSession = Depends(get_db)
+    employee_id: UUID, db: AsyncSession = Depends(get_read_db)
 ) -> list[TimesheetResponse]:
     repository = SQLAlchemyTimesheetRepository(db)
     handler = GetTimesheetsByEmployeeHandler(repository)
@@ -125,7 +125,7 @@ async def get_timesheets_by_employee_and_date_range(
     employee_id: UUID,
     start_date: date,
     end_date: date,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> list[TimesheetResponse]:
     repository = SQLAlchemyTimesheetRepository(db)
     handler = GetTimesheetsByEmployeeAndDateRangeHandler(repository)
@@ -140,7 +140,7 @@ async def get_timesheets_by_employee_and_date_range(
 
 @router.get("/status/{status_value}", response_model=list[TimesheetResponse])
 async def get_timesheets_by_status(
-    status_value: str, db: AsyncSession = Depends(get_db)
+    status_value: str, db: AsyncSession = Depends(get_read_db)
 ) -> list[TimesheetResponse]:
     repository = SQLAlchemyTimesheetRepository(db)
     handler = GetTimesheetsByStatusHandler(repository)
@@ -152,7 +152,7 @@ async def get_timesheets_by_status(
 
 
 @router.get("/pending-approval/list", response_model=list[TimesheetResponse])
-async def get_pending_approval(db: AsyncSession = Depends(get_db)) -> list[TimesheetResponse]:
+async def get_pending_approval(db: AsyncSession = Depends(get_read_db)) -> list[TimesheetResponse]:
     repository = SQLAlchemyTimesheetRepository(db)
     handler = GetPendingApprovalHandler(repository)
 
@@ -167,7 +167,7 @@ async def sum_hours_in_interval(
     employee_id: UUID,
     start_date: date,
     end_date: date,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> HoursSummaryResponse:
     repository = SQLAlchemyTimesheetRepository(db)
     handler = SumHoursInIntervalHandler(repository)
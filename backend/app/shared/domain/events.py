@@ -1,20 +1,49 @@
 import asyncio
 import logging
+import re
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, ClassVar
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, ConfigDict, Field
 
+if TYPE_CHECKING:
+    from app.shared.infrastructure.event_bus import EventTransport
+
 logger = logging.getLogger(__name__)
 
+# Event classes by class name and by kebab-case routing name (e.g. employee-created-event)
+_event_classes: dict[str, type["DomainEvent"]] = {}
+
+
+def to_kebab_case(text: str) -> str:
+    """Convert CamelCase to kebab-case"""
+    # Insert hyphens before uppercase letters and convert to lowercase
+    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1-\2", text)
+    return re.sub("([a-z0-9])([A-Z])", r"\1-\2", s1).lower()
+
 
 class DomainEvent(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    # Bump when a change to the payload is not backwards compatible
+    schema_version: ClassVar[int] = 1
+
     occurred_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     event_id: UUID = Field(default_factory=uuid4)
     changed_by: UUID | None = Field(default=None)
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        _event_classes[cls.__name__] = cls
+        _event_classes[to_kebab_case(cls.__name__)] = cls
+
+
+def get_event_class(name: str) -> type[DomainEvent] | None:
+    """Look up an event class by class name or kebab-case routing name"""
+    return _event_classes.get(name)
+
 
 class AsyncEventDispatcher:
     _instance: "AsyncEventDispatcher | None" = None
@@ -44,32 +73,45 @@ class AsyncEventDispatcher:
                 f"Error handling task exception - event_type: {event_type}, event_id: {event_id}: {e}"
             )
 
-    async def dispatch(self, event: DomainEvent) -> None:
-        try:
-            from app.shared.infrastructure.context import get_current_user_id
-            from app.shared.infrastructure.rabbitmq import get_rabbitmq_publisher
-
-            # Set changed_by from context if not already set
-            if event.changed_by is None:
-                current_user_id = get_current_user_id()
-                event.changed_by = current_user_id
-                logger.info(f"Set changed_by from context: {current_user_id}")
+    async def dispatch(self, event: DomainEvent, wait: bool = False) -> None:
+        """
+        Publish an event. By default it is published in a background task and
+        a failure is only logged. With wait=True the publish is awaited and a
+        failure raises, so an event handler emitting follow-up events fails -
+        and its message is retried or dead-lettered - when they are not published.
+        """
+        if wait:
+            await self._prepare(event).publish(event)
+            return
 
-            publisher = get_rabbitmq_publisher()
+        try:
+            transport = self._prepare(event)
             event_type = event.__class__.__name__
-            event_data = event.model_dump(mode="json")
             event_id = event.event_id
 
-            logger.info(
-                f"Dispatching event: {event_type} (id: {event_id}) with changed_by={event_data.get('changed_by')}"
-            )
-
             # Create task for async publishing with proper exception handling
-            task = asyncio.create_task(publisher.publish_event(event_type, event_data))
+            task = asyncio.create_task(transport.publish(event))
             task.add_done_callback(lambda t: self._handle_task_exception(t, event_type, event_id))
         except Exception as e:
             logger.error(f"Failed to dispatch event: {e}")
 
+    def _prepare(self, event: DomainEvent) -> "EventTransport":
+        """Stamp changed_by from the request context and return the transport to publish on"""
+        from app.shared.infrastructure.context import get_current_user_id
+        from app.shared.infrastructure.event_bus import get_event_transport
+
+        # Set changed_by from context if not already set
+        if event.changed_by is None:
+            current_user_id = get_current_user_id()
+            event.changed_by = current_user_id
+            logger.info(f"Set changed_by from context: {current_user_id}")
+
+        logger.info(
+            f"Dispatching event: {event.__class__.__name__} (id: {event.event_id}) "
+            f"with changed_by={event.changed_by}"
+        )
+        return get_event_transport()
+
 
 def get_event_dispatcher() -> AsyncEventDispatcher:
     return AsyncEventDispatcher()
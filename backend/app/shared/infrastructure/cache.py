@@ -0,0 +1,194 @@
+"""
+Shared Redis cache for hot read models.
+
+Entries are grouped per entity in a Redis hash, e.g.
+payroll:read-model:v1:rates:{employee_id} -> {"2025-01-31": <RateView json>},
+so every cached variant of an entity (active rate per check date, balances
+per year) is dropped with a single DEL when a domain event for that entity
+is handled. The key version is READ_MODEL_CACHE_VERSION - bump it when a
+cached view changes shape and old entries are never read again. Entries
+expire after READ_MODEL_CACHE_TTL_SECONDS as a backstop for missed events,
+and Redis evicts least recently used keys under memory pressure
+(maxmemory-policy allkeys-lru in docker-compose).
+
+Writes through the primary drop the cached views of the rows they touched
+once the transaction commits (see invalidate_on_commit), so a reader can never
+refill the cache from data the writer has not committed yet. Each invalidation
+leaves a marker for DB_READ_YOUR_WRITES_SECONDS during which views of that
+entity are served but not cached again: a replica that has not replayed the
+write yet, or a load that started before it, cannot put the old view back.
+
+The cache fails open: when Redis is unavailable, reads go to the database.
+Sessions with unflushed or uncommitted writes and users who just committed a
+write (see app.database.has_recent_write) bypass the cache.
+"""
+
+import logging
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterable
+from functools import lru_cache
+from typing import Any, TypeVar, cast
+from uuid import UUID
+
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, WatchError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.database import PrimarySession, has_recent_write
+from app.shared.infrastructure.context import get_current_user_id
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+T = TypeVar("T")
+
+READ_MODEL_CACHE_VERSION = 1
+KEY_PREFIX = f"payroll:read-model:v{READ_MODEL_CACHE_VERSION}"
+
+
+@lru_cache
+def _type_adapter(view_type: Any) -> TypeAdapter:
+    return TypeAdapter(view_type)
+
+
+class ReadModelCache:
+    def __init__(
+        self,
+        client: Redis | None = None,
+        ttl_seconds: int | None = None,
+        enabled: bool | None = None,
+    ):
+        timeout = settings.READ_MODEL_CACHE_TIMEOUT_MS / 1000
+        self.client = client or Redis.from_url(
+            settings.REDIS_URL, socket_timeout=timeout, socket_connect_timeout=timeout
+        )
+        self.ttl_seconds = ttl_seconds or settings.READ_MODEL_CACHE_TTL_SECONDS
+        self.enabled = settings.READ_MODEL_CACHE_ENABLED if enabled is None else enabled
+
+    @staticmethod
+    def key(namespace: str, entity_id: UUID | str) -> str:
+        return f"{KEY_PREFIX}:{namespace}:{entity_id}"
+
+    @staticmethod
+    def invalidated_key(key: str) -> str:
+        return f"{key}:invalidated"
+
+    async def _should_bypass(self, session: AsyncSession | None) -> bool:
+        if not self.enabled:
+            return True
+        if session is not None and (session.new or session.dirty or session.info.get("has_writes")):
+            return True
+        return await has_recent_write(get_current_user_id())
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        entity_id: UUID | str,
+        field: str,
+        view_type: Any,
+        loader: Callable[[], Awaitable[T]],
+        session: AsyncSession | None = None,
+        ttl_seconds: int | None = None,
+    ) -> T:
+        """
+        Return the cached view for (namespace, entity_id, field), loading and
+        caching it on a miss. None results are not cached. ttl_seconds
+        overrides the default expiry for views that go stale on their own.
+        """
+        if await self._should_bypass(session):
+            return await loader()
+
+        key = self.key(namespace, entity_id)
+        adapter = _type_adapter(view_type)
+
+        try:
+            cached = await self.client.hget(key, field)  # type: ignore[misc]
+        except RedisError as e:
+            logger.warning(f"Read model cache unavailable, reading from database: {e}")
+            return await loader()
+
+        if cached is not None:
+            return cast(T, adapter.validate_json(cached))
+
+        value = await loader()
+        if value is None:
+            return value
+
+        invalidated_key = self.invalidated_key(key)
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                # An invalidation since the load began may not be in what we read
+                await pipe.watch(invalidated_key)
+                if await pipe.exists(invalidated_key):
+                    return value
+                pipe.multi()
+                pipe.hset(key, field, adapter.dump_json(value))
+                # Expire the whole entity hash once, counted from its first entry
+                pipe.expire(key, ttl_seconds or self.ttl_seconds, nx=True)
+                await pipe.execute()
+        except WatchError:
+            pass
+        except RedisError as e:
+            logger.warning(f"Failed to cache {key}: {e}")
+
+        return value
+
+    async def invalidate(self, namespace: str, entity_id: UUID | str) -> None:
+        """Drop every cached view of an entity"""
+        await self.invalidate_many([(namespace, entity_id)])
+
+    async def invalidate_many(self, entities: Iterable[tuple[str, UUID | str]]) -> None:
+        """Drop every cached view of each (namespace, entity_id)"""
+        keys = [self.key(namespace, entity_id) for namespace, entity_id in entities]
+        if not self.enabled or not keys:
+            return
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                for key in keys:
+                    pipe.delete(key)
+                    pipe.set(self.invalidated_key(key), 1, ex=settings.DB_READ_YOUR_WRITES_SECONDS)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Failed to invalidate {', '.join(keys)}: {e}")
+
+
+# ORM class -> (namespace, cached entity id of a row) of the views built from it
+_cached_views: defaultdict[type, list[tuple[str, Callable[[Any], UUID]]]] = defaultdict(list)
+
+
+def invalidate_on_commit(orm_class: type, namespace: str, entity_id: Callable[[Any], UUID]) -> None:
+    """
+    Drop the cached namespace view of entity_id(row) whenever a row of
+    orm_class is written through the primary, after the write commits
+    """
+    _cached_views[orm_class].append((namespace, entity_id))
+
+
+@event.listens_for(PrimarySession, "after_flush")
+def _collect_stale_views(session: Session, flush_context: Any) -> None:
+    stale = {
+        (namespace, entity_id(row))
+        for row in (*session.new, *session.dirty, *session.deleted)
+        for namespace, entity_id in _cached_views.get(type(row), ())
+    }
+    if stale:
+        session.info.setdefault("stale_views", set()).update(stale)
+
+
+@event.listens_for(PrimarySession, "after_soft_rollback")
+def _forget_stale_views(session: Session, previous_transaction: Any) -> None:
+    session.info.pop("stale_views", None)
+
+
+_read_model_cache: ReadModelCache | None = None
+
+
+def get_read_model_cache() -> ReadModelCache:
+    global _read_model_cache
+    if _read_model_cache is None:
+        _read_model_cache = ReadModelCache()
+    return _read_model_cache
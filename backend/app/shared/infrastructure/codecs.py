@@ -0,0 +1,128 @@
+"""
+Wire codecs for domain events.
+
+Publishers encode with the codec selected by EVENT_CODEC and stamp its content
+type on the message; consumers pick the decoder from the message content type,
+so producers can switch codecs without coordinating with consumers.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, cast
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+EVENT_TYPE_HEADER = "x-event-type"
+SCHEMA_VERSION_HEADER = "x-schema-version"
+
+
+class EventDecodeError(ValueError):
+    """Raised when a message body cannot be decoded into an event payload"""
+
+
+class EventCodec(ABC):
+    content_type: str
+
+    @abstractmethod
+    def encode(self, data: dict[str, Any]) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode(self, body: bytes) -> dict[str, Any]:
+        pass
+
+    @staticmethod
+    def _ensure_dict(payload: Any) -> dict[str, Any]:
+        if not isinstance(payload, dict):
+            raise EventDecodeError(f"Expected an object payload, got {type(payload).__name__}")
+        return payload
+
+
+class JsonEventCodec(EventCodec):
+    content_type = JSON_CONTENT_TYPE
+
+    def encode(self, data: dict[str, Any]) -> bytes:
+        return json.dumps(data, default=str).encode()
+
+    def decode(self, body: bytes) -> dict[str, Any]:
+        try:
+            return self._ensure_dict(json.loads(body))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise EventDecodeError(str(e)) from e
+
+
+class OrjsonEventCodec(EventCodec):
+    content_type = JSON_CONTENT_TYPE
+
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError:
+            raise ImportError(
+                "orjson is required for the orjson codec. Install with: pip install orjson"
+            )
+        self._orjson = orjson
+
+    def encode(self, data: dict[str, Any]) -> bytes:
+        return self._orjson.dumps(data, default=str)
+
+    def decode(self, body: bytes) -> dict[str, Any]:
+        try:
+            return self._ensure_dict(self._orjson.loads(body))
+        except self._orjson.JSONDecodeError as e:
+            raise EventDecodeError(str(e)) from e
+
+
+class MsgpackEventCodec(EventCodec):
+    content_type = MSGPACK_CONTENT_TYPE
+
+    def __init__(self):
+        try:
+            import msgpack
+        except ImportError:
+            raise ImportError(
+                "msgpack is required for the msgpack codec. Install with: pip install msgpack"
+            )
+        self._msgpack = msgpack
+
+    def encode(self, data: dict[str, Any]) -> bytes:
+        return cast(bytes, self._msgpack.packb(data, default=str))
+
+    def decode(self, body: bytes) -> dict[str, Any]:
+        try:
+            return self._ensure_dict(self._msgpack.unpackb(body))
+        except (ValueError, self._msgpack.UnpackException) as e:
+            raise EventDecodeError(str(e)) from e
+
+
+_CODECS: dict[str, type[EventCodec]] = {
+    "json": JsonEventCodec,
+    "orjson": OrjsonEventCodec,
+    "msgpack": MsgpackEventCodec,
+}
+
+
+def get_codec(name: str) -> EventCodec:
+    """Get a codec by its EVENT_CODEC name"""
+    codec_class = _CODECS.get(name.lower())
+    if codec_class is None:
+        raise ValueError(f"Unknown event codec: {name}. Available: {', '.join(_CODECS)}")
+    return codec_class()
+
+
+@lru_cache
+def get_codec_for_content_type(content_type: str | None) -> EventCodec:
+    """
+    Get a decoder for a message content type.
+    Messages without a content type are treated as JSON (external publishers, legacy messages).
+    """
+    if content_type is None or content_type == JSON_CONTENT_TYPE:
+        try:
+            return OrjsonEventCodec()
+        except ImportError:
+            return JsonEventCodec()
+    if content_type == MSGPACK_CONTENT_TYPE:
+        return MsgpackEventCodec()
+    raise EventDecodeError(f"Unsupported content type: {content_type}")
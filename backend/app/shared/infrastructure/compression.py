@@ -0,0 +1,129 @@
+"""
+HTTP response compression.
+
+Responses of at least RESPONSE_COMPRESSION_MIN_SIZE bytes are compressed with
+Brotli when the client accepts it and the optional brotli package is
+installed, otherwise with gzip. Formats that are compressed already (PDF,
+XLSX, ZIP, images) and partial responses are sent as they are.
+
+Large JSON bodies are serialized by FastAPI straight to bytes through
+Pydantic whenever the route declares a response model, so there is no custom
+default response class - one would disable that path.
+"""
+
+from typing import Any, cast
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import (
+    DEFAULT_EXCLUDED_CONTENT_TYPES,
+    GZipResponder,
+    IdentityResponder,
+)
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+EXCLUDED_CONTENT_TYPES = DEFAULT_EXCLUDED_CONTENT_TYPES + (
+    "application/pdf",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    # Report downloads support byte ranges, which would address the compressed
+    # bytes if the body were compressed on the fly
+    "application/octet-stream",
+)
+
+# Bodies this large are compressed in a worker thread to keep the event loop free
+THREAD_MINIMUM_SIZE = 128 * 1024
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """Map each content coding of an Accept-Encoding header to its q-value"""
+    codings: dict[str, float] = {}
+    for token in header.split(","):
+        coding, *params = (part.strip() for part in token.split(";"))
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        codings[coding.lower()] = quality
+    return codings
+
+
+def _quality(codings: dict[str, float], coding: str) -> float:
+    """q-value of a coding, falling back to the * wildcard; 0 means not acceptable"""
+    return codings.get(coding, codings.get("*", 0.0))
+
+
+class BrotliResponder(IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int):
+        super().__init__(app, minimum_size, exclude_content_types=EXCLUDED_CONTENT_TYPES)
+        self.quality = quality
+        self._compressor: Any | None = None
+
+    async def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if len(body) >= THREAD_MINIMUM_SIZE:
+            return await anyio.to_thread.run_sync(self._compress_body, body, more_body)
+        return self._compress_body(body, more_body)
+
+    def _compress_body(self, body: bytes, more_body: bool) -> bytes:
+        compressor = self._compressor
+        if compressor is None:
+            compressor = self._compressor = brotli.Compressor(
+                mode=brotli.MODE_TEXT, quality=self.quality
+            )
+        compressed = compressor.process(body)
+        if more_body:
+            return cast(bytes, compressed + compressor.flush())
+        return cast(bytes, compressed + compressor.finish())
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        codings = parse_accept_encoding(Headers(scope=scope).get("Accept-Encoding", ""))
+        br_quality = _quality(codings, "br") if brotli is not None else 0.0
+        gzip_quality = _quality(codings, "gzip")
+        responder: ASGIApp
+        # Brotli wins ties; a coding with q=0 is refused
+        if br_quality > 0 and br_quality >= gzip_quality:
+            responder = BrotliResponder(self.app, self.minimum_size, self.brotli_quality)
+        elif gzip_quality > 0:
+            responder = GZipResponder(
+                self.app,
+                self.minimum_size,
+                compresslevel=self.gzip_level,
+                thread_minimum_size=THREAD_MINIMUM_SIZE,
+                exclude_content_types=EXCLUDED_CONTENT_TYPES,
+            )
+        else:
+            responder = IdentityResponder(
+                self.app, self.minimum_size, exclude_content_types=EXCLUDED_CONTENT_TYPES
+            )
+
+        await responder(scope, receive, send)
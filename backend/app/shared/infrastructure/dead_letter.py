@@ -0,0 +1,141 @@
+"""
+Retry and dead-letter topology for the unified event consumer.
+
+Failed messages are republished to a retry queue whose TTL expires them back
+into the main queue, giving exponential backoff without holding consumer
+slots. After the last retry (or immediately for messages that can never be
+processed) they are parked on the dead-letter queue for inspection and replay.
+"""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+import aio_pika
+from aio_pika import ExchangeType, Message
+from aio_pika.abc import AbstractChannel, AbstractExchange, AbstractIncomingMessage
+
+from app.config import get_settings
+from app.shared.infrastructure.event_registry import EventDispatchError
+
+settings = get_settings()
+
+EVENTS_QUEUE = "payroll_events"
+DEAD_LETTER_EXCHANGE = "domain_events.dlx"
+DEAD_LETTER_QUEUE = "payroll_events.dlq"
+
+RETRY_COUNT_HEADER = "x-retry-count"
+ORIGINAL_ROUTING_KEY_HEADER = "x-original-routing-key"
+LAST_ERROR_HEADER = "x-last-error"
+FAILED_AT_HEADER = "x-failed-at"
+PENDING_HANDLERS_HEADER = "x-pending-handlers"
+
+MAX_ERROR_LENGTH = 1000
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Backoff schedule - one retry queue per delay"""
+
+    delays_ms: tuple[int, ...]
+
+    @classmethod
+    def from_settings(cls) -> "RetryPolicy":
+        return cls(
+            delays_ms=tuple(
+                settings.EVENT_RETRY_BASE_DELAY_MS
+                * settings.EVENT_RETRY_BACKOFF_MULTIPLIER**attempt
+                for attempt in range(settings.EVENT_RETRY_MAX_ATTEMPTS)
+            )
+        )
+
+    @property
+    def max_attempts(self) -> int:
+        return len(self.delays_ms)
+
+    def next_delay_ms(self, retry_count: int) -> int | None:
+        """Delay before the next attempt, or None when retries are exhausted"""
+        if retry_count >= self.max_attempts:
+            return None
+        return self.delays_ms[retry_count]
+
+    @staticmethod
+    def retry_queue_name(delay_ms: int) -> str:
+        return f"{EVENTS_QUEUE}.retry.{delay_ms}ms"
+
+
+async def declare_dead_letter_topology(
+    channel: AbstractChannel, policy: RetryPolicy
+) -> AbstractExchange:
+    """Declare the retry queues and the dead-letter exchange/queue"""
+    dead_letter_exchange = await channel.declare_exchange(
+        DEAD_LETTER_EXCHANGE, ExchangeType.FANOUT, durable=True
+    )
+    dead_letter_queue = await channel.declare_queue(DEAD_LETTER_QUEUE, durable=True)
+    await dead_letter_queue.bind(dead_letter_exchange)
+
+    for delay_ms in policy.delays_ms:
+        await channel.declare_queue(
+            policy.retry_queue_name(delay_ms),
+            durable=True,
+            arguments={
+                "x-message-ttl": delay_ms,
+                "x-dead-letter-exchange": "",
+                "x-dead-letter-routing-key": EVENTS_QUEUE,
+            },
+        )
+
+    return dead_letter_exchange
+
+
+def get_retry_count(message: AbstractIncomingMessage) -> int:
+    value = (message.headers or {}).get(RETRY_COUNT_HEADER, 0)
+    return value if isinstance(value, int) else 0
+
+
+def get_original_routing_key(message: AbstractIncomingMessage) -> str | None:
+    """Routing key the event was first published with (retries arrive via the default exchange)"""
+    original = (message.headers or {}).get(ORIGINAL_ROUTING_KEY_HEADER)
+    if isinstance(original, bytes):
+        original = original.decode()
+    return str(original) if original else message.routing_key
+
+
+def get_pending_handlers(message: AbstractIncomingMessage) -> list[str] | None:
+    """Handlers that still have to run for a retried message (None means all)"""
+    pending = (message.headers or {}).get(PENDING_HANDLERS_HEADER)
+    if not isinstance(pending, list):
+        return None
+    return [name.decode() if isinstance(name, bytes) else str(name) for name in pending]
+
+
+def copy_message(
+    message: AbstractIncomingMessage, routing_key: str | None, **headers: Any
+) -> Message:
+    """Build a persistent copy of the message with updated bookkeeping headers"""
+    new_headers = dict(message.headers or {})
+    if routing_key:
+        new_headers[ORIGINAL_ROUTING_KEY_HEADER] = routing_key
+    new_headers.update(headers)
+
+    return Message(
+        body=message.body,
+        content_type=message.content_type,
+        headers=new_headers,
+        message_id=message.message_id,
+        delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+    )
+
+
+def failure_headers(
+    error: str, retry_count: int, exception: Exception | None = None
+) -> dict[str, Any]:
+    headers: dict[str, Any] = {
+        RETRY_COUNT_HEADER: retry_count,
+        LAST_ERROR_HEADER: error[:MAX_ERROR_LENGTH],
+        FAILED_AT_HEADER: datetime.now(UTC).isoformat(),
+    }
+    # Only the handlers that failed are re-run on retry/replay
+    if isinstance(exception, EventDispatchError):
+        headers[PENDING_HANDLERS_HEADER] = list(exception.failures)
+    return headers
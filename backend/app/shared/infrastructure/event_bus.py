@@ -0,0 +1,140 @@
+"""
+Event transports behind AsyncEventDispatcher.
+
+EVENT_BUS_TRANSPORT=rabbitmq (default) publishes to the domain_events exchange
+and events are handled by the unified consumer process. EVENT_BUS_TRANSPORT=memory
+delivers events to the registry handlers inside the same process - no broker,
+no serialization - for single-node deployments, tests and benchmarks. The
+in-memory bus is not durable: events still queued when the process stops
+are lost, and failed handlers are logged rather than retried.
+"""
+
+import asyncio
+import logging
+from typing import Protocol
+
+from app.config import get_settings
+from app.shared.domain.events import DomainEvent
+from app.shared.infrastructure.event_registry import EventHandlerRegistry, get_event_registry
+from app.shared.infrastructure.routing import (
+    ALL_EVENTS_BINDING,
+    build_routing_key,
+    parse_routing_key,
+    topic_matches,
+)
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class EventTransport(Protocol):
+    async def publish(self, event: DomainEvent) -> None: ...
+
+
+class InMemoryEventBus:
+    """
+    In-process transport with the same routing semantics as the domain_events
+    topic exchange. Events are put on a bounded queue (publishers wait when it
+    is full) and worker tasks dispatch them to the registry handlers.
+    """
+
+    def __init__(
+        self,
+        registry: EventHandlerRegistry | None = None,
+        binding: str = ALL_EVENTS_BINDING,
+        max_queue_size: int | None = None,
+        workers: int | None = None,
+    ):
+        self.registry = registry or get_event_registry()
+        self.binding = binding
+        self.queue: asyncio.Queue[tuple[str, DomainEvent]] = asyncio.Queue(
+            maxsize=max_queue_size or settings.EVENT_BUS_QUEUE_SIZE
+        )
+        self.worker_count = workers or settings.EVENT_BUS_WORKERS
+        self._workers: list[asyncio.Task] = []
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._workers)
+
+    async def start(self) -> None:
+        """Start the worker tasks"""
+        if self.is_running:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"event-bus-worker-{i}")
+            for i in range(self.worker_count)
+        ]
+        logger.info(f"In-memory event bus started with {self.worker_count} workers")
+
+    async def publish(self, event: DomainEvent) -> None:
+        """Queue an event, waiting for space if the queue is full"""
+        routing_key = build_routing_key(event.__class__.__name__)
+        if not topic_matches(self.binding, routing_key):
+            logger.debug(f"No binding for {routing_key}, dropping event")
+            return
+        if self.queue.full() and asyncio.current_task() in self._workers:
+            # A handler awaiting its follow-up events would wait on its own queue
+            # forever once every worker does the same; deliver them in place instead
+            await self._deliver(routing_key, event)
+            return
+        await self.queue.put((routing_key, event))
+
+    async def join(self) -> None:
+        """Wait until every queued event has been handled"""
+        await self.queue.join()
+
+    async def close(self) -> None:
+        """Drain the queue and stop the workers"""
+        if not self.is_running:
+            return
+        await self.queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        logger.info("In-memory event bus stopped")
+
+    async def _worker(self) -> None:
+        while True:
+            routing_key, event = await self.queue.get()
+            try:
+                await self._deliver(routing_key, event)
+            finally:
+                self.queue.task_done()
+
+    async def _deliver(self, routing_key: str, event: DomainEvent) -> None:
+        parsed = parse_routing_key(routing_key)
+        if parsed is None:
+            logger.error(f"Invalid routing key format: {routing_key}")
+            return
+
+        event_type, _ = parsed
+        if not self.registry.get_handlers(event_type):
+            logger.debug(f"No handler registered for event type: {event_type}")
+            return
+
+        try:
+            await self.registry.dispatch(event_type, event)
+        except Exception as e:
+            logger.error(f"Failed to process event {event_type}: {e}", exc_info=True)
+
+
+_in_memory_bus: InMemoryEventBus | None = None
+
+
+def get_in_memory_event_bus() -> InMemoryEventBus:
+    global _in_memory_bus
+    if _in_memory_bus is None:
+        _in_memory_bus = InMemoryEventBus()
+    return _in_memory_bus
+
+
+def get_event_transport() -> EventTransport:
+    """Transport selected by EVENT_BUS_TRANSPORT"""
+    if settings.EVENT_BUS_TRANSPORT == "memory":
+        return get_in_memory_event_bus()
+
+    from app.shared.infrastructure.rabbitmq import get_rabbitmq_publisher
+
+    return get_rabbitmq_publisher()
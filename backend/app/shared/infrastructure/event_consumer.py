@@ -4,14 +4,38 @@ This consumer handles events from all modules through a centralized registry.
 """
 
 import asyncio
-import json
 import logging
+from typing import Any
 
 import aio_pika
-from aio_pika.abc import AbstractChannel, AbstractIncomingMessage, AbstractRobustConnection
+from aio_pika.abc import (
+    AbstractChannel,
+    AbstractExchange,
+    AbstractIncomingMessage,
+    AbstractRobustConnection,
+)
+from pydantic import ValidationError
 
 from app.config import get_settings
+from app.shared.domain.events import DomainEvent, get_event_class
+from app.shared.infrastructure.codecs import (
+    EVENT_TYPE_HEADER,
+    SCHEMA_VERSION_HEADER,
+    EventDecodeError,
+    get_codec_for_content_type,
+)
+from app.shared.infrastructure.dead_letter import (
+    EVENTS_QUEUE,
+    RetryPolicy,
+    copy_message,
+    declare_dead_letter_topology,
+    failure_headers,
+    get_original_routing_key,
+    get_pending_handlers,
+    get_retry_count,
+)
 from app.shared.infrastructure.event_registry import EventHandlerRegistry, get_event_registry
+from app.shared.infrastructure.routing import ALL_EVENTS_BINDING, parse_routing_key
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -21,29 +45,42 @@ class UnifiedEventConsumer:
     """
     Unified consumer that handles all domain events from all modules.
     Routes events to appropriate handlers based on event type.
+
+    A handler that raises is retried with exponential backoff through the
+    retry queues; once retries are exhausted the message is moved to the
+    dead-letter queue instead of being dropped.
     """
 
-    def __init__(self, registry: EventHandlerRegistry | None = None):
+    def __init__(
+        self,
+        registry: EventHandlerRegistry | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
         self.registry = registry or get_event_registry()
+        self.retry_policy = retry_policy or RetryPolicy.from_settings()
         self.connection: AbstractRobustConnection | None = None
         self.channel: AbstractChannel | None = None
+        self.dead_letter_exchange: AbstractExchange | None = None
 
     async def connect(self) -> None:
         """Connect to RabbitMQ and set up queue bindings"""
         try:
             self.connection = await aio_pika.connect_robust(settings.RABBITMQ_URL)
             self.channel = await self.connection.channel()
-            await self.channel.set_qos(prefetch_count=10)
+            await self.channel.set_qos(prefetch_count=settings.EVENT_CONSUMER_PREFETCH_COUNT)
 
             exchange = await self.channel.declare_exchange(
                 "domain_events", aio_pika.ExchangeType.TOPIC, durable=True
             )
+            self.dead_letter_exchange = await declare_dead_letter_topology(
+                self.channel, self.retry_policy
+            )
 
-            queue = await self.channel.declare_queue("payroll_events", durable=True)
+            queue = await self.channel.declare_queue(EVENTS_QUEUE, durable=True)
 
             # Bind to all payroll-manager events using wildcard
             # Format: event.payroll-manager.*.* will catch all events from all modules
-            await queue.bind(exchange, routing_key="event.payroll-manager.#")
+            await queue.bind(exchange, routing_key=ALL_EVENTS_BINDING)
 
             logger.info("Unified event consumer connected to RabbitMQ")
             logger.info(f"Registered event types: {self.registry.list_registered_events()}")
@@ -55,47 +92,122 @@ class UnifiedEventConsumer:
 
     async def process_message(self, message: AbstractIncomingMessage) -> None:
         """Process incoming message and route to appropriate handler"""
-        async with message.process():
+        # If a retry or dead-letter publish fails the message is requeued, never dropped
+        async with message.process(requeue=True):
+            routing_key = get_original_routing_key(message)
+
+            # Parse routing key: event.payroll-manager.module.event-name
+            if routing_key is None:
+                await self._dead_letter(message, routing_key, "Routing key is None")
+                return
+
+            parsed = parse_routing_key(routing_key)
+            if parsed is None:
+                await self._dead_letter(
+                    message, routing_key, f"Invalid routing key format: {routing_key}"
+                )
+                return
+
+            # event.payroll-manager.audit.employee-created -> audit.employee-created
+            event_type, event_name = parsed
+
+            logger.info(f"Received event: {event_type} (routing key: {routing_key})")
+
+            # Get handlers for this event type
+            if not self.registry.get_handlers(event_type):
+                logger.warning(f"No handler registered for event type: {event_type}")
+                return
+
+            # Decode once; every handler receives the same event instance
+            try:
+                event = self._decode(message, event_type, event_name)
+            except (EventDecodeError, ValidationError) as e:
+                await self._dead_letter(message, routing_key, f"Failed to decode message body: {e}")
+                return
+
             try:
-                event_data = json.loads(message.body.decode())
-                routing_key = message.routing_key
-
-                # Parse routing key: event.payroll-manager.module.event-name
-                if routing_key is None:
-                    logger.warning("Routing key is None")
-                    return
-
-                parts = routing_key.split(".")
-                if len(parts) < 4:
-                    logger.warning(f"Invalid routing key format: {routing_key}")
-                    return
-
-                # Extract event type from routing key
-                # event.payroll-manager.audit.employee-created
-                # -> audit.employee-created
-                module = parts[2]
-                event_name = ".".join(parts[3:])
-                event_type = f"{module}.{event_name}"
-
-                logger.info(f"Received event: {event_type} (routing key: {routing_key})")
-                logger.info(f"Available handlers: {self.registry.list_registered_events()}")
-
-                # Get handler for this event type
-                handler = self.registry.get_handler(event_type)
-
-                if handler:
-                    await handler(event_data)
-                    logger.info(f"Successfully processed event: {event_type}")
-                else:
-                    logger.warning(f"No handler registered for event type: {event_type}")
-                    logger.warning(
-                        f"Registry has {len(self.registry.list_registered_events())} handlers"
-                    )
-
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to decode message body: {e}")
+                await self.registry.dispatch(event_type, event, only=get_pending_handlers(message))
+                logger.info(f"Successfully processed event: {event_type}")
             except Exception as e:
-                logger.error(f"Failed to process event: {e}", exc_info=True)
+                logger.error(f"Failed to process event {event_type}: {e}", exc_info=True)
+                await self._retry_or_dead_letter(message, routing_key, e)
+
+    def _decode(
+        self, message: AbstractIncomingMessage, event_type: str, event_name: str
+    ) -> DomainEvent | dict[str, Any]:
+        """
+        Decode the body with the codec matching its content type. Known events are
+        validated into their DomainEvent class so handlers get typed values
+        (UUID, date, Decimal) instead of strings; anything else (e.g. events from
+        external systems) is passed on as the decoded dict.
+        """
+        payload = get_codec_for_content_type(message.content_type).decode(message.body)
+
+        event_class = self.registry.get_event_class(event_type)
+        if event_class is None:
+            headers = message.headers or {}
+            class_name = headers.get(EVENT_TYPE_HEADER)
+            if isinstance(class_name, bytes):
+                class_name = class_name.decode()
+            event_class = get_event_class(str(class_name or event_name))
+        if event_class is None:
+            return payload
+
+        schema_version = (message.headers or {}).get(SCHEMA_VERSION_HEADER, 1)
+        if isinstance(schema_version, int) and schema_version > event_class.schema_version:
+            logger.warning(
+                f"Received {event_class.__name__} schema v{schema_version}, "
+                f"consumer knows v{event_class.schema_version}"
+            )
+
+        return event_class.model_validate(payload)
+
+    async def _retry_or_dead_letter(
+        self, message: AbstractIncomingMessage, routing_key: str, error: Exception
+    ) -> None:
+        """Schedule the next attempt, or dead-letter the message when retries are exhausted"""
+        retry_count = get_retry_count(message)
+        delay_ms = self.retry_policy.next_delay_ms(retry_count)
+
+        if delay_ms is None:
+            await self._dead_letter(
+                message,
+                routing_key,
+                f"Retries exhausted after {retry_count} attempts: {error}",
+                error,
+            )
+            return
+
+        if self.channel is None:
+            raise RuntimeError("Consumer is not connected")
+
+        retry_message = copy_message(
+            message, routing_key, **failure_headers(repr(error), retry_count + 1, error)
+        )
+        await self.channel.default_exchange.publish(
+            retry_message, routing_key=self.retry_policy.retry_queue_name(delay_ms)
+        )
+        logger.warning(
+            f"Scheduled retry {retry_count + 1}/{self.retry_policy.max_attempts} "
+            f"in {delay_ms}ms for {routing_key}"
+        )
+
+    async def _dead_letter(
+        self,
+        message: AbstractIncomingMessage,
+        routing_key: str | None,
+        reason: str,
+        error: Exception | None = None,
+    ) -> None:
+        """Park a message on the dead-letter queue"""
+        if self.dead_letter_exchange is None:
+            raise RuntimeError("Consumer is not connected")
+
+        dead_message = copy_message(
+            message, routing_key, **failure_headers(reason, get_retry_count(message), error)
+        )
+        await self.dead_letter_exchange.publish(dead_message, routing_key=routing_key or "")
+        logger.error(f"Moved message to dead-letter queue ({routing_key}): {reason}")
 
     async def close(self) -> None:
         """Close RabbitMQ connection"""
@@ -126,13 +238,40 @@ async def start_unified_consumer():
     await start_scheduler()
     logger.info("Payroll scheduler started")
 
+    # Start the nightly employee current_status rollover
+    from app.modules.employee.infrastructure.scheduler import start_employee_status_scheduler
+
+    await start_employee_status_scheduler()
+
+    # Start the report retention sweep and the reclaiming of reports with an expired lease
+    from app.modules.reporting.infrastructure.scheduler import (
+        start_report_lease_scheduler,
+        start_report_retention_scheduler,
+    )
+
+    await start_report_retention_scheduler()
+    await start_report_lease_scheduler()
+
     try:
         await asyncio.Future()
-    except KeyboardInterrupt:
+    finally:
+        from app.modules.audit.infrastructure.batch_writer import get_audit_log_batch_writer
+        from app.modules.employee.infrastructure.scheduler import stop_employee_status_scheduler
         from app.modules.payroll.infrastructure.scheduler import stop_scheduler
-
+        from app.modules.reporting.infrastructure.render_pool import get_report_render_pool
+        from app.modules.reporting.infrastructure.scheduler import (
+            stop_report_lease_scheduler,
+            stop_report_retention_scheduler,
+        )
+
+        await stop_report_lease_scheduler()
+        await stop_report_retention_scheduler()
+        await stop_employee_status_scheduler()
         await stop_scheduler()
+        # Write audit logs still waiting for their batch while their messages can be acked
+        await get_audit_log_batch_writer().close()
         await consumer.close()
+        get_report_render_pool().shutdown()
 
 
 if __name__ == "__main__":
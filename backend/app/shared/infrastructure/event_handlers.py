@@ -26,6 +26,13 @@ def register_all_handlers() -> None:
 
     register_employee_audit_handlers(registry)
 
+    # Register employee projection handlers (maintain employees.current_status)
+    from app.modules.employee.infrastructure.event_handlers import (
+        register_employee_projection_handlers,
+    )
+
+    register_employee_projection_handlers(registry)
+
     # Register contract module handlers (emit audit events)
     from app.modules.contract.infrastructure.event_handlers import (
         register_contract_audit_handlers,
@@ -71,4 +78,21 @@ def register_all_handlers() -> None:
     register_absence_handlers(registry)
     register_absence_audit_handlers(registry)
 
+    # Register read model cache invalidation handlers
+    from app.modules.absence.infrastructure.event_handlers import register_absence_cache_handlers
+    from app.modules.compensation.infrastructure.event_handlers import (
+        register_compensation_cache_handlers,
+    )
+    from app.modules.contract.infrastructure.event_handlers import (
+        register_contract_cache_handlers,
+    )
+    from app.modules.employee.infrastructure.event_handlers import (
+        register_employee_cache_handlers,
+    )
+
+    register_employee_cache_handlers(registry)
+    register_contract_cache_handlers(registry)
+    register_compensation_cache_handlers(registry)
+    register_absence_cache_handlers(registry)
+
     logger.info(f"Total registered event types: {len(registry.list_registered_events())}")
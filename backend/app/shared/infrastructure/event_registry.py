@@ -1,32 +1,142 @@
 """Global event handler registry - single source of truth"""
 
+import asyncio
 import logging
-from typing import Callable, Dict
+from collections.abc import Awaitable, Callable, Collection
+from dataclasses import dataclass
+from typing import Any
+
+from app.shared.domain.events import DomainEvent
 
 logger = logging.getLogger(__name__)
 
+EventHandler = Callable[[Any], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class HandlerRegistration:
+    handler: EventHandler
+    name: str
+    concurrent: bool = True
+
+
+class EventDispatchError(Exception):
+    """Raised when one or more handlers for an event fail"""
+
+    def __init__(self, event_type: str, failures: dict[str, Exception]):
+        self.event_type = event_type
+        self.failures = failures
+        details = "; ".join(f"{name}: {error!r}" for name, error in failures.items())
+        super().__init__(f"{len(failures)} handler(s) failed for {event_type}: {details}")
+
 
 class EventHandlerRegistry:
-    """Registry for mapping event types to their handlers"""
+    """
+    Registry for mapping event types to their handlers.
+
+    An event type can have any number of handlers; they all receive the same
+    decoded event. Dispatch tables are rebuilt on registration so the hot
+    path is a single dict lookup.
+    """
 
     def __init__(self):
-        self._handlers: Dict[str, Callable] = {}
+        self._handlers: dict[str, tuple[HandlerRegistration, ...]] = {}
+        self._event_classes: dict[str, type[DomainEvent]] = {}
+
+    def register(
+        self,
+        event_type: str,
+        handler: EventHandler,
+        event_class: type[DomainEvent] | None = None,
+        concurrent: bool = True,
+    ) -> None:
+        """
+        Register a handler for a specific event type.
 
-    def register(self, event_type: str, handler: Callable) -> None:
-        """Register a handler for a specific event type"""
-        if event_type in self._handlers:
-            logger.warning(f"Overwriting existing handler for event type: {event_type}")
-        self._handlers[event_type] = handler
-        logger.info(f"Registered handler for event type: {event_type}")
+        event_class is the DomainEvent the payload is decoded into before the
+        handler is called. Handlers registered with concurrent=False run one
+        at a time, in registration order, before the concurrent ones.
+        """
+        if event_class is not None:
+            existing = self._event_classes.get(event_type)
+            if existing is not None and existing is not event_class:
+                raise ValueError(
+                    f"Event type {event_type} is already bound to {existing.__name__}, "
+                    f"cannot bind it to {event_class.__name__}"
+                )
+            self._event_classes[event_type] = event_class
 
-    def get_handler(self, event_type: str) -> Callable | None:
-        """Get handler for an event type"""
-        return self._handlers.get(event_type)
+        registration = HandlerRegistration(
+            handler=handler,
+            name=getattr(handler, "__qualname__", repr(handler)),
+            concurrent=concurrent,
+        )
+        handlers = self._handlers.get(event_type, ())
+        if any(existing.name == registration.name for existing in handlers):
+            logger.warning(f"Handler {registration.name} already registered for {event_type}")
+            return
+
+        # Sequential handlers first, each group in registration order
+        self._handlers[event_type] = tuple(
+            sorted((*handlers, registration), key=lambda r: r.concurrent)
+        )
+        logger.info(f"Registered handler {registration.name} for event type: {event_type}")
+
+    def get_handlers(self, event_type: str) -> tuple[HandlerRegistration, ...]:
+        """Get all handlers for an event type"""
+        return self._handlers.get(event_type, ())
+
+    def get_event_class(self, event_type: str) -> type[DomainEvent] | None:
+        """Get the DomainEvent class an event type is decoded into"""
+        return self._event_classes.get(event_type)
 
     def list_registered_events(self) -> list[str]:
         """List all registered event types"""
         return list(self._handlers.keys())
 
+    async def dispatch(
+        self, event_type: str, event: Any, only: Collection[str] | None = None
+    ) -> None:
+        """
+        Run every handler for the event. All handlers run even if some fail;
+        failures are raised together as EventDispatchError.
+
+        only restricts dispatch to the named handlers, so a retried message
+        does not re-run handlers that already succeeded.
+        """
+        handlers = self.get_handlers(event_type)
+        if only is not None:
+            handlers = tuple(r for r in handlers if r.name in only)
+
+        failures: dict[str, Exception] = {}
+
+        for registration in handlers:
+            if registration.concurrent:
+                break
+            try:
+                await registration.handler(event)
+            except Exception as e:
+                failures[registration.name] = e
+
+        concurrent = [r for r in handlers if r.concurrent]
+        if len(concurrent) == 1:
+            try:
+                await concurrent[0].handler(event)
+            except Exception as e:
+                failures[concurrent[0].name] = e
+        elif concurrent:
+            results = await asyncio.gather(
+                *(r.handler(event) for r in concurrent), return_exceptions=True
+            )
+            for registration, result in zip(concurrent, results):
+                if isinstance(result, Exception):
+                    failures[registration.name] = result
+                elif isinstance(result, BaseException):
+                    raise result
+
+        if failures:
+            raise EventDispatchError(event_type, failures)
+
 
 # Global registry instance - THE ONLY ONE
 _global_registry = EventHandlerRegistry()
@@ -1,4 +1,3 @@
-import json
 import logging
 
 import aio_pika
@@ -6,6 +5,14 @@ from aio_pika import ExchangeType, Message
 from aio_pika.abc import AbstractChannel, AbstractExchange, AbstractRobustConnection
 
 from app.config import get_settings
+from app.shared.domain.events import DomainEvent
+from app.shared.infrastructure.codecs import (
+    EVENT_TYPE_HEADER,
+    SCHEMA_VERSION_HEADER,
+    EventCodec,
+    get_codec,
+)
+from app.shared.infrastructure.routing import build_routing_key
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -16,10 +23,12 @@ class RabbitMQPublisher:
     _connection: AbstractRobustConnection | None = None
     _channel: AbstractChannel | None = None
     _exchange: AbstractExchange | None = None
+    codec: EventCodec
 
     def __new__(cls) -> "RabbitMQPublisher":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            cls._instance.codec = get_codec(settings.EVENT_CODEC)
         return cls._instance
 
     async def connect(self) -> None:
@@ -50,66 +59,47 @@ class RabbitMQPublisher:
                         )
                         raise
 
+    async def publish(self, event: DomainEvent) -> None:
+        """Publish a domain event to the domain_events exchange"""
+        await self.publish_event(
+            event.__class__.__name__,
+            event.model_dump(mode="json"),
+            schema_version=event.schema_version,
+        )
+
     async def publish_event(
-        self, event_type: str, event_data: dict, module: str | None = None
+        self,
+        event_type: str,
+        event_data: dict,
+        module: str | None = None,
+        schema_version: int = 1,
     ) -> None:
         try:
             if self._exchange is None:
                 logger.warning("Exchange is None, connecting...")
                 await self.connect()
 
-            message_body = json.dumps(event_data, default=str)
             message = Message(
-                body=message_body.encode(),
-                content_type="application/json",
+                body=self.codec.encode(event_data),
+                content_type=self.codec.content_type,
+                headers={
+                    EVENT_TYPE_HEADER: event_type,
+                    SCHEMA_VERSION_HEADER: schema_version,
+                },
                 delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
             )
 
-            # Auto-detect module from event type if not provided
-            # e.g., "Employee dEvent" -> "employee.employee- d-event"
-            if module is None:
-                # Convert camelCase to kebab-case and extract module
-                module = self._extract_module_from_event(event_type)
-
             # Format: event.payroll-manager.module.event-name
-            event_name = self._to_kebab_case(event_type)
-            routing_key = f"event.payroll-manager.{module}.{event_name}"
+            routing_key = build_routing_key(event_type, module)
 
-            if self._exchange is not None:
-                await self._exchange.publish(message, routing_key=routing_key)
-                logger.info(f"Published event: {routing_key}")
+            if self._exchange is None:
+                raise RuntimeError("RabbitMQ exchange is not available")
+            await self._exchange.publish(message, routing_key=routing_key)
+            logger.info(f"Published event: {routing_key}")
         except Exception as e:
             logger.error(f"Failed to publish event {event_type}: {e}")
-
-    def _extract_module_from_event(self, event_type: str) -> str:
-        """Extract module name from event type (e.g., Employee dEvent -> employee)"""
-        # Common module prefixes
-        if "Employee" in event_type:
-            return "employee"
-        elif "Contract" in event_type:
-            return "contract"
-        elif "Report" in event_type:
-            return "reporting"
-        elif "Audit" in event_type:
-            return "audit"
-        elif "Payroll" in event_type or "MonthEnd" in event_type:
-            return "payroll"
-        elif "Absence" in event_type:
-            return "absence"
-        elif "Timesheet" in event_type:
-            return "timesheet"
-        elif "Compensation" in event_type:
-            return "compensation"
-        else:
-            return "unknown"
-
-    def _to_kebab_case(self, text: str) -> str:
-        """Convert CamelCase to kebab-case"""
-        import re
-
-        # Insert hyphens before uppercase letters and convert to lowercase
-        s1 = re.sub("(.)([A-Z][a-z]+)", r"\1-\2", text)
-        return re.sub("([a-z0-9])([A-Z])", r"\1-\2", s1).lower()
+            # Background publishes only log the error; awaited ones fail their caller
+            raise
 
     async def close(self) -> None:
         if self._connection and not self._connection.is_closed:
@@ -0,0 +1,62 @@
+"""
+Read-your-writes markers shared by every API process.
+
+A user who committed a write gets a Redis key
+payroll:recent-write:{user_id} that expires after DB_READ_YOUR_WRITES_SECONDS.
+While it exists, the user's queries go to the primary and skip the read model
+cache, so the next request sees the write whichever process serves it.
+
+When Redis is unavailable, users are treated as having written recently:
+reads fall back to the primary rather than risk a lagging replica.
+"""
+
+import logging
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+KEY_PREFIX = "payroll:recent-write"
+
+
+class RecentWrites:
+    def __init__(self, client: Redis | None = None, ttl_seconds: int | None = None):
+        timeout = settings.READ_MODEL_CACHE_TIMEOUT_MS / 1000
+        self.client = client or Redis.from_url(
+            settings.REDIS_URL, socket_timeout=timeout, socket_connect_timeout=timeout
+        )
+        self.ttl_seconds = ttl_seconds or settings.DB_READ_YOUR_WRITES_SECONDS
+
+    @staticmethod
+    def key(user_id: UUID) -> str:
+        return f"{KEY_PREFIX}:{user_id}"
+
+    async def record(self, user_id: UUID) -> None:
+        try:
+            await self.client.set(self.key(user_id), 1, ex=self.ttl_seconds)
+        except RedisError as e:
+            logger.warning(f"Failed to record recent write of user {user_id}: {e}")
+
+    async def has_recent_write(self, user_id: UUID | None) -> bool:
+        if user_id is None:
+            return False
+        try:
+            return bool(await self.client.exists(self.key(user_id)))
+        except RedisError as e:
+            logger.warning(f"Recent writes unavailable, reading from the primary: {e}")
+            return True
+
+
+_recent_writes: RecentWrites | None = None
+
+
+def get_recent_writes() -> RecentWrites:
+    global _recent_writes
+    if _recent_writes is None:
+        _recent_writes = RecentWrites()
+    return _recent_writes
@@ -0,0 +1,78 @@
+"""
+Routing keys for domain events.
+
+Format: event.payroll-manager.{module}.{kebab-event-name}, e.g.
+event.payroll-manager.employee.employee-created-event. Shared by the
+RabbitMQ publisher/consumer and the in-memory event bus so both transports
+route identically.
+"""
+
+from app.shared.domain.events import to_kebab_case
+
+ROUTING_KEY_PREFIX = "event.payroll-manager"
+ALL_EVENTS_BINDING = f"{ROUTING_KEY_PREFIX}.#"
+
+# Compensation events are named after the compensation component they create
+COMPENSATION_EVENT_NAMES = ("Rate", "Bonus", "Deduction", "Overtime", "SickLeave")
+
+
+def extract_module_from_event(event_type: str) -> str:
+    """Extract module name from event type (e.g., EmployeeCreatedEvent -> employee)"""
+    # Common module prefixes
+    if "Employee" in event_type:
+        return "employee"
+    elif "Contract" in event_type:
+        return "contract"
+    elif "Report" in event_type:
+        return "reporting"
+    elif "Audit" in event_type:
+        return "audit"
+    elif "Payroll" in event_type or "MonthEnd" in event_type:
+        return "payroll"
+    elif "Absence" in event_type:
+        return "absence"
+    elif "Timesheet" in event_type:
+        return "timesheet"
+    elif "Compensation" in event_type or any(
+        name in event_type for name in COMPENSATION_EVENT_NAMES
+    ):
+        return "compensation"
+    else:
+        return "unknown"
+
+
+def build_routing_key(event_type: str, module: str | None = None) -> str:
+    """Build the routing key for an event class name"""
+    if module is None:
+        module = extract_module_from_event(event_type)
+    return f"{ROUTING_KEY_PREFIX}.{module}.{to_kebab_case(event_type)}"
+
+
+def parse_routing_key(routing_key: str) -> tuple[str, str] | None:
+    """
+    Split a routing key into (event_type, event_name), e.g.
+    event.payroll-manager.audit.employee-created -> ("audit.employee-created", "employee-created").
+    Returns None when the key is not in the expected format.
+    """
+    parts = routing_key.split(".")
+    if len(parts) < 4:
+        return None
+    module = parts[2]
+    event_name = ".".join(parts[3:])
+    return f"{module}.{event_name}", event_name
+
+
+def topic_matches(pattern: str, routing_key: str) -> bool:
+    """AMQP topic matching: '*' matches exactly one word, '#' matches zero or more"""
+    return _match(pattern.split("."), routing_key.split("."))
+
+
+def _match(pattern: list[str], words: list[str]) -> bool:
+    if not pattern:
+        return not words
+    head, rest = pattern[0], pattern[1:]
+    if head == "#":
+        return any(_match(rest, words[i:]) for i in range(len(words) + 1))
+    if not words:
+        return False
+    return (head == "*" or head == words[0]) and _match(rest, words[1:])
@@ -0,0 +1,159 @@
+import asyncio
+import sys
+
+import aio_pika
+from aio_pika import Message
+from aio_pika.abc import AbstractIncomingMessage, AbstractQueue
+
+from app.config import get_settings
+from app.shared.infrastructure.dead_letter import (
+    DEAD_LETTER_QUEUE,
+    FAILED_AT_HEADER,
+    LAST_ERROR_HEADER,
+    RETRY_COUNT_HEADER,
+    get_original_routing_key,
+    get_retry_count,
+)
+
+settings = get_settings()
+
+
+async def _get_messages(queue: AbstractQueue, limit: int) -> list[AbstractIncomingMessage]:
+    messages: list[AbstractIncomingMessage] = []
+    while len(messages) < limit:
+        message = await queue.get(no_ack=False, fail=False)
+        if message is None:
+            break
+        messages.append(message)
+    return messages
+
+
+def _header(message: AbstractIncomingMessage, name: str) -> str:
+    value = (message.headers or {}).get(name)
+    if isinstance(value, bytes):
+        value = value.decode()
+    return str(value) if value is not None else "N/A"
+
+
+async def list_dead_letters_command(limit: int = 50):
+    """List messages parked on the dead-letter queue without removing them."""
+    connection = await aio_pika.connect_robust(settings.RABBITMQ_URL)
+    async with connection:
+        channel = await connection.channel()
+        queue = await channel.declare_queue(DEAD_LETTER_QUEUE, durable=True)
+
+        messages = await _get_messages(queue, limit)
+        if not messages:
+            print("Dead-letter queue is empty.")
+            return
+
+        print(f"\nFound {len(messages)} dead-lettered message(s):\n")
+        for message in messages:
+            print(f"  Routing key: {get_original_routing_key(message)}")
+            print(f"  Message ID:  {message.message_id or 'N/A'}")
+            print(f"  Attempts:    {get_retry_count(message)}")
+            print(f"  Failed at:   {_header(message, FAILED_AT_HEADER)}")
+            print(f"  Last error:  {_header(message, LAST_ERROR_HEADER)}")
+            print("-" * 80)
+
+        # Put everything back in its original order
+        for message in messages:
+            await message.nack(requeue=True)
+
+
+async def replay_dead_letters_command(limit: int = 50, routing_key: str | None = None):
+    """Republish dead-lettered messages to the domain events exchange."""
+    connection = await aio_pika.connect_robust(settings.RABBITMQ_URL)
+    async with connection:
+        channel = await connection.channel(publisher_confirms=True)
+        exchange = await channel.declare_exchange(
+            "domain_events", aio_pika.ExchangeType.TOPIC, durable=True
+        )
+        queue = await channel.declare_queue(DEAD_LETTER_QUEUE, durable=True)
+
+        replayed = 0
+        skipped = []
+        for message in await _get_messages(queue, limit):
+            original_routing_key = get_original_routing_key(message)
+            if not original_routing_key or (routing_key and original_routing_key != routing_key):
+                skipped.append(message)
+                continue
+
+            # Start over with a fresh retry budget
+            headers = {
+                key: value
+                for key, value in (message.headers or {}).items()
+                if key not in (RETRY_COUNT_HEADER, LAST_ERROR_HEADER, FAILED_AT_HEADER)
+            }
+            await exchange.publish(
+                Message(
+                    body=message.body,
+                    content_type=message.content_type,
+                    headers=headers,
+                    message_id=message.message_id,
+                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                ),
+                routing_key=original_routing_key,
+            )
+            await message.ack()
+            replayed += 1
+
+        for message in skipped:
+            await message.nack(requeue=True)
+
+        print(f"✓ Replayed {replayed} message(s), {len(skipped)} left on the dead-letter queue.")
+
+
+async def purge_dead_letters_command():
+    """Drop every message on the dead-letter queue."""
+    connection = await aio_pika.connect_robust(settings.RABBITMQ_URL)
+    async with connection:
+        channel = await connection.channel()
+        queue = await channel.declare_queue(DEAD_LETTER_QUEUE, durable=True)
+        result = await queue.purge()
+
+        print(f"✓ Purged {result.message_count} message(s) from the dead-letter queue.")
+
+
+def main():
+    """CLI entry point for dead-letter queue management."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Dead-letter queue management CLI")
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # List command
+    list_parser = subparsers.add_parser("list", help="List dead-lettered messages")
+    list_parser.add_argument("--limit", type=int, default=50, help="Maximum messages to show")
+
+    # Replay command
+    replay_parser = subparsers.add_parser("replay", help="Replay dead-lettered messages")
+    replay_parser.add_argument("--limit", type=int, default=50, help="Maximum messages to replay")
+    replay_parser.add_argument(
+        "--routing-key", help="Only replay messages with this original routing key"
+    )
+
+    # Purge command
+    purge_parser = subparsers.add_parser("purge", help="Drop all dead-lettered messages")
+    purge_parser.add_argument("--yes", action="store_true", help="Skip confirmation")
+
+    args = parser.parse_args()
+
+    if args.command == "list":
+        asyncio.run(list_dead_letters_command(limit=args.limit))
+
+    elif args.command == "replay":
+        asyncio.run(replay_dead_letters_command(limit=args.limit, routing_key=args.routing_key))
+
+    elif args.command == "purge":
+        if not args.yes and input("Purge the dead-letter queue? [y/N] ").lower() != "y":
+            print("✗ Aborted.", file=sys.stderr)
+            sys.exit(1)
+        asyncio.run(purge_dead_letters_command())
+
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
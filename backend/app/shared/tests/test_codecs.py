@@ -0,0 +1,105 @@
+from datetime import date
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.modules.contract.domain.events import ContractCreatedEvent
+from app.shared.domain.events import get_event_class
+from app.shared.infrastructure.codecs import (
+    EVENT_TYPE_HEADER,
+    JSON_CONTENT_TYPE,
+    MSGPACK_CONTENT_TYPE,
+    SCHEMA_VERSION_HEADER,
+    EventDecodeError,
+    get_codec,
+    get_codec_for_content_type,
+)
+from app.shared.infrastructure.event_consumer import UnifiedEventConsumer
+from app.shared.infrastructure.event_registry import EventHandlerRegistry
+
+
+def make_contract_created_event() -> ContractCreatedEvent:
+    return ContractCreatedEvent(
+        contract_id=uuid4(),
+        employee_id=uuid4(),
+        contract_type="fixed_monthly",
+        rate_amount=Decimal("5000.00"),
+        rate_currency="PLN",
+        valid_from=date(2025, 1, 1),
+        valid_to=None,
+    )
+
+
+class FakeMessage:
+    def __init__(self, body: bytes, content_type: str | None, headers: dict | None = None):
+        self.body = body
+        self.content_type = content_type
+        self.headers = headers or {}
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgpack"])
+def test_codec_round_trip(name: str):
+    codec = get_codec(name)
+    data = make_contract_created_event().model_dump(mode="json")
+
+    assert codec.decode(codec.encode(data)) == data
+
+
+def test_msgpack_payload_is_smaller_than_json():
+    data = make_contract_created_event().model_dump(mode="json")
+
+    assert len(get_codec("msgpack").encode(data)) < len(get_codec("json").encode(data))
+
+
+def test_decoder_is_selected_by_content_type():
+    assert get_codec_for_content_type(MSGPACK_CONTENT_TYPE).content_type == MSGPACK_CONTENT_TYPE
+    assert get_codec_for_content_type(None).content_type == JSON_CONTENT_TYPE
+
+    with pytest.raises(EventDecodeError):
+        get_codec_for_content_type("text/plain")
+
+
+def test_undecodable_body_raises_decode_error():
+    with pytest.raises(EventDecodeError):
+        get_codec("json").decode(b"[1, 2, 3]")
+
+
+def test_event_classes_are_indexed_by_class_and_routing_name():
+    assert get_event_class("ContractCreatedEvent") is ContractCreatedEvent
+    assert get_event_class("contract-created-event") is ContractCreatedEvent
+
+
+@pytest.mark.parametrize("name", ["json", "msgpack"])
+def test_consumer_decodes_into_typed_values(name: str):
+    codec = get_codec(name)
+    event = make_contract_created_event()
+    message = FakeMessage(
+        codec.encode(event.model_dump(mode="json")),
+        codec.content_type,
+        {EVENT_TYPE_HEADER: "ContractCreatedEvent", SCHEMA_VERSION_HEADER: 1},
+    )
+
+    decoded = UnifiedEventConsumer(EventHandlerRegistry())._decode(
+        message,  # type: ignore[arg-type]
+        "contract.contract-created-event",
+        "contract-created-event",
+    )
+
+    assert isinstance(decoded, ContractCreatedEvent)
+    assert isinstance(decoded.contract_id, UUID)
+    assert decoded.rate_amount == Decimal("5000.00")
+    assert decoded.valid_from == date(2025, 1, 1)
+    assert decoded == event
+
+
+def test_consumer_passes_unknown_events_through_as_decoded():
+    message = FakeMessage(b'{"data": {"start_date": "2025-01-01"}}', JSON_CONTENT_TYPE)
+
+    decoded = UnifiedEventConsumer(EventHandlerRegistry())._decode(
+        message,  # type: ignore[arg-type]
+        "absence.absence-requested-event",
+        "absence-requested-event",
+    )
+
+    assert decoded == {"data": {"start_date": "2025-01-01"}}
@@ -0,0 +1,85 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from app.shared.infrastructure.compression import CompressionMiddleware, parse_accept_encoding
+
+LARGE_PAYLOAD = {"items": [{"description": "Base salary", "amount": "8000.00"}] * 200}
+
+
+async def large_json(request):
+    return JSONResponse(LARGE_PAYLOAD)
+
+
+async def small_json(request):
+    return JSONResponse({"status": "healthy"})
+
+
+async def pdf(request):
+    return Response(b"%PDF-1.4" + b"0" * 4096, media_type="application/pdf")
+
+
+def make_client() -> AsyncClient:
+    app = Starlette(
+        routes=[Route("/large", large_json), Route("/small", small_json), Route("/pdf", pdf)]
+    )
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_large_json_is_gzipped():
+    async with make_client() as client:
+        response = await client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json() == LARGE_PAYLOAD
+
+
+@pytest.mark.asyncio
+async def test_small_and_precompressed_responses_are_sent_as_is():
+    async with make_client() as client:
+        small = await client.get("/small", headers={"Accept-Encoding": "gzip"})
+        document = await client.get("/pdf", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in small.headers
+    assert "content-encoding" not in document.headers
+    assert document.content.startswith(b"%PDF")
+
+
+@pytest.mark.asyncio
+async def test_brotli_is_preferred_when_accepted():
+    pytest.importorskip("brotli")
+    async with make_client() as client:
+        response = await client.get("/large", headers={"Accept-Encoding": "gzip, br"})
+
+    assert response.headers["content-encoding"] == "br"
+    assert response.json() == LARGE_PAYLOAD
+
+
+def test_accept_encoding_q_values_are_parsed():
+    assert parse_accept_encoding("gzip, br;q=0, *;q=0.5, brotli-ish") == {
+        "gzip": 1.0,
+        "br": 0.0,
+        "*": 0.5,
+        "brotli-ish": 1.0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_refused_brotli_falls_back_to_gzip():
+    async with make_client() as client:
+        response = await client.get("/large", headers={"Accept-Encoding": "br;q=0, gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+
+
+@pytest.mark.asyncio
+async def test_refused_codings_are_not_used():
+    async with make_client() as client:
+        response = await client.get("/large", headers={"Accept-Encoding": "gzip;q=0, abr"})
+
+    assert "content-encoding" not in response.headers
@@ -0,0 +1,139 @@
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.shared.infrastructure.dead_letter import (
+    LAST_ERROR_HEADER,
+    ORIGINAL_ROUTING_KEY_HEADER,
+    PENDING_HANDLERS_HEADER,
+    RETRY_COUNT_HEADER,
+    RetryPolicy,
+)
+from app.shared.infrastructure.event_consumer import UnifiedEventConsumer
+from app.shared.infrastructure.event_registry import EventHandlerRegistry
+
+ROUTING_KEY = "event.payroll-manager.absence.absence-requested-event"
+
+
+class FakeMessage:
+    def __init__(self, body: bytes = b"{}", routing_key: str | None = ROUTING_KEY, headers=None):
+        self.body = body
+        self.routing_key = routing_key
+        self.headers = headers or {}
+        self.content_type = "application/json"
+        self.message_id = "message-1"
+
+    @asynccontextmanager
+    async def process(self, requeue: bool = False):
+        yield
+
+
+class FakeExchange:
+    def __init__(self):
+        self.published: list[tuple[object, str]] = []
+
+    async def publish(self, message, routing_key: str) -> None:
+        self.published.append((message, routing_key))
+
+
+class FakeChannel:
+    def __init__(self):
+        self.default_exchange = FakeExchange()
+
+
+def make_consumer(handler) -> UnifiedEventConsumer:
+    registry = EventHandlerRegistry()
+    registry.register("absence.absence-requested-event", handler)
+    consumer = UnifiedEventConsumer(registry, RetryPolicy(delays_ms=(1000, 4000)))
+    consumer.channel = FakeChannel()  # type: ignore[assignment]
+    consumer.dead_letter_exchange = FakeExchange()  # type: ignore[assignment]
+    return consumer
+
+
+async def failing_handler(event_data: dict) -> None:
+    raise RuntimeError("database unavailable")
+
+
+def test_retry_policy_uses_exponential_delays():
+    policy = RetryPolicy(delays_ms=(1000, 4000, 16000))
+
+    assert policy.next_delay_ms(0) == 1000
+    assert policy.next_delay_ms(2) == 16000
+    assert policy.next_delay_ms(3) is None
+    assert policy.retry_queue_name(4000) == "payroll_events.retry.4000ms"
+
+
+@pytest.mark.asyncio
+async def test_failed_message_is_sent_to_first_retry_queue():
+    consumer = make_consumer(failing_handler)
+
+    await consumer.process_message(FakeMessage())  # type: ignore[arg-type]
+
+    [(message, routing_key)] = consumer.channel.default_exchange.published  # type: ignore[union-attr]
+    assert routing_key == "payroll_events.retry.1000ms"
+    assert message.headers[RETRY_COUNT_HEADER] == 1
+    assert message.headers[ORIGINAL_ROUTING_KEY_HEADER] == ROUTING_KEY
+    assert "database unavailable" in message.headers[LAST_ERROR_HEADER]
+
+
+@pytest.mark.asyncio
+async def test_retried_message_is_routed_by_original_routing_key():
+    received = []
+
+    async def handler(event_data: dict) -> None:
+        received.append(event_data)
+
+    consumer = make_consumer(handler)
+    message = FakeMessage(
+        body=b'{"employee_id": "1"}',
+        routing_key="payroll_events",
+        headers={ORIGINAL_ROUTING_KEY_HEADER: ROUTING_KEY, RETRY_COUNT_HEADER: 1},
+    )
+
+    await consumer.process_message(message)  # type: ignore[arg-type]
+
+    assert received == [{"employee_id": "1"}]
+
+
+@pytest.mark.asyncio
+async def test_message_is_dead_lettered_when_retries_are_exhausted():
+    consumer = make_consumer(failing_handler)
+
+    await consumer.process_message(FakeMessage(headers={RETRY_COUNT_HEADER: 2}))  # type: ignore[arg-type]
+
+    assert consumer.channel.default_exchange.published == []  # type: ignore[union-attr]
+    [(message, routing_key)] = consumer.dead_letter_exchange.published  # type: ignore[union-attr]
+    assert routing_key == ROUTING_KEY
+    assert "Retries exhausted" in message.headers[LAST_ERROR_HEADER]
+
+
+@pytest.mark.asyncio
+async def test_undecodable_message_is_dead_lettered_without_retry():
+    consumer = make_consumer(failing_handler)
+
+    await consumer.process_message(FakeMessage(body=b"not json"))  # type: ignore[arg-type]
+
+    assert consumer.channel.default_exchange.published == []  # type: ignore[union-attr]
+    assert len(consumer.dead_letter_exchange.published) == 1  # type: ignore[union-attr]
+
+
+@pytest.mark.asyncio
+async def test_retry_only_reruns_failed_handlers():
+    calls = []
+
+    async def audit_handler(event_data: dict) -> None:
+        calls.append("audit")
+
+    consumer = make_consumer(failing_handler)
+    consumer.registry.register("absence.absence-requested-event", audit_handler)
+
+    await consumer.process_message(FakeMessage())  # type: ignore[arg-type]
+
+    [(message, _)] = consumer.channel.default_exchange.published  # type: ignore[union-attr]
+    assert message.headers[PENDING_HANDLERS_HEADER] == [failing_handler.__qualname__]
+
+    # The retry only runs the handler that failed
+    await consumer.process_message(
+        FakeMessage(headers=message.headers)  # type: ignore[arg-type]
+    )
+    assert calls == ["audit"]
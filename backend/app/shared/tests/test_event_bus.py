@@ -0,0 +1,159 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.modules.employee.domain.events import EmployeeCreatedEvent
+from app.shared.domain.events import get_event_dispatcher
+from app.shared.infrastructure import event_bus
+from app.shared.infrastructure.event_bus import InMemoryEventBus
+from app.shared.infrastructure.event_registry import EventHandlerRegistry
+from app.shared.infrastructure.routing import build_routing_key, parse_routing_key, topic_matches
+
+
+def make_event() -> EmployeeCreatedEvent:
+    return EmployeeCreatedEvent(
+        employee_id=uuid4(),
+        first_name="Jan",
+        last_name="Kowalski",
+        email="jan@example.com",
+        hire_date=None,
+    )
+
+
+@pytest.mark.parametrize(
+    "pattern,routing_key,expected",
+    [
+        ("event.payroll-manager.#", "event.payroll-manager.employee.employee-created-event", True),
+        ("event.payroll-manager.*", "event.payroll-manager.employee.employee-created-event", False),
+        ("event.*.employee.*", "event.payroll-manager.employee.employee-created-event", True),
+        ("event.payroll-manager.reporting.#", "event.payroll-manager.employee.x", False),
+        ("#", "anything.at.all", True),
+        ("event.#.x", "event.x", True),
+    ],
+)
+def test_topic_matching_follows_amqp_semantics(pattern, routing_key, expected):
+    assert topic_matches(pattern, routing_key) is expected
+
+
+def test_routing_key_round_trip():
+    routing_key = build_routing_key("EmployeeCreatedEvent")
+
+    assert routing_key == "event.payroll-manager.employee.employee-created-event"
+    assert parse_routing_key(routing_key) == (
+        "employee.employee-created-event",
+        "employee-created-event",
+    )
+    assert parse_routing_key("event.payroll-manager") is None
+
+
+@pytest.mark.asyncio
+async def test_bus_delivers_typed_events_to_registered_handlers():
+    received = []
+
+    async def handler(event: EmployeeCreatedEvent) -> None:
+        received.append(event)
+
+    registry = EventHandlerRegistry()
+    registry.register("employee.employee-created-event", handler, EmployeeCreatedEvent)
+    bus = InMemoryEventBus(registry, max_queue_size=10, workers=2)
+    await bus.start()
+
+    event = make_event()
+    await bus.publish(event)
+    await bus.close()
+
+    assert received == [event]
+
+
+@pytest.mark.asyncio
+async def test_bus_drops_events_outside_its_binding():
+    received = []
+
+    async def handler(event: EmployeeCreatedEvent) -> None:
+        received.append(event)
+
+    registry = EventHandlerRegistry()
+    registry.register("employee.employee-created-event", handler)
+    bus = InMemoryEventBus(registry, binding="event.payroll-manager.reporting.#", workers=1)
+    await bus.start()
+
+    await bus.publish(make_event())
+    await bus.close()
+
+    assert received == []
+
+
+@pytest.mark.asyncio
+async def test_handler_failure_does_not_stop_the_bus():
+    received = []
+
+    async def handler(event: EmployeeCreatedEvent) -> None:
+        if not received:
+            received.append(None)
+            raise RuntimeError("boom")
+        received.append(event)
+
+    registry = EventHandlerRegistry()
+    registry.register("employee.employee-created-event", handler)
+    bus = InMemoryEventBus(registry, workers=1)
+    await bus.start()
+
+    await bus.publish(make_event())
+    await bus.publish(make_event())
+    await bus.close()
+
+    assert len(received) == 2
+
+
+@pytest.mark.asyncio
+async def test_publish_waits_when_queue_is_full():
+    registry = EventHandlerRegistry()
+    bus = InMemoryEventBus(registry, max_queue_size=1, workers=1)
+
+    await bus.publish(make_event())
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(bus.publish(make_event()), timeout=0.05)
+
+    await bus.start()
+    await bus.close()
+
+
+@pytest.mark.asyncio
+async def test_worker_publishing_into_a_full_queue_delivers_in_place():
+    received = []
+    registry = EventHandlerRegistry()
+    bus = InMemoryEventBus(registry, max_queue_size=1, workers=1)
+
+    async def handler(event: EmployeeCreatedEvent) -> None:
+        received.append(event)
+        # Follow-up events, awaited like audit events emitted by a handler
+        if len(received) == 1:
+            await bus.publish(make_event())
+            await bus.publish(make_event())
+
+    registry.register("employee.employee-created-event", handler, EmployeeCreatedEvent)
+    await bus.start()
+
+    await bus.publish(make_event())
+    await asyncio.wait_for(bus.close(), timeout=1)
+
+    assert len(received) == 3
+
+
+class FailingTransport:
+    async def publish(self, event) -> None:
+        raise ConnectionError("broker unavailable")
+
+
+@pytest.mark.asyncio
+async def test_awaited_dispatch_raises_publish_failures(monkeypatch):
+    monkeypatch.setattr(event_bus, "get_event_transport", lambda: FailingTransport())
+    dispatcher = get_event_dispatcher()
+
+    # Background publishes only log the failure
+    await dispatcher.dispatch(make_event())
+    await asyncio.sleep(0)
+
+    with pytest.raises(ConnectionError):
+        await dispatcher.dispatch(make_event(), wait=True)
@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from app.modules.contract.domain.events import ContractActivatedEvent, ContractCreatedEvent
+from app.shared.infrastructure.event_registry import EventDispatchError, EventHandlerRegistry
+from app.shared.infrastructure.routing import build_routing_key, parse_routing_key
+
+EVENT_TYPE = "contract.contract-created-event"
+
+
+class Recorder:
+    def __init__(self):
+        self.calls: list[str] = []
+
+    async def audit(self, event: object) -> None:
+        self.calls.append("audit")
+
+    async def rate(self, event: object) -> None:
+        self.calls.append("rate")
+
+    async def broken(self, event: object) -> None:
+        raise RuntimeError("boom")
+
+
+@pytest.mark.asyncio
+async def test_all_handlers_for_an_event_type_are_called():
+    registry = EventHandlerRegistry()
+    recorder = Recorder()
+    registry.register(EVENT_TYPE, recorder.audit, ContractCreatedEvent)
+    registry.register(EVENT_TYPE, recorder.rate, ContractCreatedEvent)
+
+    await registry.dispatch(EVENT_TYPE, object())
+
+    assert sorted(recorder.calls) == ["audit", "rate"]
+    assert registry.get_event_class(EVENT_TYPE) is ContractCreatedEvent
+
+
+def test_registering_the_same_handler_twice_is_ignored():
+    registry = EventHandlerRegistry()
+    recorder = Recorder()
+    registry.register(EVENT_TYPE, recorder.audit)
+    registry.register(EVENT_TYPE, recorder.audit)
+
+    assert len(registry.get_handlers(EVENT_TYPE)) == 1
+
+
+def test_event_type_cannot_be_bound_to_two_event_classes():
+    registry = EventHandlerRegistry()
+    recorder = Recorder()
+    registry.register(EVENT_TYPE, recorder.audit, ContractCreatedEvent)
+
+    with pytest.raises(ValueError):
+        registry.register(EVENT_TYPE, recorder.rate, ContractActivatedEvent)
+
+
+@pytest.mark.asyncio
+async def test_failing_handler_does_not_stop_the_others():
+    registry = EventHandlerRegistry()
+    recorder = Recorder()
+    registry.register(EVENT_TYPE, recorder.broken)
+    registry.register(EVENT_TYPE, recorder.audit)
+
+    with pytest.raises(EventDispatchError) as exc_info:
+        await registry.dispatch(EVENT_TYPE, object())
+
+    assert recorder.calls == ["audit"]
+    assert list(exc_info.value.failures) == ["Recorder.broken"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_can_be_restricted_to_named_handlers():
+    registry = EventHandlerRegistry()
+    recorder = Recorder()
+    registry.register(EVENT_TYPE, recorder.audit)
+    registry.register(EVENT_TYPE, recorder.rate)
+
+    await registry.dispatch(EVENT_TYPE, object(), only=["Recorder.rate"])
+
+    assert recorder.calls == ["rate"]
+
+
+@pytest.mark.asyncio
+async def test_sequential_handlers_run_before_concurrent_ones():
+    registry = EventHandlerRegistry()
+    order: list[str] = []
+
+    async def concurrent_handler(event: object) -> None:
+        order.append("concurrent")
+
+    async def sequential_handler(event: object) -> None:
+        await asyncio.sleep(0.01)
+        order.append("sequential")
+
+    registry.register(EVENT_TYPE, concurrent_handler)
+    registry.register(EVENT_TYPE, sequential_handler, concurrent=False)
+
+    await registry.dispatch(EVENT_TYPE, object())
+
+    assert order == ["sequential", "concurrent"]
+
+
+def test_compensation_event_types_match_their_routing_keys():
+    from app.modules.compensation.infrastructure.event_handlers import (
+        register_compensation_cache_handlers,
+        register_compensation_handlers,
+    )
+
+    registry = EventHandlerRegistry()
+    register_compensation_handlers(registry)
+    register_compensation_cache_handlers(registry)
+
+    for event_type in registry.list_registered_events():
+        event_class = registry.get_event_class(event_type)
+        assert event_class is not None
+        assert parse_routing_key(build_routing_key(event_class.__name__)) == (
+            event_type,
+            event_type.split(".", 1)[1],
+        )
@@ -0,0 +1,222 @@
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.config import get_settings
+from app.database import PrimaryAsyncSession, PrimarySession
+from app.modules.compensation.domain.value_objects import RateType
+from app.modules.compensation.presentation.views import RateView
+from app.shared.infrastructure import cache as cache_module
+from app.shared.infrastructure.cache import ReadModelCache, invalidate_on_commit
+
+settings = get_settings()
+
+
+class FakePipeline:
+    def __init__(self, client: "FakeRedis"):
+        self.client = client
+        self.commands: list = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def watch(self, key):
+        pass
+
+    async def exists(self, key):
+        return await self.client.exists(key)
+
+    def multi(self):
+        pass
+
+    def hset(self, key, field, value):
+        self.commands.append(("hset", key, field, value))
+
+    def expire(self, key, seconds, nx=False):
+        self.commands.append(("expire", key, seconds))
+
+    def delete(self, key):
+        self.commands.append(("delete", key))
+
+    def set(self, key, value, ex=None):
+        self.commands.append(("set", key, ex))
+
+    async def execute(self):
+        for command, key, *args in self.commands:
+            if command == "hset":
+                self.client.data.setdefault(key, {})[args[0]] = args[1]
+            elif command == "expire":
+                self.client.ttls.setdefault(key, args[0])
+            elif command == "delete":
+                self.client.data.pop(key, None)
+            else:
+                self.client.markers[key] = args[0]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data: dict[str, dict] = {}
+        self.ttls: dict[str, int] = {}
+        self.markers: dict[str, int] = {}
+
+    async def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    async def exists(self, key):
+        return int(key in self.markers)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class UnavailablePipeline(FakePipeline):
+    async def watch(self, key):
+        raise RedisConnectionError("Connection refused")
+
+    async def execute(self):
+        raise RedisConnectionError("Connection refused")
+
+
+class UnavailableRedis:
+    async def hget(self, key, field):
+        raise RedisConnectionError("Connection refused")
+
+    def pipeline(self, transaction=True):
+        return UnavailablePipeline(FakeRedis())
+
+
+def make_rate(employee_id) -> RateView:
+    return RateView(
+        id=uuid4(),
+        employee_id=employee_id,
+        rate_type=RateType.BASE_SALARY,
+        amount=Decimal("8000.00"),
+        currency="PLN",
+        valid_from=date(2025, 1, 1),
+        valid_to=None,
+        description=None,
+        created_at=None,
+        updated_at=None,
+    )
+
+
+class CountingLoader:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+@pytest.mark.asyncio
+async def test_views_are_cached_until_invalidated():
+    cache = ReadModelCache(FakeRedis(), ttl_seconds=60, enabled=True)  # type: ignore[arg-type]
+    employee_id = uuid4()
+    loader = CountingLoader(make_rate(employee_id))
+
+    first = await cache.get_or_load("rates", employee_id, "2025-01-31", RateView, loader)
+    second = await cache.get_or_load("rates", employee_id, "2025-01-31", RateView, loader)
+
+    assert first == second
+    assert loader.calls == 1
+    assert cache.client.ttls[cache.key("rates", employee_id)] == 60  # type: ignore[attr-defined]
+
+    await cache.invalidate("rates", employee_id)
+    await cache.get_or_load("rates", employee_id, "2025-01-31", RateView, loader)
+
+    assert loader.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_views_are_not_cached_again_right_after_an_invalidation():
+    redis = FakeRedis()
+    cache = ReadModelCache(redis, ttl_seconds=60, enabled=True)  # type: ignore[arg-type]
+    employee_id = uuid4()
+    loader = CountingLoader(make_rate(employee_id))
+
+    await cache.invalidate("rates", employee_id)
+    key = cache.key("rates", employee_id)
+    assert redis.markers[cache.invalidated_key(key)] == settings.DB_READ_YOUR_WRITES_SECONDS
+
+    # A replica may not have replayed the write yet, so the view is not stored
+    await cache.get_or_load("rates", employee_id, "today", RateView, loader)
+    await cache.get_or_load("rates", employee_id, "today", RateView, loader)
+    assert loader.calls == 2
+    assert key not in redis.data
+
+    redis.markers.clear()
+    await cache.get_or_load("rates", employee_id, "today", RateView, loader)
+    await cache.get_or_load("rates", employee_id, "today", RateView, loader)
+    assert loader.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_views_invalidated_while_loading_are_not_cached():
+    redis = FakeRedis()
+    cache = ReadModelCache(redis, ttl_seconds=60, enabled=True)  # type: ignore[arg-type]
+    employee_id = uuid4()
+    rate = make_rate(employee_id)
+
+    async def load_then_invalidate():
+        await cache.invalidate("rates", employee_id)
+        return rate
+
+    assert await cache.get_or_load("rates", employee_id, "today", RateView, load_then_invalidate)
+    assert cache.key("rates", employee_id) not in redis.data
+
+
+@pytest.mark.asyncio
+async def test_committed_writes_invalidate_the_views_they_touched(monkeypatch):
+    cache = ReadModelCache(FakeRedis(), ttl_seconds=60, enabled=True)  # type: ignore[arg-type]
+    monkeypatch.setattr(cache_module, "get_read_model_cache", lambda: cache)
+    monkeypatch.setattr(cache_module, "_cached_views", defaultdict(list))
+    invalidate_on_commit(RateView, "rates", lambda row: row.employee_id)
+    employee_id = uuid4()
+    loader = CountingLoader(make_rate(employee_id))
+    await cache.get_or_load("rates", employee_id, "today", RateView, loader)
+
+    session = PrimaryAsyncSession(sync_session_class=PrimarySession)
+    flushed = SimpleNamespace(
+        new=[make_rate(employee_id)], dirty=[], deleted=[], info=session.sync_session.info
+    )
+    cache_module._collect_stale_views(flushed, None)  # type: ignore[arg-type]
+    # Nothing is dropped before the commit
+    await cache.get_or_load("rates", employee_id, "today", RateView, loader)
+    assert loader.calls == 1
+
+    await session.commit()
+    await cache.get_or_load("rates", employee_id, "today", RateView, loader)
+    assert loader.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_views_are_not_cached():
+    cache = ReadModelCache(FakeRedis(), ttl_seconds=60, enabled=True)  # type: ignore[arg-type]
+    loader = CountingLoader(None)
+
+    await cache.get_or_load("employee", uuid4(), "detail", RateView | None, loader)
+
+    assert cache.client.data == {}  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_cache_fails_open_when_redis_is_unavailable():
+    cache = ReadModelCache(UnavailableRedis(), ttl_seconds=60, enabled=True)  # type: ignore[arg-type]
+    employee_id = uuid4()
+    rate = make_rate(employee_id)
+
+    assert (
+        await cache.get_or_load("rates", employee_id, "today", RateView, CountingLoader(rate))
+        == rate
+    )
+    await cache.invalidate("rates", employee_id)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-request latency of the authentication middleware - no database needed.
+
+Drives a minimal ASGI app directly (no HTTP client or server in the loop) with an
+authenticated request and compares:
+  none            - no middleware, the floor
+  base-http       - the previous BaseHTTPMiddleware implementation, verifying the JWT every time
+  asgi-uncached   - AuthContextMiddleware with the claims cache cleared before every request
+  asgi-cached     - AuthContextMiddleware with the token's claims already cached
+
+Usage:
+    docker exec payroll_backend python /app/scripts/benchmark_auth_middleware.py [--requests N]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from uuid import UUID, uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from starlette.applications import Starlette  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+from starlette.responses import PlainTextResponse  # noqa: E402
+from starlette.routing import Route  # noqa: E402
+
+from app.modules.auth.application.services import AuthenticationService  # noqa: E402
+from app.modules.auth.infrastructure.middleware import AuthContextMiddleware  # noqa: E402
+from app.modules.auth.infrastructure.token_cache import get_token_claims_cache  # noqa: E402
+from app.shared.infrastructure.context import set_current_user_id  # noqa: E402
+
+
+class BaseHTTPAuthContextMiddleware(BaseHTTPMiddleware):
+    """The previous implementation, kept here for comparison"""
+
+    async def dispatch(self, request, call_next):
+        set_current_user_id(None)
+        authorization = request.headers.get("Authorization")
+        if authorization and authorization.startswith("Bearer "):
+            payload = AuthenticationService.decode_access_token(authorization[7:])
+            if payload and "sub" in payload:
+                set_current_user_id(UUID(payload["sub"]))
+        return await call_next(request)
+
+
+async def ok(request):
+    return PlainTextResponse("ok")
+
+
+def make_app(middleware=None) -> Starlette:
+    app = Starlette(routes=[Route("/", ok)])
+    if middleware is not None:
+        app.add_middleware(middleware)
+    return app
+
+
+async def call(app, token: str) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/",
+        "raw_path": b"/",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("test", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+async def measure(name: str, app, token: str, requests: int, clear_cache: bool = False) -> None:
+    cache = get_token_claims_cache()
+    # Warm up; also starts the app's middleware stack
+    for _ in range(100):
+        await call(app, token)
+
+    timings = []
+    for _ in range(requests):
+        if clear_cache:
+            cache.clear()
+        start = time.perf_counter()
+        await call(app, token)
+        timings.append(time.perf_counter() - start)
+
+    timings.sort()
+    p50 = statistics.median(timings) * 1_000_000
+    p99 = timings[int(len(timings) * 0.99) - 1] * 1_000_000
+    print(
+        f"  {name:<14} p50 {p50:>7.1f} us   p99 {p99:>7.1f} us   {requests / sum(timings):>9,.0f} req/s"
+    )
+
+
+async def run(requests: int) -> None:
+    token = AuthenticationService.create_access_token({"sub": str(uuid4())})
+
+    print(f"Authenticated requests ({requests} per variant):")
+    await measure("none", make_app(), token, requests)
+    await measure("base-http", make_app(BaseHTTPAuthContextMiddleware), token, requests)
+    await measure(
+        "asgi-uncached", make_app(AuthContextMiddleware), token, requests, clear_cache=True
+    )
+    await measure("asgi-cached", make_app(AuthContextMiddleware), token, requests)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark authentication middleware latency")
+    parser.add_argument("--requests", type=int, default=20_000, help="Requests per variant")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
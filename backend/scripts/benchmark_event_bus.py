@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark domain event throughput through the in-memory event bus - no broker needed.
+
+Publishes synthetic EmployeeCreatedEvents through InMemoryEventBus to no-op handlers
+and, for comparison, measures the encode/validate cost every event pays on the
+RabbitMQ path with each available codec.
+
+Usage:
+    docker exec payroll_backend python /app/scripts/benchmark_event_bus.py [--events N] [--handlers N] [--workers N]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.modules.employee.domain.events import EmployeeCreatedEvent  # noqa: E402
+from app.shared.infrastructure.codecs import get_codec  # noqa: E402
+from app.shared.infrastructure.event_bus import InMemoryEventBus  # noqa: E402
+from app.shared.infrastructure.event_registry import EventHandlerRegistry  # noqa: E402
+
+EVENT_TYPE = "employee.employee-created-event"
+
+
+def make_event() -> EmployeeCreatedEvent:
+    return EmployeeCreatedEvent(
+        employee_id=uuid4(),
+        first_name="Jan",
+        last_name="Kowalski",
+        email="jan.kowalski@example.com",
+        hire_date=None,
+    )
+
+
+async def benchmark_in_memory_bus(events: int, handlers: int, workers: int) -> None:
+    registry = EventHandlerRegistry()
+    handled = 0
+
+    def make_handler(index: int):
+        async def handler(event: EmployeeCreatedEvent) -> None:
+            nonlocal handled
+            handled += 1
+
+        handler.__qualname__ = f"noop_handler_{index}"
+        return handler
+
+    for index in range(handlers):
+        registry.register(EVENT_TYPE, make_handler(index), EmployeeCreatedEvent)
+
+    bus = InMemoryEventBus(registry, workers=workers)
+    await bus.start()
+
+    payload = [make_event() for _ in range(events)]
+    start = time.perf_counter()
+    for event in payload:
+        await bus.publish(event)
+    await bus.join()
+    elapsed = time.perf_counter() - start
+    await bus.close()
+
+    print(f"In-memory bus ({handlers} handler(s), {workers} worker(s)):")
+    print(f"  {events} events, {handled} handler calls in {elapsed:.3f}s")
+    print(f"  {events / elapsed:,.0f} events/s")
+
+
+def benchmark_codecs(events: int) -> None:
+    payload = [make_event() for _ in range(events)]
+
+    print("\nBroker path serialization (encode + decode + validate):")
+    for name in ("json", "orjson", "msgpack"):
+        try:
+            codec = get_codec(name)
+        except ImportError as e:
+            print(f"  {name:<8} skipped ({e})")
+            continue
+
+        start = time.perf_counter()
+        size = 0
+        for event in payload:
+            body = codec.encode(event.model_dump(mode="json"))
+            size += len(body)
+            EmployeeCreatedEvent.model_validate(codec.decode(body))
+        elapsed = time.perf_counter() - start
+
+        print(f"  {name:<8} {events / elapsed:>10,.0f} events/s, {size / events:>6.0f} bytes/event")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark domain event throughput")
+    parser.add_argument("--events", type=int, default=100_000, help="Number of events")
+    parser.add_argument("--handlers", type=int, default=2, help="Handlers per event")
+    parser.add_argument("--workers", type=int, default=10, help="Bus worker tasks")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark_in_memory_bus(args.events, args.handlers, args.workers))
+    benchmark_codecs(args.events)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark PDF report rendering for growing row counts - no database needed.
+
+Renders synthetic payroll rows in this process and compares:
+  single-table  - the previous layout, one reportlab Table holding every row
+  chunked       - render_pdf, page-sized tables with a repeated header
+  summary       - render_pdf above REPORT_PDF_MAX_ROWS, a summary PDF plus CSV in a ZIP
+
+The single-table layout gets quadratically slower, so by default it is only
+run up to 10,000 rows.
+
+Usage:
+    docker exec payroll_backend python /app/scripts/benchmark_pdf_reports.py [--rows 1000 10000 100000]
+"""
+
+import argparse
+import csv
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from reportlab.lib import colors  # noqa: E402
+from reportlab.lib.pagesizes import letter  # noqa: E402
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle  # noqa: E402
+
+from app.modules.reporting.infrastructure.rendering import (  # noqa: E402
+    RenderJob,
+    read_spooled_rows,
+    render_pdf,
+)
+
+HEADERS = ["Employee", "Gross Pay", "Deductions", "Net Pay", "Period"]
+
+
+def spool_rows(directory: Path, rows: int) -> Path:
+    rows_path = directory / f"rows_{rows}.csv"
+    with open(rows_path, "w", newline="", encoding="utf-8") as rows_file:
+        writer = csv.writer(rows_file)
+        for index in range(rows):
+            writer.writerow(
+                [
+                    f"Employee {index}",
+                    "$8,000.00",
+                    "$800.00",
+                    "$7,200.00",
+                    "2025-01-01 to 2025-01-31",
+                ]
+            )
+    return rows_path
+
+
+def render_single_table(job: RenderJob) -> str:
+    """The previous implementation, kept here for comparison"""
+    doc = SimpleDocTemplate(job.output_path, pagesize=letter)
+    table = Table([job.headers, *read_spooled_rows(job.rows_path)])
+    table.setStyle(
+        TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                ("FONTSIZE", (0, 0), (-1, 0), 14),
+                ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+                ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
+                ("GRID", (0, 0), (-1, -1), 1, colors.black),
+            ]
+        )
+    )
+    doc.build([table])
+    return job.output_path
+
+
+def measure(name: str, render_function, job: RenderJob) -> None:
+    start = time.perf_counter()
+    output_path = Path(render_function(job))
+    elapsed = time.perf_counter() - start
+    size_kib = output_path.stat().st_size / 1024
+    print(
+        f"  {name:<13} {elapsed:>8.2f} s   {job.row_count / elapsed:>9,.0f} rows/s"
+        f"   {size_kib:>9,.0f} KiB  {output_path.suffix}"
+    )
+
+
+def run(row_counts: list[int], single_table_max: int, max_rows: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        for rows in row_counts:
+            rows_path = spool_rows(directory, rows)
+
+            def make_job(variant: str, limit: int | None = None) -> RenderJob:
+                return RenderJob(
+                    title="Payroll Summary",
+                    report_type="payroll_summary",
+                    generated_at="2025-02-01 00:00:00",
+                    headers=HEADERS,
+                    rows_path=str(rows_path),
+                    output_path=str(directory / f"{variant}_{rows}.pdf"),
+                    row_count=rows,
+                    max_rows=limit,
+                )
+
+            print(f"{rows:,} rows:")
+            if rows <= single_table_max:
+                measure("single-table", render_single_table, make_job("single"))
+            else:
+                print("  single-table  skipped")
+            measure("chunked", render_pdf, make_job("chunked"))
+            if rows > max_rows:
+                measure("summary", render_pdf, make_job("summary", max_rows))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PDF report rendering")
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="Row counts"
+    )
+    parser.add_argument(
+        "--single-table-max",
+        type=int,
+        default=10_000,
+        help="Largest row count rendered with the previous single-table layout",
+    )
+    parser.add_argument(
+        "--max-rows", type=int, default=20_000, help="Row cap for the summary fallback"
+    )
+    args = parser.parse_args()
+
+    run(args.rows, args.single_table_max, args.max_rows)
+
+
+if __name__ == "__main__":
+    main()
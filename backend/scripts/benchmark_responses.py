@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON serialization and compression of large API responses - no database needed.
+
+Builds a synthetic PayrollDetailView with many lines and an AuditLogListResponse with
+JSON old/new values, then compares how each one is serialized:
+  stdlib   - jsonable_encoder + json.dumps (FastAPI's JSONResponse path)
+  orjson   - jsonable_encoder + orjson.dumps (ORJSONResponse)
+  pydantic - TypeAdapter.dump_json (FastAPI's path for routes with a response model)
+and how many bytes gzip and Brotli save on the serialized body.
+
+Usage:
+    docker exec payroll_backend python /app/scripts/benchmark_responses.py [--lines N] [--audit-logs N] [--rounds N]
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import time
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.modules.audit.presentation.views import (  # noqa: E402
+    AuditLogListResponse,
+    AuditLogResponse,
+)
+from app.modules.payroll.domain.value_objects import (  # noqa: E402
+    PayrollLineType,
+    PayrollPeriodType,
+    PayrollStatus,
+)
+from app.modules.payroll.presentation.views import PayrollDetailView, PayrollLineView  # noqa: E402
+
+settings = get_settings()
+
+
+def make_payroll(lines: int) -> PayrollDetailView:
+    return PayrollDetailView(
+        id=uuid4(),
+        employee_id=uuid4(),
+        period_type=PayrollPeriodType.MONTHLY,
+        period_start_date=date(2025, 1, 1),
+        period_end_date=date(2025, 1, 31),
+        status=PayrollStatus.APPROVED,
+        gross_pay=Decimal("12500.00"),
+        total_deductions=Decimal("1250.00"),
+        total_taxes=Decimal("2300.00"),
+        net_pay=Decimal("8950.00"),
+        currency="PLN",
+        lines=[
+            PayrollLineView(
+                line_type=PayrollLineType.OVERTIME,
+                description=f"Overtime {index % 31 + 1:02d}.01.2025",
+                quantity=Decimal("2.50"),
+                rate=Decimal("75.00"),
+                amount=Decimal("187.50"),
+                currency="PLN",
+                reference_id=uuid4(),
+            )
+            for index in range(lines)
+        ],
+        approved_by=uuid4(),
+        approved_at=datetime.now(UTC),
+        processed_at=None,
+        paid_at=None,
+        payment_reference=None,
+        notes=None,
+        version="1",
+        created_at=date(2025, 1, 31),
+        updated_at=date(2025, 1, 31),
+    )
+
+
+def make_audit_logs(count: int) -> AuditLogListResponse:
+    now = datetime.now(UTC)
+    items = [
+        AuditLogResponse(
+            id=uuid4(),
+            entity_type="contract",
+            entity_id=uuid4(),
+            employee_id=uuid4(),
+            action="updated",
+            old_values={"status": "pending", "rate_amount": "8000.00", "hours_per_week": 40},
+            new_values={"status": "active", "rate_amount": "8500.00", "hours_per_week": 40},
+            changed_by=uuid4(),
+            metadata={"source": "contract.contract-activated-event"},
+            occurred_at=now,
+            created_at=now,
+        )
+        for _ in range(count)
+    ]
+    return AuditLogListResponse(items=items, total=count, page=1, limit=count)
+
+
+def serializers(view_type):
+    adapter = TypeAdapter(view_type)
+    yield "stdlib", lambda view: json.dumps(jsonable_encoder(view)).encode()
+    try:
+        import orjson
+
+        yield "orjson", lambda view: orjson.dumps(jsonable_encoder(view))
+    except ImportError:
+        pass
+    yield "pydantic", adapter.dump_json
+
+
+def compressors():
+    yield "gzip", lambda body: gzip.compress(body, settings.RESPONSE_COMPRESSION_GZIP_LEVEL)
+    try:
+        import brotli
+
+        yield (
+            "brotli",
+            lambda body: brotli.compress(
+                body, mode=brotli.MODE_TEXT, quality=settings.RESPONSE_COMPRESSION_BROTLI_QUALITY
+            ),
+        )
+    except ImportError:
+        print("  (brotli not installed, skipping)")
+
+
+def benchmark(name: str, view, rounds: int) -> None:
+    print(f"\n{name}:")
+    body = b""
+    for serializer_name, serialize in serializers(type(view)):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            body = serialize(view)
+        elapsed = (time.perf_counter() - start) / rounds
+        print(f"  {serializer_name:<8} {elapsed * 1000:>8.2f} ms/response, {len(body):>9,} bytes")
+
+    for compressor_name, compress in compressors():
+        start = time.perf_counter()
+        for _ in range(rounds):
+            compressed = compress(body)
+        elapsed = (time.perf_counter() - start) / rounds
+        saved = 1 - len(compressed) / len(body)
+        print(
+            f"  {compressor_name:<8} {elapsed * 1000:>8.2f} ms/response, "
+            f"{len(compressed):>9,} bytes ({saved:.0%} saved)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark API response serialization")
+    parser.add_argument("--lines", type=int, default=2_000, help="Payroll lines")
+    parser.add_argument("--audit-logs", type=int, default=1_000, help="Audit log entries")
+    parser.add_argument("--rounds", type=int, default=20, help="Repetitions per measurement")
+    args = parser.parse_args()
+
+    benchmark(f"PayrollDetailView ({args.lines} lines)", make_payroll(args.lines), args.rounds)
+    benchmark(
+        f"AuditLogListResponse ({args.audit_logs} entries)",
+        make_audit_logs(args.audit_logs),
+        args.rounds,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
 import pytest
 import pytest_asyncio
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from httpx import AsyncClient, ASGITransport
-from app.database import Base, get_db
+from app.database import Base, get_db, get_read_db
 from app.main import app
 
 
@@ -12,6 +13,7 @@ async def test_engine():
     engine = create_async_engine(test_database_url, echo=True)
 
     async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
 
     yield engine
@@ -37,6 +39,7 @@ async def client(test_session):
         yield test_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
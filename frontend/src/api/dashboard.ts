@@ -0,0 +1,17 @@
+import apiClient from './client'
+import type { DashboardSummaryView } from '@/api'
+
+export type { DashboardSummaryView } from '@/api'
+
+/**
+ * Dashboard API endpoints
+ */
+export const dashboardApi = {
+  /**
+   * Get aggregated headcount, payroll, approval and contract statistics
+   */
+  getSummary: async (): Promise<DashboardSummaryView> => {
+    const response = await apiClient.get<DashboardSummaryView>('/dashboard/summary')
+    return response.data
+  },
+}
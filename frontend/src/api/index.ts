@@ -29,6 +29,7 @@ export type { CalculatePayrollRequest } from './models/CalculatePayrollRequest'
 export type { CancelContractRequest } from './models/CancelContractRequest'
 export type { ChangeStatusRequest } from './models/ChangeStatusRequest'
 export type { ContractDetailView } from './models/ContractDetailView'
+export type { ContractExpirationsView } from './models/ContractExpirationsView'
 export type { ContractListResponse } from './models/ContractListResponse'
 export type { ContractListView } from './models/ContractListView'
 export { ContractStatus } from './models/ContractStatus'
@@ -41,10 +42,12 @@ export type { CreatePayrollRequest } from './models/CreatePayrollRequest'
 export type { CreateRateRequest } from './models/CreateRateRequest'
 export type { CreateReportRequest } from './models/CreateReportRequest'
 export type { CreateTimesheetRequest } from './models/CreateTimesheetRequest'
+export type { DashboardSummaryView } from './models/DashboardSummaryView'
 export type { EmployeeDetailView } from './models/EmployeeDetailView'
 export type { EmployeeListView } from './models/EmployeeListView'
 export { EmploymentStatusType } from './models/EmploymentStatusType'
 export type { EmploymentStatusView } from './models/EmploymentStatusView'
+export type { HeadcountView } from './models/HeadcountView'
 export type { HoursSummaryResponse } from './models/HoursSummaryResponse'
 export type { HTTPValidationError } from './models/HTTPValidationError'
 export type { MarkAsPaidRequest } from './models/MarkAsPaidRequest'
@@ -61,8 +64,11 @@ export type { PayrollDetailView } from './models/PayrollDetailView'
 export { PayrollLineType } from './models/PayrollLineType'
 export type { PayrollLineView } from './models/PayrollLineView'
 export type { PayrollListView } from './models/PayrollListView'
+export type { PayrollPeriodSummaryView } from './models/PayrollPeriodSummaryView'
 export { PayrollPeriodType } from './models/PayrollPeriodType'
 export { PayrollStatus } from './models/PayrollStatus'
+export type { PayrollStatusTotalView } from './models/PayrollStatusTotalView'
+export type { PendingApprovalsView } from './models/PendingApprovalsView'
 export type { RateListResponse } from './models/RateListResponse'
 export { RateType } from './models/RateType'
 export type { RateView } from './models/RateView'
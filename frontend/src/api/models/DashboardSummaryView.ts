@@ -0,0 +1,15 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+import type { ContractExpirationsView } from './ContractExpirationsView'
+import type { HeadcountView } from './HeadcountView'
+import type { PayrollPeriodSummaryView } from './PayrollPeriodSummaryView'
+import type { PendingApprovalsView } from './PendingApprovalsView'
+export type DashboardSummaryView = {
+  as_of: string
+  headcount: HeadcountView
+  payroll: PayrollPeriodSummaryView
+  pending_approvals: PendingApprovalsView
+  contract_expirations: ContractExpirationsView
+}
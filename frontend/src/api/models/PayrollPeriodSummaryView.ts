@@ -0,0 +1,10 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+import type { PayrollStatusTotalView } from './PayrollStatusTotalView'
+export type PayrollPeriodSummaryView = {
+  period_start: string
+  period_end: string
+  by_status: Array<PayrollStatusTotalView>
+}
@@ -0,0 +1,11 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+export type PayrollStatusTotalView = {
+  status: string
+  currency: string
+  count: number
+  gross_pay: string
+  net_pay: string
+}
@@ -2,31 +2,25 @@ import { useEffect, useState } from 'react'
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card'
 import { Alert, AlertDescription } from '@/components/ui/alert'
 import { Users, FileText, Calendar, AlertCircle } from 'lucide-react'
-import apiClient from '@/api/client'
-import type {
-  PaginatedResponse_EmployeeListView_,
-  PaginatedResponse_ContractListView_,
-  PaginatedResponse_AbsenceResponse_,
-  AbsenceResponse,
-} from '@/api'
+import { dashboardApi, type DashboardSummaryView } from '@/api/dashboard'
 
 interface DashboardStats {
   totalEmployees: number
   activeEmployees: number
-  totalContracts: number
-  activeContracts: number
+  expiringContracts: number
+  expiringWithinDays: number
   pendingAbsences: number
-  totalAbsences: number
+  pendingApprovals: number
 }
 
 export function Dashboard() {
   const [stats, setStats] = useState<DashboardStats>({
     totalEmployees: 0,
     activeEmployees: 0,
-    totalContracts: 0,
-    activeContracts: 0,
+    expiringContracts: 0,
+    expiringWithinDays: 0,
     pendingAbsences: 0,
-    totalAbsences: 0,
+    pendingApprovals: 0,
   })
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState<string | null>(null)
@@ -40,41 +34,17 @@ export function Dashboard() {
       setLoading(true)
       setError(null)
 
-      // Fetch all data in parallel
-      const [employeesRes, contractsRes, absencesRes] = await Promise.all([
-        apiClient.get<PaginatedResponse_EmployeeListView_>('/employees/', {
-          params: { page: 1, limit: 1 },
-        }),
-        apiClient.get<PaginatedResponse_ContractListView_>('/contracts/', {
-          params: { page: 1, limit: 1 },
-        }),
-        apiClient.get<PaginatedResponse_AbsenceResponse_>('/absence/absences/', {
-          params: { page: 1, limit: 100 },
-        }),
-      ])
-
-      // Calculate stats
-      const totalEmployees = (employeesRes.data.items || []).length
-      const totalContracts = (contractsRes.data.items || []).length
-      const absences: AbsenceResponse[] = absencesRes.data.items || []
-
-      // Count active employees (you might need to filter based on status)
-      const activeEmployees = totalEmployees // Adjust based on actual status filtering
-
-      // Count active contracts (you might need to filter based on status)
-      const activeContracts = totalContracts // Adjust based on actual status filtering
-
-      // Count pending absences
-      const pendingAbsences = absences.filter((a) => a.status === 'pending').length
-      const totalAbsences = absences.length
+      // All figures are aggregated server-side in a single request
+      const summary: DashboardSummaryView = await dashboardApi.getSummary()
+      const pending = summary.pending_approvals
 
       setStats({
-        totalEmployees,
-        activeEmployees,
-        totalContracts,
-        activeContracts,
-        pendingAbsences,
-        totalAbsences,
+        totalEmployees: summary.headcount.total,
+        activeEmployees: summary.headcount.by_status.active ?? 0,
+        expiringContracts: summary.contract_expirations.count,
+        expiringWithinDays: summary.contract_expirations.within_days,
+        pendingAbsences: pending.absences,
+        pendingApprovals: pending.absences + pending.timesheets + pending.payrolls,
       })
     } catch (err) {
       console.error('Failed to load dashboard data:', err)
@@ -128,12 +98,12 @@ export function Dashboard() {
         {/* Contracts Card */}
         <Card>
           <CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2">
-            <CardTitle className="text-sm font-medium">Contracts</CardTitle>
+            <CardTitle className="text-sm font-medium">Expiring Contracts</CardTitle>
             <FileText className="h-4 w-4 text-muted-foreground" />
           </CardHeader>
           <CardContent>
-            <div className="text-2xl font-bold">{stats.totalContracts}</div>
-            <p className="text-xs text-muted-foreground">{stats.activeContracts} active</p>
+            <div className="text-2xl font-bold">{stats.expiringContracts}</div>
+            <p className="text-xs text-muted-foreground">within {stats.expiringWithinDays} days</p>
           </CardContent>
         </Card>
 
@@ -145,7 +115,9 @@ export function Dashboard() {
           </CardHeader>
           <CardContent>
             <div className="text-2xl font-bold">{stats.pendingAbsences}</div>
-            <p className="text-xs text-muted-foreground">{stats.totalAbsences} total this period</p>
+            <p className="text-xs text-muted-foreground">
+              {stats.pendingApprovals} approvals pending in total
+            </p>
           </CardContent>
         </Card>
       </div>
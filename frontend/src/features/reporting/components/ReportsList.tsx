@@ -28,6 +28,7 @@ const statusColors: Record<string, string> = {
   processing: 'bg-blue-100 text-blue-800',
   completed: 'bg-green-100 text-green-800',
   failed: 'bg-red-100 text-red-800',
+  cancelled: 'bg-yellow-100 text-yellow-800',
 }
 
 export function ReportsList() {
@@ -104,6 +105,7 @@ export function ReportsList() {
             <SelectItem value="processing">Processing</SelectItem>
             <SelectItem value="completed">Completed</SelectItem>
             <SelectItem value="failed">Failed</SelectItem>
+            <SelectItem value="cancelled">Cancelled</SelectItem>
           </SelectContent>
         </Select>
 
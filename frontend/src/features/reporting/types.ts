@@ -2,7 +2,7 @@ import type { ReportResponse, CreateReportRequest } from '@/api/reports'
 
 export type { ReportResponse, CreateReportRequest }
 
-export type ReportStatus = 'pending' | 'processing' | 'completed' | 'failed'
+export type ReportStatus = 'pending' | 'processing' | 'completed' | 'failed' | 'cancelled'
 
 export type ReportType =
   | 'payroll_summary'
@@ -10,9 +10,10 @@ export type ReportType =
   | 'absence_summary'
   | 'timesheet_summary'
   | 'tax_report'
+  | 'payroll_close_pack'
   | 'custom'
 
-export type ReportFormat = 'pdf' | 'csv' | 'xlsx' | 'json'
+export type ReportFormat = 'pdf' | 'csv' | 'xlsx' | 'json' | 'parquet' | 'arrow'
 
 export const REPORT_TYPE_LABELS: Record<ReportType, string> = {
   payroll_summary: 'Payroll Summary',
@@ -20,6 +21,7 @@ export const REPORT_TYPE_LABELS: Record<ReportType, string> = {
   absence_summary: 'Absence Summary',
   timesheet_summary: 'Timesheet Summary',
   tax_report: 'Tax Report',
+  payroll_close_pack: 'Payroll Close Pack',
   custom: 'Custom Report',
 }
 
@@ -28,6 +30,7 @@ export const REPORT_STATUS_LABELS: Record<ReportStatus, string> = {
   processing: 'Processing',
   completed: 'Completed',
   failed: 'Failed',
+  cancelled: 'Cancelled',
 }
 
 export const REPORT_FORMAT_LABELS: Record<ReportFormat, string> = {
@@ -35,4 +38,6 @@ export const REPORT_FORMAT_LABELS: Record<ReportFormat, string> = {
   csv: 'CSV',
   xlsx: 'Excel',
   json: 'JSON',
+  parquet: 'Parquet',
+  arrow: 'Arrow IPC',
 }
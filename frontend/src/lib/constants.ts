@@ -102,6 +102,7 @@ export const REPORT_TYPES = {
   ABSENCE_SUMMARY: 'absence_summary',
   TIMESHEET_SUMMARY: 'timesheet_summary',
   TAX_REPORT: 'tax_report',
+  PAYROLL_CLOSE_PACK: 'payroll_close_pack',
   CUSTOM: 'custom',
 } as const
 
@@ -111,6 +112,8 @@ export const REPORT_FORMATS = {
   CSV: 'csv',
   XLSX: 'xlsx',
   JSON: 'json',
+  PARQUET: 'parquet',
+  ARROW: 'arrow',
 } as const
 
 // Report Status
@@ -119,6 +122,7 @@ export const REPORT_STATUSES = {
   PROCESSING: 'processing',
   COMPLETED: 'completed',
   FAILED: 'failed',
+  CANCELLED: 'cancelled',
 } as const
 
 // User Roles
@@ -183,4 +187,5 @@ export const AUDIT_ACTIONS = {
   PAID: 'paid',
   COMPLETED: 'completed',
   FAILED: 'failed',
+  CANCELLED: 'cancelled',
 } as const